@@ -0,0 +1,122 @@
+"""密码库代理延迟基准测试
+
+在临时目录中生成密码库，于后台线程启动代理，再用客户端模拟界面/脚本的查询：
+对比直接打开密码库（密钥派生 + 全量解密）与通过代理查询的耗时，
+并验证锁定后查询被拒绝。
+
+用法：
+    python benchmarks/bench_agent.py [--size 10000] [--requests 1000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+USERNAME = 'bench'
+PASSWORD = 'benchmark'
+
+
+def build_vault(size: int):
+    from utils.crypto import CryptoManager
+    from utils.data_manager import DataManager
+
+    data_manager = DataManager()
+    data_manager.register_user(USERNAME, PASSWORD)
+    data_manager.login_user(USERNAME, PASSWORD)
+    users = data_manager.load_users()
+    users[USERNAME]['passwords'] = [{
+        'id': i + 1,
+        'data': CryptoManager.encrypt_data(json.dumps({
+            'website': f'站点{i}', 'username': f'user{i}@example.com', 'password': f'pw{i:08d}',
+            'category': ['工作', '个人', '银行', ''][i % 4], 'url': '', 'notes': '',
+        }, ensure_ascii=False), data_manager.encryption_key),
+    } for i in range(size)]
+    data_manager.save_users(users)
+
+
+def start_agent(socket_path: str):
+    """在后台线程中运行代理，返回 (agent, loop, thread)"""
+    from utils.agent import VaultAgent
+
+    agent = VaultAgent(socket_path, lock_timeout=60)
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+
+    async def run():
+        started = asyncio.Event()
+        task = asyncio.create_task(agent.serve(started))
+        await started.wait()
+        ready.set()
+        await task
+
+    thread = threading.Thread(target=lambda: loop.run_until_complete(run()), daemon=True)
+    thread.start()
+    ready.wait()
+    return agent, loop, thread
+
+
+def percentiles(samples: list) -> str:
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return f'p50 {statistics.median(samples) * 1000:7.3f} ms  p99 {p99 * 1000:7.3f} ms'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='密码库代理延迟基准测试')
+    parser.add_argument('--size', type=int, default=10000)
+    parser.add_argument('--requests', type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ['HOME'] = home
+        os.environ['USERPROFILE'] = home
+        build_vault(args.size)
+
+        from utils.agent import AgentClient, AgentError
+        from utils.data_manager import DataManager
+
+        start = time.perf_counter()
+        data_manager = DataManager()
+        data_manager.login_user(USERNAME, PASSWORD)
+        data_manager.get_user_passwords()
+        print(f'条目数: {args.size}')
+        print(f'  直接打开密码库      {(time.perf_counter() - start) * 1000:9.1f} ms')
+
+        agent, loop, thread = start_agent(os.path.join(home, 'agent.sock'))
+        with AgentClient(agent.socket_path) as client:
+            start = time.perf_counter()
+            client.unlock(USERNAME, PASSWORD)
+            print(f'  代理解锁（一次性）  {(time.perf_counter() - start) * 1000:9.1f} ms')
+
+            for name, call in [
+                ('status', lambda i: client.status()),
+                ('get', lambda i: client.get(i % args.size + 1)),
+                ('search', lambda i: client.search(f'user{i % args.size}@')),
+            ]:
+                samples = []
+                for i in range(args.requests):
+                    start = time.perf_counter()
+                    call(i)
+                    samples.append(time.perf_counter() - start)
+                print(f'  {name:<8} {percentiles(samples)}')
+
+            client.lock()
+            try:
+                client.get(1)
+                print('  锁定后查询: 未被拒绝（错误）')
+            except AgentError as e:
+                print(f'  锁定后查询: 已拒绝（{e}）')
+
+        loop.call_soon_threadsafe(agent.close)
+        thread.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""密码体检基准测试
+
+用确定性生成的密码库测量 VaultAudit（见 utils/vault_audit.py）各场景的耗时：
+首次体检（全部解密）、无变化时再次体检、修改少量条目后体检、重新登录后借助缓存文件体检，
+并与逐对比较明文的重复检测（O(n²)，只在不超过 --pairwise-limit 条时运行）对照。
+
+用法：
+    python benchmarks/bench_audit.py [--sizes 1000 10000 100000] [--changes 10]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vault_generator import DEFAULT_SEED, write_vault  # noqa: E402
+
+USERNAME = 'bench'
+PASSWORD = 'benchmark'
+
+
+def timed(func) -> tuple:
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def pairwise_reuse(data_manager) -> int:
+    """改动前可行的做法：解密全部条目后两两比较密码，返回与其他条目共用密码的条目数"""
+    passwords = [item['password'] for item in data_manager.get_user_passwords()]
+    reused = set()
+    for i, password in enumerate(passwords):
+        for j in range(i + 1, len(passwords)):
+            if passwords[j] == password:
+                reused.update((i, j))
+    return len(reused)
+
+
+def run(size: int, changes: int, pairwise_limit: int) -> dict:
+    from utils.data_manager import DataManager
+    from utils.vault_audit import VaultAudit
+
+    data_manager = DataManager()
+    data_manager.register_user(USERNAME, PASSWORD)
+    data_manager.login_user(USERNAME, PASSWORD)
+    passwords = write_vault(data_manager, size, DEFAULT_SEED)
+
+    audit = VaultAudit(data_manager)
+    results = {}
+    results['首次体检'], first = timed(audit.run)
+    results['无变化再次体检'], _ = timed(audit.run)
+
+    for entry_id in range(1, min(changes, size) + 1):
+        data_manager.update_password(entry_id, dict(passwords[entry_id - 1], password='same-password'),
+                                     force_update=True)
+    results[f'修改 {changes} 条后体检'], changed = timed(audit.run)
+
+    reopened = DataManager()
+    reopened.login_user(USERNAME, PASSWORD)
+    results['重新登录后体检（缓存）'], cached = timed(VaultAudit(reopened).run)
+    if cached['findings'] != changed['findings']:
+        raise AssertionError('使用缓存的体检结果与增量体检不一致')
+
+    if size <= pairwise_limit:
+        results['逐对比较（仅重复检测）'], _ = timed(lambda: pairwise_reuse(reopened))
+
+    print(f'\n条目数: {size}（首次重新计算 {first["recomputed"]} 条，修改后 {changed["recomputed"]} 条，'
+          f'缓存后 {cached["recomputed"]} 条）')
+    for name, ms in results.items():
+        print(f'  {name:<20}{ms:>12.1f} ms')
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='密码体检基准测试')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--changes', type=int, default=10, help='两次体检之间修改的条目数')
+    parser.add_argument('--pairwise-limit', type=int, default=10000, help='逐对比较的最大条目数')
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as workdir:
+            os.environ['HOME'] = workdir
+            os.environ['USERPROFILE'] = workdir
+            run(size, args.changes, args.pairwise_limit)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""离线泄露检查基准测试
+
+生成 Pwned Passwords 格式（"SHA1:次数"）的合成泄露库文本，测量：
+构建二进制泄露库的耗时（已排序与乱序两种输入）、mmap 二分查找的单次耗时与
+查找期间的 Python 内存分配，以及整库检查的首次、无变化再次、修改少量条目后的耗时。
+合成泄露库包含每 10 条密码中的 1 条，检查结果与预期不一致时退出码为 1。
+
+用法：
+    python benchmarks/bench_breach_check.py [--corpus-size 2000000] [--vault-size 10000]
+"""
+import argparse
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vault_generator import DEFAULT_SEED, write_vault  # noqa: E402
+
+USERNAME = 'bench'
+PASSWORD = 'benchmark'
+LOOKUPS = 100000
+
+
+def sha1_line(password: str, count: int) -> str:
+    return f'{hashlib.sha1(password.encode()).hexdigest().upper()}:{count}\n'
+
+
+def write_corpus_text(path: str, size: int, known_passwords: list, shuffled: bool, seed: int):
+    """写入 size 条随机哈希以及 known_passwords 的哈希"""
+    rng = random.Random(seed)
+    lines = [f'{rng.getrandbits(160):040X}:{rng.randint(1, 10 ** 5)}\n' for _ in range(size)]
+    lines.extend(sha1_line(password, rng.randint(1, 10 ** 5)) for password in known_passwords)
+    if shuffled:
+        rng.shuffle(lines)
+    else:
+        lines.sort()
+    with open(path, 'w', encoding='ascii') as f:
+        f.writelines(lines)
+
+
+def timed(func) -> tuple:
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def run(corpus_size: int, vault_size: int, changes: int, workdir: str) -> int:
+    from utils.breach_check import BreachChecker, BreachCorpus, build_corpus
+    from utils.data_manager import DataManager
+
+    data_manager = DataManager()
+    data_manager.register_user(USERNAME, PASSWORD)
+    data_manager.login_user(USERNAME, PASSWORD)
+    passwords = write_vault(data_manager, vault_size, DEFAULT_SEED)
+    known = [data['password'] for data in passwords[::10]]
+
+    results = {}
+    corpus_path = os.path.join(workdir, 'corpus.bin')
+    for label, shuffled in (('已排序', False), ('乱序', True)):
+        text_path = os.path.join(workdir, f'corpus-{label}.txt')
+        write_corpus_text(text_path, corpus_size, known, shuffled, DEFAULT_SEED)
+        results[f'构建（{label}输入）'], count = timed(lambda: build_corpus(text_path, corpus_path))
+        os.remove(text_path)
+
+    rng = random.Random(DEFAULT_SEED)
+    digests = [rng.getrandbits(160).to_bytes(20, 'big') for _ in range(LOOKUPS)]
+    with BreachCorpus(corpus_path) as corpus:
+        tracemalloc.start()
+        ms, _ = timed(lambda: [corpus.lookup_digest(digest) for digest in digests])
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    results['单次查找（微秒）'] = ms * 1000 / LOOKUPS
+
+    checker = BreachChecker(data_manager)
+    results['首次整库检查'], first = timed(lambda: checker.run(corpus_path))
+    results['无变化再次检查'], _ = timed(lambda: checker.run(corpus_path))
+    for entry_id in range(1, min(changes, vault_size) + 1):
+        data_manager.update_password(entry_id, dict(passwords[entry_id - 1], notes='changed'), force_update=True)
+    results[f'修改 {changes} 条后检查'], changed = timed(lambda: checker.run(corpus_path))
+
+    breached = sum(1 for value in changed['counts'].values() if value)
+    print(f'\n泄露库 {count} 条（{os.path.getsize(corpus_path) / 2 ** 20:.0f} MB），密码库 {vault_size} 条')
+    for name, value in results.items():
+        print(f'  {name:<20}{value:>12.1f}')
+    print(f'  {LOOKUPS} 次查找期间 Python 内存峰值 {peak / 1024:.0f} KB')
+    print(f'  首次检查查找 {first["checked"]} 次，修改后查找 {changed["checked"]} 次，'
+          f'{breached} 条出现在泄露库中')
+    # 生成的密码长度 8 到 32 位且随机，重复的概率可以忽略
+    return 0 if breached == len(known) else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description='离线泄露检查基准测试')
+    parser.add_argument('--corpus-size', type=int, default=2000000)
+    parser.add_argument('--vault-size', type=int, default=10000)
+    parser.add_argument('--changes', type=int, default=10, help='两次检查之间修改的条目数')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.environ['HOME'] = workdir
+        os.environ['USERPROFILE'] = workdir
+        return run(args.corpus_size, args.vault_size, args.changes, workdir)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
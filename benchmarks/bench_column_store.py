@@ -0,0 +1,110 @@
+"""列式筛选基准测试
+
+比较主窗口筛选的两种实现：逐条遍历记录（SearchIndex + 分类列表推导）与
+列式索引 ColumnStore（纯 Python 批量操作；安装了 numpy 时同时测试 numpy 版本）。
+每个查询都校验各实现的结果完全一致。
+
+用法：
+    python benchmarks/bench_column_store.py [--size 100000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vault_generator import generate_passwords  # noqa: E402
+from utils.category_facets import normalize_category  # noqa: E402
+from utils.column_store import ColumnStore, numpy_available  # noqa: E402
+from utils.password_entry import PasswordEntry  # noqa: E402
+from utils.search_index import SearchIndex  # noqa: E402
+
+# (搜索文本, 分类)：分别覆盖只筛分类、高/低选择性的原文与拼音查询、组合条件
+QUERIES = [
+    ('', '工作'),
+    ('', '未分类'),
+    ('zfb', ''),
+    ('zhifubao', ''),
+    ('支付宝1', ''),
+    ('example.com', ''),
+    ('user12', ''),
+    ('a', ''),
+    ('github', '工作'),
+    ('不存在的内容', ''),
+]
+
+
+class RowScanFilter:
+    """改动前的筛选方式：逐条检查分类，再逐条查询搜索索引"""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.index = SearchIndex()
+        self.index.sync(entries)
+
+    def filter(self, query, category):
+        result = self.entries
+        if category:
+            result = [entry for entry in result if normalize_category(entry.category) == category]
+        if query:
+            result = self.index.search(query, result)
+        return [entry.id for entry in result]
+
+
+def timed(func, repeat: int) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) * 1000 / repeat, result
+
+
+def build_store(entries, use_numpy):
+    store = ColumnStore(use_numpy=use_numpy)
+    for entry in entries:
+        store.add(entry)
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description='列式筛选基准测试')
+    parser.add_argument('--size', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    entries = [PasswordEntry.from_dict(dict(data, id=i + 1), exclude=('password',))
+               for i, data in enumerate(generate_passwords(args.size))]
+
+    build_ms, baseline = timed(lambda: RowScanFilter(entries), 1)
+    implementations = [('逐条遍历', baseline, build_ms)]
+    variants = [('列式', False)] + ([('列式+numpy', True)] if numpy_available() else [])
+    for name, use_numpy in variants:
+        build_ms, store = timed(lambda: build_store(entries, use_numpy), 1)
+        store.filter('warm-up')  # 首次筛选时拼接文本
+        implementations.append((name, store, build_ms))
+
+    names = [name for name, *_ in implementations]
+    print(f'条目数: {args.size}（numpy: {"可用" if numpy_available() else "未安装"}）')
+    print(f'  {"查询":<24}{"结果数":>8}' + ''.join(f'{name:>14}' for name in names) + '  (ms)')
+    print(f'  {"构建":<24}{"":>8}' + ''.join(f'{build_ms:>14.1f}' for _, _, build_ms in implementations))
+
+    mismatches = 0
+    for query, category in QUERIES:
+        timings = []
+        expected = None
+        for name, implementation, _ in implementations:
+            ms, result = timed(lambda: implementation.filter(query, category), args.repeat)
+            if expected is None:
+                expected = result
+            elif result != expected:
+                mismatches += 1
+                print(f'  结果不一致: {name} {query!r} {category!r}', file=sys.stderr)
+            timings.append(ms)
+        label = f'{query or "-"} / {category or "全部"}'
+        print(f'  {label:<24}{len(expected):>8}' + ''.join(f'{ms:>14.2f}' for ms in timings))
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
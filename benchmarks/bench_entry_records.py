@@ -0,0 +1,89 @@
+"""记录表示方式基准测试：dict 与 PasswordEntry
+
+按解密路径（JSON 解析 -> 去除敏感字段）构造记录，比较每条记录的内存占用
+（tracemalloc）以及分类筛选、取搜索字段等热点循环的耗时。
+
+用法：
+    python benchmarks/bench_entry_records.py [--size 100000]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from operator import attrgetter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vault_generator import generate_passwords  # noqa: E402
+from utils.category_facets import normalize_category  # noqa: E402
+from utils.password_entry import PasswordEntry  # noqa: E402
+
+SEARCH_FIELDS = ('website', 'username', 'notes', 'category')
+
+
+def as_dict(data: dict) -> dict:
+    """改动前的表示：去除敏感字段后的 dict 副本"""
+    return {key: value for key, value in data.items() if key != 'password'}
+
+
+def as_entry(data: dict) -> PasswordEntry:
+    return PasswordEntry.from_dict(data, exclude=('password',))
+
+
+def build(payloads, convert) -> tuple[list, float]:
+    """解析并转换全部记录，返回（记录列表, 每条记录字节数）"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = []
+    for i, payload in enumerate(payloads):
+        data = json.loads(payload)
+        data['id'] = i + 1
+        records.append(convert(data))
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return records, size / len(payloads)
+
+
+def timed(func, repeat: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def run(size: int):
+    payloads = [json.dumps(dict(data, id=0), ensure_ascii=False) for data in generate_passwords(size)]
+
+    dicts, dict_bytes = build(payloads, as_dict)
+    entries, entry_bytes = build(payloads, as_entry)
+
+    fields = attrgetter(*SEARCH_FIELDS)
+    results = [
+        ('每条记录字节数', dict_bytes, entry_bytes, 'B'),
+        ('分类筛选', timed(lambda: [r for r in dicts if normalize_category(r.get('category')) == '工作']),
+         timed(lambda: [r for r in entries if normalize_category(r.category) == '工作']), 'ms'),
+        ('取搜索字段', timed(lambda: [tuple(r.get(f, '') or '' for f in SEARCH_FIELDS) for r in dicts]),
+         timed(lambda: [fields(r) for r in entries]), 'ms'),
+        ('按 ID 取值', timed(lambda: [r['id'] for r in dicts]), timed(lambda: [r.id for r in entries]), 'ms'),
+    ]
+
+    print(f'\n条目数: {size}')
+    print(f'  {"项目":<12}{"dict":>12}{"PasswordEntry":>16}{"变化":>10}')
+    for name, before, after, unit in results:
+        print(f'  {name:<12}{before:>10.1f}{unit:<2}{after:>14.1f}{unit:<2}{(after - before) / before:>+9.0%}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='记录表示方式基准测试')
+    parser.add_argument('--size', type=int, default=100000)
+    args = parser.parse_args()
+    run(args.size)
+
+
+if __name__ == '__main__':
+    main()
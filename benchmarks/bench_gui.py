@@ -0,0 +1,220 @@
+"""界面基准测试（无需显示器）
+
+在 offscreen 平台上对合成密码库回放脚本化的会话：登录、逐字输入搜索词、
+切换分类、添加、编辑、删除。每个动作的耗时包含信号处理与一次同步重绘，
+输出各动作耗时的百分位数以及主窗口首次绘制、首屏记录、全部加载的时间。
+
+模态对话框与消息框由脚本替换为立即返回的替身，只测量界面本身的处理。
+
+用法：
+    python benchmarks/bench_gui.py [--sizes 1000 10000] [--query zhifubao] [--output gui.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vault_generator import DEFAULT_SEED, write_vault  # noqa: E402
+
+USERNAME = 'bench'
+PASSWORD = 'benchmark'
+EDITS = 20
+
+
+class ScriptedDialog:
+    """密码对话框替身：直接返回预设数据"""
+
+    next_data = None
+
+    def __init__(self, password_data=None, parent=None):
+        self.password_data = password_data
+
+    def exec(self):
+        from PySide6.QtWidgets import QDialog
+        return QDialog.Accepted
+
+    def get_data(self):
+        return dict(ScriptedDialog.next_data)
+
+
+def install_scripted_dialogs():
+    from PySide6.QtWidgets import QMessageBox
+    import ui.handlers.password_handler as password_handler
+
+    password_handler.PasswordDialog = ScriptedDialog
+    QMessageBox.information = staticmethod(lambda *args, **kwargs: QMessageBox.Ok)
+    QMessageBox.critical = staticmethod(lambda *args, **kwargs: QMessageBox.Ok)
+    QMessageBox.warning = staticmethod(lambda *args, **kwargs: QMessageBox.Ok)
+    QMessageBox.question = staticmethod(lambda *args, **kwargs: QMessageBox.Yes)
+
+
+def wait_for(signal, timeout_ms: int = 60000):
+    """运行事件循环直到信号发出"""
+    from PySide6.QtCore import QEventLoop, QTimer
+
+    loop = QEventLoop()
+    signal.connect(loop.quit)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    signal.disconnect(loop.quit)
+
+
+def settle(window):
+    """处理挂起的事件并同步重绘表格"""
+    from PySide6.QtWidgets import QApplication
+
+    QApplication.processEvents()
+    window.password_table.viewport().repaint()
+
+
+def summarize(samples: list) -> dict:
+    samples = sorted(samples)
+
+    def pct(p):
+        return samples[min(len(samples) - 1, int(round(p * (len(samples) - 1))))]
+
+    return {'count': len(samples), 'p50_ms': statistics.median(samples), 'p90_ms': pct(0.9),
+            'p99_ms': pct(0.99), 'max_ms': samples[-1]}
+
+
+def run_session(size: int, query: str, seed: int) -> dict:
+    from PySide6.QtCore import QObject, QEvent
+    from utils.data_manager import DataManager
+    from ui.main_window import MainWindow
+
+    data_manager = DataManager()
+    data_manager.register_user(USERNAME, PASSWORD)
+    data_manager.login_user(USERNAME, PASSWORD)
+    passwords = write_vault(data_manager, size, seed)
+
+    timings = {}
+    samples = {}
+
+    def timed(action, func, *args):
+        start = time.perf_counter()
+        func(*args)
+        samples.setdefault(action, []).append((time.perf_counter() - start) * 1000)
+
+    # 登录与主窗口
+    data_manager = DataManager()
+    start = time.perf_counter()
+    data_manager.login_user(USERNAME, PASSWORD)
+    timings['login_user_ms'] = (time.perf_counter() - start) * 1000
+
+    first_paint = []
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Paint and not first_paint:
+                first_paint.append(time.perf_counter())
+            return False
+
+    start = time.perf_counter()
+    window = MainWindow(data_manager)
+    timings['main_window_init_ms'] = (time.perf_counter() - start) * 1000
+    watcher = PaintWatcher()
+    window.installEventFilter(watcher)
+    window.show()
+    wait_for(window.passwords_loaded)
+    settle(window)
+    timings['first_paint_ms'] = (first_paint[0] - start) * 1000 if first_paint else None
+    timings['first_rows_ms'] = (window.load_started_at - start) * 1000 + window.load_metrics['first_row_ms']
+    timings['full_load_ms'] = (window.load_started_at - start) * 1000 + window.load_metrics['total_ms']
+
+    # 逐字输入搜索词，再逐字删除
+    for i in range(1, len(query) + 1):
+        timed('type_query', lambda text: (window.toolbar.search_edit.setText(text), settle(window)), query[:i])
+    for i in range(len(query) - 1, -1, -1):
+        timed('erase_query', lambda text: (window.toolbar.search_edit.setText(text), settle(window)), query[:i])
+
+    # 切换分类
+    combo = window.toolbar.category_combo
+    for _ in range(2):
+        for index in list(range(1, combo.count())) + [0]:
+            timed('switch_category', lambda i: (combo.setCurrentIndex(i), settle(window)), index)
+
+    # 直接调用的热点
+    entries = list(window.entries.values())
+    for _ in range(5):
+        timed('table_update_data', lambda: (window.password_table.update_data(entries), settle(window)))
+        timed('toolbar_update_categories', window.toolbar.update_categories,
+              window.category_facets.counts(), window.category_facets.total)
+
+    # 添加、编辑、删除（经由处理器与后台存储服务）
+    handler = window.password_handler
+    added = []
+    for i in range(EDITS):
+        ScriptedDialog.next_data = dict(passwords[i % len(passwords)], website=f'基准新增{i}')
+        start = time.perf_counter()
+        handler.add_password()
+        wait_for(handler.entry_added)
+        settle(window)
+        samples.setdefault('add', []).append((time.perf_counter() - start) * 1000)
+        added.append(max(window.entries))
+
+    for password_id in added:
+        ScriptedDialog.next_data = dict(passwords[0], website=f'基准编辑{password_id}')
+        start = time.perf_counter()
+        handler.edit_password(window.entries[password_id])
+        wait_for(handler.entry_updated)
+        settle(window)
+        samples.setdefault('edit', []).append((time.perf_counter() - start) * 1000)
+
+    for password_id in added:
+        start = time.perf_counter()
+        handler.delete_password(window.entries[password_id])
+        wait_for(handler.entry_removed)
+        settle(window)
+        samples.setdefault('delete', []).append((time.perf_counter() - start) * 1000)
+
+    window.close()
+    window.deleteLater()
+    return {'timings': timings, 'actions': {action: summarize(values) for action, values in samples.items()}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='界面基准测试（offscreen）')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--query', default='zhifubao', help='逐字输入的搜索词')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--output', help='结果 JSON 文件')
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        from PySide6.QtWidgets import QApplication
+        from utils.styles import StyleManager
+
+        app = QApplication.instance() or QApplication(sys.argv)
+        install_scripted_dialogs()
+
+        for size in args.sizes:
+            home = os.path.join(workdir, str(size))
+            os.makedirs(home)
+            os.environ['HOME'] = home
+            os.environ['USERPROFILE'] = home
+            StyleManager.apply_theme(StyleManager.DEFAULT_THEME, app, save=False)
+
+            result = results[str(size)] = run_session(size, args.query, args.seed)
+            print(f'\n条目数: {size}')
+            for name, value in result['timings'].items():
+                print(f'  {name:<24} {value:10.1f} ms' if value is not None else f'  {name:<24}          -')
+            print(f'  {"动作":<22}{"次数":>6}{"p50":>10}{"p90":>10}{"p99":>10}{"max":>10}  (ms)')
+            for action, stats in result['actions'].items():
+                print(f'  {action:<24}{stats["count"]:>6}{stats["p50_ms"]:>10.1f}{stats["p90_ms"]:>10.1f}'
+                      f'{stats["p99_ms"]:>10.1f}{stats["max_ms"]:>10.1f}')
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f'\n结果已写入 {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""历史版本基准测试
+
+对确定性生成的密码库中的部分条目反复修改，测量：每个历史版本使 users.json 增加的字节数
+（差异保存，与整条记录加密保存的估算对照）、保留历史对单次更新耗时的影响，
+以及恢复不同深度的历史版本的耗时。修改分两类：只改密码，以及在长备注末尾追加内容。
+
+用法：
+    python benchmarks/bench_history.py [--size 1000] [--edited 100] [--edits 20]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vault_generator import DEFAULT_SEED, make_notes, write_vault  # noqa: E402
+
+USERNAME = 'bench'
+PASSWORD = 'benchmark'
+# 历史记录在 users.json 中除密文外的部分：{"data": "...", "saved_at": "..."} 及缩进
+RECORD_OVERHEAD = 80
+
+
+def edit(password_data: dict, kind: str, step: int, rng: random.Random) -> dict:
+    if kind == 'password':
+        return dict(password_data, password=f'{rng.getrandbits(64):016x}')
+    return dict(password_data, notes=f'{password_data["notes"]}；第 {step} 次补充')
+
+
+def run_edits(data_manager, passwords: list, ids: list, kind: str, edits: int, rng) -> dict:
+    """对 ids 中的条目各修改 edits 次，返回总耗时、文件增长与整条保存的估算"""
+    from utils.crypto import CryptoManager
+
+    size_before = data_manager.users_file.stat().st_size
+    full_copy = 0
+    elapsed = 0.0
+    for entry_id in ids:
+        current = passwords[entry_id - 1]
+        for step in range(edits):
+            updated = edit(current, kind, step, rng)
+            start = time.perf_counter()
+            data_manager.update_password(entry_id, updated, force_update=True)
+            elapsed += time.perf_counter() - start
+            full_copy += len(CryptoManager.encrypt_data(json.dumps(current, ensure_ascii=False),
+                                                        data_manager.encryption_key)) + RECORD_OVERHEAD
+            current = updated
+        passwords[entry_id - 1] = current
+    versions = len(ids) * edits
+    return {
+        'update_ms': elapsed * 1000 / versions,
+        'delta_bytes': (data_manager.users_file.stat().st_size - size_before) / versions,
+        'full_bytes': full_copy / versions,
+    }
+
+
+def run(size: int, edited: int, edits: int) -> int:
+    from utils.data_manager import DataManager
+
+    data_manager = DataManager()
+    data_manager.register_user(USERNAME, PASSWORD)
+    data_manager.login_user(USERNAME, PASSWORD)
+    passwords = write_vault(data_manager, size, DEFAULT_SEED)
+    rng = random.Random(DEFAULT_SEED)
+    for data in passwords:
+        data['notes'] = data['notes'] or make_notes(rng)
+    ids = list(range(1, min(edited, size) + 1))
+
+    data_manager.set_history_limit(0)
+    baseline = run_edits(data_manager, passwords, ids, 'password', 1, rng)
+    print(f'\n条目数 {size}，修改其中 {len(ids)} 条，每条 {edits} 次；不保留历史时单次更新 '
+          f'{baseline["update_ms"]:.2f} ms')
+    print(f'  {"修改类型":<12}{"更新耗时 ms":>12}{"差异保存 B/版本":>18}{"整条保存 B/版本":>18}')
+    for kind, label in (('password', '只改密码'), ('notes', '追加备注')):
+        # 每类修改前清空历史，文件增长中不含清理掉的旧版本
+        data_manager.set_history_limit(0)
+        data_manager.set_history_limit(edits)
+        result = run_edits(data_manager, passwords, ids, kind, edits, rng)
+        print(f'  {label:<12}{result["update_ms"]:>12.2f}{result["delta_bytes"]:>18.0f}{result["full_bytes"]:>18.0f}')
+
+    entry_id = ids[0]
+    expected = data_manager.get_password_history(entry_id, include_secrets=True)
+    for depth in sorted({1, edits // 2, edits}):
+        start = time.perf_counter()
+        success, message, _ = data_manager.restore_password_version(entry_id, depth)
+        ms = (time.perf_counter() - start) * 1000
+        secret = data_manager.get_secret(entry_id)
+        if not success or secret != expected[depth - 1]['data']['password']:
+            print(f'恢复第 {depth} 个版本失败：{message}')
+            return 1
+        print(f'  恢复第 {depth:>3} 个版本 {ms:8.2f} ms')
+        # 恢复后被替换的内容成为第 1 个版本，重新取历史作为下一次比较的基准
+        expected = data_manager.get_password_history(entry_id, include_secrets=True)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='历史版本基准测试')
+    parser.add_argument('--size', type=int, default=1000)
+    parser.add_argument('--edited', type=int, default=100, help='被修改的条目数')
+    parser.add_argument('--edits', type=int, default=20, help='每个条目的修改次数（同时作为保留数）')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.environ['HOME'] = workdir
+        os.environ['USERPROFILE'] = workdir
+        return run(args.size, args.edited, args.edits)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
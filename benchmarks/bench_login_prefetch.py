@@ -0,0 +1,100 @@
+"""登录到主窗口的延迟基准测试
+
+对比登录框打开时是否预读密码库文件：模拟用户输入密码的间隔后，
+统计从提交登录到主窗口显示首屏记录、以及全部记录加载完成的耗时。
+
+用法：
+    python benchmarks/bench_login_prefetch.py [--sizes 1000 10000 50000] [--typing 1.0] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def build_vault(size: int, username: str, password: str):
+    """生成测试密码库（直接写入加密记录）"""
+    from utils.crypto import CryptoManager
+    from utils.data_manager import DataManager
+
+    data_manager = DataManager()
+    data_manager.register_user(username, password)
+    data_manager.login_user(username, password)
+    users = data_manager.load_users()
+    users[username]['passwords'] = [{
+        'id': i + 1,
+        'data': CryptoManager.encrypt_data(json.dumps({
+            'website': f'站点{i}', 'username': f'user{i}@example.com', 'password': f'pw{i:08d}',
+            'category': ['工作', '个人', '银行', ''][i % 4], 'url': f'https://site{i}.example.com',
+            'notes': '备注' * (i % 10),
+        }, ensure_ascii=False), data_manager.encryption_key),
+        'created_at': '2024-01-01T00:00:00',
+    } for i in range(size)]
+    data_manager.save_users(users)
+
+
+def login_to_main_window(username: str, password: str, prefetch: bool, typing: float) -> tuple[float, float]:
+    """模拟一次登录，返回（首屏耗时, 全部加载耗时），单位毫秒"""
+    from PySide6.QtCore import QEventLoop
+    from utils.data_manager import DataManager
+    from ui.main_window import MainWindow
+
+    data_manager = DataManager()
+    if prefetch:
+        data_manager.prefetch()
+    time.sleep(typing)  # 用户输入密码
+
+    start = time.perf_counter()
+    if not data_manager.login_user(username, password):
+        raise RuntimeError('登录失败')
+    window = MainWindow(data_manager)
+    window.show()
+
+    loop = QEventLoop()
+    window.passwords_loaded.connect(lambda metrics: loop.quit())
+    loop.exec()
+    total_ms = (time.perf_counter() - start) * 1000
+    first_row_ms = (window.load_started_at - start) * 1000 + window.load_metrics['first_row_ms']
+
+    window.close()
+    window.deleteLater()
+    return first_row_ms, total_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description='登录到主窗口的延迟基准测试')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--typing', type=float, default=1.0, help='模拟输入密码的秒数')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ['HOME'] = home
+        os.environ['USERPROFILE'] = home
+
+        from PySide6.QtWidgets import QApplication
+        app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+
+        for size in args.sizes:
+            username = f'bench{size}'
+            build_vault(size, username, 'benchmark')
+            results = {False: [], True: []}
+            for _ in range(args.repeat):
+                for prefetch in (False, True):
+                    results[prefetch].append(login_to_main_window(username, 'benchmark', prefetch, args.typing))
+
+            print(f'\n条目数: {size}')
+            for prefetch, label in ((False, '无预读'), (True, '预读')):
+                first_row = statistics.median(r[0] for r in results[prefetch])
+                total = statistics.median(r[1] for r in results[prefetch])
+                print(f'  {label:<6} 首屏 {first_row:8.1f} ms  全部 {total:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""内存占用基准测试
+
+在 offscreen 平台上按界面的真实路径（登录 -> 主窗口后台加载 -> 搜索 -> 导入）载入
+合成密码库，用 tracemalloc 在各阶段拍摄快照（见 utils/memory_profile.py），
+输出各子系统每条记录的字节数。加载完成后每条记录的总增量超过 --budget 字节时
+退出码为 1，可用于发现内存回退。
+
+用法：
+    python benchmarks/bench_memory.py [--size 10000] [--budget 3000] [--query zhifubao]
+    python benchmarks/bench_memory.py --size 100000
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vault_generator import DEFAULT_SEED, write_import_file, write_vault  # noqa: E402
+
+USERNAME = 'bench'
+PASSWORD = 'benchmark'
+DEFAULT_BUDGET = 3000  # 加载完成后每条记录的字节数上限
+
+
+def wait_for(signal, timeout_ms: int = 600000):
+    """运行事件循环直到信号发出"""
+    from PySide6.QtCore import QEventLoop, QTimer
+
+    loop = QEventLoop()
+    signal.connect(loop.quit)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    signal.disconnect(loop.quit)
+
+
+def checkpoint(profiler, name, window=None):
+    from PySide6.QtWidgets import QApplication
+
+    QApplication.processEvents()
+    gc.collect()
+    profiler.checkpoint(name, len(window.entries) if window is not None else 0)
+
+
+def run(size: int, query: str, seed: int, workdir: str):
+    from utils.data_manager import DataManager
+    from utils.memory_profile import MemoryProfiler
+    from ui.main_window import MainWindow
+
+    data_manager = DataManager()
+    data_manager.register_user(USERNAME, PASSWORD)
+    data_manager.login_user(USERNAME, PASSWORD)
+    write_vault(data_manager, size, seed)
+    import_path = os.path.join(workdir, 'import.sbk')
+    write_import_file(data_manager, import_path, max(1, size // 10), seed + 1)
+
+    # 生成数据之后才开始追踪，基线不含生成器本身
+    profiler = MemoryProfiler(enabled=True)
+    data_manager = DataManager()
+    gc.collect()
+    profiler.start()
+    data_manager.login_user(USERNAME, PASSWORD)
+    checkpoint(profiler, '登录后')
+
+    window = MainWindow(data_manager)
+    window.show()
+    wait_for(window.passwords_loaded)
+    checkpoint(profiler, '加载完成', window)
+
+    window.toolbar.search_edit.setText(query)
+    checkpoint(profiler, '搜索后', window)
+    window.toolbar.search_edit.clear()
+
+    # 直接调用存储层导入，再与界面一样重新加载
+    data_manager.import_passwords(import_path)
+    window.load_passwords()
+    wait_for(window.passwords_loaded)
+    checkpoint(profiler, '导入后', window)
+
+    profiler.stop()
+    profiler.report(sys.stdout)
+    window.close()
+    return profiler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='内存占用基准测试')
+    parser.add_argument('--size', type=int, default=10000)
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET, help='加载完成后每条记录的字节数上限')
+    parser.add_argument('--query', default='zhifubao', help='搜索阶段使用的搜索词')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.environ['HOME'] = workdir
+        os.environ['USERPROFILE'] = workdir
+        from PySide6.QtWidgets import QApplication
+
+        app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+        profiler = run(args.size, args.query, args.seed, workdir)
+
+    per_entry = sum(profiler.per_entry('加载完成').values())
+    print(f'\n加载完成后每条记录 {per_entry:.0f} 字节（预算 {args.budget:.0f} 字节）')
+    if per_entry > args.budget:
+        print('超出内存预算', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
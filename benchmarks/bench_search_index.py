@@ -0,0 +1,77 @@
+"""搜索索引维护开销基准测试
+
+用法：
+    python benchmarks/bench_search_index.py [--sizes 1000 10000 100000]
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.password_entry import PasswordEntry
+from utils.search_index import SearchIndex, pinyin_available, to_pinyin_keys
+
+
+NAMES = ['支付宝', '微信', '淘宝', '京东', '百度网盘', 'QQ音乐', '网易云音乐', '招商银行',
+         '工商银行', '中国移动', 'GitHub', 'Gmail', '阿里云', '腾讯云', '钉钉', '飞书']
+CATEGORIES = ['工作', '本地', '个人', '全链路', '']
+
+
+def make_entries(count: int, seed: int = 0) -> list:
+    """生成测试条目"""
+    rng = random.Random(seed)
+    return [PasswordEntry(
+        id=i + 1,
+        website=f'{rng.choice(NAMES)}{i}',
+        username=f'user{rng.randrange(10 ** 6)}@example.com',
+        category=rng.choice(CATEGORIES),
+        notes=rng.choice(['', '备用账号', '公司内网', 'shared account']),
+    ) for i in range(count)]
+
+
+def timed(func, repeat: int = 1) -> float:
+    """返回单次调用的平均耗时（毫秒）"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def run(size: int):
+    entries = make_entries(size)
+    to_pinyin_keys.cache_clear()
+
+    index = SearchIndex()
+    results = {'全量构建': timed(lambda: index.sync(entries))}
+    results['无变化同步'] = timed(lambda: index.sync(entries))
+
+    changed = entries[size // 2].replace(website='招商银行信用卡')
+    entries[size // 2] = changed
+    results['单条变更后同步'] = timed(lambda: index.sync(entries))
+    counter = itertools.count()
+    results['单条增量更新'] = timed(lambda: index.update(changed.replace(notes=f'已更新{next(counter)}')), repeat=100)
+    results['拼音查询'] = timed(lambda: index.search('zfb', entries), repeat=5)
+    results['原文查询'] = timed(lambda: index.search('支付', entries), repeat=5)
+
+    print(f'\n条目数: {size}')
+    for name, ms in results.items():
+        print(f'  {name:<10} {ms:10.3f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='搜索索引基准测试')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    if not pinyin_available():
+        print('警告: 未安装 pypinyin，仅测试原文索引')
+    for size in args.sizes:
+        run(size)
+
+
+if __name__ == '__main__':
+    main()
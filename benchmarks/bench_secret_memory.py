@@ -0,0 +1,113 @@
+"""常驻明文内存基准测试
+
+按界面的加载路径（不含敏感字段解密 -> 表格模型）载入大型密码库，
+从表格模型与访问器出发统计可达的密码明文，验证常驻明文不随条目数增长，
+并且查看过的明文在访问器过期后被丢弃。
+
+用法：
+    python benchmarks/bench_secret_memory.py [--sizes 1000 10000 50000]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MARKER = 'SBSECRET-'
+
+
+def resident_plaintext(*roots) -> tuple[int, int]:
+    """从给定对象出发遍历引用，统计可达的明文字符串，返回（条数, 字节数）"""
+    seen = set()
+    stack = list(roots)
+    count = size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if type(obj) is str:
+            if obj.startswith(MARKER) and obj != MARKER:
+                count += 1
+                size += len(obj.encode())
+        elif isinstance(obj, (dict, list, tuple, set)) or hasattr(obj, '__dict__'):
+            stack.extend(gc.get_referents(obj))
+    return count, size
+
+
+def build_vault(data_manager, size: int):
+    """直接写入加密记录，生成测试密码库"""
+    from utils.crypto import CryptoManager
+
+    users = data_manager.load_users()
+    users[data_manager.current_user]['passwords'] = [{
+        'id': i + 1,
+        'data': CryptoManager.encrypt_data(json.dumps({
+            'website': f'站点{i}', 'username': f'user{i}', 'password': f'{MARKER}{i:08d}',
+            'category': '个人', 'url': '', 'notes': '',
+        }, ensure_ascii=False), data_manager.encryption_key),
+    } for i in range(size)]
+    data_manager.save_users(users)
+
+
+def run(size: int):
+    from utils.data_manager import DataManager
+    from utils.secret_access import SecretAccessor
+    from ui.components.password_table_model import PasswordTableModel
+
+    data_manager = DataManager()
+    data_manager.register_user(f'bench{size}', 'benchmark')
+    data_manager.login_user(f'bench{size}', 'benchmark')
+    build_vault(data_manager, size)
+
+    now = [0.0]
+    accessor = SecretAccessor(ttl=30, clock=lambda: now[0])
+    model = PasswordTableModel()
+
+    start = time.perf_counter()
+    entries = [data_manager.decrypt_password_item(item, include_secrets=False)
+               for item in data_manager.get_encrypted_passwords()]
+    model.set_entries(entries)
+    load_ms = (time.perf_counter() - start) * 1000
+    after_load = resident_plaintext(model, accessor, entries)
+
+    # 与界面相同：缓存未命中时解密（界面中在存储线程执行），再放入访问器
+    for entry_id in range(1, 11):
+        secret = accessor.cached(entry_id)
+        if secret is None:
+            secret = data_manager.get_secret(entry_id)
+            accessor.put(entry_id, secret)
+        model.reveal(entry_id, secret)
+    after_reveal = resident_plaintext(model, accessor, entries)
+
+    now[0] += accessor.ttl + 1
+    accessor.purge()
+    for entry_id in model.revealed_ids():
+        if entry_id not in accessor:
+            model.conceal(entry_id)
+    after_expire = resident_plaintext(model, accessor, entries)
+
+    print(f'\n条目数: {size}（加载 {load_ms:.0f} ms）')
+    for name, (count, nbytes) in [('加载后', after_load), ('查看10条后', after_reveal), ('过期后', after_expire)]:
+        print(f'  {name:<8} 常驻明文 {count:6d} 条 {nbytes:8d} 字节')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='常驻明文内存基准测试')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ['HOME'] = home
+        os.environ['USERPROFILE'] = home
+        for size in args.sizes:
+            run(size)
+
+
+if __name__ == '__main__':
+    main()
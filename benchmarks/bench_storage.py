@@ -0,0 +1,175 @@
+"""存储与加密层基准测试
+
+用确定性生成的密码库（见 vault_generator.py）测量 DataManager 各操作的耗时，
+结果可写入 JSON，并可与保存的基线比较、标记性能回退。
+
+用法：
+    python benchmarks/bench_storage.py [--sizes 1000 10000] [--repeat 3] [--output result.json]
+    python benchmarks/bench_storage.py --sizes 1000 10000 100000 --output baseline.json
+    python benchmarks/bench_storage.py --baseline baseline.json          # 运行并与基线比较
+    python benchmarks/bench_storage.py --compare result.json baseline.json   # 只比较两个结果文件
+
+比较时中位数比基线慢 --threshold（默认 15%）且差值超过 --min-delta 毫秒的项目
+标记为回退，存在回退时退出码为 1。
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vault_generator import DEFAULT_SEED, write_import_file, write_vault  # noqa: E402
+
+USERNAME = 'bench'
+PASSWORD = 'benchmark'
+IMPORT_SIZE = 100
+
+OPERATIONS = ('login_user', 'get_user_passwords', 'check_password_exists', 'save_password',
+              'update_password', 'delete_password', 'import_passwords', 'export_passwords')
+
+
+def measure(func, repeat: int, setup=None, teardown=None) -> dict:
+    """重复执行 func，setup/teardown 不计时"""
+    runs = []
+    for _ in range(repeat):
+        context = setup() if setup else None
+        start = time.perf_counter()
+        func(context)
+        runs.append((time.perf_counter() - start) * 1000)
+        if teardown:
+            teardown(context)
+    return {'median_ms': statistics.median(runs), 'min_ms': min(runs), 'runs_ms': runs}
+
+
+def run_size(size: int, repeat: int, seed: int, workdir: str) -> dict:
+    home = os.path.join(workdir, str(size))
+    os.makedirs(home)
+    os.environ['HOME'] = home
+    os.environ['USERPROFILE'] = home
+    from utils.data_manager import DataManager
+
+    data_manager = DataManager()
+    data_manager.register_user(USERNAME, PASSWORD)
+    data_manager.login_user(USERNAME, PASSWORD)
+    passwords = write_vault(data_manager, size, seed)
+    data_manager.get_encrypted_passwords()
+
+    results = {}
+    results['login_user'] = measure(
+        lambda _: DataManager().login_user(USERNAME, PASSWORD), repeat)
+    results['get_user_passwords'] = measure(
+        lambda _: data_manager.get_user_passwords(), repeat)
+    results['check_password_exists'] = measure(
+        lambda _: data_manager.check_password_exists('不存在的网站', 'nobody'), repeat)
+
+    counter = iter(range(10 ** 9))
+    new_entry = lambda: dict(passwords[0], website=f'新增网站{next(counter)}')  # noqa: E731
+    results['save_password'] = measure(
+        lambda _: data_manager.save_password(new_entry()), repeat,
+        teardown=lambda _: data_manager.delete_password(max(data_manager._ciphertexts)))
+    results['update_password'] = measure(
+        lambda _: data_manager.update_password(1, dict(passwords[0], notes=f'更新{next(counter)}')), repeat)
+    results['delete_password'] = measure(
+        lambda password_id: data_manager.delete_password(password_id), repeat,
+        setup=lambda: data_manager.save_password(new_entry(), force_save=True)[2]['id'])
+
+    export_path = os.path.join(home, 'export.sbk')
+    results['export_passwords'] = measure(
+        lambda _: data_manager.export_passwords(export_path), repeat)
+
+    import_path = os.path.join(home, 'import.sbk')
+    write_import_file(data_manager, import_path, IMPORT_SIZE, seed + 1)
+    snapshot = os.path.join(home, 'users.snapshot.json')
+    shutil.copyfile(data_manager.users_file, snapshot)
+
+    def restore(_):
+        shutil.copyfile(snapshot, data_manager.users_file)
+        data_manager.get_encrypted_passwords()
+
+    results['import_passwords'] = measure(
+        lambda _: data_manager.import_passwords(import_path, merge_mode=True), repeat, teardown=restore)
+
+    return {op: results[op] for op in OPERATIONS}
+
+
+def compare(current: dict, baseline: dict, threshold: float, min_delta: float) -> list:
+    """比较两份结果，返回回退项 [(条目数, 操作, 当前, 基线)]"""
+    regressions = []
+    print(f'\n与基线比较（阈值 +{threshold:.0%}，最小差值 {min_delta} ms）')
+    print(f'  {"条目数":>8}  {"操作":<24}{"基线 ms":>12}{"当前 ms":>12}{"变化":>9}')
+    for size, operations in current['results'].items():
+        base_operations = baseline['results'].get(size)
+        if base_operations is None:
+            continue
+        for op, result in operations.items():
+            base = base_operations.get(op)
+            if base is None:
+                continue
+            now_ms, base_ms = result['median_ms'], base['median_ms']
+            change = (now_ms - base_ms) / base_ms if base_ms else 0.0
+            regressed = change > threshold and now_ms - base_ms > min_delta
+            flag = '  ← 回退' if regressed else ''
+            print(f'  {size:>8}  {op:<24}{base_ms:>12.1f}{now_ms:>12.1f}{change:>+9.0%}{flag}')
+            if regressed:
+                regressions.append((size, op, now_ms, base_ms))
+    return regressions
+
+
+def load_json(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='存储与加密层基准测试')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--output', help='结果 JSON 文件')
+    parser.add_argument('--baseline', help='运行后与该基线比较')
+    parser.add_argument('--compare', nargs=2, metavar=('RESULT', 'BASELINE'), help='只比较两个结果文件')
+    parser.add_argument('--threshold', type=float, default=0.15)
+    parser.add_argument('--min-delta', type=float, default=2.0)
+    args = parser.parse_args()
+
+    if args.compare:
+        regressions = compare(load_json(args.compare[0]), load_json(args.compare[1]),
+                              args.threshold, args.min_delta)
+        sys.exit(1 if regressions else 0)
+
+    result = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'repeat': args.repeat,
+        },
+        'results': {},
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            result['results'][str(size)] = run_size(size, args.repeat, args.seed, workdir)
+            print(f'\n条目数: {size}')
+            for op, timing in result['results'][str(size)].items():
+                print(f'  {op:<24} 中位数 {timing["median_ms"]:10.1f} ms  最小 {timing["min_ms"]:10.1f} ms')
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f'\n结果已写入 {args.output}')
+
+    if args.baseline:
+        regressions = compare(result, load_json(args.baseline), args.threshold, args.min_delta)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
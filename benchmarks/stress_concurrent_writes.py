@@ -0,0 +1,114 @@
+"""多进程并发写入压力测试
+
+多个进程同时向同一个密码库添加、更新记录，结束后检查是否有丢失的修改：
+每个进程添加的记录都应存在、ID 不重复，更新后的内容都应保留。
+
+用法：
+    python benchmarks/stress_concurrent_writes.py [--processes 4] [--operations 50]
+    python benchmarks/stress_concurrent_writes.py --unsafe   # 不加锁直接读写，作为对照
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+USERNAME = 'stress'
+PASSWORD = 'stress-test'
+
+
+def unsafe_save(data_manager, password_data):
+    """旧的写入方式：读取整个文件、追加、整体写回（不加锁）"""
+    import json
+    from utils.crypto import CryptoManager
+
+    users = data_manager.load_users()
+    passwords = users[USERNAME]['passwords']
+    encrypted = CryptoManager.encrypt_data(json.dumps(password_data, ensure_ascii=False),
+                                           data_manager.encryption_key)
+    passwords.append({'id': max((item['id'] for item in passwords), default=0) + 1, 'data': encrypted})
+    data_manager.save_users(users)
+
+
+def worker(home: str, index: int, operations: int, unsafe: bool):
+    os.environ['HOME'] = home
+    os.environ['USERPROFILE'] = home
+    from utils.data_manager import DataManager
+
+    data_manager = DataManager()
+    data_manager.login_user(USERNAME, PASSWORD)
+    data_manager.get_encrypted_passwords()
+
+    last_id = None
+    for i in range(operations):
+        password_data = {'website': f'p{index}-{i}', 'username': f'user{index}', 'password': f'pw{i}',
+                         'category': '', 'url': '', 'notes': ''}
+        if unsafe:
+            unsafe_save(data_manager, password_data)
+            continue
+
+        success, _, saved = data_manager.save_password(password_data, force_save=True)
+        if success and i % 5 == 4 and last_id is not None:
+            # 更新自己上一条记录，其他进程的写入不应覆盖它
+            data_manager.update_password(last_id, dict(password_data, website=f'p{index}-{i - 1}',
+                                                       notes='updated'), force_update=True)
+        last_id = saved['id'] if success else None
+
+
+def check(home: str, processes: int, operations: int, unsafe: bool) -> bool:
+    os.environ['HOME'] = home
+    from utils.data_manager import DataManager
+
+    data_manager = DataManager()
+    data_manager.login_user(USERNAME, PASSWORD)
+    passwords = data_manager.get_user_passwords()
+
+    ids = [pwd['id'] for pwd in passwords]
+    websites = {pwd['website']: pwd for pwd in passwords}
+    expected = {f'p{p}-{i}' for p in range(processes) for i in range(operations)}
+    missing = expected - websites.keys()
+    lost_updates = [] if unsafe else [
+        name for name in (f'p{p}-{i - 1}' for p in range(processes) for i in range(4, operations, 5))
+        if name in websites and websites[name].get('notes') != 'updated'
+    ]
+
+    print(f'记录数: {len(passwords)}/{len(expected)}  重复ID: {len(ids) - len(set(ids))}  '
+          f'丢失的添加: {len(missing)}  丢失的更新: {len(lost_updates)}  '
+          f'版本号: {data_manager.get_user_version()}')
+    return not missing and len(ids) == len(set(ids)) and not lost_updates
+
+
+def main():
+    parser = argparse.ArgumentParser(description='多进程并发写入压力测试')
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--operations', type=int, default=50)
+    parser.add_argument('--unsafe', action='store_true', help='不加锁直接读写（对照组）')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ['HOME'] = home
+        os.environ['USERPROFILE'] = home
+        from utils.data_manager import DataManager
+        DataManager().register_user(USERNAME, PASSWORD)
+
+        start = time.perf_counter()
+        procs = [multiprocessing.Process(target=worker, args=(home, i, args.operations, args.unsafe))
+                 for i in range(args.processes)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+        elapsed = time.perf_counter() - start
+
+        print(f'{args.processes} 个进程 x {args.operations} 次写入，耗时 {elapsed:.1f} s'
+              f'{"（不加锁）" if args.unsafe else ""}')
+        ok = check(home, args.processes, args.operations, args.unsafe)
+        print('通过' if ok else '失败：存在丢失的修改')
+        sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""确定性的测试密码库生成器
+
+同一 (条目数, 种子) 总是生成相同的明文记录：字段长度接近真实数据，
+包含中文网站名与分类、长备注以及少量超长备注。密文因加密随机数而不同，
+但解密后内容一致，基准测试结果可以跨次比较。
+"""
+import json
+import random
+
+SITES = ['支付宝', '微信', '淘宝', '京东', '百度网盘', 'QQ音乐', '网易云音乐', '招商银行', '工商银行',
+         '中国移动', '阿里云', '腾讯云', '钉钉', '飞书', '知乎', '哔哩哔哩', '小红书', '美团',
+         'GitHub', 'Gmail', 'Outlook', 'AWS Console', 'Jira', 'Confluence', 'GitLab', 'Docker Hub',
+         'Slack', 'Figma', 'Notion', 'Dropbox']
+DOMAINS = ['example.com', 'example.cn', 'corp.example.net', 'mail.example.org']
+CATEGORIES = ['工作', '本地', '个人', '全链路', '银行', '']
+NOTE_PHRASES = ['备用账号', '公司内网', '双重验证已开启', '密保问题：母亲的名字', 'shared account',
+                '每季度更换密码', '绑定手机 138****0000', 'VPN 登录后才能访问', '测试环境专用',
+                'recovery codes stored offline', '管理员账号，请勿外传']
+PASSWORD_CHARS = 'abcdefghijkmnopqrstuvwxyzABCDEFGHJKLMNPQRSTUVWXYZ23456789!@#$%^&*-_=+'
+
+DEFAULT_SEED = 20240101
+
+
+def make_notes(rng: random.Random) -> str:
+    """备注：多数为空或短句，约 10% 为长备注，约 1% 超过 2000 字"""
+    roll = rng.random()
+    if roll < 0.4:
+        return ''
+    if roll < 0.89:
+        return rng.choice(NOTE_PHRASES)
+    count = rng.randint(200, 400) if roll >= 0.99 else rng.randint(10, 40)
+    return '；'.join(rng.choice(NOTE_PHRASES) for _ in range(count))
+
+
+def make_password_data(index: int, rng: random.Random) -> dict:
+    """生成一条明文记录"""
+    site = rng.choice(SITES)
+    domain = rng.choice(DOMAINS)
+    return {
+        'website': f'{site}{index}' if rng.random() < 0.7 else f'{site} - {rng.choice(CATEGORIES) or "个人"}{index}',
+        'username': f'user{rng.randrange(10 ** 6)}@{domain}' if rng.random() < 0.6 else f'用户{rng.randrange(10 ** 4)}',
+        'password': ''.join(rng.choice(PASSWORD_CHARS) for _ in range(rng.randint(8, 32))),
+        'category': rng.choice(CATEGORIES),
+        'url': f'https://{site.lower().replace(" ", "")}.{domain}/login' if rng.random() < 0.8 else '',
+        'notes': make_notes(rng),
+    }
+
+
+def generate_passwords(count: int, seed: int = DEFAULT_SEED) -> list:
+    """生成 count 条明文记录"""
+    rng = random.Random(seed)
+    return [make_password_data(i, rng) for i in range(count)]
+
+
+def write_vault(data_manager, count: int, seed: int = DEFAULT_SEED) -> list:
+    """为已登录的用户直接写入 count 条加密记录（替换现有记录），返回明文记录"""
+    from utils.crypto import CryptoManager
+
+    passwords = generate_passwords(count, seed)
+    users = data_manager.load_users()
+    users[data_manager.current_user]['passwords'] = [{
+        'id': i + 1,
+        'data': CryptoManager.encrypt_data(json.dumps(password_data, ensure_ascii=False),
+                                           data_manager.encryption_key),
+        'created_at': '2024-01-01T00:00:00',
+    } for i, password_data in enumerate(passwords)]
+    data_manager.save_users(users)
+    return passwords
+
+
+def write_import_file(data_manager, path: str, count: int, seed: int = DEFAULT_SEED) -> list:
+    """生成含 count 条记录的导入文件（用当前用户的密钥加密，与导出格式一致）
+
+    网站名带“导入”前缀，不与 write_vault 生成的记录重复。返回明文记录。
+    """
+    from utils.crypto import CryptoManager
+
+    passwords = generate_passwords(count, seed)
+    for i, password_data in enumerate(passwords):
+        password_data['website'] = f'导入{i}-{password_data["website"]}'
+    payload = json.dumps({'version': '1.0', 'passwords': passwords}, ensure_ascii=False)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'format': 'SecretBook_Export_v1.0',
+                   'data': CryptoManager.encrypt_data(payload, data_manager.encryption_key)}, f)
+    return passwords
@@ -1,38 +1,144 @@
 import sys
-from PySide6.QtWidgets import QApplication, QDialog
+import threading
 
-from ui.main_window import MainWindow
-from ui.login_dialog import LoginDialog
-from utils.data_manager import DataManager
+from utils.memory_profile import MemoryProfiler
+from utils.startup_profile import StartupProfiler
+from utils.tracing import tracer
+
+# 启动阶段只导入显示登录框所需的最少模块，主窗口相关模块在登录框显示后再加载
+profiler = StartupProfiler(enabled='--startup-profile' in sys.argv)
+if '--trace' in sys.argv:
+    tracer.enable()  # 从启动开始记录操作耗时，可在“帮助 → 诊断”中查看
+memory_profiler = MemoryProfiler(enabled='--memory-profile' in sys.argv)
+memory_profiler.start()
+
+with profiler.phase('导入 Qt'):
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication, QDialog
 
 
 class SecretBookApp:
     """密码本应用程序"""
     
+    # 登录框显示后延迟多久预加载主窗口模块（毫秒）
+    PRELOAD_DELAY = 300
+    
     def __init__(self):
-        self.app = QApplication(sys.argv)
-        self.app.setApplicationName('密码本')
-        self.app.setApplicationVersion('1.0')
+        self.startup_reported = False
+        with profiler.phase('Qt 初始化'):
+            self.app = QApplication(sys.argv)
+            self.app.setApplicationName('密码本')
+            self.app.setApplicationVersion('1.0')
+        
+        if '--watchdog' in sys.argv:
+            # 界面线程卡顿超过阈值时记录调用栈，可在“帮助 → 诊断”中查看
+            from utils.stall_detector import stall_detector
+            stall_detector.start()
+        
+        with profiler.phase('导入登录模块'):
+            from utils.data_manager import DataManager
+            from utils.icon_manager import IconManager
+            from utils.styles import StyleManager
+        
+        with profiler.phase('应用主题'):
+            # 应用级样式表只设置一次
+            StyleManager.apply_theme(StyleManager.saved_theme(), self.app)
+        
+        with profiler.phase('加载图标'):
+            IconManager.get_app_icon()
         
         self.data_manager = DataManager()
+    
+    @staticmethod
+    def preload_main_window():
+        """在后台线程中预先导入主窗口模块，不阻塞登录框的输入
         
-        # 设置应用图标（如果有的话）
-        # self.app.setWindowIcon(QIcon('icon.png'))
+        主窗口模块在导入时不创建控件，可以在非界面线程导入；
+        登录时若尚未导入完成，界面线程的 import 会等待后台导入结束。
+        """
+        def preload():
+            with profiler.phase('预加载主窗口模块（后台线程）'):
+                import ui.main_window  # noqa: F401
+        
+        threading.Thread(target=preload, name='secretbook-preload', daemon=True).start()
     
     def run(self):
         """运行应用程序"""
-        # 显示登录对话框
-        login_dialog = LoginDialog(self.data_manager)
+        with profiler.phase('创建登录框'):
+            from ui.login_dialog import LoginDialog
+            login_dialog = LoginDialog(self.data_manager)
         
+        # 登录框首次绘制后再预加载主窗口模块，不阻塞首屏
+        profiler.watch_first_paint(login_dialog, '登录框首次绘制')
+        QTimer.singleShot(self.PRELOAD_DELAY, self.preload_main_window)
+        
+        # 显示登录对话框
         if login_dialog.exec() == QDialog.Accepted:
-            # 登录成功，显示主窗口
-            main_window = MainWindow(self.data_manager)
+            profiler.mark('登录成功')
+            memory_profiler.checkpoint('登录后')
+            with profiler.phase('创建主窗口'):
+                from ui.main_window import MainWindow
+                main_window = MainWindow(self.data_manager)
+            
+            profiler.watch_first_paint(main_window, '主窗口首次绘制')
+            if profiler.enabled:
+                main_window.passwords_loaded.connect(self.on_passwords_loaded)
+            if memory_profiler.enabled:
+                self.watch_memory(main_window)
             main_window.show()
             
-            return self.app.exec()
+            result = self.app.exec()
+            memory_profiler.report()
+            return result
         else:
             # 用户取消登录
+            self.report_startup()
             return 0
+    
+    @staticmethod
+    def watch_memory(main_window):
+        """在加载完成、首次搜索、导入后拍摄内存快照，退出时输出"""
+        state = {'loaded': False, 'searched': False, 'importing': False}
+        
+        def on_loaded(_metrics):
+            if not state['loaded']:
+                state['loaded'] = True
+                memory_profiler.checkpoint('加载完成', len(main_window.entries))
+            elif state['importing']:
+                state['importing'] = False
+                memory_profiler.checkpoint('导入后', len(main_window.entries))
+        
+        def on_search(text):
+            if text and state['loaded'] and not state['searched']:
+                state['searched'] = True
+                # 筛选与重绘完成后再拍摄
+                QTimer.singleShot(0, lambda: memory_profiler.checkpoint('搜索后', len(main_window.entries)))
+        
+        def on_imported():
+            state['importing'] = True
+        
+        main_window.passwords_loaded.connect(on_loaded)
+        main_window.toolbar.search_changed.connect(on_search)
+        main_window.import_export_handler.passwords_updated.connect(on_imported)
+    
+    def on_passwords_loaded(self, metrics):
+        """首次加载完成后输出启动耗时分析，之后的重新加载（导入、外部同步、刷新）不再输出"""
+        if self.startup_reported:
+            return
+        self.startup_reported = True
+        start = profiler.elapsed_ms() - metrics['total_ms']
+        profiler.add_span('解密并显示首屏记录', start, metrics['first_row_ms'])
+        profiler.add_span('解密全部记录', start, metrics['total_ms'])
+        self.report_startup()
+    
+    @staticmethod
+    def report_startup():
+        """输出启动耗时分析，附图标缓存统计"""
+        from utils.icon_manager import IconManager
+        stats = IconManager.stats()
+        profiler.add_note('图标缓存', f'命中 {stats["hits"]} 次，栅格化 {stats["misses"]} 次'
+                                     f'（{stats["load_ms"]:.1f} ms），缓存 {stats["cached"]} 项')
+        profiler.report()
 
 if __name__ == '__main__':
     try:
@@ -0,0 +1,344 @@
+"""SecretBook 命令行工具
+
+不启动图形界面，直接使用与界面相同的存储代码（utils.data_manager / utils.crypto），
+供脚本批量操作密码库。列表类命令边解密边输出（每行一个 JSON 对象），
+可以直接接到管道中处理。
+
+用户名取自 --user 或环境变量 SECRETBOOK_USER，密码取自环境变量
+SECRETBOOK_PASSWORD，未设置时从终端读取。
+
+设置了 SECRETBOOK_AGENT_SOCK 且该代理已为同一用户解锁时，list（不含 --show-secrets）、
+search 与 get 直接向代理查询，不做密钥派生；代理不可用时回退为登录后读取文件。
+
+用法：
+    python secretbook.py list [--category 工作] [--show-secrets] [--format json|tsv]
+    python secretbook.py get ID [--field password]
+    python secretbook.py search QUERY [--format json|tsv]
+    python secretbook.py add [--force] < entries.jsonl
+    python secretbook.py import FILE.sbk [--replace] [--overwrite]
+    python secretbook.py export FILE.sbk
+    python secretbook.py breach-build pwned-passwords-sha1.txt pwned.bin
+    python secretbook.py breach-check pwned.bin [--all]
+    python secretbook.py history ID [--show-secrets]
+    python secretbook.py restore ID VERSION
+    python secretbook.py history-limit [N]
+"""
+import argparse
+import getpass
+import json
+import os
+import socket
+import sys
+
+from utils.agent import SOCKET_ENV, AgentClient, AgentError
+from utils.category_facets import normalize_category
+from utils.data_manager import DataManager
+
+
+USER_ENV = 'SECRETBOOK_USER'
+PASSWORD_ENV = 'SECRETBOOK_PASSWORD'
+TSV_FIELDS = ('id', 'website', 'username', 'category', 'url', 'notes')
+FLUSH_EVERY = 100
+
+
+class CommandError(Exception):
+    """命令执行失败，消息输出到标准错误"""
+
+
+def login(args) -> DataManager:
+    username = args.user or os.environ.get(USER_ENV)
+    if not username:
+        raise CommandError(f'请通过 --user 或环境变量 {USER_ENV} 指定用户名')
+    password = os.environ.get(PASSWORD_ENV)
+    if password is None:
+        password = getpass.getpass(f'{username} 的密码: ')
+
+    data_manager = DataManager()
+    if not data_manager.login_user(username, password):
+        raise CommandError('用户名或密码错误')
+    return data_manager
+
+
+def ask_agent(args, op: str, **params):
+    """通过 SECRETBOOK_AGENT_SOCK 指向的代理执行只读请求
+
+    未设置代理、无法连接、代理已锁定或解锁的是其他用户时返回 None，由调用方回退到 login()；
+    请求本身的错误（如记录不存在）作为 CommandError 抛出。
+    """
+    socket_path = os.environ.get(SOCKET_ENV)
+    if not socket_path or not hasattr(socket, 'AF_UNIX'):
+        return None
+    username = args.user or os.environ.get(USER_ENV)
+    try:
+        with AgentClient(socket_path) as client:
+            status = client.status()
+            if not status['unlocked'] or (username and status['user'] != username):
+                return None
+            try:
+                return client.request(op, **params)
+            except AgentError as e:
+                raise CommandError(str(e))
+    except (OSError, ValueError, AgentError):
+        return None
+
+
+def iter_passwords(data_manager: DataManager, include_secrets: bool):
+    """逐条解密，不等全部解密完成"""
+    for encrypted_item in data_manager.get_encrypted_passwords():
+        password_data = data_manager.decrypt_password_item(encrypted_item, include_secrets=include_secrets)
+        if password_data is not None:
+            yield password_data
+
+
+def write_records(records, output_format: str, stream=None) -> int:
+    """流式输出记录，返回输出条数"""
+    stream = stream or sys.stdout
+    count = 0
+    for record in records:
+        if output_format == 'tsv':
+            line = '\t'.join(str(record.get(field, '')).replace('\t', ' ').replace('\n', ' ')
+                             for field in TSV_FIELDS)
+        else:
+            line = json.dumps(dict(record), ensure_ascii=False)
+        stream.write(line + '\n')
+        count += 1
+        if count % FLUSH_EVERY == 0:
+            stream.flush()
+    stream.flush()
+    return count
+
+
+def cmd_list(args):
+    # 代理中的条目不含密码，需要 --show-secrets 时读取文件
+    records = None if args.show_secrets else ask_agent(args, 'list')
+    if records is None:
+        records = iter_passwords(login(args), include_secrets=args.show_secrets)
+    if args.category is not None:
+        # 与界面的分类筛选一致：忽略首尾空白，空分类即“未分类”
+        category = normalize_category(args.category)
+        records = (pwd for pwd in records if normalize_category(pwd.get('category')) == category)
+    write_records(records, args.format)
+
+
+def cmd_get(args):
+    secret = ask_agent(args, 'get', id=args.id, field=args.field)
+    if secret is None:
+        secret = login(args).get_secret(args.id, args.field)
+    if secret is None:
+        raise CommandError(f'记录 {args.id} 不存在')
+    print(secret)
+
+
+def cmd_search(args):
+    # 与界面使用同一套搜索规则（含拼音），逐条匹配，不为一次查询建立索引
+    from utils.search_index import build_search_text, normalize_query, search_fields
+
+    records = ask_agent(args, 'search', query=args.query)
+    if records is None:
+        query, pinyin_query = normalize_query(args.query)
+
+        def matches(password) -> bool:
+            text, pinyin = build_search_text(search_fields(password))
+            return query in text or bool(pinyin_query) and pinyin_query in pinyin
+
+        records = filter(matches, iter_passwords(login(args), include_secrets=False))
+    write_records(records, args.format)
+
+
+def cmd_add(args):
+    """从标准输入读取 JSON lines，一次写入"""
+    passwords = []
+    for line_number, line in enumerate(sys.stdin, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            password_data = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise CommandError(f'第 {line_number} 行不是有效的 JSON: {e}')
+        if not isinstance(password_data, dict) or not all(
+                key in password_data for key in ('website', 'username', 'password')):
+            raise CommandError(f'第 {line_number} 行缺少 website/username/password 字段')
+        password_data.pop('id', None)
+        passwords.append(password_data)
+
+    data_manager = login(args)
+    saved, duplicates = data_manager.save_passwords(passwords, force_save=args.force)
+    write_records(saved, 'json')
+    for duplicate in duplicates:
+        existing = duplicate['existing_data']
+        print(f'跳过重复: {existing.get("website", "")} / {existing.get("username", "")}'
+              f'（已有记录 {existing["id"]}）', file=sys.stderr)
+    print(f'已添加 {len(saved)} 条，跳过重复 {len(duplicates)} 条', file=sys.stderr)
+
+
+def cmd_import(args):
+    data_manager = login(args)
+    success, message, duplicates = data_manager.import_passwords(args.file, merge_mode=not args.replace)
+    if not success:
+        raise CommandError(message)
+    print(message, file=sys.stderr)
+
+    if duplicates and args.overwrite:
+        overwritten = 0
+        for duplicate in duplicates:
+            ok, _, _ = data_manager.update_password(
+                duplicate['existing_data']['id'], duplicate['import_data'], force_update=True
+            )
+            overwritten += ok
+        print(f'已覆盖 {overwritten} 条重复密码', file=sys.stderr)
+    elif duplicates:
+        print(f'跳过 {len(duplicates)} 条重复密码（使用 --overwrite 覆盖）', file=sys.stderr)
+
+
+def cmd_export(args):
+    data_manager = login(args)
+    if not data_manager.export_passwords(args.file):
+        raise CommandError('导出失败')
+    print(f'已导出到 {args.file}', file=sys.stderr)
+
+
+def cmd_breach_build(args):
+    """构建泄露库不需要登录"""
+    from utils.breach_check import build_corpus
+
+    def progress(done, total):
+        print(f'\r已读取 {done * 100 // max(total, 1)}%', end='', file=sys.stderr, flush=True)
+
+    try:
+        count = build_corpus(args.source, args.output, progress=progress)
+    except OSError as e:
+        raise CommandError(f'构建失败: {e}')
+    print(f'\r已写入 {count} 条记录到 {args.output}', file=sys.stderr)
+
+
+def cmd_breach_check(args):
+    """输出出现在泄露库中的记录（附 breach_count 字段），结果缓存与界面共用"""
+    from utils.breach_check import BreachChecker
+
+    data_manager = login(args)
+    try:
+        result = BreachChecker(data_manager).run(args.corpus)
+    except (OSError, ValueError) as e:
+        raise CommandError(str(e))
+    counts = result['counts']
+
+    def records():
+        for password in iter_passwords(data_manager, include_secrets=False):
+            count = counts.get(password['id'], 0)
+            if count or args.all:
+                yield dict(password, breach_count=count)
+
+    write_records(records(), 'json')
+    breached = sum(1 for count in counts.values() if count)
+    print(f'共检查 {len(counts)} 条，{breached} 条出现在泄露库中', file=sys.stderr)
+
+
+def cmd_history(args):
+    """逐行输出历史版本（新到旧），附 version、saved_at、changed 字段"""
+    data_manager = login(args)
+    versions = data_manager.get_password_history(args.id, include_secrets=args.show_secrets)
+    write_records((dict(version['data'], version=version['version'], saved_at=version['saved_at'],
+                        changed=version['changed']) for version in versions), 'json')
+    print(f'记录 {args.id} 共 {len(versions)} 个历史版本', file=sys.stderr)
+
+
+def cmd_restore(args):
+    data_manager = login(args)
+    success, message, restored = data_manager.restore_password_version(args.id, args.version)
+    if not success:
+        raise CommandError(message)
+    write_records([restored], 'json')
+    print(f'已将记录 {args.id} 恢复为历史版本 {args.version}', file=sys.stderr)
+
+
+def cmd_history_limit(args):
+    data_manager = login(args)
+    if args.limit is None:
+        print(data_manager.get_history_limit())
+        return
+    if args.limit < 0:
+        raise CommandError('保留数不能为负数')
+    removed = data_manager.set_history_limit(args.limit)
+    print(f'已设置保留 {args.limit} 个历史版本，清理了 {removed} 个旧版本', file=sys.stderr)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='secretbook', description='SecretBook 命令行工具')
+    parser.add_argument('--user', help=f'用户名（默认读取环境变量 {USER_ENV}）')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser('list', help='列出全部记录')
+    list_parser.add_argument('--category', help='只列出指定分类（空字符串表示未分类）')
+    list_parser.add_argument('--show-secrets', action='store_true', help='输出中包含密码')
+    list_parser.add_argument('--format', choices=('json', 'tsv'), default='json')
+    list_parser.set_defaults(func=cmd_list)
+
+    get_parser = subparsers.add_parser('get', help='输出一条记录的密码')
+    get_parser.add_argument('id', type=int)
+    get_parser.add_argument('--field', default='password')
+    get_parser.set_defaults(func=cmd_get)
+
+    search_parser = subparsers.add_parser('search', help='搜索网站、用户名、备注、分类或拼音')
+    search_parser.add_argument('query')
+    search_parser.add_argument('--format', choices=('json', 'tsv'), default='json')
+    search_parser.set_defaults(func=cmd_search)
+
+    add_parser = subparsers.add_parser('add', help='从标准输入添加记录（每行一个 JSON 对象）')
+    add_parser.add_argument('--force', action='store_true', help='不检查重复')
+    add_parser.set_defaults(func=cmd_add)
+
+    import_parser = subparsers.add_parser('import', help='导入 .sbk 导出文件')
+    import_parser.add_argument('file')
+    import_parser.add_argument('--replace', action='store_true', help='替换模式：清空现有密码')
+    import_parser.add_argument('--overwrite', action='store_true', help='用导入的数据覆盖重复密码')
+    import_parser.set_defaults(func=cmd_import)
+
+    export_parser = subparsers.add_parser('export', help='导出为加密的 .sbk 文件')
+    export_parser.add_argument('file')
+    export_parser.set_defaults(func=cmd_export)
+
+    corpus_parser = subparsers.add_parser('breach-build', help='由 Pwned Passwords 的 SHA-1 文本构建离线泄露库')
+    corpus_parser.add_argument('source', help='"SHA1:次数" 格式的文本文件')
+    corpus_parser.add_argument('output', help='输出的二进制泄露库文件')
+    corpus_parser.set_defaults(func=cmd_breach_build)
+
+    check_parser = subparsers.add_parser('breach-check', help='检查哪些密码出现在离线泄露库中')
+    check_parser.add_argument('corpus', help='breach-build 生成的泄露库文件')
+    check_parser.add_argument('--all', action='store_true', help='同时输出未泄露的记录')
+    check_parser.set_defaults(func=cmd_breach_check)
+
+    history_parser = subparsers.add_parser('history', help='列出一条记录的历史版本')
+    history_parser.add_argument('id', type=int)
+    history_parser.add_argument('--show-secrets', action='store_true', help='输出中包含密码')
+    history_parser.set_defaults(func=cmd_history)
+
+    restore_parser = subparsers.add_parser('restore', help='把一条记录恢复为某个历史版本')
+    restore_parser.add_argument('id', type=int)
+    restore_parser.add_argument('version', type=int, help='history 输出的版本号（1 为上一版本）')
+    restore_parser.set_defaults(func=cmd_restore)
+
+    limit_parser = subparsers.add_parser('history-limit', help='查看或设置每条记录保留的历史版本数')
+    limit_parser.add_argument('limit', type=int, nargs='?', help='新的保留数，0 表示不保留（会立即清理旧版本）')
+    limit_parser.set_defaults(func=cmd_history_limit)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        args.func(args)
+    except CommandError as e:
+        print(f'错误: {e}', file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # 下游（如 head）提前关闭管道，丢弃剩余输出
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except KeyboardInterrupt:
+        return 130
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""生成内嵌图标资源
+
+把应用图标预先栅格化为各标准尺寸的 PNG，写入 assets/icons/ 与 assets/icons.qrc，
+再用 pyside6-rcc 编译为 utils/icon_resources.py。运行时 IconManager 直接从资源中
+读取对应尺寸的位图，不再探测文件系统，也不需要在运行时缩放或渲染 SVG。
+
+图标源文件变化后重新运行：
+    python tools/build_icons.py
+"""
+import os
+import subprocess
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QGuiApplication, QImage, QImageReader, QPainter
+from PySide6.QtSvg import QSvgRenderer
+
+from utils.icon_manager import IconManager
+
+ASSETS_DIR = os.path.join(ROOT, 'assets')
+ICONS_DIR = os.path.join(ASSETS_DIR, 'icons')
+QRC_FILE = os.path.join(ASSETS_DIR, 'icons.qrc')
+OUTPUT_FILE = os.path.join(ROOT, 'utils', 'icon_resources.py')
+
+# 图标名 -> 源文件（依次尝试）
+SOURCES = {
+    'app': ['app.ico', 'logo.svg'],
+}
+
+
+def read_frames(path: str) -> dict:
+    """读取位图源文件中的各尺寸帧，返回 {尺寸: QImage}"""
+    reader = QImageReader(path)
+    frames = {}
+    for _ in range(max(reader.imageCount(), 1)):
+        image = reader.read()
+        if not image.isNull() and image.width() == image.height():
+            frames[image.width()] = image
+        if not reader.jumpToNextImage():
+            break
+    return frames
+
+
+def rasterize(path: str, size: int) -> QImage:
+    """按指定尺寸栅格化图标：SVG 直接渲染，位图优先取同尺寸帧，否则从更大的帧平滑缩小"""
+    if path.endswith('.svg'):
+        image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        QSvgRenderer(path).render(painter)
+        painter.end()
+        return image
+
+    frames = read_frames(path)
+    if size in frames:
+        return frames[size]
+    source = frames[min((s for s in frames if s >= size), default=max(frames))]
+    return source.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def main():
+    app = QGuiApplication(sys.argv)  # noqa: F841
+    os.makedirs(ICONS_DIR, exist_ok=True)
+
+    entries = []
+    for name, candidates in SOURCES.items():
+        source = next(os.path.join(ASSETS_DIR, f) for f in candidates
+                      if os.path.exists(os.path.join(ASSETS_DIR, f)))
+        for size in IconManager.STANDARD_SIZES:
+            file_name = f'{name}_{size}.png'
+            rasterize(source, size).save(os.path.join(ICONS_DIR, file_name))
+            entries.append(f'        <file>icons/{file_name}</file>')
+        print(f'{name}: {os.path.basename(source)} -> {len(IconManager.STANDARD_SIZES)} 个尺寸')
+
+    with open(QRC_FILE, 'w', encoding='utf-8') as f:
+        f.write('<!DOCTYPE RCC>\n<RCC version="1.0">\n    <qresource prefix="/">\n')
+        f.write('\n'.join(entries))
+        f.write('\n    </qresource>\n</RCC>\n')
+
+    subprocess.run(['pyside6-rcc', '-g', 'python', QRC_FILE, '-o', OUTPUT_FILE], check=True)
+    print(f'已生成 {os.path.relpath(OUTPUT_FILE, ROOT)}')
+
+
+if __name__ == '__main__':
+    main()
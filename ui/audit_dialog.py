@@ -0,0 +1,169 @@
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from PySide6.QtCore import Qt, Signal, QEvent
+from PySide6.QtGui import QColor
+
+from utils.category_facets import normalize_category
+from utils.icon_manager import IconManager
+from utils.styles import StyleManager
+from utils.vault_audit import STRENGTH_LABELS, WEAK_SCORE
+
+
+class SortKeyItem(QTableWidgetItem):
+    """显示文本、按 UserRole 中的值排序的单元格"""
+
+    def __lt__(self, other):
+        return self.data(Qt.UserRole) < other.data(Qt.UserRole)
+
+
+class AuditDialog(QDialog):
+    """密码体检报告 - 列出弱密码、重复使用与已泄露的密码，可按各列排序，双击编辑条目"""
+
+    # 信号定义
+    edit_requested = Signal(object)  # PasswordEntry
+    refresh_requested = Signal()
+
+    COLUMNS = ['网站/应用', '用户名', '分类', '强度', '重复次数', '共用组', '泄露次数']
+    STRENGTH_COLUMN = 3
+    REUSE_COLUMN = 4
+    GROUP_COLUMN = 5
+    BREACH_COLUMN = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = {}
+        self._findings = {}
+        self._breaches = None
+        self.setup_ui()
+
+    def setup_ui(self):
+        IconManager.set_window_icon(self)
+        self.setWindowTitle('密码体检')
+        self.resize(720, 520)
+
+        layout = QVBoxLayout(self)
+
+        header = QHBoxLayout()
+        self.summary_label = QLabel('正在体检...')
+        header.addWidget(self.summary_label)
+        header.addStretch()
+        self.issues_only_check = QCheckBox('只显示有问题的条目')
+        self.issues_only_check.setChecked(True)
+        self.issues_only_check.toggled.connect(self.populate)
+        header.addWidget(self.issues_only_check)
+        layout.addLayout(header)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(self.REUSE_COLUMN, Qt.DescendingOrder)
+        self.table.itemDoubleClicked.connect(self._on_item_double_clicked)
+        layout.addWidget(self.table)
+
+        hint = QLabel('双击条目可直接修改密码；密码只在本地比较，重复检测使用带密钥的哈希，\n'
+                      '泄露检查使用本地的泄露库文件（工具 → 离线泄露检查），不联网。')
+        layout.addWidget(hint)
+
+        buttons = QHBoxLayout()
+        refresh_btn = QPushButton(IconManager.glyph_icon('🔄'), '重新体检')
+        refresh_btn.setProperty('variant', 'secondary')
+        refresh_btn.clicked.connect(self.refresh_requested.emit)
+        buttons.addWidget(refresh_btn)
+        buttons.addStretch()
+        close_btn = QPushButton('关闭')
+        close_btn.setProperty('variant', 'secondary')
+        close_btn.clicked.connect(self.close)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+    def set_results(self, entries: dict, findings: dict, breaches: dict = None):
+        """显示体检结果
+
+        Args:
+            entries: id -> PasswordEntry（主窗口当前加载的全部条目）
+            findings: id -> (强度, 共用该密码的条目数, 共用组编号)
+            breaches: id -> 在泄露库中出现的次数，未进行泄露检查时为None
+        """
+        self._entries = entries
+        self._findings = findings
+        self._breaches = breaches
+
+        audited = [entry_id for entry_id in entries if entry_id in findings]
+        weak = sum(1 for entry_id in audited if findings[entry_id][0] <= WEAK_SCORE)
+        reused = sum(1 for entry_id in audited if findings[entry_id][1] > 1)
+        summary = f'共 {len(audited)} 条：弱密码 {weak} 条，与其他条目共用密码 {reused} 条'
+        if breaches is not None:
+            summary += f'，出现在泄露库中 {sum(1 for entry_id in entries if breaches.get(entry_id))} 条'
+        self.summary_label.setText(summary)
+        self.table.setColumnHidden(self.BREACH_COLUMN, breaches is None)
+        self.populate()
+
+    def populate(self):
+        """按当前筛选条件填充表格"""
+        issues_only = self.issues_only_check.isChecked()
+        breaches = self._breaches or {}
+        rows = []
+        for entry_id, entry in self._entries.items():
+            finding = self._findings.get(entry_id)
+            if finding is None:
+                continue
+            score, reuse_count, group = finding
+            breach_count = breaches.get(entry_id)
+            if issues_only and score > WEAK_SCORE and reuse_count <= 1 and not breach_count:
+                continue
+            rows.append((entry, score, reuse_count, group, breach_count))
+
+        warning = QColor(StyleManager.color('warning'))
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(rows))
+        for row, (entry, score, reuse_count, group, breach_count) in enumerate(rows):
+            website = QTableWidgetItem(entry.website)
+            website.setData(Qt.UserRole, entry.id)
+            self.table.setItem(row, 0, website)
+            self.table.setItem(row, 1, QTableWidgetItem(entry.username))
+            self.table.setItem(row, 2, QTableWidgetItem(normalize_category(entry.category)))
+
+            strength = SortKeyItem(STRENGTH_LABELS[score])
+            strength.setData(Qt.UserRole, score)
+            strength.setTextAlignment(Qt.AlignCenter)
+            # 按重复次数排序时同组条目排在一起
+            reuse = SortKeyItem(str(reuse_count))
+            reuse.setData(Qt.UserRole, (reuse_count, -group))
+            reuse.setTextAlignment(Qt.AlignCenter)
+            group_item = SortKeyItem(f'#{group}' if group else '')
+            group_item.setData(Qt.UserRole, group or float('inf'))
+            group_item.setTextAlignment(Qt.AlignCenter)
+            breach = SortKeyItem('' if breach_count is None else str(breach_count))
+            breach.setData(Qt.UserRole, breach_count or 0)
+            breach.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            if score <= WEAK_SCORE:
+                strength.setForeground(warning)
+            if reuse_count > 1:
+                reuse.setForeground(warning)
+            if breach_count:
+                breach.setForeground(warning)
+            self.table.setItem(row, self.STRENGTH_COLUMN, strength)
+            self.table.setItem(row, self.REUSE_COLUMN, reuse)
+            self.table.setItem(row, self.GROUP_COLUMN, group_item)
+            self.table.setItem(row, self.BREACH_COLUMN, breach)
+        self.table.setSortingEnabled(True)
+
+    def changeEvent(self, event):
+        # 切换主题后按新主题的警示色重新填充
+        if event.type() == QEvent.StyleChange and self._entries:
+            self.populate()
+        super().changeEvent(event)
+
+    def _on_item_double_clicked(self, item):
+        entry_id = self.table.item(item.row(), 0).data(Qt.UserRole)
+        entry = self._entries.get(entry_id)
+        if entry is not None:
+            self.edit_requested.emit(entry)
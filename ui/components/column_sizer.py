@@ -0,0 +1,108 @@
+from PySide6.QtCore import QObject, QSettings, QEvent
+
+
+class ColumnSizer(QObject):
+    """表格列宽策略
+
+    用有限的行样本加上模型记录的最长文本估算列宽，代替逐行测量的
+    ResizeToContents；只有某列最长文本变化时才重算该列。
+    用户手动调整过的列宽会被记住，双击表头分隔线可恢复自动列宽。
+    """
+
+    SAMPLE_ROWS = 100
+    MIN_WIDTH = 60
+    MAX_WIDTH = 320
+    PADDING = 40  # 单元格左右内边距及文本边距
+
+    def __init__(self, view, columns, settings_group='PasswordTable'):
+        super().__init__(view)
+        self.view = view
+        self.model = view.model()
+        self.columns = tuple(columns)
+        self.settings = QSettings('SecretBook', 'TableSettings')
+        self.settings_group = settings_group
+        self._resizing = False
+        self._user_widths = self.load_user_widths()
+
+        header = view.horizontalHeader()
+        header.sectionResized.connect(self._on_section_resized)
+        header.sectionHandleDoubleClicked.connect(self.reset_column)
+        self.model.modelReset.connect(self.resize_all)
+        self.model.column_extent_changed.connect(self.resize_column)
+        self.model.rowsInserted.connect(self._on_rows_inserted)
+        view.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        """字体或样式变化（如切换主题）后重算列宽"""
+        if watched is self.view and event.type() in (QEvent.FontChange, QEvent.StyleChange):
+            self.resize_all()
+        return False
+
+    def _on_rows_inserted(self, parent, first, last):
+        """新行落入采样范围时重算列宽，之后的插入只依赖最长文本统计"""
+        if first < max(self.view.rowAt(0), 0) + self.SAMPLE_ROWS:
+            self.resize_all()
+
+    def load_user_widths(self) -> dict:
+        """读取保存的用户列宽"""
+        widths = {}
+        self.settings.beginGroup(self.settings_group)
+        for column in self.columns:
+            width = self.settings.value(f'column_{column}', 0, type=int)
+            if width > 0:
+                widths[column] = width
+        self.settings.endGroup()
+        return widths
+
+    def _save_user_width(self, column, width):
+        self.settings.beginGroup(self.settings_group)
+        if width:
+            self.settings.setValue(f'column_{column}', width)
+        else:
+            self.settings.remove(f'column_{column}')
+        self.settings.endGroup()
+
+    def _on_section_resized(self, column, old_size, new_size):
+        """记录用户拖动调整的列宽"""
+        if self._resizing or column not in self.columns:
+            return
+        self._user_widths[column] = new_size
+        self._save_user_width(column, new_size)
+
+    def reset_column(self, column):
+        """恢复某列为自动列宽"""
+        if column not in self.columns:
+            return
+        self._user_widths.pop(column, None)
+        self._save_user_width(column, None)
+        self.resize_column(column)
+
+    def estimate_width(self, column) -> int:
+        """估算列宽：表头、可见区域附近的样本行与最长文本三者取最大"""
+        metrics = self.view.fontMetrics()
+        header_width = self.view.horizontalHeader().sectionSizeFromContents(column).width()
+
+        first_row = max(self.view.rowAt(0), 0)
+        last_row = min(first_row + self.SAMPLE_ROWS, self.model.rowCount())
+        texts = [self.model.longest_text(column)]
+        for row in range(first_row, last_row):
+            texts.append(self.model.display_text(self.model.entry_at(row), row, column))
+
+        content_width = max(metrics.horizontalAdvance(text) for text in texts) + self.PADDING
+        return max(self.MIN_WIDTH, header_width, min(content_width, self.MAX_WIDTH))
+
+    def resize_column(self, column):
+        """重算单列宽度"""
+        if column not in self.columns:
+            return
+        width = self._user_widths.get(column) or self.estimate_width(column)
+        self._resizing = True
+        try:
+            self.view.horizontalHeader().resizeSection(column, width)
+        finally:
+            self._resizing = False
+
+    def resize_all(self):
+        """重算所有列宽"""
+        for column in self.columns:
+            self.resize_column(column)
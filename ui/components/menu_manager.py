@@ -1,6 +1,9 @@
-from PySide6.QtGui import QAction
+from PySide6.QtGui import QAction, QActionGroup
 from PySide6.QtCore import QObject, Signal
 
+from utils.icon_manager import IconManager
+from utils.styles import StyleManager
+
 class MenuManager(QObject):
     """菜单管理器"""
     
@@ -10,6 +13,11 @@ class MenuManager(QObject):
     import_requested = Signal()
     logout_requested = Signal()
     about_requested = Signal()
+    diagnostics_requested = Signal()
+    audit_requested = Signal()
+    breach_check_requested = Signal()
+    history_limit_requested = Signal()
+    theme_change_requested = Signal(str)
     
     def __init__(self, main_window):
         super().__init__()
@@ -19,54 +27,25 @@ class MenuManager(QObject):
     def setup_menu(self):
         """设置菜单"""
         menubar = self.main_window.menuBar()
-        self.apply_menu_styles(menubar)
         
         # 文件菜单
         self.create_file_menu(menubar)
         
+        # 视图菜单
+        self.create_view_menu(menubar)
+        
+        # 工具菜单
+        self.create_tools_menu(menubar)
+        
         # 帮助菜单
         self.create_help_menu(menubar)
     
-    def apply_menu_styles(self, menubar):
-        """应用菜单样式"""
-        menubar.setStyleSheet("""
-            QMenuBar {
-                background-color: #ffffff;
-                color: #2c3e50;
-                border-bottom: 1px solid #e0e0e0;
-                font-size: 13px;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                padding: 5px;
-            }
-            QMenuBar::item {
-                padding: 8px 12px;
-                margin: 2px;
-                border-radius: 4px;
-            }
-            QMenuBar::item:selected {
-                background-color: #f0f0f0;
-            }
-            QMenu {
-                background-color: #ffffff;
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-                padding: 5px;
-            }
-            QMenu::item {
-                padding: 6px 15px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background-color: #f0f0f0;
-            }
-        """)
-    
     def create_file_menu(self, menubar):
         """创建文件菜单"""
         file_menu = menubar.addMenu('文件')
         
         # 添加密码
-        add_action = QAction('添加密码', self.main_window)
+        add_action = QAction(IconManager.glyph_icon('➕'), '添加密码', self.main_window)
         add_action.setShortcut('Ctrl+N')
         add_action.triggered.connect(self.add_password_requested.emit)
         file_menu.addAction(add_action)
@@ -74,13 +53,13 @@ class MenuManager(QObject):
         file_menu.addSeparator()
         
         # 导出密码
-        export_action = QAction('导出密码...', self.main_window)
+        export_action = QAction(IconManager.glyph_icon('📤'), '导出密码...', self.main_window)
         export_action.setShortcut('Ctrl+E')
         export_action.triggered.connect(self.export_requested.emit)
         file_menu.addAction(export_action)
         
         # 导入密码
-        import_action = QAction('导入密码...', self.main_window)
+        import_action = QAction(IconManager.glyph_icon('📥'), '导入密码...', self.main_window)
         import_action.setShortcut('Ctrl+I')
         import_action.triggered.connect(self.import_requested.emit)
         file_menu.addAction(import_action)
@@ -88,7 +67,7 @@ class MenuManager(QObject):
         file_menu.addSeparator()
         
         # 注销
-        logout_action = QAction('注销', self.main_window)
+        logout_action = QAction(IconManager.glyph_icon('🚪'), '注销', self.main_window)
         logout_action.triggered.connect(self.logout_requested.emit)
         file_menu.addAction(logout_action)
         
@@ -98,10 +77,46 @@ class MenuManager(QObject):
         exit_action.triggered.connect(self.main_window.close)
         file_menu.addAction(exit_action)
     
+    def create_view_menu(self, menubar):
+        """创建视图菜单"""
+        view_menu = menubar.addMenu('视图')
+        theme_menu = view_menu.addMenu('主题')
+        
+        theme_group = QActionGroup(self.main_window)
+        theme_group.setExclusive(True)
+        for theme, palette in StyleManager.THEMES.items():
+            action = QAction(palette['name'], self.main_window, checkable=True)
+            action.setChecked(theme == StyleManager.current_theme())
+            action.triggered.connect(lambda checked, name=theme: self.theme_change_requested.emit(name))
+            theme_group.addAction(action)
+            theme_menu.addAction(action)
+    
+    def create_tools_menu(self, menubar):
+        """创建工具菜单"""
+        tools_menu = menubar.addMenu('工具')
+        
+        audit_action = QAction(IconManager.glyph_icon('🛡️'), '密码体检...', self.main_window)
+        audit_action.triggered.connect(self.audit_requested.emit)
+        tools_menu.addAction(audit_action)
+        
+        breach_action = QAction(IconManager.glyph_icon('🔎'), '离线泄露检查...', self.main_window)
+        breach_action.triggered.connect(self.breach_check_requested.emit)
+        tools_menu.addAction(breach_action)
+        
+        tools_menu.addSeparator()
+        
+        history_action = QAction(IconManager.glyph_icon('🕘'), '历史版本保留数...', self.main_window)
+        history_action.triggered.connect(self.history_limit_requested.emit)
+        tools_menu.addAction(history_action)
+    
     def create_help_menu(self, menubar):
         """创建帮助菜单"""
         help_menu = menubar.addMenu('帮助')
         
+        diagnostics_action = QAction('诊断...', self.main_window)
+        diagnostics_action.triggered.connect(self.diagnostics_requested.emit)
+        help_menu.addAction(diagnostics_action)
+        
         about_action = QAction('关于', self.main_window)
         about_action.triggered.connect(self.about_requested.emit)
         help_menu.addAction(about_action)
\ No newline at end of file
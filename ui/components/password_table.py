@@ -1,248 +1,260 @@
 from PySide6.QtWidgets import (
-    QTableWidget, QTableWidgetItem, QHeaderView, QWidget, 
-    QHBoxLayout, QPushButton, QAbstractItemView, QApplication
+    QTableView, QHeaderView, QAbstractItemView, QApplication,
+    QStyledItemDelegate, QToolTip
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QEvent, QRect, QTimer
+from PySide6.QtGui import QColor, QPainter
 
-class PasswordTableWidget(QTableWidget):
+from utils.icon_manager import IconManager
+from utils.styles import StyleManager
+from utils.tracing import traced
+from .password_table_model import PasswordTableModel
+from .column_sizer import ColumnSizer
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """操作列委托 - 直接绘制操作按钮，避免为每行创建控件"""
+
+    # 信号定义
+    action_triggered = Signal(str, int)  # action, row
+
+    # (动作, 图标, 提示)，背景色取自当前主题的 action_<动作> 与 action_<动作>_hover
+    BUTTONS = [
+        ('copy', '📋', '复制密码'),
+        ('view', '👁️', '查看密码'),
+        ('edit', '✏️', '编辑'),
+        ('history', '🕘', '历史版本'),
+        ('delete', '🗑️', '删除'),
+    ]
+    BUTTON_WIDTH = 32
+    BUTTON_HEIGHT = 28
+    ICON_SIZE = 16
+    SPACING = 2
+    MARGIN = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hover = None  # (row, action)
+
+    def button_rects(self, cell_rect):
+        """计算各按钮在单元格中的位置"""
+        top = cell_rect.top() + (cell_rect.height() - self.BUTTON_HEIGHT) // 2
+        left = cell_rect.left() + self.MARGIN
+        rects = []
+        for action, *_ in self.BUTTONS:
+            rects.append((action, QRect(left, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)))
+            left += self.BUTTON_WIDTH + self.SPACING
+        return rects
+
+    def action_at(self, cell_rect, pos):
+        """获取坐标处的按钮动作"""
+        for action, rect in self.button_rects(cell_rect):
+            if rect.contains(pos):
+                return action
+        return None
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        for (action, icon, _), (_, rect) in zip(self.BUTTONS, self.button_rects(option.rect)):
+            hovered = self._hover == (index.row(), action)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(StyleManager.color(f'action_{action}_hover' if hovered else f'action_{action}')))
+            painter.drawRoundedRect(rect, 4, 4)
+            pixmap = IconManager.glyph_pixmap(icon, self.ICON_SIZE, painter.device().devicePixelRatioF())
+            painter.drawPixmap(
+                rect.left() + (rect.width() - self.ICON_SIZE) // 2,
+                rect.top() + (rect.height() - self.ICON_SIZE) // 2,
+                pixmap
+            )
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseMove:
+            hover = (index.row(), self.action_at(option.rect, event.position().toPoint()))
+            if hover != self._hover:
+                self._hover = hover
+                self.parent().viewport().update(option.rect)
+        elif event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            action = self.action_at(option.rect, event.position().toPoint())
+            if action:
+                self.action_triggered.emit(action, index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip:
+            action = self.action_at(option.rect, event.pos())
+            for name, _, tooltip in self.BUTTONS:
+                if name == action:
+                    QToolTip.showText(event.globalPos(), tooltip, view)
+                    return True
+        return super().helpEvent(event, view, option, index)
+
+    def clear_hover(self):
+        """清除悬停状态"""
+        self._hover = None
+
+
+class PasswordTableWidget(QTableView):
     """密码表格组件"""
-    
+
     # 信号定义
     password_copied = Signal(str)
-    password_edit_requested = Signal(dict)
-    password_delete_requested = Signal(dict)
-    
-    def __init__(self, parent=None):
+    password_edit_requested = Signal(object)  # PasswordEntry
+    password_delete_requested = Signal(object)  # PasswordEntry
+    password_history_requested = Signal(object)  # PasswordEntry
+
+    def __init__(self, secret_accessor, storage, parent=None):
         super().__init__(parent)
+        self.secret_accessor = secret_accessor
+        self.storage = storage
+        self.password_model = PasswordTableModel(self)
+        self.setModel(self.password_model)
+        self.action_delegate = ActionButtonsDelegate(self)
+        self.action_delegate.action_triggered.connect(self._on_action_triggered)
+        self.setItemDelegateForColumn(PasswordTableModel.ACTION_COLUMN, self.action_delegate)
+        
+        # 定期丢弃过期的明文
+        self.secret_timer = QTimer(self)
+        self.secret_timer.setInterval(1000)
+        self.secret_timer.timeout.connect(self.expire_secrets)
         self.setup_ui()
-        self.apply_styles()
-    
+
     def setup_ui(self):
         """设置UI"""
-        self.setColumnCount(8)  # 增加一列
-        self.setHorizontalHeaderLabels([
-            '序号', '网站/应用', '分类', '用户名', '密码', '网址', '备注', '操作'
-        ])
-        
         # 设置表格不可编辑
         self.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        
+        self.setMouseTracking(True)
+
         # 设置行高
         self.verticalHeader().setDefaultSectionSize(42)
         self.verticalHeader().setVisible(False)
-        
+
         # 设置列宽
         self.setup_column_widths()
-    
+
     def setup_column_widths(self):
         """设置列宽"""
         header = self.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Fixed)  # 序号列固定宽度
         header.resizeSection(0, 60)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)  # 网站/应用
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # 分类
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # 用户名
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # 密码
+        for column in (1, 2, 3, 4, 6):  # 网站/应用、分类、用户名、密码、备注
+            header.setSectionResizeMode(column, QHeaderView.Interactive)
         header.setSectionResizeMode(5, QHeaderView.Stretch)  # 网址
-        header.setSectionResizeMode(6, QHeaderView.ResizeToContents)  # 备注
-        header.setSectionResizeMode(7, QHeaderView.Fixed)  # 操作列固定宽度
-        header.resizeSection(7, 150)
-    
-    def apply_styles(self):
-        """应用样式"""
-        self.setStyleSheet("""
-            QTableWidget {
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                background-color: white;
-                gridline-color: #f0f0f0;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                font-size: 13px;
-                selection-background-color: transparent;
-            }
-            QTableWidget::item {
-                padding: 4px 12px;
-                border-bottom: 1px solid #f0f0f0;
-                min-height: 40px;
-                selection-background-color: transparent;
-            }
-            QTableWidget::item:selected {
-                background-color: transparent;
-                color: inherit;
-            }
-            QTableWidget::item:focus {
-                background-color: transparent;
-                outline: none;
-            }
-            QHeaderView::section {
-                background-color: #f8f9fa;
-                padding: 12px 10px;
-                border: none;
-                border-bottom: 2px solid #e0e0e0;
-                font-weight: 600;
-                color: #2c3e50;
-                min-height: 35px;
-            }
-        """)
+        header.setSectionResizeMode(PasswordTableModel.AUDIT_COLUMN, QHeaderView.Fixed)  # 安全列固定宽度
+        header.resizeSection(PasswordTableModel.AUDIT_COLUMN, 100)
+        header.setSectionResizeMode(PasswordTableModel.ACTION_COLUMN, QHeaderView.Fixed)  # 操作列固定宽度
+        header.resizeSection(PasswordTableModel.ACTION_COLUMN, 185)
+        
+        # 按样本估算列宽，避免 ResizeToContents 逐行测量
+        self.column_sizer = ColumnSizer(self, (1, 2, 3, 4, 6))
+        self.column_sizer.resize_all()
     
+    @traced('重建表格数据', 'ui')
     def update_data(self, passwords):
         """更新表格数据"""
-        self.setRowCount(len(passwords))
-        
-        for row, password in enumerate(passwords):
-            self.populate_row(row, password)
+        self.action_delegate.clear_hover()
+        self.password_model.set_entries(passwords)
+
+    def add_entry(self, password):
+        """追加一行"""
+        self.password_model.append_entry(password)
+
+    def add_entries(self, passwords):
+        """批量追加多行"""
+        self.password_model.append_entries(passwords)
+
+    def visible_row_capacity(self):
+        """视口一屏可容纳的行数"""
+        row_height = self.verticalHeader().defaultSectionSize()
+        return max(1, self.viewport().height() // row_height + 1)
+
+    def update_entry(self, password):
+        """更新单行，条目不在表格中时返回 False"""
+        return self.password_model.update_entry(password)
+
+    def remove_entry(self, password_id):
+        """移除单行，条目不在表格中时返回 False"""
+        self.action_delegate.clear_hover()
+        return self.password_model.remove_entry(password_id)
+
+    def set_audit(self, findings):
+        """显示密码体检结果（{id: (强度, 共用该密码的条目数, 共用组编号)}）"""
+        self.password_model.set_audit(findings)
+
+    def set_breaches(self, counts):
+        """显示泄露检查结果（{id: 在泄露库中出现的次数}）"""
+        self.password_model.set_breaches(counts)
+
+    def contains_entry(self, password_id):
+        """条目是否显示在表格中"""
+        return self.password_model.row_of(password_id) >= 0
+
+    def _on_action_triggered(self, action, row):
+        """处理操作按钮点击"""
+        password = self.password_model.entry_at(row)
+        if password is None:
+            return
+
+        if action == 'copy':
+            self.copy_password(password['id'])
+        elif action == 'view':
+            self.toggle_password_visibility(password['id'])
+        elif action == 'edit':
+            self.password_edit_requested.emit(password)
+        elif action == 'history':
+            self.password_history_requested.emit(password)
+        elif action == 'delete':
+            self.password_delete_requested.emit(password)
+
+    def copy_password(self, password_id):
+        """复制密码到剪贴板（按需在存储线程中解密，不在表格中保留明文）"""
+        secret = self.secret_accessor.cached(password_id)
+        if secret is not None:
+            self._copy_secret(secret)
+        else:
+            self.storage.get_secret(password_id, callback=self._copy_secret)
     
-    def populate_row(self, row, password):
-        """填充行数据"""
-        # 序号
-        sequence_item = QTableWidgetItem(str(row + 1))
-        sequence_item.setTextAlignment(Qt.AlignCenter)
-        self.setItem(row, 0, sequence_item)
-        
-        # 网站/应用
-        self.setItem(row, 1, QTableWidgetItem(password.get('website', '')))
-        
-        # 分类
-        category_item = QTableWidgetItem(password.get('category', '未分类'))
-        category_item.setTextAlignment(Qt.AlignCenter)
-        self.setItem(row, 2, category_item)
-        
-        # 用户名
-        self.setItem(row, 3, QTableWidgetItem(password.get('username', '')))
-        
-        # 密码（隐藏显示）
-        password_item = QTableWidgetItem('••••••••')
-        password_item.setData(Qt.UserRole, password.get('password', ''))
-        self.setItem(row, 4, password_item)
-        
-        # 网址
-        self.setItem(row, 5, QTableWidgetItem(password.get('url', '')))
-        
-        # 备注
-        notes = password.get('notes', '')
-        if len(notes) > 20:
-            notes = notes[:20] + '...'
-        self.setItem(row, 6, QTableWidgetItem(notes))
-        
-        # 操作按钮
-        self.create_action_buttons(row, password)
+    def _copy_secret(self, secret):
+        if secret is None:
+            self.password_copied.emit('密码读取失败')
+            return
+        clipboard = QApplication.clipboard()
+        clipboard.setText(secret)
+        self.password_copied.emit('密码已复制到剪贴板')
     
-    def create_action_buttons(self, row, password):
-        """创建操作按钮"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(4, 2, 4, 2)
-        layout.setSpacing(2)
+    def toggle_password_visibility(self, password_id):
+        """切换密码可见性，明文在访问器过期后自动隐藏"""
+        if self.password_model.is_revealed(password_id):
+            self.password_model.conceal(password_id)
+            self.secret_accessor.drop(password_id)
+            return
         
-        # 按钮样式
-        small_button_style = """
-            QPushButton {
-                border: none;
-                border-radius: 4px;
-                font-size: 11px;
-                font-weight: 500;
-                margin: 1px;
-                min-width: 28px;
-                min-height: 28px;
-            }
-        """
-        
-        # 复制密码按钮
-        copy_btn = QPushButton('📋')
-        copy_btn.setToolTip('复制密码')
-        copy_btn.setFixedSize(32, 28)
-        copy_btn.setStyleSheet(small_button_style + """
-            QPushButton {
-                background-color: #17a2b8;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #138496;
-                transform: translateY(-1px);
-            }
-            QPushButton:pressed {
-                background-color: #117a8b;
-            }
-        """)
-        copy_btn.clicked.connect(lambda: self.copy_password(password.get('password', '')))
-        layout.addWidget(copy_btn)
-        
-        # 查看按钮
-        view_btn = QPushButton('👁️')
-        view_btn.setToolTip('查看密码')
-        view_btn.setFixedSize(32, 28)
-        view_btn.setStyleSheet(small_button_style + """
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-                transform: translateY(-1px);
-            }
-            QPushButton:pressed {
-                background-color: #545b62;
-            }
-        """)
-        view_btn.clicked.connect(lambda: self.toggle_password_visibility(row))
-        layout.addWidget(view_btn)
-        
-        # 编辑按钮
-        edit_btn = QPushButton('✏️')
-        edit_btn.setToolTip('编辑')
-        edit_btn.setFixedSize(32, 28)
-        edit_btn.setStyleSheet(small_button_style + """
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-                transform: translateY(-1px);
-            }
-            QPushButton:pressed {
-                background-color: #1e7e34;
-            }
-        """)
-        edit_btn.clicked.connect(lambda: self.password_edit_requested.emit(password))
-        layout.addWidget(edit_btn)
-        
-        # 删除按钮
-        delete_btn = QPushButton('🗑️')
-        delete_btn.setToolTip('删除')
-        delete_btn.setFixedSize(32, 28)
-        delete_btn.setStyleSheet(small_button_style + """
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-                transform: translateY(-1px);
-            }
-            QPushButton:pressed {
-                background-color: #bd2130;
-            }
-        """)
-        delete_btn.clicked.connect(lambda: self.password_delete_requested.emit(password))
-        layout.addWidget(delete_btn)
-        
-        self.setCellWidget(row, 7, widget)
+        secret = self.secret_accessor.cached(password_id)
+        if secret is not None:
+            self._reveal_secret(password_id, secret)
+        else:
+            self.storage.get_secret(
+                password_id, callback=lambda secret: self._reveal_secret(password_id, secret)
+            )
     
-    def copy_password(self, password):
-        """复制密码到剪贴板"""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(password)
-        self.password_copied.emit('密码已复制到剪贴板')
+    def _reveal_secret(self, password_id, secret):
+        """显示解密后的明文；解密期间该行已被移除时丢弃"""
+        if secret is None:
+            self.password_copied.emit('密码读取失败')
+            return
+        if not self.contains_entry(password_id):
+            return
+        self.secret_accessor.put(password_id, secret)
+        self.password_model.reveal(password_id, secret)
+        self.secret_timer.start()
     
-    def toggle_password_visibility(self, row):
-        """切换密码可见性"""
-        item = self.item(row, 4)  # 密码列索引改为4
-        if item:
-            current_text = item.text()
-            real_password = item.data(Qt.UserRole)
-            
-            if current_text == '••••••••':
-                item.setText(real_password)
-            else:
-                item.setText('••••••••')
\ No newline at end of file
+    def expire_secrets(self):
+        """隐藏并丢弃已过期的明文"""
+        self.secret_accessor.purge()
+        for password_id in self.password_model.revealed_ids():
+            if password_id not in self.secret_accessor:
+                self.password_model.conceal(password_id)
+        if not self.password_model.revealed_ids():
+            self.secret_timer.stop()
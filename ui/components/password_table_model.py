@@ -0,0 +1,334 @@
+import unicodedata
+from collections import Counter
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from PySide6.QtGui import QColor
+
+from utils.category_facets import normalize_category
+from utils.styles import StyleManager
+from utils.vault_audit import STRENGTH_LABELS, WEAK_SCORE
+
+
+def text_units(text: str) -> int:
+    """估算文本显示宽度（全角字符计 2，其余计 1）"""
+    return sum(2 if unicodedata.east_asian_width(char) in 'WF' else 1 for char in text)
+
+
+class ColumnExtent:
+    """单列文本宽度统计
+
+    按宽度单位计数并记住每种宽度的一个示例文本，
+    增删时只需更新计数，最大宽度变化时才需要重新计算列宽。
+    敏感列（密码明文）不保存示例，以同宽度的占位文本代替。
+    """
+
+    def __init__(self, sensitive=False):
+        self._counts = Counter()
+        self._examples = {}
+        self.sensitive = sensitive
+        self.max_units = 0
+
+    @property
+    def longest_text(self) -> str:
+        """当前最长文本的示例"""
+        if self.sensitive:
+            return '0' * self.max_units
+        return self._examples.get(self.max_units, '')
+
+    def clear(self):
+        self._counts.clear()
+        self._examples.clear()
+        self.max_units = 0
+
+    def add(self, text) -> bool:
+        """记录一个文本，返回最大宽度是否变化"""
+        units = text_units(text)
+        self._counts[units] += 1
+        if not self.sensitive:
+            self._examples[units] = text
+        if units > self.max_units:
+            self.max_units = units
+            return True
+        return False
+
+    def remove(self, text) -> bool:
+        """移除一个文本，返回最大宽度是否变化"""
+        units = text_units(text)
+        if self._counts.get(units, 0) <= 0:
+            return False
+        self._counts[units] -= 1
+        if self._counts[units]:
+            return False
+
+        del self._counts[units]
+        self._examples.pop(units, None)
+        if units == self.max_units:
+            self.max_units = max(self._counts, default=0)
+            return True
+        return False
+
+
+class PasswordTableModel(QAbstractTableModel):
+    """密码表格数据模型
+
+    按条目 ID 维护行号，增删改只通知受影响的行。
+    条目为 PasswordEntry，不含密码明文，只有用户点击查看的行才临时持有明文，由视图负责超时隐藏。
+    安全列显示最近一次密码体检的结果（强度与重复使用次数，见 utils/vault_audit.py）
+    以及离线泄露检查的结果（见 utils/breach_check.py）。
+    """
+
+    # 信号定义
+    column_extent_changed = Signal(int)  # 某列最长文本的宽度发生变化
+
+    HEADERS = ['序号', '网站/应用', '分类', '用户名', '密码', '网址', '备注', '安全', '操作']
+    ACTION_COLUMN = 8
+    AUDIT_COLUMN = 7
+    PASSWORD_COLUMN = 4
+    MASK = '••••••••'
+
+    # 按内容估算宽度的列（密码列只统计已显示明文的条目）
+    TRACKED_COLUMNS = (1, 2, 3, 6)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        self._row_by_id = {}
+        self._revealed = {}  # id -> 正在显示的明文
+        self._audit = {}  # id -> (强度, 共用该密码的条目数, 共用组编号)
+        self._breaches = {}  # id -> 在泄露库中出现的次数
+        self._extents = {column: ColumnExtent() for column in self.TRACKED_COLUMNS}
+        self._extents[self.PASSWORD_COLUMN] = ColumnExtent(sensitive=True)
+
+    # ---- Qt 模型接口 ----
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, column = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            return self.display_text(self._entries[row], row, column)
+        if role == Qt.TextAlignmentRole and column in (0, 2, self.AUDIT_COLUMN):
+            return int(Qt.AlignCenter)
+        if role == Qt.ForegroundRole and column == self.AUDIT_COLUMN and self.has_issue(self._entries[row].id):
+            return QColor(StyleManager.color('warning'))
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable if index.isValid() else Qt.NoItemFlags
+
+    def display_text(self, entry, row, column):
+        """单元格显示文本"""
+        if column == 0:
+            return str(row + 1)
+        if column == 1:
+            return entry.website
+        if column == 2:
+            return normalize_category(entry.category)
+        if column == 3:
+            return entry.username
+        if column == self.PASSWORD_COLUMN:
+            return self._revealed.get(entry.id, self.MASK)
+        if column == 5:
+            return entry.url
+        if column == 6:
+            notes = entry.notes
+            return notes[:20] + '...' if len(notes) > 20 else notes
+        if column == self.AUDIT_COLUMN:
+            parts = []
+            finding = self._audit.get(entry.id)
+            if finding is not None:
+                score, reuse_count, _ = finding
+                parts.append(STRENGTH_LABELS[score])
+                if reuse_count > 1:
+                    parts.append(f'重复 {reuse_count}')
+            if self._breaches.get(entry.id):
+                parts.append('已泄露')
+            return ' · '.join(parts)
+        return None
+
+    # ---- 数据访问 ----
+
+    def entry_at(self, row):
+        """获取指定行的条目"""
+        if 0 <= row < len(self._entries):
+            return self._entries[row]
+        return None
+
+    def entry_by_id(self, entry_id):
+        """按 ID 获取条目"""
+        row = self._row_by_id.get(entry_id)
+        return None if row is None else self._entries[row]
+
+    def row_of(self, entry_id):
+        """按 ID 获取行号，不存在时返回 -1"""
+        return self._row_by_id.get(entry_id, -1)
+
+    def has_issue(self, entry_id) -> bool:
+        """条目是否为弱密码、与其他条目共用密码或出现在泄露库中"""
+        if self._breaches.get(entry_id):
+            return True
+        finding = self._audit.get(entry_id)
+        return finding is not None and (finding[0] <= WEAK_SCORE or finding[1] > 1)
+
+    def longest_text(self, column) -> str:
+        """该列当前最长的显示文本"""
+        extent = self._extents.get(column)
+        return extent.longest_text if extent else ''
+
+    # ---- 列宽统计 ----
+
+    def _track(self, entry, add=True):
+        """增减条目对各列宽度统计的贡献"""
+        for column in self.TRACKED_COLUMNS:
+            extent = self._extents[column]
+            text = self.display_text(entry, 0, column)
+            if extent.add(text) if add else extent.remove(text):
+                self.column_extent_changed.emit(column)
+
+    def _track_revealed(self, secret, add=True):
+        extent = self._extents[self.PASSWORD_COLUMN]
+        if extent.add(secret) if add else extent.remove(secret):
+            self.column_extent_changed.emit(self.PASSWORD_COLUMN)
+
+    # ---- 数据更新 ----
+
+    def set_entries(self, entries):
+        """整体替换数据"""
+        self.beginResetModel()
+        self._entries = list(entries)
+        self._row_by_id = {entry['id']: row for row, entry in enumerate(self._entries)}
+        self._revealed = {
+            entry_id: secret for entry_id, secret in self._revealed.items() if entry_id in self._row_by_id
+        }
+
+        # 重置时视图会整体重新计算列宽，这里只重建统计
+        self.blockSignals(True)
+        try:
+            for extent in self._extents.values():
+                extent.clear()
+            for entry in self._entries:
+                self._track(entry)
+            for secret in self._revealed.values():
+                self._track_revealed(secret)
+        finally:
+            self.blockSignals(False)
+        self.endResetModel()
+
+    def append_entry(self, entry):
+        """在末尾追加一行"""
+        row = len(self._entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.append(entry)
+        self._row_by_id[entry['id']] = row
+        self.endInsertRows()
+        self._track(entry)
+
+    def append_entries(self, entries):
+        """在末尾批量追加多行"""
+        if not entries:
+            return
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        for row, entry in enumerate(entries, first):
+            self._entries.append(entry)
+            self._row_by_id[entry['id']] = row
+        self.endInsertRows()
+        for entry in entries:
+            self._track(entry)
+
+    def update_entry(self, entry):
+        """更新单行数据，条目不在模型中时返回 False"""
+        row = self._row_by_id.get(entry['id'])
+        if row is None:
+            return False
+        previous = self._entries[row]
+        self._entries[row] = entry
+        self.conceal(entry['id'])  # 密码可能已修改，旧明文作废
+        # 先加后减，文本宽度不变时不会触发列宽重算
+        self._track(entry)
+        self._track(previous, add=False)
+        self.dataChanged.emit(self.index(row, 1), self.index(row, self.ACTION_COLUMN - 1))
+        return True
+
+    def remove_entry(self, entry_id):
+        """移除单行，条目不在模型中时返回 False"""
+        row = self._row_by_id.get(entry_id)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        removed = self._entries.pop(row)
+        del self._row_by_id[entry_id]
+        for later_row in range(row, len(self._entries)):
+            self._row_by_id[self._entries[later_row]['id']] = later_row
+        self.endRemoveRows()
+
+        self._track(removed, add=False)
+        if entry_id in self._revealed:
+            self._track_revealed(self._revealed.pop(entry_id), add=False)
+
+        # 后续行的序号随之变化
+        if row < len(self._entries):
+            self.dataChanged.emit(self.index(row, 0), self.index(len(self._entries) - 1, 0))
+        return True
+
+    def set_audit(self, findings):
+        """更新密码体检结果，只刷新安全列"""
+        self._audit = findings
+        self._refresh_audit_column()
+
+    def set_breaches(self, counts):
+        """更新泄露检查结果，只刷新安全列"""
+        self._breaches = counts
+        self._refresh_audit_column()
+
+    def _refresh_audit_column(self):
+        if self._entries:
+            self.dataChanged.emit(self.index(0, self.AUDIT_COLUMN),
+                                  self.index(len(self._entries) - 1, self.AUDIT_COLUMN))
+
+    def revealed_ids(self) -> list:
+        """正在显示明文的条目 ID"""
+        return list(self._revealed)
+
+    def is_revealed(self, entry_id) -> bool:
+        """条目是否正在显示明文"""
+        return entry_id in self._revealed
+
+    def reveal(self, entry_id, secret):
+        """显示某行的密码明文"""
+        row = self._row_by_id.get(entry_id)
+        if row is None:
+            return
+        self.conceal(entry_id)
+        self._revealed[entry_id] = secret
+        self._track_revealed(secret)
+        index = self.index(row, self.PASSWORD_COLUMN)
+        self.dataChanged.emit(index, index)
+
+    def conceal(self, entry_id):
+        """隐藏某行的密码明文并丢弃"""
+        secret = self._revealed.pop(entry_id, None)
+        if secret is None:
+            return
+        self._track_revealed(secret, add=False)
+        row = self._row_by_id.get(entry_id)
+        if row is not None:
+            index = self.index(row, self.PASSWORD_COLUMN)
+            self.dataChanged.emit(index, index)
+
+    def conceal_all(self):
+        """隐藏全部明文"""
+        for entry_id in list(self._revealed):
+            self.conceal(entry_id)
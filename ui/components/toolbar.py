@@ -1,6 +1,9 @@
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLineEdit, QPushButton, QComboBox, QLabel
-from PySide6.QtCore import Signal
-from utils.styles import StyleManager
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QStandardItemModel, QStandardItem
+from utils.category_facets import UNCATEGORIZED
+from utils.icon_manager import IconManager
+from utils.tracing import traced
 
 class ToolbarWidget(QWidget):
     """工具栏组件"""
@@ -11,10 +14,14 @@ class ToolbarWidget(QWidget):
     add_clicked = Signal()
     refresh_clicked = Signal()
     
+    # 预设分类
+    DEFAULT_CATEGORIES = ['工作', '本地', '个人', '全链路']
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._category_items = {}  # 分类 -> QStandardItem
+        self._current_category = ''
         self.setup_ui()
-        self.apply_styles()
     
     def setup_ui(self):
         """设置UI"""
@@ -22,44 +29,45 @@ class ToolbarWidget(QWidget):
         layout.setSpacing(15)
 
         # 添加密码按钮
-        self.add_btn = QPushButton('➕ 添加')
+        self.add_btn = QPushButton(IconManager.glyph_icon('➕'), '添加')
         self.add_btn.clicked.connect(self.add_clicked.emit)
         layout.addWidget(self.add_btn)
         
         # 搜索框
         self.search_edit = QLineEdit()
-        self.search_edit.setPlaceholderText('🔍 搜索网站、用户名或备注...')
+        self.search_edit.setPlaceholderText('🔍 搜索网站、用户名、备注或拼音...')
         self.search_edit.textChanged.connect(self.search_changed.emit)
         layout.addWidget(self.search_edit)
         
+        # 分类下拉框（模型原地更新，显示各分类条目数）
+        self.category_model = QStandardItemModel(self)
         self.category_combo = QComboBox()
-        self.category_combo.currentTextChanged.connect(self._on_category_changed)
+        self.category_combo.setModel(self.category_model)
+        self._all_item = self._create_category_item('')
+        self.category_model.appendRow(self._all_item)
+        for category in self.DEFAULT_CATEGORIES + [UNCATEGORIZED]:
+            self._insert_category_item(category, 0)
+        self.category_combo.currentIndexChanged.connect(self._on_category_changed)
         layout.addWidget(self.category_combo)
 
         # 清除筛选按钮
-        self.clear_filter_btn = QPushButton('🗑️ 重置')
+        self.clear_filter_btn = QPushButton(IconManager.glyph_icon('🗑️'), '重置')
+        self.clear_filter_btn.setProperty('variant', 'secondary')
         self.clear_filter_btn.clicked.connect(self.clear_all_filters)
         layout.addWidget(self.clear_filter_btn)
         
         # 刷新按钮
-        self.refresh_btn = QPushButton('🔄 刷新')
+        self.refresh_btn = QPushButton(IconManager.glyph_icon('🔄'), '刷新')
+        self.refresh_btn.setProperty('variant', 'secondary')
         self.refresh_btn.clicked.connect(self.refresh_clicked.emit)
         layout.addWidget(self.refresh_btn)
     
-    def _on_category_changed(self, text):
-        """分类改变时的处理"""
-        if text == '全部分类':
-            self.category_changed.emit('')
-        else:
-            self.category_changed.emit(text)
-    
-    def apply_styles(self):
-        """应用样式"""
-        self.search_edit.setStyleSheet(StyleManager.get_input_style())
-        self.category_combo.setStyleSheet(StyleManager.get_combobox_style())
-        self.add_btn.setStyleSheet(StyleManager.get_button_style())
-        self.clear_filter_btn.setStyleSheet(StyleManager.get_secondary_button_style())
-        self.refresh_btn.setStyleSheet(StyleManager.get_secondary_button_style())
+    def _on_category_changed(self, index):
+        """分类改变时的处理，仅在选中的分类确实变化时发出信号"""
+        category = self.get_selected_category()
+        if category != self._current_category:
+            self._current_category = category
+            self.category_changed.emit(category)
     
     def get_search_text(self):
         """获取搜索文本"""
@@ -67,10 +75,8 @@ class ToolbarWidget(QWidget):
     
     def get_selected_category(self):
         """获取选中的分类"""
-        current_data = self.category_combo.currentData()
-        if current_data is not None:
-            return current_data
-        return self.category_combo.currentText() if self.category_combo.currentText() != '全部分类' else ''
+        current_data = self.category_combo.currentData(Qt.UserRole)
+        return current_data or ''
     
     def clear_search(self):
         """清空搜索框"""
@@ -80,34 +86,72 @@ class ToolbarWidget(QWidget):
         """重置分类筛选"""
         self.category_combo.setCurrentIndex(0)
     
-    def update_categories(self, categories):
-        """更新分类列表"""
-        current_selection = self.get_selected_category()
-        
-        # 清空并重新添加
-        self.category_combo.clear()
-        self.category_combo.addItem('全部分类', '')
-        
-        # 添加预设分类
-        default_categories = [
-            '工作', '本地', '个人', '全链路'
-        ]
-        
-        # 合并用户自定义分类
-        all_categories = list(set(default_categories + [cat for cat in categories if cat and cat not in default_categories]))
-        all_categories.sort()
-        
-        for category in all_categories:
-            self.category_combo.addItem(category)
-        
-        # 添加未分类选项
-        self.category_combo.addItem('未分类')
-        
-        # 恢复之前的选择
-        if current_selection:
-            index = self.category_combo.findText(current_selection)
-            if index >= 0:
-                self.category_combo.setCurrentIndex(index)
+    @staticmethod
+    def _format_category(category, count):
+        """下拉框显示文本"""
+        return f'{category or "全部分类"} ({count})'
+
+    def _create_category_item(self, category, count=0):
+        item = QStandardItem(self._format_category(category, count))
+        item.setData(category, Qt.UserRole)
+        return item
+
+    def _insert_category_item(self, category, count):
+        """按排序位置插入分类项，“未分类”始终位于末尾"""
+        position = self.category_model.rowCount()
+        if category != UNCATEGORIZED:
+            position = 1
+            while position < self.category_model.rowCount():
+                other = self.category_model.item(position).data(Qt.UserRole)
+                if other == UNCATEGORIZED or other > category:
+                    break
+                position += 1
+        item = self._create_category_item(category, count)
+        self.category_model.insertRow(position, item)
+        self._category_items[category] = item
+
+    def _is_removable(self, category):
+        return (category not in self.DEFAULT_CATEGORIES and category != UNCATEGORIZED
+                and category != self.get_selected_category())
+
+    @traced('刷新分类列表', 'ui')
+    def update_categories(self, counts, total):
+        """按完整统计结果更新分类列表
+
+        Args:
+            counts: {分类: 条目数}
+            total: 条目总数
+        """
+        self.category_combo.blockSignals(True)
+        try:
+            self.set_total_count(total)
+            for category in list(self._category_items):
+                if category not in counts and self._is_removable(category):
+                    self.category_model.removeRow(self._category_items.pop(category).row())
+            for category in set(self._category_items) | set(counts):
+                self.update_category_count(category, counts.get(category, 0))
+        finally:
+            self.category_combo.blockSignals(False)
+
+    def update_category_count(self, category, count):
+        """原地更新单个分类的条目数
+
+        自定义分类计数归零时移除（当前选中的除外），新分类按排序位置插入。
+        """
+        item = self._category_items.get(category)
+        if item is None:
+            if count > 0:
+                self._insert_category_item(category, count)
+            return
+
+        if count <= 0 and self._is_removable(category):
+            self.category_model.removeRow(self._category_items.pop(category).row())
+        else:
+            item.setText(self._format_category(category, count))
+
+    def set_total_count(self, total):
+        """更新“全部分类”的条目数"""
+        self._all_item.setText(self._format_category('', total))
 
     def clear_all_filters(self):
         """清除所有筛选条件"""
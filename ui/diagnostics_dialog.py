@@ -0,0 +1,267 @@
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QWidget,
+    QFileDialog, QMessageBox, QTabWidget
+)
+import time
+
+from PySide6.QtCore import Qt, QTimer, QRectF
+from PySide6.QtGui import QPainter, QColor
+
+from utils.icon_manager import IconManager
+from utils.styles import StyleManager
+from utils.tracing import tracer, HISTOGRAM_BOUNDS
+from utils.stall_detector import stall_detector
+
+
+class HistogramWidget(QWidget):
+    """耗时分布直方图（对数分桶）"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.counts = []
+        self.title = ''
+        self.setMinimumHeight(160)
+
+    def set_histogram(self, title, counts):
+        self.title = title
+        self.counts = counts
+        self.update()
+
+    @staticmethod
+    def bucket_labels():
+        labels = [f'≤{bound:g}' for bound in HISTOGRAM_BOUNDS]
+        labels.append(f'>{HISTOGRAM_BOUNDS[-1]:g}')
+        return labels
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        text_color = self.palette().windowText().color()
+        metrics = painter.fontMetrics()
+        line_height = metrics.height()
+
+        painter.setPen(text_color)
+        painter.drawText(0, line_height, self.title or '选择一行查看耗时分布（毫秒）')
+        if not self.counts or not any(self.counts):
+            return
+
+        labels = self.bucket_labels()
+        top = line_height * 2
+        bottom = self.height() - line_height - 4
+        slot = self.width() / len(self.counts)
+        peak = max(self.counts)
+        for index, (count, label) in enumerate(zip(self.counts, labels)):
+            left = index * slot
+            if count:
+                height = max(1.0, (bottom - top) * count / peak)
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(QColor(StyleManager.color('chart')))
+                painter.drawRect(QRectF(left + 2, bottom - height, slot - 4, height))
+                painter.setPen(text_color)
+                painter.drawText(QRectF(left, bottom - height - line_height, slot, line_height),
+                                 Qt.AlignCenter, str(count))
+            painter.setPen(text_color)
+            painter.drawText(QRectF(left, bottom + 2, slot, line_height), Qt.AlignCenter, label)
+
+
+class DiagnosticsDialog(QDialog):
+    """诊断窗口 - 显示最近操作的耗时统计与界面卡顿记录，可导出 Chrome trace"""
+
+    COLUMNS = ['操作', '类别', '次数', '总计', '平均', 'p50', 'p95', '最大']
+    STALL_COLUMNS = ['时间', '时长(ms)', '处理函数', '耗时位置']
+    REFRESH_INTERVAL = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._stats = {}
+        self.setup_ui()
+
+        # 窗口可见时定期刷新
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def setup_ui(self):
+        IconManager.set_window_icon(self)
+        self.setWindowTitle('诊断')
+        self.resize(760, 560)
+
+        layout = QVBoxLayout(self)
+
+        # 记录开关与缓冲区占用
+        header = QHBoxLayout()
+        self.enabled_check = QCheckBox('记录操作耗时')
+        self.enabled_check.setChecked(tracer.enabled)
+        self.enabled_check.toggled.connect(self.set_tracing_enabled)
+        header.addWidget(self.enabled_check)
+        self.stall_check = QCheckBox(f'检测界面卡顿（>{stall_detector.threshold:g} ms）')
+        self.stall_check.setChecked(stall_detector.running)
+        self.stall_check.toggled.connect(self.set_stall_detection_enabled)
+        header.addWidget(self.stall_check)
+        header.addStretch()
+        self.buffer_label = QLabel()
+        header.addWidget(self.buffer_label)
+        layout.addLayout(header)
+
+        self.tabs = QTabWidget()
+        layout.addWidget(self.tabs)
+
+        # 各操作耗时统计（毫秒）
+        timings_page = QWidget()
+        timings_layout = QVBoxLayout(timings_page)
+        timings_layout.setContentsMargins(0, 0, 0, 0)
+        self.stats_table = QTableWidget(0, len(self.COLUMNS))
+        self.stats_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.stats_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.stats_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.stats_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.stats_table.verticalHeader().setVisible(False)
+        self.stats_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.stats_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.stats_table.setSortingEnabled(True)
+        self.stats_table.itemSelectionChanged.connect(self.update_histogram)
+        timings_layout.addWidget(self.stats_table)
+
+        self.histogram = HistogramWidget()
+        timings_layout.addWidget(self.histogram)
+        self.tabs.addTab(timings_page, '操作耗时')
+
+        # 最近的界面卡顿，悬停显示卡顿时的调用栈
+        stalls_page = QWidget()
+        stalls_layout = QVBoxLayout(stalls_page)
+        stalls_layout.setContentsMargins(0, 0, 0, 0)
+        self.stall_label = QLabel()
+        stalls_layout.addWidget(self.stall_label)
+        self.stall_table = QTableWidget(0, len(self.STALL_COLUMNS))
+        self.stall_table.setHorizontalHeaderLabels(self.STALL_COLUMNS)
+        self.stall_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.stall_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.stall_table.verticalHeader().setVisible(False)
+        self.stall_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.stall_table.horizontalHeader().setStretchLastSection(True)
+        stalls_layout.addWidget(self.stall_table)
+        self.tabs.addTab(stalls_page, '界面卡顿')
+
+        # 按钮
+        buttons = QHBoxLayout()
+        clear_btn = QPushButton('清空')
+        clear_btn.setProperty('variant', 'secondary')
+        clear_btn.clicked.connect(self.clear)
+        buttons.addWidget(clear_btn)
+        export_btn = QPushButton(IconManager.glyph_icon('📤'), '导出 Chrome Trace...')
+        export_btn.clicked.connect(self.export_trace)
+        buttons.addWidget(export_btn)
+        buttons.addStretch()
+        close_btn = QPushButton('关闭')
+        close_btn.setProperty('variant', 'secondary')
+        close_btn.clicked.connect(self.close)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def set_tracing_enabled(self, enabled):
+        if enabled:
+            tracer.enable()
+        else:
+            tracer.disable()
+        self.refresh()
+
+    def set_stall_detection_enabled(self, enabled):
+        if enabled:
+            stall_detector.start()
+        else:
+            stall_detector.stop()
+        self.refresh()
+
+    def selected_name(self):
+        row = self.stats_table.currentRow()
+        item = self.stats_table.item(row, 0) if row >= 0 else None
+        return item.text() if item is not None else None
+
+    def refresh(self):
+        """重新汇总缓冲区中的记录"""
+        self._stats = tracer.stats()
+        records = sum(stats['count'] for stats in self._stats.values())
+        self.buffer_label.setText(f'最近 {records}/{tracer.capacity} 条记录')
+
+        selected = self.selected_name()
+        self.stats_table.setSortingEnabled(False)
+        self.stats_table.setRowCount(len(self._stats))
+        for row, (name, stats) in enumerate(self._stats.items()):
+            self.stats_table.setItem(row, 0, QTableWidgetItem(name))
+            self.stats_table.setItem(row, 1, QTableWidgetItem(stats['category']))
+            values = [stats['count'], stats['total_ms'], stats['mean_ms'],
+                      stats['p50_ms'], stats['p95_ms'], stats['max_ms']]
+            for column, value in enumerate(values, 2):
+                item = QTableWidgetItem()
+                # 以数值存储，排序按大小而非字符串
+                item.setData(Qt.DisplayRole, value if column == 2 else round(value, 2))
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.stats_table.setItem(row, column, item)
+        self.stats_table.setSortingEnabled(True)
+
+        if selected is not None:
+            matches = self.stats_table.findItems(selected, Qt.MatchExactly)
+            if matches:
+                self.stats_table.selectRow(matches[0].row())
+        self.update_histogram()
+        self.refresh_stalls()
+
+    def refresh_stalls(self):
+        """更新卡顿次数、事件循环延迟与最近的卡顿列表"""
+        if stall_detector.running:
+            latency = stall_detector.latency_stats()
+            self.stall_label.setText(
+                f'界面卡顿 {stall_detector.stall_count} 次；事件循环延迟 '
+                f'p50 {latency["p50_ms"]:.1f} ms，p99 {latency["p99_ms"]:.1f} ms，'
+                f'最大 {latency["max_ms"]:.1f} ms'
+            )
+        else:
+            self.stall_label.setText(f'界面卡顿 {stall_detector.stall_count} 次（检测未开启）')
+        self.tabs.setTabText(1, f'界面卡顿 ({stall_detector.stall_count})')
+
+        stalls = list(reversed(stall_detector.stalls))
+        self.stall_table.setRowCount(len(stalls))
+        for row, stall in enumerate(stalls):
+            values = [time.strftime('%H:%M:%S', time.localtime(stall['at'])),
+                      f'{stall["duration_ms"]:.0f}', stall['handler'], stall['hotspot']]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setToolTip(''.join(stall['stack']) or value)
+                self.stall_table.setItem(row, column, item)
+
+    def update_histogram(self):
+        name = self.selected_name()
+        stats = self._stats.get(name)
+        if stats is None:
+            self.histogram.set_histogram('', [])
+        else:
+            self.histogram.set_histogram(f'{name} 耗时分布（毫秒，共 {stats["count"]} 次）', stats['histogram'])
+
+    def clear(self):
+        tracer.clear()
+        self.refresh()
+
+    def export_trace(self):
+        """导出为 Chrome trace-event JSON"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, '导出 Chrome Trace', 'secretbook_trace.json', 'Trace 文件 (*.json);;所有文件 (*)'
+        )
+        if not file_path:
+            return
+        try:
+            tracer.export_chrome_trace(file_path)
+        except OSError as e:
+            QMessageBox.critical(self, '错误', f'导出失败：{e}')
+            return
+        QMessageBox.information(self, '导出完成', f'已导出 {len(tracer.records())} 条记录，'
+                                '可在 chrome://tracing 或 Perfetto 中打开。')
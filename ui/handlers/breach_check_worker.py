@@ -0,0 +1,31 @@
+from PySide6.QtCore import QThread, Signal
+
+
+class BreachCheckWorker(QThread):
+    """后台泄露检查
+
+    查找需要随机访问可能长达数 GB 的泄露库文件，放在独立线程中执行，
+    不占用存储服务的工作线程，保存等操作不必排队等待。
+    中途被打断时已完成的部分写入缓存，下次只检查剩余的条目。
+    """
+
+    # 信号定义
+    progress = Signal(int, int)  # 已处理条数, 总条数
+    check_finished = Signal(object)  # {'counts': {id: 泄露次数}, 'checked': 查找次数}
+    check_failed = Signal(str)
+
+    def __init__(self, checker, corpus_path, parent=None):
+        super().__init__(parent)
+        self.checker = checker
+        self.corpus_path = corpus_path
+
+    def run(self):
+        try:
+            result = self.checker.run(
+                self.corpus_path, should_stop=self.isInterruptionRequested, progress=self.progress.emit
+            )
+        except (OSError, ValueError) as e:
+            self.check_failed.emit(str(e))
+            return
+        if result is not None:
+            self.check_finished.emit(result)
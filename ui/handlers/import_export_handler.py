@@ -3,14 +3,16 @@ from PySide6.QtCore import QObject, Signal
 from datetime import datetime
 
 class ImportExportHandler(QObject):
-    """导入导出处理器"""
+    """导入导出处理器（文件读写与加解密在 StorageService 的后台线程执行）"""
     
     # 信号定义
     passwords_updated = Signal()
+    status_message = Signal(str, int)  # message, timeout
     
-    def __init__(self, data_manager, parent_window):
+    def __init__(self, data_manager, storage, parent_window):
         super().__init__()
         self.data_manager = data_manager
+        self.storage = storage
         self.parent_window = parent_window
 
     def export_passwords(self):
@@ -30,14 +32,23 @@ class ImportExportHandler(QObject):
         )
 
         if file_path:
-            if self.data_manager.export_passwords(file_path):
-                QMessageBox.information(
-                    self.parent_window,
-                    '导出成功',
-                    f'密码已成功导出到:\n{file_path}\n\n注意：导出文件已加密，只能通过本程序导入。'
-                )
-            else:
-                QMessageBox.critical(self.parent_window, '导出失败', '导出密码时发生错误，请重试。')
+            self.status_message.emit('正在导出密码...', 0)
+            self.storage.export_passwords(
+                file_path, callback=lambda success: self._on_exported(file_path, success)
+            )
+
+    def _on_exported(self, file_path, success):
+        """导出完成"""
+        if success:
+            self.status_message.emit('导出完成', 2000)
+            QMessageBox.information(
+                self.parent_window,
+                '导出成功',
+                f'密码已成功导出到:\n{file_path}\n\n注意：导出文件已加密，只能通过本程序导入。'
+            )
+        else:
+            self.status_message.emit('导出失败', 2000)
+            QMessageBox.critical(self.parent_window, '导出失败', '导出密码时发生错误，请重试。')
 
     def import_passwords(self):
         """导入密码"""
@@ -67,19 +78,26 @@ class ImportExportHandler(QObject):
             merge_mode = (reply == QMessageBox.Yes)
 
             # 执行导入
-            success, message, duplicates = self.data_manager.import_passwords(file_path, merge_mode)
+            self.status_message.emit('正在导入密码...', 0)
+            self.storage.import_passwords(file_path, merge_mode, callback=self._on_imported)
 
-            if success:
-                if duplicates:
-                    # 处理重复密码
-                    self.handle_duplicate_passwords(duplicates)
-                else:
-                    QMessageBox.information(self.parent_window, '导入成功', message)
+    def _on_imported(self, result):
+        """导入完成"""
+        success, message, duplicates = result
 
-                # 发射信号通知主窗口刷新
-                self.passwords_updated.emit()
+        if success:
+            self.status_message.emit('导入完成', 2000)
+            if duplicates:
+                # 处理重复密码
+                self.handle_duplicate_passwords(duplicates)
             else:
-                QMessageBox.critical(self.parent_window, '导入失败', message)
+                QMessageBox.information(self.parent_window, '导入成功', message)
+
+            # 覆盖操作按提交顺序执行，全部完成后再通知主窗口刷新
+            self.storage.after_pending(self.passwords_updated.emit)
+        else:
+            self.status_message.emit('导入失败', 2000)
+            QMessageBox.critical(self.parent_window, '导入失败', message)
 
     def handle_duplicate_passwords(self, duplicates: list):
         """处理重复密码"""
@@ -103,7 +121,7 @@ class ImportExportHandler(QObject):
             if reply == QMessageBox.YesToAll:
                 # 覆盖所有剩余重复项
                 for remaining_duplicate in duplicates[i:]:
-                    self.data_manager.update_password(
+                    self.storage.update_password(
                         remaining_duplicate['existing_data']['id'],
                         remaining_duplicate['import_data'],
                         force_update=True
@@ -114,7 +132,7 @@ class ImportExportHandler(QObject):
                 break
             elif reply == QMessageBox.Yes:
                 # 覆盖当前项
-                self.data_manager.update_password(
+                self.storage.update_password(
                     existing_data['id'],
                     import_data,
                     force_update=True
@@ -1,18 +1,26 @@
 from PySide6.QtWidgets import QMessageBox, QDialog
 from PySide6.QtCore import QObject, Signal
 from ..password_dialog import PasswordDialog
+from ..history_dialog import HistoryDialog
 from ..login_dialog import LoginDialog
 
 class PasswordHandler(QObject):
-    """密码业务逻辑处理器"""
+    """密码业务逻辑处理器
     
-    # 信号定义
-    passwords_updated = Signal()
+    存储与加密操作通过 StorageService 在后台线程执行，结果在回调中处理，
+    操作进行期间界面保持响应。
+    """
+    
+    # 信号定义（携带变更后的密码记录 PasswordEntry）
+    entry_added = Signal(object)
+    entry_updated = Signal(object)
+    entry_removed = Signal(object)
     status_message = Signal(str, int)  # message, timeout
     
-    def __init__(self, data_manager, parent_window):
+    def __init__(self, data_manager, storage, parent_window):
         super().__init__()
         self.data_manager = data_manager
+        self.storage = storage
         self.parent_window = parent_window
     
     def add_password(self):
@@ -20,80 +28,137 @@ class PasswordHandler(QObject):
         dialog = PasswordDialog()
         if dialog.exec() == QDialog.Accepted:
             password_data = dialog.get_data()
+            self.status_message.emit('正在保存密码...', 0)
+            self.storage.save_password(
+                password_data, callback=lambda result: self._on_password_saved(password_data, result)
+            )
+    
+    def _on_password_saved(self, password_data, result):
+        """添加完成（失败时 result_data 为重复记录，成功时为保存后的记录）"""
+        success, message, result_data = result
+        
+        if not success and result_data:
+            # 发现重复，询问用户
+            reply = QMessageBox.question(
+                self.parent_window,
+                '发现重复密码',
+                f'应用名：{password_data.get("website", "")}\n'
+                f'用户名：{password_data.get("username", "")}\n\n'
+                f'该密码已存在，是否要更新现有密码？\n\n'
+                f'现有密码创建时间：{result_data.get("created_at", "未知")}',
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
+            )
             
-            # 检查唯一性
-            success, message, duplicate_data = self.data_manager.save_password(password_data)
-            
-            if not success and duplicate_data:
-                # 发现重复，询问用户
-                reply = QMessageBox.question(
-                    self.parent_window,
-                    '发现重复密码',
-                    f'应用名：{password_data.get("website", "")}\n'
-                    f'用户名：{password_data.get("username", "")}\n\n'
-                    f'该密码已存在，是否要更新现有密码？\n\n'
-                    f'现有密码创建时间：{duplicate_data.get("created_at", "未知")}',
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.No
-                )
-                
-                if reply == QMessageBox.Yes:
-                    # 用户选择更新
-                    success, message, _ = self.data_manager.update_password(
-                        duplicate_data['id'], password_data, force_update=True
-                    )
-                    
-                    if success:
-                        QMessageBox.information(self.parent_window, '成功', '密码已更新')
-                        self.passwords_updated.emit()
-                    else:
-                        QMessageBox.critical(self.parent_window, '错误', f'更新失败：{message}')
-            elif success:
-                QMessageBox.information(self.parent_window, '成功', '密码已添加')
-                self.passwords_updated.emit()
+            if reply == QMessageBox.Yes:
+                # 用户选择更新
+                self.force_update(result_data['id'], password_data)
             else:
-                QMessageBox.critical(self.parent_window, '错误', f'添加失败：{message}')
+                self.status_message.emit('已取消', 2000)
+        elif success:
+            self.status_message.emit('密码已添加', 2000)
+            QMessageBox.information(self.parent_window, '成功', '密码已添加')
+            self.entry_added.emit(result_data)
+        else:
+            self.status_message.emit('添加失败', 2000)
+            QMessageBox.critical(self.parent_window, '错误', f'添加失败：{message}')
+    
+    def force_update(self, password_id, password_data):
+        """忽略重复检查更新密码"""
+        self.status_message.emit('正在更新密码...', 0)
+        self.storage.update_password(
+            password_id, password_data, force_update=True, callback=self._on_force_updated
+        )
+    
+    def _on_force_updated(self, result):
+        success, message, updated_entry = result
+        if success:
+            self.status_message.emit('密码已更新', 2000)
+            QMessageBox.information(self.parent_window, '成功', '密码已更新')
+            self.entry_updated.emit(updated_entry)
+        else:
+            self.status_message.emit('更新失败', 2000)
+            QMessageBox.critical(self.parent_window, '错误', f'更新失败：{message}')
     
     def edit_password(self, password):
         """编辑密码"""
-        dialog = PasswordDialog(password)
+        # 表格中的记录不含明文，编辑时按需解密
+        self.status_message.emit('正在读取密码...', 0)
+        self.storage.get_secret(
+            password['id'], callback=lambda secret: self._on_secret_loaded(password, secret)
+        )
+    
+    def _on_secret_loaded(self, password, secret):
+        """读取明文后打开编辑对话框"""
+        if secret is None:
+            self.status_message.emit('读取密码失败', 2000)
+            QMessageBox.critical(self.parent_window, '错误', '读取密码失败')
+            return
+        
+        self.status_message.emit('', 0)
+        dialog = PasswordDialog(dict(password, password=secret))
         if dialog.exec() == QDialog.Accepted:
             password_data = dialog.get_data()
-            
-            # 检查唯一性
-            success, message, duplicate_data = self.data_manager.update_password(
-                password['id'], password_data
+            self.status_message.emit('正在更新密码...', 0)
+            self.storage.update_password(
+                password['id'], password_data,
+                callback=lambda result: self._on_password_updated(password, password_data, result)
+            )
+    
+    def _on_password_updated(self, password, password_data, result):
+        """编辑完成（失败时 result_data 为重复记录，成功时为更新后的记录）"""
+        success, message, result_data = result
+        
+        if not success and result_data:
+            # 发现重复，询问用户
+            reply = QMessageBox.question(
+                self.parent_window,
+                '发现重复密码',
+                f'应用名：{password_data.get("website", "")}\n'
+                f'用户名：{password_data.get("username", "")}\n\n'
+                f'该密码已存在，是否要强制更新？\n\n'
+                f'冲突密码创建时间：{result_data.get("created_at", "未知")}',
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
             )
             
-            if not success and duplicate_data:
-                # 发现重复，询问用户
-                reply = QMessageBox.question(
-                    self.parent_window,
-                    '发现重复密码',
-                    f'应用名：{password_data.get("website", "")}\n'
-                    f'用户名：{password_data.get("username", "")}\n\n'
-                    f'该密码已存在，是否要强制更新？\n\n'
-                    f'冲突密码创建时间：{duplicate_data.get("created_at", "未知")}',
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.No
-                )
-                
-                if reply == QMessageBox.Yes:
-                    # 用户选择强制更新
-                    success, message, _ = self.data_manager.update_password(
-                        password['id'], password_data, force_update=True
-                    )
-                    
-                    if success:
-                        QMessageBox.information(self.parent_window, '成功', '密码已更新')
-                        self.passwords_updated.emit()
-                    else:
-                        QMessageBox.critical(self.parent_window, '错误', f'更新失败：{message}')
-            elif success:
-                QMessageBox.information(self.parent_window, '成功', '密码已更新')
-                self.passwords_updated.emit()
+            if reply == QMessageBox.Yes:
+                # 用户选择强制更新
+                self.force_update(password['id'], password_data)
             else:
-                QMessageBox.critical(self.parent_window, '错误', f'更新失败：{message}')
+                self.status_message.emit('已取消', 2000)
+        elif success:
+            self.status_message.emit('密码已更新', 2000)
+            QMessageBox.information(self.parent_window, '成功', '密码已更新')
+            self.entry_updated.emit(result_data)
+        else:
+            self.status_message.emit('更新失败', 2000)
+            QMessageBox.critical(self.parent_window, '错误', f'更新失败：{message}')
+    
+    def show_history(self, password):
+        """查看历史版本"""
+        self.status_message.emit('正在读取历史版本...', 0)
+        self.storage.get_password_history(
+            password['id'], callback=lambda versions: self._on_history_loaded(password, versions)
+        )
+    
+    def _on_history_loaded(self, password, versions):
+        """读取历史版本后打开历史对话框，选择恢复时在后台恢复"""
+        self.status_message.emit('', 0)
+        dialog = HistoryDialog(password, versions, self.parent_window)
+        if dialog.exec() == QDialog.Accepted and dialog.selected_version() is not None:
+            version = dialog.selected_version()
+            self.status_message.emit('正在恢复历史版本...', 0)
+            self.storage.restore_password_version(password['id'], version, callback=self._on_version_restored)
+    
+    def _on_version_restored(self, result):
+        success, message, restored_entry = result
+        if success:
+            self.status_message.emit('已恢复历史版本', 2000)
+            self.entry_updated.emit(restored_entry)
+        else:
+            self.status_message.emit('恢复失败', 2000)
+            QMessageBox.critical(self.parent_window, '错误', f'恢复失败：{message}')
     
     def delete_password(self, password):
         """删除密码"""
@@ -105,11 +170,18 @@ class PasswordHandler(QObject):
         )
         
         if reply == QMessageBox.Yes:
-            if self.data_manager.delete_password(password['id']):
-                self.passwords_updated.emit()
-                self.status_message.emit('密码删除成功', 2000)
-            else:
-                QMessageBox.warning(self.parent_window, '错误', '密码删除失败')
+            self.status_message.emit('正在删除密码...', 0)
+            self.storage.delete_password(
+                password['id'], callback=lambda success: self._on_password_deleted(password, success)
+            )
+    
+    def _on_password_deleted(self, password, success):
+        if success:
+            self.entry_removed.emit(password)
+            self.status_message.emit('密码删除成功', 2000)
+        else:
+            self.status_message.emit('密码删除失败', 2000)
+            QMessageBox.warning(self.parent_window, '错误', '密码删除失败')
     
     def logout(self):
         """注销"""
@@ -0,0 +1,49 @@
+from PySide6.QtCore import QThread, Signal
+
+from utils.tracing import tracer
+
+
+class PasswordLoader(QThread):
+    """后台分批解密密码
+
+    首批只解密一屏左右的条目以尽快显示，之后按较大的批次继续。
+    发出的记录不含密码明文。
+    每个信号都带有加载批次号，主窗口据此丢弃过期加载的结果。
+    """
+
+    # 信号定义
+    load_started = Signal(int, int)  # generation, total
+    chunk_loaded = Signal(int, object)  # generation, passwords
+    load_finished = Signal(int)  # generation
+
+    CHUNK_SIZE = 500
+
+    def __init__(self, data_manager, generation, first_chunk_size=50, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.generation = generation
+        self.first_chunk_size = max(1, first_chunk_size)
+
+    def run(self):
+        encrypted_items = self.data_manager.get_encrypted_passwords()
+        self.load_started.emit(self.generation, len(encrypted_items))
+
+        start = 0
+        chunk_size = self.first_chunk_size
+        while start < len(encrypted_items):
+            if self.isInterruptionRequested():
+                return
+
+            chunk = []
+            with tracer.span('后台解密一批记录', 'loader'):
+                for encrypted_item in encrypted_items[start:start + chunk_size]:
+                    password_data = self.data_manager.decrypt_password_item(encrypted_item, include_secrets=False)
+                    if password_data is not None:
+                        chunk.append(password_data)
+            if chunk:
+                self.chunk_loaded.emit(self.generation, chunk)
+
+            start += chunk_size
+            chunk_size = self.CHUNK_SIZE
+
+        self.load_finished.emit(self.generation)
@@ -0,0 +1,101 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, Qt, Signal
+
+
+class StorageService(QObject):
+    """存储服务 - 在专用工作线程中执行 DataManager 的存储与加密操作
+
+    所有操作在同一个工作线程中按提交顺序依次执行，因此写入顺序与提交顺序一致。
+    每个方法立即返回 Future；操作完成后结果经 Qt 信号回到 GUI 线程，再调用
+    提交时传入的回调。操作抛出的异常通过 operation_failed 信号报告。
+    """
+
+    # 信号定义
+    busy_changed = Signal(bool)  # 是否有未完成的操作
+    operation_failed = Signal(str, str)  # 操作描述, 错误信息
+    _completed = Signal(object, object, str)  # future, callback, description
+
+    def __init__(self, data_manager, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='secretbook-storage')
+        self._pending = 0
+        # 显式排队连接：即使操作在 submit 返回前完成，回调也总在事件循环中执行
+        self._completed.connect(self._on_completed, Qt.QueuedConnection)
+
+    @property
+    def busy(self) -> bool:
+        return self._pending > 0
+
+    def submit(self, func, *args, callback=None, description='', **kwargs) -> Future:
+        """提交一个操作，完成后在 GUI 线程中以结果调用 callback"""
+        self._pending += 1
+        if self._pending == 1:
+            self.busy_changed.emit(True)
+
+        future = self._executor.submit(func, *args, **kwargs)
+        future.add_done_callback(lambda f: self._completed.emit(f, callback, description))
+        return future
+
+    def _on_completed(self, future, callback, description):
+        self._pending -= 1
+        if self._pending == 0:
+            self.busy_changed.emit(False)
+
+        error = future.exception()
+        if error is not None:
+            self.operation_failed.emit(description, str(error))
+        elif callback is not None:
+            callback(future.result())
+
+    def after_pending(self, callback) -> Future:
+        """在此前提交的操作全部完成后调用 callback"""
+        return self.submit(lambda: None, callback=lambda _: callback())
+
+    def shutdown(self):
+        """等待未完成的写入结束后停止工作线程"""
+        self._executor.shutdown(wait=True)
+
+    # DataManager 操作（回调参数与对应方法的返回值一致）
+
+    def save_password(self, password_data: dict, force_save: bool = False, callback=None) -> Future:
+        return self.submit(self.data_manager.save_password, password_data, force_save,
+                           callback=callback, description='保存密码')
+
+    def update_password(self, password_id: int, password_data: dict, force_update: bool = False,
+                        callback=None) -> Future:
+        return self.submit(self.data_manager.update_password, password_id, password_data, force_update,
+                           callback=callback, description='更新密码')
+
+    def delete_password(self, password_id: int, callback=None) -> Future:
+        return self.submit(self.data_manager.delete_password, password_id,
+                           callback=callback, description='删除密码')
+
+    def get_secret(self, password_id: int, callback=None) -> Future:
+        return self.submit(self.data_manager.get_secret, password_id,
+                           callback=callback, description='读取密码')
+
+    def get_password_history(self, password_id: int, callback=None) -> Future:
+        return self.submit(self.data_manager.get_password_history, password_id,
+                           callback=callback, description='读取历史版本')
+
+    def restore_password_version(self, password_id: int, version: int, callback=None) -> Future:
+        return self.submit(self.data_manager.restore_password_version, password_id, version,
+                           callback=callback, description='恢复历史版本')
+
+    def get_history_limit(self, callback=None) -> Future:
+        return self.submit(self.data_manager.get_history_limit,
+                           callback=callback, description='读取历史版本设置')
+
+    def set_history_limit(self, limit: int, callback=None) -> Future:
+        return self.submit(self.data_manager.set_history_limit, limit,
+                           callback=callback, description='清理历史版本')
+
+    def import_passwords(self, file_path: str, merge_mode: bool = True, callback=None) -> Future:
+        return self.submit(self.data_manager.import_passwords, file_path, merge_mode,
+                           callback=callback, description='导入密码')
+
+    def export_passwords(self, file_path: str, callback=None) -> Future:
+        return self.submit(self.data_manager.export_passwords, file_path,
+                           callback=callback, description='导出密码')
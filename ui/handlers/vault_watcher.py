@@ -0,0 +1,51 @@
+import os
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+
+
+class VaultWatcher(QObject):
+    """监视密码库文件的外部修改
+
+    同时监视文件本身和所在目录：密码库以原子替换的方式写入，替换后原文件
+    的监视会失效，需要重新添加。连续的变化合并为一次（去抖），在最后一次
+    变化 DEBOUNCE_MS 毫秒后发出 changed 信号。
+    """
+
+    # 信号定义
+    changed = Signal()
+
+    DEBOUNCE_MS = 300
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = str(path)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.addPath(os.path.dirname(self.path))
+        self._watch_file()
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.DEBOUNCE_MS)
+        self.timer.timeout.connect(self._on_timeout)
+
+        self.watcher.fileChanged.connect(self.schedule)
+        self.watcher.directoryChanged.connect(self.schedule)
+
+    def _watch_file(self):
+        if self.path not in self.watcher.files() and os.path.exists(self.path):
+            self.watcher.addPath(self.path)
+
+    def schedule(self, *_):
+        """（重新）开始去抖计时"""
+        self.timer.start()
+
+    def _on_timeout(self):
+        self._watch_file()
+        self.changed.emit()
+
+    def stop(self):
+        """停止监视"""
+        self.timer.stop()
+        paths = self.watcher.files() + self.watcher.directories()
+        if paths:
+            self.watcher.removePaths(paths)
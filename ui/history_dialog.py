@@ -0,0 +1,92 @@
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from PySide6.QtCore import Qt
+
+from utils.category_facets import normalize_category
+from utils.icon_manager import IconManager
+
+
+class HistoryDialog(QDialog):
+    """历史版本 - 列出某条密码的历史版本，选中后可恢复"""
+
+    COLUMNS = ['版本', '保存时间', '与后一版本的差异', '网站/应用', '用户名', '分类', '网址', '备注']
+    FIELD_LABELS = {
+        'website': '网站/应用', 'username': '用户名', 'password': '密码',
+        'url': '网址', 'category': '分类', 'notes': '备注',
+    }
+
+    def __init__(self, password, versions, parent=None):
+        """
+        Args:
+            password: 当前的 PasswordEntry
+            versions: DataManager.get_password_history 的结果（不含敏感字段）
+        """
+        super().__init__(parent)
+        self.password = password
+        self.versions = versions
+        self.setup_ui()
+
+    def setup_ui(self):
+        IconManager.set_window_icon(self)
+        self.setWindowTitle(f'历史版本 - {self.password.get("website", "")}')
+        self.resize(760, 420)
+
+        layout = QVBoxLayout(self)
+        summary = f'共 {len(self.versions)} 个历史版本' if self.versions else '暂无历史版本'
+        layout.addWidget(QLabel(summary))
+
+        self.table = QTableWidget(len(self.versions), len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.populate()
+        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.itemDoubleClicked.connect(self.accept)
+        layout.addWidget(self.table)
+
+        layout.addWidget(QLabel('恢复后当前内容会保存为新的历史版本，可以再次恢复。'))
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        self.restore_btn = QPushButton(IconManager.glyph_icon('↩️'), '恢复此版本')
+        self.restore_btn.setEnabled(False)
+        self.restore_btn.clicked.connect(self.accept)
+        buttons.addWidget(self.restore_btn)
+        close_btn = QPushButton('关闭')
+        close_btn.setProperty('variant', 'secondary')
+        close_btn.clicked.connect(self.reject)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+    def populate(self):
+        for row, version in enumerate(self.versions):
+            data = version['data']
+            saved_at = (version.get('saved_at') or '')[:19].replace('T', ' ')
+            changed = '、'.join(self.FIELD_LABELS.get(field, field) for field in version['changed'])
+            values = [
+                str(version['version']), saved_at, changed,
+                data.get('website', ''), data.get('username', ''), normalize_category(data.get('category', '')),
+                data.get('url', ''), (data.get('notes') or '').replace('\n', ' '),
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column == 0:
+                    item.setData(Qt.UserRole, version['version'])
+                    item.setTextAlignment(Qt.AlignCenter)
+                self.table.setItem(row, column, item)
+
+    def _on_selection_changed(self):
+        self.restore_btn.setEnabled(self.selected_version() is not None)
+
+    def selected_version(self):
+        """选中的版本号，未选中时为None"""
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.table.item(rows[0].row(), 0).data(Qt.UserRole)
@@ -6,7 +6,6 @@ from PySide6.QtCore import Qt, QSettings
 from PySide6.QtGui import QFont, QIcon
 
 from utils.icon_manager import IconManager
-from utils.styles import StyleManager
 from utils.data_manager import DataManager
 
 
@@ -18,8 +17,9 @@ class LoginDialog(QDialog):
         self.data_manager = data_manager
         self.settings = QSettings('SecretBook', 'LoginSettings')
         self.setup_ui()
-        self.apply_styles()
         self.load_saved_settings()
+        # 用户输入期间在后台解析密码库文件
+        self.data_manager.prefetch()
     
     def setup_ui(self):
         IconManager.set_window_icon(self)
@@ -35,7 +35,7 @@ class LoginDialog(QDialog):
         title = QLabel('🔐 密码管理')
         title.setAlignment(Qt.AlignCenter)
         title.setFont(QFont('Microsoft YaHei', 20, QFont.Bold))
-        title.setStyleSheet("color: #2c3e50;")
+        title.setObjectName('dialogTitle')
         layout.addWidget(title)
         
         # 表单
@@ -45,7 +45,7 @@ class LoginDialog(QDialog):
         # 用户名标签
         username_label = QLabel('用户名:')
         username_label.setFont(QFont('Microsoft YaHei', 12))
-        username_label.setStyleSheet("color: #34495e; font-weight: 500;")
+        username_label.setProperty('role', 'form-label')
         
         self.username_edit = QLineEdit()
         self.username_edit.setPlaceholderText('请输入用户名')
@@ -54,7 +54,7 @@ class LoginDialog(QDialog):
         # 密码标签
         password_label = QLabel('密码:')
         password_label.setFont(QFont('Microsoft YaHei', 12))
-        password_label.setStyleSheet("color: #34495e; font-weight: 500;")
+        password_label.setProperty('role', 'form-label')
         
         self.password_edit = QLineEdit()
         self.password_edit.setEchoMode(QLineEdit.Password)
@@ -69,24 +69,6 @@ class LoginDialog(QDialog):
         
         self.remember_password_cb = QCheckBox('记住密码')
         self.remember_password_cb.setFont(QFont('Microsoft YaHei', 10))
-        self.remember_password_cb.setStyleSheet("""
-            QCheckBox {
-                color: #34495e;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 2px solid #bdc3c7;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #3498db;
-                border-color: #3498db;
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iOSIgdmlld0JveD0iMCAwIDEyIDkiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CjxwYXRoIGQ9Ik0xIDQuNUw0LjUgOEwxMSAxIiBzdHJva2U9IndoaXRlIiBzdHJva2Utd2lkdGg9IjIiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIgc3Ryb2tlLWxpbmVqb2luPSJyb3VuZCIvPgo8L3N2Zz4K);
-            }
-        """)
         remember_layout.addWidget(self.remember_password_cb)
         
         layout.addLayout(remember_layout)
@@ -99,6 +81,7 @@ class LoginDialog(QDialog):
         self.login_btn.clicked.connect(self.login)
         
         self.register_btn = QPushButton('注册')
+        self.register_btn.setProperty('variant', 'secondary')
         self.register_btn.clicked.connect(self.register)
         
         button_layout.addWidget(self.login_btn)
@@ -138,14 +121,6 @@ class LoginDialog(QDialog):
         else:
             self.settings.remove('password')
     
-    def apply_styles(self):
-        """应用样式"""
-        self.setStyleSheet(StyleManager.get_dialog_style())
-        self.username_edit.setStyleSheet(StyleManager.get_input_style())
-        self.password_edit.setStyleSheet(StyleManager.get_input_style())
-        self.login_btn.setStyleSheet(StyleManager.get_button_style())
-        self.register_btn.setStyleSheet(StyleManager.get_secondary_button_style())
-    
     def show_message(self, icon_type, title, message):
         """显示消息框的通用方法
         
@@ -155,7 +130,6 @@ class LoginDialog(QDialog):
             message: 消息内容
         """
         qmb = QMessageBox(self)
-        qmb.setStyleSheet(StyleManager.get_msg_box_style())
         qmb.setIcon(icon_type)
         qmb.setWindowTitle(title)
         qmb.setText(message)
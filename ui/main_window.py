@@ -1,43 +1,87 @@
-import os
+import time
 
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, Signal, QTimer, QSettings
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QMessageBox, QApplication
+    QMainWindow, QWidget, QVBoxLayout, QMessageBox, QApplication, QFileDialog, QInputDialog
 )
 
 from utils.icon_manager import IconManager
 from utils.styles import StyleManager
 from utils.data_manager import DataManager
+from utils.column_store import ColumnStore
+from utils.secret_access import SecretAccessor
+from utils.category_facets import CategoryFacets, normalize_category
+from utils.tracing import traced
+from utils.vault_audit import VaultAudit
+from utils.breach_check import BreachChecker, BreachCorpus
+from utils.version_history import MAX_HISTORY_LIMIT
 from .components.toolbar import ToolbarWidget
 from .components.password_table import PasswordTableWidget
 from .components.menu_manager import MenuManager
 from .handlers.password_handler import PasswordHandler
 from .handlers.import_export_handler import ImportExportHandler
+from .handlers.password_loader import PasswordLoader
+from .handlers.storage_service import StorageService
+from .handlers.vault_watcher import VaultWatcher
+from .handlers.breach_check_worker import BreachCheckWorker
 
 class MainWindow(QMainWindow):
     """主窗口 - 重构后的简洁版本"""
     
+    # 信号定义
+    passwords_loaded = Signal(dict)  # 后台加载完成，携带耗时统计
+    
+    AUDIT_DELAY = 500  # 条目变化后延迟体检的毫秒数
+    
     def __init__(self, data_manager: DataManager):
         super().__init__()
         self.data_manager = data_manager
-        self.passwords = []
+        self.entries = {}  # id -> 密码记录，保持加载顺序
+        self.category_facets = CategoryFacets()
+        self.column_store = ColumnStore()  # 列式搜索与分类筛选
+        self.loader = None
+        self.load_generation = 0
+        self.load_total = 0
+        self.load_started_at = 0.0
+        self.load_metrics = {}  # 最近一次加载的耗时统计（毫秒）
+        self.diagnostics_dialog = None
+        self.audit_dialog = None
+        self.audit_findings = {}  # id -> (强度, 共用该密码的条目数, 共用组编号)
+        self.breach_counts = None  # id -> 在泄露库中出现的次数，未配置泄露库时为None
+        self.breach_worker = None
+        self.breach_check_pending = False
 
         # 初始化组件
         self.init_components()
         self.setup_ui()
         self.connect_signals()
-        self.apply_styles()
         self.load_passwords()
     
     def init_components(self):
         """初始化组件"""
+        # 存储服务：存储与加密操作在后台线程串行执行
+        self.storage = StorageService(self.data_manager, self)
+        
+        # 监视其他进程对密码库的修改
+        self.vault_watcher = VaultWatcher(self.data_manager.users_file, self)
+        
+        # 密码体检：条目变化后稍作合并再在存储线程中增量体检
+        self.vault_audit = VaultAudit(self.data_manager)
+        self.audit_timer = QTimer(self)
+        self.audit_timer.setSingleShot(True)
+        self.audit_timer.setInterval(self.AUDIT_DELAY)
+        self.audit_timer.timeout.connect(self.run_audit)
+        self.breach_checker = BreachChecker(self.data_manager)
+        self.breach_settings = QSettings('SecretBook', 'BreachSettings')
+        
         # 创建处理器
-        self.password_handler = PasswordHandler(self.data_manager, self)
-        self.import_export_handler = ImportExportHandler(self.data_manager, self)
+        self.password_handler = PasswordHandler(self.data_manager, self.storage, self)
+        self.import_export_handler = ImportExportHandler(self.data_manager, self.storage, self)
         
         # 创建UI组件
         self.toolbar = ToolbarWidget()
-        self.password_table = PasswordTableWidget()
+        self.secret_accessor = SecretAccessor()
+        self.password_table = PasswordTableWidget(self.secret_accessor, self.storage)
         self.menu_manager = MenuManager(self)
     
     def setup_ui(self):
@@ -65,36 +109,9 @@ class MainWindow(QMainWindow):
         # 状态栏
         self.setup_status_bar()
 
-    def set_window_icon(self):
-        """设置窗口图标"""
-        try:
-            # 获取logo文件路径
-            current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            logo_path = os.path.join(current_dir, 'assets', 'logo.svg')
-
-            if os.path.exists(logo_path):
-                icon = QIcon(logo_path)
-                self.setWindowIcon(icon)
-            else:
-                # 如果logo文件不存在，使用emoji作为标题
-                self.setWindowTitle(f'🔐 密码本 - {self.data_manager.current_user}')
-        except Exception as e:
-            print(f"设置图标失败: {e}")
-            # 使用emoji作为备选方案
-            self.setWindowTitle(f'🔐 密码本 - {self.data_manager.current_user}')
-    
     def setup_status_bar(self):
         """设置状态栏"""
         self.statusBar().showMessage('就绪')
-        self.statusBar().setStyleSheet("""
-            QStatusBar {
-                background-color: #f8f9fa;
-                color: #6c757d;
-                border-top: 1px solid #e0e0e0;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                padding: 8px;
-            }
-        """)
     
     def connect_signals(self):
         """连接信号"""
@@ -108,6 +125,7 @@ class MainWindow(QMainWindow):
         self.password_table.password_copied.connect(self.show_status_message)
         self.password_table.password_edit_requested.connect(self.password_handler.edit_password)
         self.password_table.password_delete_requested.connect(self.password_handler.delete_password)
+        self.password_table.password_history_requested.connect(self.password_handler.show_history)
         
         # 菜单信号
         self.menu_manager.add_password_requested.connect(self.password_handler.add_password)
@@ -115,25 +133,280 @@ class MainWindow(QMainWindow):
         self.menu_manager.import_requested.connect(self.import_export_handler.import_passwords)
         self.menu_manager.logout_requested.connect(self.password_handler.logout)
         self.menu_manager.about_requested.connect(self.show_about)
+        self.menu_manager.diagnostics_requested.connect(self.show_diagnostics)
+        self.menu_manager.audit_requested.connect(self.show_audit)
+        self.menu_manager.breach_check_requested.connect(self.configure_breach_check)
+        self.menu_manager.history_limit_requested.connect(self.configure_history_limit)
+        self.menu_manager.theme_change_requested.connect(StyleManager.apply_theme)
         
         # 处理器信号
-        self.password_handler.passwords_updated.connect(self.load_passwords)
+        self.password_handler.entry_added.connect(self.on_entry_added)
+        self.password_handler.entry_updated.connect(self.on_entry_updated)
+        self.password_handler.entry_removed.connect(self.on_entry_removed)
         self.password_handler.status_message.connect(self.show_status_message)
+        self.import_export_handler.status_message.connect(self.show_status_message)
+        self.import_export_handler.passwords_updated.connect(self.load_passwords)
+        
+        # 存储服务信号
+        self.storage.busy_changed.connect(self.on_storage_busy_changed)
+        self.storage.operation_failed.connect(self.on_storage_failed)
+        self.vault_watcher.changed.connect(self.sync_external_changes)
     
-    def apply_styles(self):
-        """应用样式"""
-        self.setStyleSheet(StyleManager.get_main_window_style())
-    
+    @property
+    def passwords(self):
+        """当前用户的全部密码记录"""
+        return list(self.entries.values())
+
     def load_passwords(self):
-        """加载密码列表"""
-        self.passwords = self.data_manager.get_user_passwords()
-        self.password_table.update_data(self.passwords)
-        self.statusBar().showMessage(f'共 {len(self.passwords)} 条密码记录')
+        """加载密码列表
+
+        在后台线程分批解密，首批约一屏条目，到达后立即显示；
+        加载期间搜索与分类筛选作用于已加载的部分。
+        加载在此前提交的写入全部完成后才开始，保证读到最新数据。
+        """
+        self.stop_loading()
+        self.load_generation += 1
+        self.load_total = 0
+        self.load_started_at = time.perf_counter()
+        self.load_metrics = {}
+        
+        self.entries = {}
+        self.column_store.clear()
+        self.category_facets.rebuild([])
+        self.toolbar.update_categories({}, 0)
+        self.password_table.update_data([])
+        self.statusBar().showMessage('正在加载密码记录...')
+        
+        self.loader = PasswordLoader(
+            self.data_manager, self.load_generation,
+            first_chunk_size=max(self.password_table.visible_row_capacity(), 30),
+            parent=self
+        )
+        self.loader.load_started.connect(self.on_load_started)
+        self.loader.chunk_loaded.connect(self.on_chunk_loaded)
+        self.loader.load_finished.connect(self.on_load_finished)
+        self.storage.after_pending(self._start_loader(self.loader))
+
+    def _start_loader(self, loader):
+        """返回启动指定加载器的回调（加载器已被新的加载取代时不再启动）"""
+        def start():
+            if loader is self.loader:
+                loader.start()
+        return start
+
+    def stop_loading(self):
+        """停止正在进行的后台加载"""
+        if self.loader is not None:
+            self.loader.requestInterruption()
+            self.loader.wait()
+            self.loader = None
+
+    def is_loading(self):
+        """是否正在后台加载"""
+        return self.loader is not None and self.loader.isRunning()
+
+    def on_load_started(self, generation, total):
+        """后台加载开始，已知记录总数"""
+        if generation == self.load_generation:
+            self.load_total = total
+
+    @traced('显示一批记录', 'ui')
+    def on_chunk_loaded(self, generation, passwords):
+        """追加一批已解密的密码"""
+        if generation != self.load_generation:
+            return
+        
+        # 加载期间新增的记录可能已通过 entry_added 显示，跳过以免重复
+        passwords = [pwd for pwd in passwords if pwd['id'] not in self.entries]
+        changed = set()
+        for password in passwords:
+            self.entries[password['id']] = password
+            self.column_store.add(password)
+            changed.update(self.category_facets.add(password.get('category')))
+        self._refresh_category_counts(changed)
+        
+        search_text = self.toolbar.get_search_text()
+        selected_category = self.toolbar.get_selected_category()
+        self.password_table.add_entries([
+            pwd for pwd in passwords if self.matches_filters(pwd, search_text, selected_category)
+        ])
+        
+        if 'first_row_ms' not in self.load_metrics:
+            self.load_metrics['first_row_ms'] = (time.perf_counter() - self.load_started_at) * 1000
+        self.statusBar().showMessage(f'正在加载 {len(self.entries)}/{self.load_total} 条密码记录...')
+
+    def on_load_finished(self, generation):
+        """后台加载完成"""
+        if generation != self.load_generation:
+            return
+        
+        self.load_metrics['total_ms'] = (time.perf_counter() - self.load_started_at) * 1000
+        self.load_metrics.setdefault('first_row_ms', self.load_metrics['total_ms'])
+        self.loader = None
+        self.statusBar().showMessage(
+            f'共 {len(self.entries)} 条密码记录'
+            f'（首屏 {self.load_metrics["first_row_ms"]:.0f} ms，'
+            f'全部 {self.load_metrics["total_ms"]:.0f} ms）'
+        )
+        self.passwords_loaded.emit(dict(self.load_metrics))
+        self.schedule_audit()
+
+    def sync_external_changes(self):
+        """密码库被其他进程修改：只解密并更新变化的记录"""
+        if self.loader is not None:
+            # 加载完成后再比较，加载本身会读到最新数据
+            self.vault_watcher.schedule()
+            return
+        self.storage.submit(
+            self.data_manager.sync_external_changes,
+            callback=self.on_external_changes, description='同步外部修改'
+        )
+
+    @traced('应用外部修改', 'ui')
+    def on_external_changes(self, result):
+        """应用其他进程的修改"""
+        changed, removed = result
+        for password in changed:
+            self.on_entry_updated(password)
+        for password_id in removed:
+            self.on_entry_removed({'id': password_id})
+        
+        if changed or removed:
+            self.schedule_audit()
+            self.statusBar().showMessage(
+                f'已同步其他窗口的修改：{len(changed)} 条新增或更新，{len(removed)} 条删除', 3000
+            )
+
+    def schedule_audit(self):
+        """条目变化后安排一次增量体检（短时间内的多次变化合并为一次）"""
+        self.audit_timer.start()
+
+    def run_audit(self):
+        """在存储线程中增量体检，只解密上次体检后新增或修改的条目；配置了泄露库时同时检查泄露"""
+        self.audit_timer.stop()
+        self.storage.submit(self.vault_audit.run, callback=self.on_audit_finished, description='密码体检')
+        self.start_breach_check()
+
+    def on_audit_finished(self, result):
+        """显示体检结果"""
+        self.audit_findings = result['findings']
+        self.password_table.set_audit(self.audit_findings)
+        self._refresh_audit_dialog()
+
+    def _refresh_audit_dialog(self):
+        if self.audit_dialog is not None and self.audit_dialog.isVisible():
+            self.audit_dialog.set_results(self.entries, self.audit_findings, self.breach_counts)
+
+    def breach_corpus_path(self) -> str:
+        """已配置的泄露库文件路径，未配置时返回空字符串"""
+        return self.breach_settings.value('corpus_path', '', type=str)
+
+    def start_breach_check(self):
+        """在后台线程中增量检查泄露，检查进行中时等其结束后再检查一次"""
+        corpus_path = self.breach_corpus_path()
+        if not corpus_path:
+            return
+        if self.breach_worker is not None:
+            self.breach_check_pending = True
+            return
+        self.breach_worker = BreachCheckWorker(self.breach_checker, corpus_path, self)
+        self.breach_worker.progress.connect(self.on_breach_progress)
+        self.breach_worker.check_finished.connect(self.on_breach_checked)
+        self.breach_worker.check_failed.connect(self.on_breach_failed)
+        self.breach_worker.finished.connect(self.on_breach_worker_finished)
+        self.breach_worker.start()
+
+    def stop_breach_check(self):
+        """打断进行中的泄露检查（已完成的部分已写入缓存）"""
+        self.breach_check_pending = False
+        if self.breach_worker is not None:
+            self.breach_worker.requestInterruption()
+            self.breach_worker.wait()
+            self.breach_worker = None
+
+    def on_breach_progress(self, done, total):
+        self.statusBar().showMessage(f'正在检查泄露密码 {done}/{total}...')
+
+    def on_breach_checked(self, result):
+        """显示泄露检查结果"""
+        self.breach_counts = result['counts']
+        self.password_table.set_breaches(self.breach_counts)
+        self._refresh_audit_dialog()
+        if result['checked']:
+            breached = sum(1 for count in self.breach_counts.values() if count)
+            self.statusBar().showMessage(f'泄露检查完成：{breached} 条密码出现在泄露库中', 5000)
+
+    def on_breach_failed(self, error):
+        self.statusBar().showMessage(f'泄露检查失败：{error}', 5000)
+
+    def on_breach_worker_finished(self):
+        if self.sender() is not self.breach_worker:
+            return
+        self.breach_worker = None
+        if self.breach_check_pending:
+            self.breach_check_pending = False
+            self.start_breach_check()
+
+    def configure_breach_check(self):
+        """选择本地泄露库文件，随后检查全部条目并打开体检报告"""
+        corpus_path, _ = QFileDialog.getOpenFileName(
+            self, '选择泄露密码库', self.breach_corpus_path(), '泄露密码库 (*.bin);;所有文件 (*)'
+        )
+        if not corpus_path:
+            return
+        try:
+            BreachCorpus(corpus_path).close()
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(
+                self, '无法使用该文件',
+                f'{e}\n\n可以用以下命令由 Pwned Passwords 的 SHA-1 文本构建：\n'
+                'python secretbook.py breach-build pwned-passwords-sha1.txt pwned.bin'
+            )
+            return
+        self.stop_breach_check()
+        self.breach_settings.setValue('corpus_path', corpus_path)
+        self.show_audit()
+
+    def configure_history_limit(self):
+        """设置每条密码保留的历史版本数（保存在密码库中，命令行与界面共用）"""
+        self.storage.get_history_limit(callback=self._ask_history_limit)
+
+    def _ask_history_limit(self, current):
+        limit, accepted = QInputDialog.getInt(
+            self, '历史版本', '每条密码保留的历史版本数（0 表示不保留）：', current, 0, MAX_HISTORY_LIMIT
+        )
+        if not accepted or limit == current:
+            return
+        self.storage.set_history_limit(
+            limit, callback=lambda removed: self.show_status_message(
+                f'已设置保留 {limit} 个历史版本' + (f'，清理了 {removed} 个旧版本' if removed else ''), 3000
+            )
+        )
+
+    def closeEvent(self, event):
+        """关闭窗口时停止后台加载、等待未完成的写入并丢弃明文"""
+        self.audit_timer.stop()
+        self.stop_breach_check()
+        self.vault_watcher.stop()
+        self.stop_loading()
+        self.storage.shutdown()
+        self.password_table.password_model.conceal_all()
+        self.secret_accessor.clear()
+        super().closeEvent(event)
+
+    def matches_filters(self, password, search_text=None, selected_category=None):
+        """判断单条密码是否满足当前筛选条件"""
+        if search_text is None:
+            search_text = self.toolbar.get_search_text()
+        if selected_category is None:
+            selected_category = self.toolbar.get_selected_category()
         
-        # 更新分类列表
-        categories = list(set([pwd.get('category', '') for pwd in self.passwords if pwd.get('category')]))
-        self.toolbar.update_categories(categories)
+        if selected_category and normalize_category(password.category) != selected_category:
+            return False
+        
+        return not search_text or self.column_store.matches(password['id'], search_text)
 
+    @traced('筛选并刷新表格', 'ui')
     def filter_passwords(self, search_text=None):
         """过滤密码"""
         if search_text is None:
@@ -141,33 +414,82 @@ class MainWindow(QMainWindow):
         
         selected_category = self.toolbar.get_selected_category()
         
-        filtered_passwords = self.passwords
-        
-        # 按分类筛选
-        if selected_category:
-            if selected_category == '未分类':
-                filtered_passwords = [pwd for pwd in filtered_passwords if not pwd.get('category')]
-            else:
-                filtered_passwords = [pwd for pwd in filtered_passwords if pwd.get('category') == selected_category]
-        
-        # 按搜索文本筛选
-        if search_text:
-            search_text = search_text.lower()
-            filtered_passwords = [
-                pwd for pwd in filtered_passwords
-                if (search_text in pwd.get('website', '').lower() or
-                    search_text in pwd.get('username', '').lower() or
-                    search_text in pwd.get('notes', '').lower() or
-                    search_text in pwd.get('category', '').lower())
-            ]
+        # 在列式索引上整体筛选分类（空分类归入“未分类”）与搜索文本（同时匹配拼音全拼与首字母）
+        filtered_ids = self.column_store.filter(search_text, selected_category)
+        filtered_passwords = list(map(self.entries.__getitem__, filtered_ids))
         
         self.password_table.update_data(filtered_passwords)
         self.statusBar().showMessage(f'显示 {len(filtered_passwords)} 条记录')
 
+    def on_entry_added(self, password):
+        """新增密码后只追加对应的行"""
+        if password['id'] in self.entries:
+            # 后台加载已包含该记录
+            self.on_entry_updated(password)
+            return
+        self.entries[password['id']] = password
+        self.column_store.add(password)
+        self._refresh_category_counts(self.category_facets.add(password.get('category')))
+        
+        if self.matches_filters(password):
+            self.password_table.add_entry(password)
+        self.statusBar().showMessage(f'共 {len(self.entries)} 条密码记录')
+        self.schedule_audit()
+
+    def on_entry_updated(self, password):
+        """编辑密码后只更新对应的行"""
+        previous = self.entries.get(password['id'])
+        self.entries[password['id']] = password
+        self.secret_accessor.drop(password['id'])  # 已显示的旧明文由 expire_secrets 隐藏
+        self.column_store.update(password)
+        if previous is None:
+            changed = self.category_facets.add(password.get('category'))
+        else:
+            changed = self.category_facets.move(previous.get('category'), password.get('category'))
+        self._refresh_category_counts(changed)
+        
+        # 编辑后可能进入或离开当前筛选结果
+        if self.matches_filters(password):
+            if not self.password_table.update_entry(password):
+                self.password_table.add_entry(password)
+        else:
+            self.password_table.remove_entry(password['id'])
+        self.schedule_audit()
+
+    def on_entry_removed(self, password):
+        """删除密码后只移除对应的行"""
+        removed = self.entries.pop(password['id'], None)
+        self.secret_accessor.drop(password['id'])
+        self.column_store.remove(password['id'])
+        if removed is not None:
+            self._refresh_category_counts(self.category_facets.remove(removed.get('category')))
+        
+        self.password_table.remove_entry(password['id'])
+        self.statusBar().showMessage(f'共 {len(self.entries)} 条密码记录')
+        self.schedule_audit()
+
+    def _refresh_category_counts(self, categories):
+        """只刷新计数发生变化的分类项"""
+        for category in categories:
+            self.toolbar.update_category_count(category, self.category_facets.count(category))
+        self.toolbar.set_total_count(self.category_facets.total)
+
     def filter_passwords_by_category(self, category):
         """按分类筛选密码"""
         self.filter_passwords()
     
+    def on_storage_busy_changed(self, busy):
+        """存储操作进行期间显示忙碌光标（界面仍可操作）"""
+        if busy:
+            QApplication.setOverrideCursor(Qt.BusyCursor)
+        else:
+            QApplication.restoreOverrideCursor()
+
+    def on_storage_failed(self, description, error):
+        """后台存储操作抛出异常"""
+        self.statusBar().showMessage(f'{description}失败', 2000)
+        QMessageBox.critical(self, '错误', f'{description}失败：{error}')
+
     def show_status_message(self, message, timeout=2000):
         """显示状态消息"""
         self.statusBar().showMessage(message, timeout)
@@ -187,6 +509,28 @@ class MainWindow(QMainWindow):
             '开发：Python + PySide6'
         )
     
+    def show_diagnostics(self):
+        """显示诊断窗口（非模态，首次打开时创建）"""
+        if self.diagnostics_dialog is None:
+            from .diagnostics_dialog import DiagnosticsDialog
+            self.diagnostics_dialog = DiagnosticsDialog(self)
+        self.diagnostics_dialog.show()
+        self.diagnostics_dialog.raise_()
+        self.diagnostics_dialog.activateWindow()
+    
+    def show_audit(self):
+        """显示密码体检报告（非模态，首次打开时创建），并立即重新体检"""
+        if self.audit_dialog is None:
+            from .audit_dialog import AuditDialog
+            self.audit_dialog = AuditDialog(self)
+            self.audit_dialog.edit_requested.connect(self.password_handler.edit_password)
+            self.audit_dialog.refresh_requested.connect(self.run_audit)
+        self.audit_dialog.set_results(self.entries, self.audit_findings, self.breach_counts)
+        self.audit_dialog.show()
+        self.audit_dialog.raise_()
+        self.audit_dialog.activateWindow()
+        self.run_audit()
+    
     def center_window(self):
         """将窗口居中显示"""
         screen = QApplication.primaryScreen().geometry()
@@ -6,7 +6,6 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 from utils.icon_manager import IconManager
-from utils.styles import StyleManager
 
 
 class PasswordDialog(QDialog):
@@ -16,7 +15,6 @@ class PasswordDialog(QDialog):
         super().__init__()
         self.password_data = password_data
         self.setup_ui()
-        self.apply_styles()
         
         if password_data:
             self.load_data()
@@ -36,7 +34,7 @@ class PasswordDialog(QDialog):
         title = QLabel('添加新密码' if not self.password_data else '编辑密码')
         title.setAlignment(Qt.AlignCenter)
         title.setFont(QFont('Microsoft YaHei', 16, QFont.Bold))
-        title.setStyleSheet("color: #2c3e50; margin-bottom: 10px;")
+        title.setObjectName('dialogTitle')
         layout.addWidget(title)
         
         # 表单
@@ -46,7 +44,7 @@ class PasswordDialog(QDialog):
         # 网站/应用 (必填)
         website_label = QLabel('<span style="color: red;">*</span>网站/应用: ')
         website_label.setFont(QFont('Microsoft YaHei', 12))
-        website_label.setStyleSheet("color: #34495e; font-weight: 500;")
+        website_label.setProperty('role', 'form-label')
         
         self.website_edit = QLineEdit()
         self.website_edit.setPlaceholderText('如：百度、QQ、微信等（必填）')
@@ -55,7 +53,7 @@ class PasswordDialog(QDialog):
         # 分类
         category_label = QLabel('分类:')
         category_label.setFont(QFont('Microsoft YaHei', 12))
-        category_label.setStyleSheet("color: #34495e; font-weight: 500;")
+        category_label.setProperty('role', 'form-label')
         
         self.category_combo = QComboBox()
         self.category_combo.setEditable(True)  # 允许用户输入自定义分类
@@ -68,7 +66,7 @@ class PasswordDialog(QDialog):
         # 用户名 (必填)
         username_label = QLabel('<span style="color: red;">*</span>账号: ')
         username_label.setFont(QFont('Microsoft YaHei', 12))
-        username_label.setStyleSheet("color: #34495e; font-weight: 500;")
+        username_label.setProperty('role', 'form-label')
         
         self.username_edit = QLineEdit()
         self.username_edit.setPlaceholderText('用户名、电话或邮箱（必填）')
@@ -77,7 +75,7 @@ class PasswordDialog(QDialog):
         # 密码 (必填)
         password_label = QLabel('<span style="color: red;">*</span>密码: ')
         password_label.setFont(QFont('Microsoft YaHei', 12))
-        password_label.setStyleSheet("color: #34495e; font-weight: 500;")
+        password_label.setProperty('role', 'form-label')
         
         self.password_edit = QLineEdit()
         self.password_edit.setEchoMode(QLineEdit.Password)
@@ -87,7 +85,7 @@ class PasswordDialog(QDialog):
         # 网址
         url_label = QLabel('网址:')
         url_label.setFont(QFont('Microsoft YaHei', 12))
-        url_label.setStyleSheet("color: #34495e; font-weight: 500;")
+        url_label.setProperty('role', 'form-label')
         
         self.url_edit = QLineEdit()
         self.url_edit.setPlaceholderText('网站地址（可选）')
@@ -96,7 +94,7 @@ class PasswordDialog(QDialog):
         # 备注
         notes_label = QLabel('备注:')
         notes_label.setFont(QFont('Microsoft YaHei', 12))
-        notes_label.setStyleSheet("color: #34495e; font-weight: 500;")
+        notes_label.setProperty('role', 'form-label')
         
         self.notes_edit = QTextEdit()
         self.notes_edit.setPlaceholderText('备注信息（可选）')
@@ -114,6 +112,7 @@ class PasswordDialog(QDialog):
         self.save_btn.clicked.connect(self.validate_and_save)
         
         self.cancel_btn = QPushButton('取消')
+        self.cancel_btn.setProperty('variant', 'secondary')
         self.cancel_btn.clicked.connect(self.reject)
         
         button_layout.addWidget(self.save_btn)
@@ -152,24 +151,11 @@ class PasswordDialog(QDialog):
     def show_validation_error(self, message):
         """显示验证错误消息"""
         msg_box = QMessageBox(self)
-        msg_box.setStyleSheet(StyleManager.get_msg_box_style())
         msg_box.setIcon(QMessageBox.Warning)
         msg_box.setWindowTitle('输入验证')
         msg_box.setText(message)
         msg_box.exec()
     
-    def apply_styles(self):
-        """应用样式"""
-        self.setStyleSheet(StyleManager.get_dialog_style())
-        self.website_edit.setStyleSheet(StyleManager.get_input_style())
-        self.category_combo.setStyleSheet(StyleManager.get_combobox_style())
-        self.username_edit.setStyleSheet(StyleManager.get_input_style())
-        self.password_edit.setStyleSheet(StyleManager.get_input_style())
-        self.url_edit.setStyleSheet(StyleManager.get_input_style())
-        self.notes_edit.setStyleSheet(StyleManager.get_textarea_style())
-        self.save_btn.setStyleSheet(StyleManager.get_button_style())
-        self.cancel_btn.setStyleSheet(StyleManager.get_secondary_button_style())
-    
     def load_data(self):
         """加载密码数据"""
         self.website_edit.setText(self.password_data.get('website', ''))
@@ -0,0 +1,332 @@
+"""密码库代理（类似 ssh-agent）
+
+代理进程解锁一次密码库后，在内存中保存解密后的条目（不含密码明文）与搜索索引，
+通过 Unix 域套接字为界面和脚本提供查询，省去每次启动时的密钥派生与全量解密。
+密码明文只在 get 请求时按需解密，不在代理中常驻。空闲超过 lock_timeout 秒后
+自动锁定，丢弃密钥与全部条目。
+
+协议为每行一个 JSON 对象：
+    请求  {"op": "search", "query": "github"}
+    响应  {"ok": true, "result": [...]} 或 {"ok": false, "error": "..."}
+
+支持的操作：ping、status、unlock(username, password)、lock、list、search(query)、
+get(id, field)。套接字权限为 0600，只有当前系统用户可以连接。同一路径上已有代理在运行时
+拒绝启动，只清理无人监听的残留套接字。
+
+启动：
+    python -m utils.agent [--socket PATH] [--timeout 900]
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .data_manager import DataManager
+from .search_index import SearchIndex
+
+
+SOCKET_ENV = 'SECRETBOOK_AGENT_SOCK'
+DEFAULT_LOCK_TIMEOUT = 15 * 60
+
+
+class AgentError(Exception):
+    """代理返回的错误"""
+
+
+def default_socket_path() -> str:
+    """代理套接字路径：优先使用环境变量 SECRETBOOK_AGENT_SOCK"""
+    return os.environ.get(SOCKET_ENV) or str(Path.home() / '.secretbook' / 'agent.sock')
+
+
+class VaultAgent:
+    """持有已解锁密码库的代理服务"""
+
+    def __init__(self, socket_path: str = None, lock_timeout: float = DEFAULT_LOCK_TIMEOUT,
+                 data_manager_factory=DataManager, clock=time.monotonic):
+        self.socket_path = socket_path or default_socket_path()
+        self.lock_timeout = lock_timeout
+        self.data_manager_factory = data_manager_factory
+        self._clock = clock
+        self.data_manager = None
+        self.entries = {}  # id -> 密码记录（不含敏感字段）
+        self.search_index = SearchIndex()
+        self.last_used = clock()
+        self._server = None
+        # 当前密码库的 DataManager 只在这个线程中使用，与 StorageService 一样串行执行
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='secretbook-agent')
+
+    @property
+    def unlocked(self) -> bool:
+        return self.data_manager is not None
+
+    # 解锁与锁定
+
+    def open_vault(self, username: str, password: str) -> tuple:
+        """登录并解密全部条目，返回 (DataManager, 条目)，不修改代理状态，可以在线程池中执行"""
+        data_manager = self.data_manager_factory()
+        if not data_manager.login_user(username, password):
+            raise AgentError('用户名或密码错误')
+
+        entries = {}
+        for encrypted_item in data_manager.get_encrypted_passwords():
+            password_data = data_manager.decrypt_password_item(encrypted_item, include_secrets=False)
+            if password_data is not None:
+                entries[password_data['id']] = password_data
+        return data_manager, entries
+
+    def install(self, data_manager, entries: dict) -> int:
+        """替换为 open_vault 的结果并重建搜索索引，返回条目数"""
+        self.lock()
+        self.data_manager = data_manager
+        self.entries = entries
+        self.search_index.sync(entries.values())
+        return len(entries)
+
+    def lock(self):
+        """丢弃密钥与全部条目"""
+        self.data_manager = None
+        self.entries = {}
+        self.search_index.clear()
+
+    def check_timeout(self) -> bool:
+        """空闲超时则锁定，返回是否因此锁定"""
+        if self.unlocked and self._clock() - self.last_used >= self.lock_timeout:
+            self.lock()
+            return True
+        return False
+
+    def apply_changes(self, changed: list, removed: list):
+        """把 sync_external_changes 的结果应用到条目与搜索索引，在事件循环线程中调用"""
+        for password in changed:
+            self.entries[password['id']] = password
+            self.search_index.update(password)
+        for password_id in removed:
+            self.entries.pop(password_id, None)
+            self.search_index.remove(password_id)
+
+    # 请求处理
+
+    async def _in_vault_thread(self, func, *args):
+        """在代理的单线程执行器中调用 DataManager 的方法，文件读取与解密不阻塞事件循环"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def handle_request(self, request: dict):
+        """处理一个请求并返回结果，出错时抛出 AgentError
+
+        读取文件、密钥派生与解密都在线程中执行；代理状态只在事件循环线程中修改，
+        其他请求不会看到解锁到一半或刷新到一半的状态。
+        """
+        if not isinstance(request, dict):
+            raise AgentError('无效的请求')
+        op = request.get('op')
+        if op == 'ping':
+            return 'pong'
+
+        self.last_used = self._clock()
+        if op == 'status':
+            return {
+                'unlocked': self.unlocked,
+                'user': self.data_manager.current_user if self.unlocked else None,
+                'entries': len(self.entries),
+                'lock_timeout': self.lock_timeout,
+            }
+        if op == 'unlock':
+            # open_vault 只使用新建的 DataManager，放到默认线程池，不排在当前密码库的操作之后
+            vault = await asyncio.get_running_loop().run_in_executor(
+                None, self.open_vault, request.get('username', ''), request.get('password', '')
+            )
+            return self.install(*vault)
+        if op == 'lock':
+            self.lock()
+            return True
+
+        if not self.unlocked:
+            raise AgentError('密码库已锁定')
+        # 同步其他进程对密码库的修改（未变化时只检查文件状态）
+        data_manager = self.data_manager
+        changed, removed = await self._in_vault_thread(data_manager.sync_external_changes)
+        if data_manager is not self.data_manager:
+            # 等待期间被锁定或重新解锁，结果属于旧的密码库
+            raise AgentError('密码库已锁定')
+        self.apply_changes(changed, removed)
+
+        # 条目为 PasswordEntry，响应中转换为 dict 以便 JSON 序列化
+        if op == 'list':
+            return [dict(entry) for entry in self.entries.values()]
+        if op == 'search':
+            return [dict(entry) for entry in self.search_index.search(request.get('query', ''), self.entries.values())]
+        if op == 'get':
+            try:
+                password_id = int(request.get('id'))
+            except (TypeError, ValueError):
+                raise AgentError('无效的记录ID')
+            secret = await self._in_vault_thread(data_manager.get_secret, password_id, request.get('field', 'password'))
+            if secret is None:
+                raise AgentError('记录不存在')
+            return secret
+
+        raise AgentError(f'未知操作: {op}')
+
+    async def _handle_client(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                try:
+                    response = {'ok': True, 'result': await self.handle_request(json.loads(line))}
+                except (AgentError, ValueError) as e:
+                    response = {'ok': False, 'error': str(e)}
+                except Exception as e:
+                    # 如读取密码库文件失败，仍然回复客户端而不是断开连接
+                    response = {'ok': False, 'error': f'内部错误: {e}'}
+                writer.write(json.dumps(response, ensure_ascii=False).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _watch_timeout(self):
+        interval = min(self.lock_timeout, 5)
+        while True:
+            await asyncio.sleep(interval)
+            self.check_timeout()
+
+    def _prepare_socket_path(self):
+        """准备套接字路径：已有代理在监听时拒绝启动，只清理无人监听的残留套接字
+
+        套接字所在目录不存在时以 0700 创建；绑定后再把套接字改为 0600，不修改进程的 umask。
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(self.socket_path)), mode=0o700, exist_ok=True)
+        try:
+            mode = os.stat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise AgentError(f'{self.socket_path} 已存在且不是套接字')
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except ConnectionRefusedError:
+            os.remove(self.socket_path)  # 上次异常退出留下的套接字
+        except FileNotFoundError:
+            pass
+        else:
+            raise AgentError(f'已有代理在 {self.socket_path} 上运行')
+        finally:
+            probe.close()
+
+    async def serve(self, ready=None):
+        """启动服务并一直运行；ready 为可选的 asyncio.Event，监听开始后置位"""
+        self._prepare_socket_path()
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+
+        watchdog = asyncio.create_task(self._watch_timeout())
+        if ready is not None:
+            ready.set()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        except asyncio.CancelledError:
+            pass  # close() 关闭服务
+        finally:
+            watchdog.cancel()
+            self.lock()
+            self._executor.shutdown(wait=False)
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def close(self):
+        """停止服务"""
+        if self._server is not None:
+            self._server.close()
+
+
+class AgentClient:
+    """代理的同步客户端，一个连接可以连续发送多个请求"""
+
+    def __init__(self, socket_path: str = None, timeout: float = 30.0):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self._sock = None
+        self._file = None
+
+    def connect(self):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(self.timeout)
+        self._sock.connect(self.socket_path)
+        self._file = self._sock.makefile('rb')
+        return self
+
+    def close(self):
+        if self._sock is not None:
+            self._file.close()
+            self._sock.close()
+            self._sock = self._file = None
+
+    def __enter__(self):
+        return self.connect()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def request(self, op: str, **params):
+        """发送请求并返回结果，代理返回错误时抛出 AgentError"""
+        if self._sock is None:
+            self.connect()
+        self._sock.sendall(json.dumps(dict(params, op=op), ensure_ascii=False).encode() + b'\n')
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError('代理已断开连接')
+        response = json.loads(line)
+        if not response.get('ok'):
+            raise AgentError(response.get('error', '未知错误'))
+        return response.get('result')
+
+    # 便捷方法
+
+    def unlock(self, username: str, password: str) -> int:
+        return self.request('unlock', username=username, password=password)
+
+    def lock(self):
+        return self.request('lock')
+
+    def status(self) -> dict:
+        return self.request('status')
+
+    def list(self) -> list:
+        return self.request('list')
+
+    def search(self, query: str) -> list:
+        return self.request('search', query=query)
+
+    def get(self, password_id: int, field: str = 'password'):
+        return self.request('get', id=password_id, field=field)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SecretBook 密码库代理')
+    parser.add_argument('--socket', help=f'套接字路径（默认读取 {SOCKET_ENV} 或 ~/.secretbook/agent.sock）')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_LOCK_TIMEOUT, help='空闲自动锁定的秒数')
+    args = parser.parse_args()
+
+    if not hasattr(socket, 'AF_UNIX'):
+        parser.error('当前平台不支持 Unix 域套接字')
+
+    agent = VaultAgent(args.socket, lock_timeout=args.timeout)
+    print(f'{SOCKET_ENV}={agent.socket_path}; export {SOCKET_ENV};', flush=True)
+    try:
+        asyncio.run(agent.serve())
+    except AgentError as e:
+        parser.exit(1, f'{e}\n')
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,300 @@
+import hashlib
+import heapq
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+
+from .tracing import traced
+from .vault_audit import (
+    fingerprint, hash_key, password_digest, read_encrypted_cache, user_cache_file, write_encrypted_cache
+)
+
+
+# 泄露密码库文件格式：文件头（标识, 记录数）之后是按 SHA-1 升序排列的定长记录（SHA-1, 泄露次数）
+MAGIC = b'SBPWNED1'
+HEADER = struct.Struct('>8sQ')
+DIGEST_SIZE = 20
+COUNT_SIZE = 4
+RECORD_SIZE = DIGEST_SIZE + COUNT_SIZE
+MAX_COUNT = 0xFFFFFFFF
+
+# 构建时每个排序段的记录数（约 100 MB 内存）
+CHUNK_RECORDS = 1_000_000
+READ_RECORDS = 4096  # 归并时每次读取的记录数
+
+# 缓存文件格式版本
+CACHE_VERSION = 1
+
+
+def parse_corpus_line(line: bytes):
+    """解析一行 "SHA1十六进制:次数"（Pwned Passwords 格式），返回定长记录，无效行返回None"""
+    digest_hex, _, count = line.strip().partition(b':')
+    if len(digest_hex) != DIGEST_SIZE * 2:
+        return None
+    try:
+        digest = bytes.fromhex(digest_hex.decode('ascii'))
+        count = min(int(count), MAX_COUNT) if count else 1
+    except ValueError:
+        return None
+    return digest + count.to_bytes(COUNT_SIZE, 'big')
+
+
+def _read_run(path, offset: int):
+    """逐条读取排序段中的记录"""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        while True:
+            block = f.read(RECORD_SIZE * READ_RECORDS)
+            if not block:
+                return
+            for start in range(0, len(block), RECORD_SIZE):
+                yield block[start:start + RECORD_SIZE]
+
+
+def _write_run(records: list, directory) -> str:
+    records.sort()
+    fd, path = tempfile.mkstemp(prefix='run.', suffix='.bin', dir=directory)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(b''.join(records))
+    return path
+
+
+@traced('构建泄露密码库', 'breach')
+def build_corpus(source_path, output_path, chunk_records: int = CHUNK_RECORDS, progress=None) -> int:
+    """由 Pwned Passwords 的 SHA-1 文本构建排序后的定长二进制文件，返回记录数
+
+    文本通常已按哈希排序，此时边解析边直接写出；遇到乱序的行时改为外部排序：
+    已写出的部分作为第一段，其余内容每 chunk_records 条排序成一段临时文件，
+    最后逐段归并。同一哈希出现多次时保留最大的次数。内存占用与文件大小无关。
+
+    Args:
+        progress: 可选的回调 progress(已读取字节数, 文件总字节数)
+    """
+    output_path = Path(output_path)
+    total_bytes = os.path.getsize(source_path)
+    work_dir = tempfile.mkdtemp(prefix='corpus.', dir=output_path.parent)
+    try:
+        # 有序前缀直接写入（预留文件头），作为第一段
+        prefix_path = os.path.join(work_dir, 'prefix.bin')
+        runs = []
+        chunk = []
+        previous = b''
+        in_order = True
+        with open(source_path, 'rb') as source, open(prefix_path, 'wb') as prefix:
+            prefix.write(bytes(HEADER.size))
+            for line_number, line in enumerate(source, 1):
+                if progress is not None and line_number % 100000 == 0:
+                    progress(source.tell(), total_bytes)
+                record = parse_corpus_line(line)
+                if record is None:
+                    continue
+                if in_order:
+                    if record[:DIGEST_SIZE] > previous[:DIGEST_SIZE]:
+                        prefix.write(record)
+                        previous = record
+                        continue
+                    in_order = False
+                chunk.append(record)
+                if len(chunk) >= chunk_records:
+                    runs.append(_write_run(chunk, work_dir))
+                    chunk = []
+            if chunk:
+                runs.append(_write_run(chunk, work_dir))
+
+        if in_order:
+            count = (os.path.getsize(prefix_path) - HEADER.size) // RECORD_SIZE
+            with open(prefix_path, 'r+b') as f:
+                f.write(HEADER.pack(MAGIC, count))
+            os.replace(prefix_path, output_path)
+            return count
+
+        # 归并各段，跳过重复的哈希（有序时同一哈希的记录相邻，次数大的在后）
+        merged_path = os.path.join(work_dir, 'merged.bin')
+        count = 0
+        streams = [_read_run(prefix_path, HEADER.size)] + [_read_run(path, 0) for path in runs]
+        with open(merged_path, 'wb') as merged:
+            merged.write(bytes(HEADER.size))
+            pending = None
+            buffer = []
+            for record in heapq.merge(*streams):
+                if pending is not None and pending[:DIGEST_SIZE] != record[:DIGEST_SIZE]:
+                    buffer.append(pending)
+                    count += 1
+                    if len(buffer) >= READ_RECORDS:
+                        merged.write(b''.join(buffer))
+                        buffer = []
+                pending = record
+            if pending is not None:
+                buffer.append(pending)
+                count += 1
+            merged.write(b''.join(buffer))
+            merged.seek(0)
+            merged.write(HEADER.pack(MAGIC, count))
+        os.replace(merged_path, output_path)
+        return count
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+class BreachCorpus:
+    """内存映射的泄露密码库
+
+    用 mmap 映射文件，按 SHA-1 二分查找，每次查找只访问 log2(记录数) 条记录，
+    文件内容由操作系统按页换入，不会整体读入内存。
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        self._mmap = None
+        try:
+            header = self._file.read(HEADER.size)
+            magic, count = HEADER.unpack(header) if len(header) == HEADER.size else (None, 0)
+            if magic != MAGIC:
+                raise ValueError('不是有效的泄露密码库文件，请先用 secretbook.py breach-build 构建')
+            stat = os.fstat(self._file.fileno())
+            if stat.st_size != HEADER.size + count * RECORD_SIZE:
+                raise ValueError('泄露密码库文件不完整')
+            self.count = count
+            self.identity = [stat.st_size, stat.st_mtime_ns, count]
+            if count:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def lookup_digest(self, digest: bytes) -> int:
+        """按 SHA-1 摘要查找，返回泄露次数，未泄露时返回 0"""
+        data = self._mmap
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            offset = HEADER.size + middle * RECORD_SIZE
+            key = data[offset:offset + DIGEST_SIZE]
+            if key < digest:
+                low = middle + 1
+            elif key > digest:
+                high = middle
+            else:
+                return int.from_bytes(data[offset + DIGEST_SIZE:offset + RECORD_SIZE], 'big')
+        return 0
+
+    def lookup(self, password: str) -> int:
+        """密码在泄露库中出现的次数"""
+        return self.lookup_digest(hashlib.sha1(password.encode()).digest())
+
+
+class BreachChecker:
+    """离线泄露检查
+
+    按条目缓存（密文指纹, 密码哈希, 泄露次数）：密文未变的条目不再解密；
+    密文变化但密码哈希已查过（如只改了备注，或与其他条目共用密码）的条目不再查找。
+    密码哈希与 VaultAudit 使用同一个带密钥的哈希，缓存用用户密钥加密保存，
+    泄露库文件变化（大小、修改时间、记录数）时整体重新检查。
+
+    run() 在后台线程中调用，结果是独立的 dict，可以交给界面线程。
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self._user = None
+        self._key = None
+        self._records = {}  # id -> (密文指纹, 密码哈希, 泄露次数)
+        self._corpus_identity = None
+
+    @property
+    def cache_file(self):
+        return user_cache_file(self.data_manager, 'breach')
+
+    def _reset(self):
+        """切换用户或首次运行时读取缓存"""
+        self._user = self.data_manager.current_user
+        self._key = hash_key(self.data_manager.encryption_key)
+        payload = read_encrypted_cache(self.cache_file, self.data_manager.encryption_key, CACHE_VERSION) or {}
+        self._corpus_identity = payload.get('corpus')
+        self._records = {entry_id: (record_fingerprint, digest, count)
+                         for entry_id, record_fingerprint, digest, count in payload.get('records', [])}
+
+    def _save_cache(self):
+        write_encrypted_cache(self.cache_file, {
+            'version': CACHE_VERSION,
+            'corpus': self._corpus_identity,
+            'records': [[entry_id, *record] for entry_id, record in self._records.items()],
+        }, self.data_manager.encryption_key)
+
+    @traced('泄露检查', 'breach')
+    def run(self, corpus_path, should_stop=None, progress=None):
+        """增量检查当前用户的全部条目
+
+        Args:
+            should_stop: 可选的回调，返回 True 时保存已完成的部分并返回 None
+            progress: 可选的回调 progress(已处理条数, 总条数)，只在需要解密的条目上调用
+
+        Returns:
+            {'counts': {id: 泄露次数}, 'checked': 本次在泄露库中查找的密码数}
+        """
+        if not self.data_manager.current_user:
+            return {'counts': {}, 'checked': 0}
+        if self._user != self.data_manager.current_user:
+            self._reset()
+
+        with BreachCorpus(corpus_path) as corpus:
+            if corpus.identity != self._corpus_identity:
+                self._corpus_identity = corpus.identity
+                self._records = {}
+            counts_by_digest = {digest: count for _, digest, count in self._records.values()}
+
+            items = self.data_manager.read_encrypted_passwords()
+            counts = {}
+            checked = decrypted = 0
+            for index, item in enumerate(items, 1):
+                entry_id = item['id']
+                current_fingerprint = fingerprint(item['data'])
+                record = self._records.get(entry_id)
+                if record is not None and record[0] == current_fingerprint:
+                    counts[entry_id] = record[2]
+                    continue
+
+                if should_stop is not None and should_stop():
+                    self._save_cache()
+                    return None
+                password_data = self.data_manager.decrypt_password_item(item)
+                if password_data is None:
+                    self._records.pop(entry_id, None)
+                    continue
+                password = password_data.get('password', '') or ''
+                digest = password_digest(self._key, password)
+                count = counts_by_digest.get(digest)
+                if count is None:
+                    count = counts_by_digest[digest] = corpus.lookup(password) if password else 0
+                    checked += 1
+                self._records[entry_id] = (current_fingerprint, digest, count)
+                counts[entry_id] = count
+                decrypted += 1
+                if progress is not None and decrypted % 200 == 0:
+                    progress(index, len(items))
+
+        removed = [entry_id for entry_id in self._records if entry_id not in counts]
+        for entry_id in removed:
+            del self._records[entry_id]
+        if decrypted or removed:
+            self._save_cache()
+        return {'counts': counts, 'checked': checked}
@@ -0,0 +1,70 @@
+from collections import Counter
+
+
+UNCATEGORIZED = '未分类'
+
+
+def normalize_category(category) -> str:
+    """规范化分类名，空分类统一归入“未分类”"""
+    category = (category or '').strip()
+    return category or UNCATEGORIZED
+
+
+class CategoryFacets:
+    """分类统计
+
+    维护每个分类（含“未分类”）的条目数，随增删改增量更新。
+    各更新方法返回计数发生变化的分类，便于界面只刷新对应项。
+    """
+
+    def __init__(self):
+        self._counts = Counter()
+        self._total = 0
+
+    @property
+    def total(self) -> int:
+        """条目总数"""
+        return self._total
+
+    def count(self, category) -> int:
+        """分类下的条目数"""
+        return self._counts.get(normalize_category(category), 0)
+
+    def counts(self) -> dict:
+        """所有非空分类的条目数"""
+        return dict(self._counts)
+
+    def categories(self) -> list:
+        """条目数大于零的分类"""
+        return list(self._counts)
+
+    def rebuild(self, entries):
+        """根据完整条目列表重新统计"""
+        self._counts = Counter(normalize_category(entry.get('category')) for entry in entries)
+        self._total = sum(self._counts.values())
+
+    def add(self, category) -> list:
+        """新增一个条目"""
+        key = normalize_category(category)
+        self._counts[key] += 1
+        self._total += 1
+        return [key]
+
+    def remove(self, category) -> list:
+        """移除一个条目"""
+        key = normalize_category(category)
+        if self._counts.get(key, 0) <= 0:
+            return []
+        self._counts[key] -= 1
+        if not self._counts[key]:
+            del self._counts[key]
+        self._total -= 1
+        return [key]
+
+    def move(self, old_category, new_category) -> list:
+        """条目从一个分类移动到另一个分类"""
+        old_key = normalize_category(old_category)
+        new_key = normalize_category(new_category)
+        if old_key == new_key:
+            return []
+        return self.remove(old_key) + self.add(new_key)
@@ -0,0 +1,225 @@
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, compress, repeat
+from operator import and_, contains, or_
+
+try:
+    import numpy as np
+except ImportError:  # 未安装 numpy 时使用纯 Python 的批量操作
+    np = None
+
+from .category_facets import normalize_category
+from .search_index import build_search_text, normalize_query, search_fields
+
+
+SEPARATOR = '\x00'  # 行与行之间的分隔符，查询中含有它时不可能匹配
+DEAD = 0xFFFF  # 已删除行的分类编码
+
+
+def numpy_available() -> bool:
+    """是否可以使用 numpy 加速"""
+    return np is not None
+
+
+class ColumnStore:
+    """列式条目索引
+
+    按行（加载顺序）保存：ID 数组、分类编码数组，以及所有行的小写搜索文本与拼音文本
+    各自拼接成的一个长字符串和对应的行起始偏移数组。
+
+    - 分类筛选在编码数组上整体比较（numpy 的向量比较，或 compress + map 的 C 级迭代），
+      不逐条读取记录；
+    - 文本搜索用 str.find 在拼接后的长字符串上扫描，命中后按偏移数组二分定位行号并
+      跳到下一行继续，只有命中的行才回到 Python 层。
+
+    搜索规则与 SearchIndex 一致（原文子串或拼音/首字母子串）。增删改只更新对应的行，
+    拼接文本在下一次筛选时重建；删除的行先标记，累积过多时再压缩。
+    """
+
+    COMPACT_MIN_DEAD = 1024
+    DENSE_RATIO = 16  # 命中超过 1/16 的行时改为逐行判断
+
+    def __init__(self, use_numpy: bool = None):
+        self.use_numpy = numpy_available() if use_numpy is None else bool(use_numpy) and numpy_available()
+        self.clear()
+
+    def clear(self):
+        """清空全部行"""
+        self._ids = array('q')
+        self._codes = array('H')
+        self._texts = []  # 每行的搜索文本（以 SEPARATOR 结尾）
+        self._pinyins = []  # 每行的拼音文本（以 SEPARATOR 结尾）
+        self._row_by_id = {}
+        self._categories = []  # 编码 -> 规范化的分类名
+        self._code_by_category = {}
+        self._dead = 0
+        self._buffers = None  # ((文本, 偏移), (拼音, 偏移))
+
+    def __len__(self):
+        return len(self._row_by_id)
+
+    def __contains__(self, entry_id):
+        return entry_id in self._row_by_id
+
+    # ---- 增删改 ----
+
+    def _category_code(self, category) -> int:
+        key = normalize_category(category)
+        code = self._code_by_category.get(key)
+        if code is None:
+            code = self._code_by_category[key] = len(self._categories)
+            self._categories.append(key)
+        return code
+
+    def add(self, entry):
+        """添加条目，已存在时原地更新（保持行的位置）"""
+        text, pinyin = build_search_text(search_fields(entry))
+        code = self._category_code(entry.category)
+        row = self._row_by_id.get(entry.id)
+        if row is None:
+            self._row_by_id[entry.id] = len(self._ids)
+            self._ids.append(entry.id)
+            self._codes.append(code)
+            self._texts.append(text + SEPARATOR)
+            self._pinyins.append(pinyin + SEPARATOR)
+        else:
+            self._codes[row] = code
+            self._texts[row] = text + SEPARATOR
+            self._pinyins[row] = pinyin + SEPARATOR
+        self._buffers = None
+
+    update = add
+
+    def remove(self, entry_id):
+        """移除条目"""
+        row = self._row_by_id.pop(entry_id, None)
+        if row is None:
+            return
+        self._codes[row] = DEAD
+        self._texts[row] = self._pinyins[row] = SEPARATOR
+        self._dead += 1
+        self._buffers = None
+        if self._dead >= self.COMPACT_MIN_DEAD and self._dead * 2 >= len(self._codes):
+            self._compact()
+
+    def _compact(self):
+        """丢弃已删除的行，保持其余行的顺序"""
+        alive = [code != DEAD for code in self._codes]
+        self._ids = array('q', compress(self._ids, alive))
+        self._codes = array('H', compress(self._codes, alive))
+        self._texts = list(compress(self._texts, alive))
+        self._pinyins = list(compress(self._pinyins, alive))
+        self._row_by_id = {entry_id: row for row, entry_id in enumerate(self._ids)}
+        self._dead = 0
+
+    # ---- 查询 ----
+
+    def matches(self, entry_id, query: str) -> bool:
+        """判断单个条目是否匹配查询"""
+        row = self._row_by_id.get(entry_id)
+        if row is None:
+            return False
+        text, pinyin_query = normalize_query(query)
+        if SEPARATOR in text:
+            return False
+        return text in self._texts[row] or bool(pinyin_query) and pinyin_query in self._pinyins[row]
+
+    def filter(self, query: str = '', category: str = '') -> list:
+        """按搜索文本与分类（规范化后的分类名，空表示全部）筛选，按行顺序返回条目 ID"""
+        code = None
+        if category:
+            code = self._code_by_category.get(category)
+            if code is None:
+                return []
+        if not self._ids:
+            return []
+
+        if not query:
+            return self._select_all() if code is None else self._select_code(code)
+
+        text, pinyin_query = normalize_query(query)
+        if SEPARATOR in text:
+            return []
+        (text_buffer, text_offsets), (pinyin_buffer, pinyin_offsets) = self._ensure_buffers()
+        rows = self._scan(text_buffer, text_offsets, text)
+        pinyin_rows = None
+        if rows is not None and pinyin_query:
+            pinyin_rows = self._scan(pinyin_buffer, pinyin_offsets, pinyin_query)
+        if rows is None or pinyin_query and pinyin_rows is None:
+            return self._dense_filter(text, pinyin_query, code)
+        if pinyin_rows:
+            rows = self._union(rows, pinyin_rows)
+        return self._select_rows(rows, code)
+
+    def _ensure_buffers(self):
+        if self._buffers is None:
+            self._buffers = (self._join(self._texts), self._join(self._pinyins))
+        return self._buffers
+
+    @staticmethod
+    def _join(texts) -> tuple:
+        """拼接各行文本，返回（长字符串, 各行起始偏移 + 末尾哨兵）"""
+        return ''.join(texts), array('q', accumulate(map(len, texts), initial=0))
+
+    def _scan(self, buffer: str, offsets, needle: str) -> list:
+        """在拼接文本中查找子串，返回命中的行号（升序，每行至多一次）
+
+        命中的行超过 1/DENSE_RATIO 时（如单个字母）逐次定位反而更慢，返回 None，
+        由调用方改用 _dense_filter。
+        """
+        rows = []
+        limit = (len(offsets) - 1) // self.DENSE_RATIO
+        find = buffer.find
+        position = find(needle)
+        while position >= 0:
+            if len(rows) > limit:
+                return None
+            row = bisect_right(offsets, position) - 1
+            rows.append(row)
+            position = find(needle, offsets[row + 1])
+        return rows
+
+    def _dense_filter(self, text: str, pinyin_query: str, code) -> list:
+        """对每行文本做一次 C 级的子串判断并直接取出 ID，适合命中很多行的查询
+
+        已删除行的文本只有分隔符，不会命中。
+        """
+        matched = map(contains, self._texts, repeat(text))
+        if pinyin_query:
+            matched = map(or_, matched, map(contains, self._pinyins, repeat(pinyin_query)))
+        if code is not None:
+            matched = map(and_, matched, map(code.__eq__, self._codes))
+        return list(compress(self._ids, matched))
+
+    def _union(self, rows: list, other: list):
+        if self.use_numpy:
+            return np.union1d(np.asarray(rows, dtype=np.intp), np.asarray(other, dtype=np.intp))
+        return sorted(set(rows).union(other))
+
+    def _select_all(self) -> list:
+        if self.use_numpy:
+            codes = np.frombuffer(self._codes, dtype=np.uint16)
+            return np.frombuffer(self._ids, dtype=np.int64)[codes != DEAD].tolist()
+        if not self._dead:
+            return self._ids.tolist()
+        return list(compress(self._ids, map(DEAD.__ne__, self._codes)))
+
+    def _select_code(self, code: int) -> list:
+        if self.use_numpy:
+            codes = np.frombuffer(self._codes, dtype=np.uint16)
+            return np.frombuffer(self._ids, dtype=np.int64)[codes == code].tolist()
+        return list(compress(self._ids, map(code.__eq__, self._codes)))
+
+    def _select_rows(self, rows, code) -> list:
+        """按行号取 ID，可选地只保留指定分类的行"""
+        if len(rows) == 0:
+            return []
+        if self.use_numpy:
+            rows = np.asarray(rows, dtype=np.intp)
+            if code is not None:
+                rows = rows[np.frombuffer(self._codes, dtype=np.uint16)[rows] == code]
+            return np.frombuffer(self._ids, dtype=np.int64)[rows].tolist()
+        if code is not None:
+            codes = self._codes
+            rows = [row for row in rows if codes[row] == code]
+        return list(map(self._ids.__getitem__, rows))
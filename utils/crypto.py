@@ -3,11 +3,14 @@ from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+from .tracing import traced
+
 
 class CryptoManager:
     """加密管理器"""
     
     @staticmethod
+    @traced('PBKDF2 密钥派生', 'crypto')
     def generate_key(password: str, salt: bytes = None) -> bytes:
         """基于密码生成加密密钥"""
         if salt is None:
@@ -23,6 +26,7 @@ class CryptoManager:
         return key
     
     @staticmethod
+    @traced('Fernet 加密', 'crypto')
     def encrypt_data(data: str, key: bytes) -> str:
         """加密数据"""
         f = Fernet(key)
@@ -30,6 +34,7 @@ class CryptoManager:
         return base64.urlsafe_b64encode(encrypted_data).decode()
     
     @staticmethod
+    @traced('Fernet 解密', 'crypto')
     def decrypt_data(encrypted_data: str, key: bytes) -> str:
         """解密数据"""
         try:
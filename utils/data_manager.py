@@ -1,48 +1,193 @@
 import json
 import hashlib
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from .crypto import CryptoManager
+from .file_lock import FileLock
+from .password_entry import PasswordEntry
+from .tracing import tracer, traced
+from .version_history import DEFAULT_HISTORY_LIMIT, iter_versions, make_delta, push_version
+
+
+# 敏感字段：界面侧的记录不携带这些字段，需要时通过 get_secret 按需解密
+SECRET_FIELDS = ('password',)
+
+
+def strip_secrets(password_data: dict) -> PasswordEntry:
+    """返回去除敏感字段后的紧凑记录，供界面、代理等长期持有"""
+    return PasswordEntry.from_dict(password_data, exclude=SECRET_FIELDS)
+
+
+class ConflictError(Exception):
+    """要修改的数据已被其他进程改动或删除"""
 
 
 class DataManager:
-    """数据管理器"""
+    """数据管理器
+    
+    解析后的用户数据按文件状态（inode、修改时间、大小）缓存，文件未变化时不再重复读取。
+    load_users 返回的是缓存对象本身，修改后必须调用 save_users 写回。
+    
+    多个进程可能同时打开同一个密码库：所有修改都在 _transaction 中进行，
+    持有跨进程文件锁、基于磁盘上的最新数据应用本次修改，再原子替换文件，
+    因此不同进程的修改会合并而不是互相覆盖。每个用户记录一个 version 计数，
+    每次写入加一，用于判断哪些用户的数据被其他进程改动过。
+    更新或删除某条记录时，若其密文与本进程上次看到的不同（已被其他进程修改），
+    视为冲突并拒绝，以免覆盖别人的修改。
+    
+    更新记录时被替换的版本以加密的差异保存在记录的 history 中（见 utils/version_history.py），
+    每个用户可设置保留的版本数（history_limit）。
+    """
     
     def __init__(self):
         self.data_dir = Path.home() / '.secretbook'
         self.data_dir.mkdir(exist_ok=True)
         self.users_file = self.data_dir / 'users.json'
+        self.lock_file = self.data_dir / 'users.json.lock'
         self.current_user = None
         self.encryption_key = None
+        # 冲突检测基准：加载线程与存储线程都会修改，只在持有 _io_lock 时读写
+        self._ciphertexts = {}  # id -> 当前用户的加密数据（界面最近一次看到的），用于按需解密与冲突检测
+        self._seen_version = None  # 界面最近一次同步到的当前用户数据版本
+        self._users_cache = None  # (文件状态, 解析后的用户数据)
+        self._cache_lock = threading.Lock()
+        self._io_lock = threading.RLock()  # 串行化文件读写，后台线程与界面线程可能同时访问
+        self._prefetch_thread = None
+    
+    def _file_state(self):
+        """用户数据文件的状态，文件不存在时返回None"""
+        try:
+            stat = self.users_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+    
+    def prefetch(self):
+        """在后台线程预先读取并解析用户数据文件
+        
+        登录框打开时调用，用户输入密码期间完成解析，
+        登录后只剩密钥派生和解密。
+        """
+        if self._prefetch_thread is not None:
+            return
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch, name='secretbook-prefetch', daemon=True
+        )
+        self._prefetch_thread.start()
+    
+    def _prefetch(self):
+        try:
+            self.load_users()
+        except (OSError, ValueError):
+            pass  # 预读失败不影响后续正常读取，错误留给调用方处理
+    
+    def _wait_prefetch(self):
+        """等待进行中的预读完成，避免重复解析"""
+        thread = self._prefetch_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+            self._prefetch_thread = None
+    
+    def invalidate_cache(self):
+        """丢弃缓存的用户数据，下次读取时重新解析文件"""
+        with self._cache_lock:
+            self._users_cache = None
     
     def load_users(self) -> dict:
         """加载用户数据"""
-        if self.users_file.exists():
-            with open(self.users_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {}
+        self._wait_prefetch()
+        with self._io_lock:
+            state = self._file_state()
+            if state is None:
+                return {}
+            
+            with self._cache_lock:
+                if self._users_cache is not None and self._users_cache[0] == state:
+                    return self._users_cache[1]
+            
+            with tracer.span('解析 users.json', 'storage'), open(self.users_file, 'r', encoding='utf-8') as f:
+                users = json.load(f)
+            with self._cache_lock:
+                self._users_cache = (state, users)
+            return users
     
     def save_users(self, users_data: dict):
-        """保存用户数据"""
-        with open(self.users_file, 'w', encoding='utf-8') as f:
-            json.dump(users_data, f, ensure_ascii=False, indent=2)
+        """保存用户数据（写入临时文件后原子替换，读取方不会看到写了一半的文件）"""
+        with self._io_lock:
+            fd, temp_path = tempfile.mkstemp(prefix='users.', suffix='.tmp', dir=self.data_dir)
+            try:
+                with tracer.span('写入 users.json', 'storage'), os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(users_data, f, ensure_ascii=False, indent=2)
+                os.replace(temp_path, self.users_file)
+            except Exception:
+                self.invalidate_cache()
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            with self._cache_lock:
+                self._users_cache = (self._file_state(), users_data)
+    
+    @contextmanager
+    def _transaction(self, username: str = None):
+        """修改用户数据的事务
+        
+        持有跨进程文件锁，产出磁盘上的最新数据；退出时把指定用户的
+        version 加一并写回。事务体抛出异常时不写入：ConflictError 表示
+        事务体在修改前放弃，其他异常可能发生在修改中途，因此同时丢弃缓存。
+        按文件状态判断的缓存可能误判（inode 复用、mtime 精度不足、写入前后大小相同），
+        因此事务中总是重新解析文件，缓存只用于不加锁的读取。
+        """
+        with self._io_lock, FileLock(self.lock_file):
+            self.invalidate_cache()
+            users = self.load_users()
+            try:
+                yield users
+            except ConflictError:
+                raise
+            except Exception:
+                self.invalidate_cache()
+                raise
+            username = username or self.current_user
+            if username in users:
+                version = users[username].get('version', 0)
+                users[username]['version'] = version + 1
+                # 写入前已与磁盘同步时，本次写入不算外部修改
+                if username == self.current_user and version == self._seen_version:
+                    self._seen_version = version + 1
+            self.save_users(users)
+    
+    def get_user_version(self) -> int:
+        """当前用户数据在磁盘上的版本号"""
+        if not self.current_user:
+            return 0
+        return self.load_users().get(self.current_user, {}).get('version', 0)
     
     def register_user(self, username: str, password: str) -> bool:
         """注册用户"""
-        users = self.load_users()
-        if username in users:
+        if username in self.load_users():
             return False
         
         # 密码哈希
         password_hash = hashlib.sha256(password.encode()).hexdigest()
-        users[username] = {
-            'password_hash': password_hash,
-            'created_at': datetime.now().isoformat(),
-            'passwords': []
-        }
-        self.save_users(users)
+        try:
+            with self._transaction(username) as users:
+                if username in users:
+                    raise ConflictError("用户名已存在")
+                users[username] = {
+                    'password_hash': password_hash,
+                    'created_at': datetime.now().isoformat(),
+                    'version': 0,
+                    'passwords': []
+                }
+        except ConflictError:
+            return False
         return True
     
+    @traced('登录', 'storage')
     def login_user(self, username: str, password: str) -> bool:
         """用户登录"""
         users = self.load_users()
@@ -55,30 +200,126 @@ class DataManager:
         
         self.current_user = username
         self.encryption_key = CryptoManager.generate_key(username)
+        with self._io_lock:
+            self._ciphertexts = {}
+            self._seen_version = None
         return True
     
     def get_user_passwords(self) -> list:
         """获取当前用户的密码列表"""
+        passwords = []
+        for encrypted_item in self.read_encrypted_passwords():
+            password_data = self.decrypt_password_item(encrypted_item)
+            if password_data is not None:
+                passwords.append(password_data)
+        
+        return passwords
+    
+    def read_encrypted_passwords(self) -> list:
+        """读取当前用户未解密的密码记录（不影响冲突检测基准）"""
         if not self.current_user:
             return []
         
         users = self.load_users()
-        encrypted_passwords = users[self.current_user].get('passwords', [])
+        # 返回副本，避免后台加载时与保存操作共享同一列表
+        return list(users[self.current_user].get('passwords', []))
+    
+    @traced('读取加密记录', 'storage')
+    def get_encrypted_passwords(self) -> list:
+        """获取当前用户未解密的密码记录，供界面加载
         
-        passwords = []
-        for encrypted_item in encrypted_passwords:
-            try:
-                decrypted_data = CryptoManager.decrypt_data(
-                    encrypted_item['data'], self.encryption_key
-                )
-                password_data = json.loads(decrypted_data)
-                password_data['id'] = encrypted_item['id']
-                passwords.append(password_data)
-            except Exception:
-                continue  # 跳过损坏的数据
+        同时记录各条目的密文与数据版本，作为之后更新、删除时的冲突检测基准。
+        读取与替换基准在同一次持锁中完成，存储线程的写入不会插在两者之间。
+        """
+        if not self.current_user:
+            return []
         
-        return passwords
+        with self._io_lock:
+            user = self.load_users()[self.current_user]
+            encrypted_passwords = list(user.get('passwords', []))
+            self._replace_baseline(encrypted_passwords, user.get('version', 0))
+        return encrypted_passwords
+    
+    def _replace_baseline(self, encrypted_passwords: list, version: int) -> bool:
+        """用磁盘快照替换冲突检测基准，持有 _io_lock 时调用
+        
+        版本号比已同步的版本旧的快照不覆盖基准，返回是否替换。
+        """
+        if self._seen_version is not None and version < self._seen_version:
+            return False
+        self._ciphertexts = {item['id']: item['data'] for item in encrypted_passwords}
+        self._seen_version = version
+        return True
+    
+    @traced('同步外部修改', 'storage')
+    def sync_external_changes(self) -> tuple[list, list]:
+        """检测其他进程对当前用户数据的修改
+        
+        数据版本与上次同步时相同则直接返回；否则逐条比较密文，
+        只解密新增或变化的记录，并把冲突检测基准更新为磁盘上的最新状态。
+        
+        Returns:
+            (新增或修改的记录（不含敏感字段）, 被删除的记录ID列表)
+        """
+        if not self.current_user:
+            return [], []
+        
+        # 持锁比较密文并替换基准，解密放在锁外
+        with self._io_lock:
+            user = self.load_users().get(self.current_user)
+            if user is None or user.get('version', 0) == self._seen_version:
+                return [], []
+            
+            passwords = user.get('passwords', [])
+            current_ids = {item['id'] for item in passwords}
+            changed_items = [item for item in passwords if self._ciphertexts.get(item['id']) != item['data']]
+            removed = [password_id for password_id in self._ciphertexts if password_id not in current_ids]
+            if not self._replace_baseline(passwords, user.get('version', 0)):
+                return [], []
+        
+        changed = []
+        for item in changed_items:
+            password_data = self.decrypt_password_item(item, include_secrets=False)
+            if password_data is not None:
+                changed.append(password_data)
+        return changed, removed
+    
+    def decrypt_password_item(self, encrypted_item: dict, include_secrets: bool = True):
+        """解密单条密码记录，数据损坏时返回None
+        
+        Args:
+            encrypted_item: 加密的密码记录
+            include_secrets: 是否保留密码等敏感字段
+        """
+        try:
+            decrypted_data = CryptoManager.decrypt_data(
+                encrypted_item['data'], self.encryption_key
+            )
+            password_data = json.loads(decrypted_data)
+            password_data['id'] = encrypted_item['id']
+            return password_data if include_secrets else strip_secrets(password_data)
+        except Exception:
+            return None  # 跳过损坏的数据
+    
+    @traced('按需解密', 'storage')
+    def get_secret(self, password_id: int, field: str = 'password'):
+        """按需解密单条记录的敏感字段，记录不存在或损坏时返回None"""
+        if not self.current_user:
+            return None
+        
+        with self._io_lock:
+            ciphertext = self._ciphertexts.get(password_id)
+            if ciphertext is None:
+                ciphertext = next((item['data'] for item in self.read_encrypted_passwords()
+                                   if item['id'] == password_id), None)
+                if ciphertext is None:
+                    return None
+                self._ciphertexts[password_id] = ciphertext
+        
+        password_data = self.decrypt_password_item({'id': password_id, 'data': ciphertext})
+        return None if password_data is None else password_data.get(field, '')
     
+    @traced('查重', 'storage')
     def check_password_exists(self, website: str, username: str, exclude_id: int = None) -> dict:
         """检查密码是否已存在
         
@@ -103,6 +344,7 @@ class DataManager:
         
         return {'exists': False, 'password': None}
     
+    @traced('保存密码', 'storage')
     def save_password(self, password_data: dict, force_save: bool = False) -> tuple[bool, str, dict]:
         """保存密码
         
@@ -111,7 +353,7 @@ class DataManager:
             force_save: 强制保存（忽略重复检查）
         
         Returns:
-            (成功状态, 消息, 重复的密码数据或None)
+            (成功状态, 消息, 失败时为重复的密码数据或None，成功时为保存后的记录（不含敏感字段）)
         """
         if not self.current_user:
             return False, "用户未登录", None
@@ -126,25 +368,82 @@ class DataManager:
             if check_result['exists']:
                 return False, "密码已存在", check_result['password']
         
-        users = self.load_users()
-        
-        # 加密密码数据
+        # 加密密码数据（在事务外完成，缩短持锁时间）
         data_to_encrypt = json.dumps(password_data, ensure_ascii=False)
         encrypted_data = CryptoManager.encrypt_data(data_to_encrypt, self.encryption_key)
         
-        # 生成ID
-        password_id = len(users[self.current_user]['passwords']) + 1
+        with self._transaction() as users:
+            passwords = users[self.current_user]['passwords']
+            # 生成ID（基于最新数据取最大ID加一，避免删除后或与其他进程的ID重复）
+            password_id = max((item['id'] for item in passwords), default=0) + 1
+            passwords.append({
+                'id': password_id,
+                'data': encrypted_data,
+                'created_at': datetime.now().isoformat()
+            })
+        
+        with self._io_lock:
+            self._ciphertexts[password_id] = encrypted_data
+        return True, "保存成功", strip_secrets(dict(password_data, id=password_id))
+    
+    def _existing_by_key(self) -> dict:
+        """（网站, 用户名）小写 -> 已有记录，供批量查重，只解密一遍"""
+        existing = {}
+        for password in self.get_user_passwords():
+            key = (password.get('website', '').lower(), password.get('username', '').lower())
+            existing.setdefault(key, password)
+        return existing
+    
+    @traced('批量保存密码', 'storage')
+    def save_passwords(self, passwords_data: list, force_save: bool = False,
+                       replace: bool = False) -> tuple[list, list]:
+        """批量保存密码，所有记录在一次加锁写入中完成
+        
+        Args:
+            passwords_data: 密码数据列表
+            force_save: 强制保存（忽略重复检查）
+            replace: 替换模式，在同一次写入中先清空现有记录（不再与现有记录查重），
+                中途失败时现有记录保持不变
+        
+        Returns:
+            (保存后的记录列表（不含敏感字段）, 重复项列表 [{'import_data': 新数据, 'existing_data': 已有记录}])
+        """
+        if not self.current_user:
+            return [], []
+        
+        existing = {} if force_save or replace else self._existing_by_key()
+        to_save = []
+        duplicates = []
+        for password_data in passwords_data:
+            key = (password_data.get('website', '').lower(), password_data.get('username', '').lower())
+            if key in existing:
+                duplicates.append({'import_data': password_data, 'existing_data': existing[key]})
+            else:
+                data_to_encrypt = json.dumps(password_data, ensure_ascii=False)
+                to_save.append((password_data, CryptoManager.encrypt_data(data_to_encrypt, self.encryption_key)))
         
-        encrypted_item = {
-            'id': password_id,
-            'data': encrypted_data,
-            'created_at': datetime.now().isoformat()
-        }
+        if not to_save and not replace:
+            return [], duplicates
         
-        users[self.current_user]['passwords'].append(encrypted_item)
-        self.save_users(users)
-        return True, "保存成功", None
+        with self._transaction() as users:
+            if replace:
+                users[self.current_user]['passwords'] = []
+            passwords = users[self.current_user]['passwords']
+            first_id = max((item['id'] for item in passwords), default=0) + 1
+            created_at = datetime.now().isoformat()
+            for offset, (_, encrypted_data) in enumerate(to_save):
+                passwords.append({'id': first_id + offset, 'data': encrypted_data, 'created_at': created_at})
+        
+        with self._io_lock:
+            if replace:
+                self._ciphertexts = {}
+            for offset, (_, encrypted_data) in enumerate(to_save):
+                self._ciphertexts[first_id + offset] = encrypted_data
+        saved = [strip_secrets(dict(password_data, id=first_id + offset))
+                 for offset, (password_data, _) in enumerate(to_save)]
+        return saved, duplicates
     
+    @traced('更新密码', 'storage')
     def update_password(self, password_id: int, password_data: dict, force_update: bool = False) -> tuple[bool, str, dict]:
         """更新密码
         
@@ -154,7 +453,7 @@ class DataManager:
             force_update: 强制更新（忽略重复检查）
         
         Returns:
-            (成功状态, 消息, 重复的密码数据或None)
+            (成功状态, 消息, 失败时为重复的密码数据或None，成功时为更新后的记录（不含敏感字段）)
         """
         if not self.current_user:
             return False, "用户未登录", None
@@ -170,21 +469,139 @@ class DataManager:
             if check_result['exists']:
                 return False, "密码已存在", check_result['password']
         
-        users = self.load_users()
-        passwords = users[self.current_user]['passwords']
+        data_to_encrypt = json.dumps(password_data, ensure_ascii=False)
+        encrypted_data = CryptoManager.encrypt_data(data_to_encrypt, self.encryption_key)
         
-        for i, item in enumerate(passwords):
-            if item['id'] == password_id:
-                data_to_encrypt = json.dumps(password_data, ensure_ascii=False)
-                encrypted_data = CryptoManager.encrypt_data(data_to_encrypt, self.encryption_key)
+        try:
+            with self._transaction() as users:
+                item = self._find_item(users, password_id)
+                if item is None:
+                    raise ConflictError("该密码已被删除")
+                self._check_conflict(item)
                 
-                passwords[i]['data'] = encrypted_data
-                passwords[i]['updated_at'] = datetime.now().isoformat()
-                break
+                self._push_history(users[self.current_user], item, password_data)
+                item['data'] = encrypted_data
+                item['updated_at'] = datetime.now().isoformat()
+        except ConflictError as e:
+            return False, str(e), None
+        
+        with self._io_lock:
+            self._ciphertexts[password_id] = encrypted_data
+        return True, "更新成功", strip_secrets(dict(password_data, id=password_id))
+    
+    def _push_history(self, user: dict, item: dict, password_data: dict):
+        """把即将被替换的版本以相对新版本的差异加入历史，内容未变或旧数据损坏时不记录"""
+        try:
+            previous = json.loads(CryptoManager.decrypt_data(item['data'], self.encryption_key))
+        except ValueError:
+            return
+        delta = make_delta(password_data, previous)
+        if not delta:
+            return
+        history = push_version(
+            item.get('history', []), delta, item.get('updated_at') or item.get('created_at'),
+            self.encryption_key, user.get('history_limit', DEFAULT_HISTORY_LIMIT)
+        )
+        if history:
+            item['history'] = history
+        else:
+            item.pop('history', None)
+    
+    @traced('读取历史版本', 'storage')
+    def get_password_history(self, password_id: int, include_secrets: bool = False) -> list:
+        """某条记录的历史版本（新到旧），记录不存在或损坏时返回空列表
+        
+        Returns:
+            [{'version': 版本号（1 为上一版本）, 'saved_at': 该版本的保存时间,
+              'changed': 与后一版本相比修改的字段, 'data': 该版本的完整数据}]
+        """
+        if not self.current_user:
+            return []
         
-        self.save_users(users)
-        return True, "更新成功", None
+        item = self._find_item(self.load_users(), password_id)
+        if item is None:
+            return []
+        current = self.decrypt_password_item(item)
+        if current is None:
+            return []
+        
+        versions = []
+        try:
+            for version, saved_at, password_data, changed in iter_versions(
+                    current, item.get('history', []), self.encryption_key):
+                data = dict(password_data) if include_secrets else dict(strip_secrets(password_data))
+                versions.append({'version': version, 'saved_at': saved_at, 'changed': changed, 'data': data})
+        except ValueError:
+            pass  # 更早的版本已损坏，只返回能还原的部分
+        return versions
+    
+    @traced('恢复历史版本', 'storage')
+    def restore_password_version(self, password_id: int, version: int) -> tuple[bool, str, dict]:
+        """把记录恢复为第 version 个历史版本
+        
+        只解密这一条记录的 version 项差异；恢复本身也是一次更新，
+        被替换的当前内容会成为新的历史版本，因此恢复可以撤销。
+        
+        Returns:
+            与 update_password 相同
+        """
+        if not self.current_user:
+            return False, "用户未登录", None
+        
+        item = self._find_item(self.load_users(), password_id)
+        current = None if item is None else self.decrypt_password_item(item)
+        if current is None:
+            return False, "该密码已被删除", None
+        history = item.get('history', [])
+        if not 1 <= version <= len(history):
+            return False, "历史版本不存在", None
+        
+        try:
+            *_, (_, _, password_data, _) = iter_versions(current, history, self.encryption_key, version)
+        except ValueError:
+            return False, "历史版本已损坏", None
+        password_data.pop('id', None)
+        return self.update_password(password_id, password_data, force_update=True)
+    
+    def get_history_limit(self) -> int:
+        """当前用户每条记录保留的历史版本数"""
+        if not self.current_user:
+            return DEFAULT_HISTORY_LIMIT
+        return self.load_users().get(self.current_user, {}).get('history_limit', DEFAULT_HISTORY_LIMIT)
     
+    @traced('清理历史版本', 'storage')
+    def set_history_limit(self, limit: int) -> int:
+        """设置保留的历史版本数并立即清理超出的旧版本，返回删除的版本数"""
+        if not self.current_user:
+            return 0
+        
+        limit = max(0, limit)
+        removed = 0
+        with self._transaction() as users:
+            user = users[self.current_user]
+            user['history_limit'] = limit
+            for item in user['passwords']:
+                history = item.get('history')
+                if history and len(history) > limit:
+                    removed += len(history) - limit
+                    if limit:
+                        item['history'] = history[:limit]
+                    else:
+                        del item['history']
+        return removed
+    
+    def _find_item(self, users: dict, password_id: int):
+        """在用户数据中查找当前用户的某条加密记录"""
+        return next((item for item in users[self.current_user]['passwords']
+                     if item['id'] == password_id), None)
+    
+    def _check_conflict(self, item: dict):
+        """记录自本进程上次看到后被其他进程修改过时抛出 ConflictError"""
+        seen = self._ciphertexts.get(item['id'])
+        if seen is not None and seen != item['data']:
+            raise ConflictError("该密码已在其他窗口中被修改，请刷新后重试")
+    
+    @traced('导入密码', 'storage')
     def import_passwords(self, file_path: str, merge_mode: bool = True) -> tuple[bool, str, list]:
         """从加密文件导入密码
         
@@ -222,17 +639,7 @@ class DataManager:
             if not isinstance(passwords_to_import, list):
                 return False, "密码数据格式错误", []
             
-            # 获取当前用户数据
-            users = self.load_users()
-            
-            if not merge_mode:
-                # 替换模式：清空现有密码
-                users[self.current_user]['passwords'] = []
-            
-            # 检查重复密码
-            duplicates = []
             valid_passwords = []
-            
             for password_data in passwords_to_import:
                 # 移除ID字段，让系统重新分配
                 if 'id' in password_data:
@@ -241,27 +648,11 @@ class DataManager:
                 # 验证必要字段
                 if not all(key in password_data for key in ['website', 'username', 'password']):
                     continue
-                
-                # 检查是否重复
-                check_result = self.check_password_exists(
-                    password_data.get('website', ''),
-                    password_data.get('username', '')
-                )
-                
-                if check_result['exists']:
-                    duplicates.append({
-                        'import_data': password_data,
-                        'existing_data': check_result['password']
-                    })
-                else:
-                    valid_passwords.append(password_data)
+                valid_passwords.append(password_data)
             
-            # 导入非重复密码
-            imported_count = 0
-            for password_data in valid_passwords:
-                success, _, _ = self.save_password(password_data, force_save=True)
-                if success:
-                    imported_count += 1
+            # 批量查重并一次写入非重复密码（替换模式下清空现有密码也在同一次写入中完成）
+            saved, duplicates = self.save_passwords(valid_passwords, replace=not merge_mode)
+            imported_count = len(saved)
             
             if duplicates:
                 return True, f"导入完成。成功导入 {imported_count} 条密码，发现 {len(duplicates)} 条重复密码需要处理。", duplicates
@@ -273,23 +664,30 @@ class DataManager:
         except json.JSONDecodeError:
             return False, "文件格式错误，不是有效的JSON文件", []
         except Exception as e:
+            self.invalidate_cache()
             return False, f"导入失败: {str(e)}", []
     
+    @traced('删除密码', 'storage')
     def delete_password(self, password_id: int) -> bool:
         """删除密码"""
         if not self.current_user:
             return False
         
-        users = self.load_users()
-        passwords = users[self.current_user]['passwords']
-        
-        users[self.current_user]['passwords'] = [
-            item for item in passwords if item['id'] != password_id
-        ]
+        # 已被其他进程删除视为成功；被其他进程修改过则拒绝删除
+        try:
+            with self._transaction() as users:
+                item = self._find_item(users, password_id)
+                if item is not None:
+                    self._check_conflict(item)
+                    users[self.current_user]['passwords'].remove(item)
+        except ConflictError:
+            return False
         
-        self.save_users(users)
+        with self._io_lock:
+            self._ciphertexts.pop(password_id, None)
         return True
     
+    @traced('导出密码', 'storage')
     def export_passwords(self, file_path: str) -> bool:
         """导出密码到加密文件"""
         if not self.current_user:
@@ -0,0 +1,75 @@
+import os
+import time
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+from .tracing import traced
+
+
+class FileLockTimeout(TimeoutError):
+    """等待文件锁超时"""
+
+
+class FileLock:
+    """跨进程的建议性文件锁
+
+    锁定一个单独的锁文件（而非数据文件本身），数据文件因此可以用
+    临时文件 + 原子替换的方式写入。同一进程内不可重入，进程内的
+    并发由调用方自己的线程锁保证。
+    """
+
+    def __init__(self, path, timeout: float = 10.0, poll_interval: float = 0.01):
+        self.path = str(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    @traced('等待文件锁', 'storage')
+    def acquire(self):
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._lock(fd)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise FileLockTimeout(f'等待文件锁超时: {self.path}')
+                time.sleep(self.poll_interval)
+        self._fd = fd
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            self._unlock(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    @staticmethod
+    def _lock(fd):
+        if os.name == 'nt':
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    @staticmethod
+    def _unlock(fd):
+        if os.name == 'nt':
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
@@ -1,62 +1,139 @@
+import logging
 import os
 import sys
-from PySide6.QtGui import QIcon
+import time
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QGuiApplication, QIcon, QPainter, QPixmap
+
+logger = logging.getLogger(__name__)
+
 
 class IconManager:
-    """图标管理器 - 统一管理应用程序图标"""
+    """图标管理器 - 统一管理应用程序图标
+
+    应用图标预先栅格化为各标准尺寸并编译进资源模块（见 tools/build_icons.py），
+    运行时按尺寸直接取用，不再探测文件系统；工具栏、菜单和表格中使用的
+    emoji 图标同样渲染一次后按（字符, 尺寸, 像素比）缓存。
+    """
+    
+    STANDARD_SIZES = (16, 24, 32, 48, 64, 128, 256)
+    GLYPH_SIZES = (16, 24, 32)
+    RESOURCE_PATH = ':/icons/{name}_{size}.png'
+    FALLBACK_FILES = ('app.ico', 'logo.svg', 'logo.png')
     
-    _app_icon = None
+    _icons = {}  # 图标名 -> QIcon
+    _pixmaps = {}  # (字符, 尺寸, 像素比) -> QPixmap
+    _resources_loaded = None
+    _stats = {'hits': 0, 'misses': 0, 'load_ms': 0.0}
+    
+    @classmethod
+    def stats(cls) -> dict:
+        """缓存命中次数、栅格化次数与累计加载耗时，由 --startup-profile 输出"""
+        return dict(cls._stats, cached=len(cls._pixmaps) + len(cls._icons))
+    
+    @classmethod
+    def _ensure_resources(cls) -> bool:
+        """注册内嵌资源，资源模块未生成时返回False"""
+        if cls._resources_loaded is None:
+            try:
+                from utils import icon_resources  # noqa: F401 导入即注册资源
+                cls._resources_loaded = True
+            except ImportError:
+                logger.warning('未找到内嵌图标资源，请运行 tools/build_icons.py；改为从 assets 目录加载')
+                cls._resources_loaded = False
+        return cls._resources_loaded
     
     @classmethod
     def get_app_icon(cls) -> QIcon:
         """获取应用程序图标"""
-        if cls._app_icon is None:
-            cls._app_icon = cls._load_app_icon()
-        return cls._app_icon
-    
-    @classmethod
-    def _load_app_icon(cls) -> QIcon:
-        """加载应用程序图标"""
-        try:
-            # 获取资源文件路径（兼容打包后的情况）
-            if getattr(sys, 'frozen', False):
-                # 打包后的情况
-                base_path = sys._MEIPASS
-            else:
-                # 开发环境
-                current_file = os.path.abspath(__file__)
-                base_path = os.path.dirname(os.path.dirname(current_file))
-            
-            # 优先尝试 ICO 文件，然后是 SVG
-            icon_files = ['app.ico', 'logo.svg', 'logo.png']
-            
-            for icon_file in icon_files:
-                icon_path = os.path.join(base_path, 'assets', icon_file)
-                if os.path.exists(icon_path):
-                    print(f"找到图标文件: {icon_path}")
-                    return QIcon(icon_path)
-            
-            print(f"未找到图标文件，搜索路径: {os.path.join(base_path, 'assets')}")
-            # 列出 assets 目录内容进行调试
-            assets_path = os.path.join(base_path, 'assets')
-            if os.path.exists(assets_path):
-                files = os.listdir(assets_path)
-                print(f"assets 目录内容: {files}")
-            
-            return QIcon()  # 返回空图标
-        except Exception as e:
-            print(f"加载图标失败: {e}")
-            return QIcon()  # 返回空图标
+        return cls.icon('app')
+    
+    @classmethod
+    def icon(cls, name: str) -> QIcon:
+        """获取内嵌图标，包含全部标准尺寸"""
+        icon = cls._icons.get(name)
+        if icon is not None:
+            cls._stats['hits'] += 1
+            return icon
+        
+        cls._stats['misses'] += 1
+        start = time.perf_counter()
+        icon = QIcon()
+        if cls._ensure_resources():
+            for size in cls.STANDARD_SIZES:
+                pixmap = QPixmap(cls.RESOURCE_PATH.format(name=name, size=size))
+                if not pixmap.isNull():
+                    icon.addPixmap(pixmap)
+        if icon.isNull() and name == 'app':
+            icon = cls._load_fallback_icon()
+        cls._stats['load_ms'] += (time.perf_counter() - start) * 1000
+        
+        cls._icons[name] = icon
+        return icon
+    
+    @classmethod
+    def glyph_pixmap(cls, glyph: str, size: int, device_pixel_ratio: float = 1.0) -> QPixmap:
+        """把 emoji 等字符渲染为透明底位图并缓存，避免每次绘制都重新排版字形"""
+        key = (glyph, size, device_pixel_ratio)
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is not None:
+            cls._stats['hits'] += 1
+            return pixmap
+        
+        cls._stats['misses'] += 1
+        start = time.perf_counter()
+        pixmap = QPixmap(round(size * device_pixel_ratio), round(size * device_pixel_ratio))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        font = QGuiApplication.font()
+        font.setPixelSize(round(size * 0.8))
+        painter.setFont(font)
+        painter.setPen(Qt.white)
+        painter.drawText(0, 0, size, size, Qt.AlignCenter, glyph)
+        painter.end()
+        cls._stats['load_ms'] += (time.perf_counter() - start) * 1000
+        
+        cls._pixmaps[key] = pixmap
+        return pixmap
+    
+    @classmethod
+    def glyph_icon(cls, glyph: str) -> QIcon:
+        """由字符位图组成的图标，供按钮和菜单使用"""
+        key = f'glyph:{glyph}'
+        icon = cls._icons.get(key)
+        if icon is None:
+            icon = QIcon()
+            for size in cls.GLYPH_SIZES:
+                icon.addPixmap(cls.glyph_pixmap(glyph, size))
+            cls._icons[key] = icon
+        else:
+            cls._stats['hits'] += 1
+        return icon
+    
+    @classmethod
+    def _load_fallback_icon(cls) -> QIcon:
+        """资源模块缺失时从 assets 目录加载应用图标"""
+        # 获取资源文件路径（兼容打包后的情况）
+        if getattr(sys, 'frozen', False):
+            base_path = sys._MEIPASS
+        else:
+            base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        
+        for icon_file in cls.FALLBACK_FILES:
+            icon_path = os.path.join(base_path, 'assets', icon_file)
+            if os.path.exists(icon_path):
+                return QIcon(icon_path)
+        
+        logger.warning('未找到图标文件，搜索路径: %s', os.path.join(base_path, 'assets'))
+        return QIcon()  # 返回空图标
     
     @classmethod
     def set_window_icon(cls, window):
         """为窗口设置图标"""
-        try:
-            icon = cls.get_app_icon()
-            if not icon.isNull():
-                window.setWindowIcon(icon)
-                print("窗口图标设置成功")
-            else:
-                print("图标为空，无法设置窗口图标")
-        except Exception as e:
-            print(f"设置窗口图标失败: {e}")
\ No newline at end of file
+        icon = cls.get_app_icon()
+        if not icon.isNull():
+            window.setWindowIcon(icon)
@@ -0,0 +1,4419 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x08\x17\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\x12tEXt_q_\
+icoOrigDepth\x0032\xd5\
+\xe2\xb8\xec\x00\x00\x07\xabIDATX\x85\x8d\x97K\
+l\x9d\xd5\x11\xc7\x7fs\xce\xf7\xf4\xf5\xb5/N\xb0\x89\
+\xed<0\x11\x89I\x84*\x9c\x16\xd2$*m\x83D\
+E\x17T\xad\xd5m+\xb5THe\xd1\x0dRWe\
+S\xd1\x1dR\xa5>\xe8\xbeR\x95\xb4;\x90\xca\xa6\x80\
+\xe2\x16\x8a\x92R \x09AA\x08%N\x9c\xc4N\x1a\
+\xe7\xfa\xfa{\x9e3]\x5c\xdb\xd8\x8e\x1d3\xd2\xdd\xdc\
+o\xce\xcc\x9c\xff\xcc\xfc\xe7\x8c\xb0\x85L\x9e\x98\xb4\xe7\
+\xce}~\xbf\xf8j\xa7U{H\xe1\x18\xe8A\xd0a\
+\xa0\xb9\xa4\xd6\x06\xae\x02g\x05N9\xd1\xd3j\xc2\xcb\
+\x07\xce\xef\x99=y\xf2\xa4\xbb\x97}\xd9\xf4\x8b\x22\x13\
+/Ml\xf3\xde\x1fp\x22\xcf\xa0\x1c\x15\x91a\xb1\xd2\
+\x14cR\x11B\x11\xb1\x00\xaa\xeaT\xa9\xd4\xfbL\x9d\
+\xb6\xbd\xd7\xab\x02S\xaa\xfaZ\x14\x98\xf3g^:s\
+\x13A\xbft\x00\x13\xcfM\x84\xd5\x0e\xd9\xa7\xdeM\x8a\
+\xcaw\xc5\xcaC6\xb2\xfda\x1c\x12\xf5D\x84I\x88\
+\x0d-\xc6v\x8f{\xa7\xb8\xcaQ\xe5\x15\xe5bI\x95\
+W\xb8\xca\xcf\xab\xf7\x9f\x22\xbc\x86\x98\xbf\x863\xfa\xc9\
+\x99?\x9d\xa9\xb6\x0c\xe0\xf0/\x0e\xa7Y\xa3z\xdcI\
+\xfd\xbc\x11\xfb\xa4\x8d\xed`\xd2\x9b\x90\xb6R\xc28\xc4\
+X\x83XAD\xbe8\xad\xa0\xaa\xa8W|\xed\xa9\xf2\
+\x8al>#o\xe7\xb8\xd2\xddP\xafo\x1a\xcc\x1f\xd3\
+N\xf8\xefw^y'[\xed\xcf\xaew\xdei\x16\xc7\
+\x15}\xd1Z\xf3\xed\xa47n\xf5\x0d6il\xeb%\
+JCLh\x11\xb3\xe4|\xfdMD\x10#\x98\xd0\x10\
+D!\xf1\x12R\xbe\xf6\x0d\xef\xfc\x98W\xc6\xaa\xb8\x9e\
+\x1d{l\xcf\xe5\xe9w\xa7\xeb\xbb\x02\x98xn\x22\x5c\
+\xdc\xee\x0f\x8b\xea\x8b\xc6\x9acI_\x9a\xf4\x0d5I\
+\x9a\x09&\xb0\xb0\x81\xd3\xcdD\x04\x8c5\x04q@\x98\
+\x86\xa8\xd3\xd0\x95\xf5\xa8z\x1d\xae\xe3\xf2\xb3\xd1}\xa3\
+Wf\xce\xccx\x80`\xf9L9\xc4~\xf1\xf5\xf3\xc6\
+\xda\xc3I\x7f\x12\xf5\x0f\xf5\x93\xf6$ \x82\xf3\x0e]\
+UC\x8av!_\xfaO\xe8\xa2\x22\xeb2*F\x88\
+\x1b1b\x04E\xa3l>{Bk\xfb\xb3j\x87\xcc\
+\x02\xe7\x00\xb5\x00\x13\xbf\x9a\xd8\xee\xd4\xff\xd8\x88\x9dL\
+z\xe3Vs\xb0\x8fFo\x0f\xf7\xa5\x03\xa4AJ\xe1\
+\x0a\xbc\xfa\x15\xc3\xa1\x09h\xc5-\x06\x92\x01\xfa\xa2>\
+B\x13Rk\x8d\xea\x86\x85\x8e\x0d,6\xb4\xd4E\x1d\
+\xba\xca\x0dz\xef:\x03Gv}47u%\xb3\x93\
+'&\xed\xf5\xeb7\x0f\x89\xca\x0bA\x12\xec\xed\x1b\xec\
+\xc2n\xad%\x0dR@\xc9\xeb|%\x80\xd8\xc6\x8co\
+\x1b\xe7\x99\x07\x9f\xe6;\x0f>\xcd\xe1\xe1'\x18m\x8e\
+\x92\xd79\xb7\x8by\x9c~\xd1\xf6F\x0c\x22\x82\xa2\xd8\
+\xc0\x22V(\x17\xcb\x86z\xed5\xb8\xf7\xbf\xf1\xc2\xb1\
+i\xcb#\x8d!\xab\xfa#\xb1r\xbc\xa7\xbf'il\
+\xeb\xc5\x04\x06U\xa5p\x05y\x9d\xaf\xa4 4\x01\xe3\
+\xdb\xc6\xf9\xe1\xc3?\xe0\xc0\xb6G\x08MD\x1a\xa4\xec\
+\xe9\xdb\xcdhs\x94\xeb\x9dk\xcc\xe57\xf1\xea\xb1b\
+\x89mL`\x82n\xf0\x02\xd6\xda\xe5vm\x08\xdc\xb9\
+1\xb3\xf0A \xbe\xda\xa9\x98#Ad\xfb\xd3V\x8a\
+\x0d\xccJ\x9ek\xbfR\xac\xa8*\xcd\xb0\xc9\xd1\xe1\xc3\
+\xecl\x8e\xf2\xe1\xdcG\xbcy\xf9m\x00\xbe\xb9\xf3I\
+\x1e\xdd~\x90##_\xe7R{\x9a[\xf9\xad\x0d\x19\
+\xc6\x84\x86\xb4\x95\x92/\xe4\xfd\xae\xa8\x8f\x22\xe5\xc9\xc0\
+\xc2WEd8\x8cC\xc2$\x04#l\xc4Y\x8a\x92\
+\x04)c\xfdc\x94\xbe\xe4\x1f\x97\xde\xe2\xbf\xb3\x1f,\
+\x05\x07\xfb\x07\x1ef\xac\x7f\x8c4HP\x14\xaf\x9e\xc2\
+\x15\x00+\xe9\x13#\x84qH\x18\x07\xb8\xc2\x0d[\xa3\
+\x87\x8c\xaa=*V\x9aQO\x84\xb1fC\xe7+\xc5\
+d,\xbdQ/N=\xb3\xd9\x1c\x95\xaf\xa8|\xc5l\
+6\x8bSO3jb\xcd\x17\xd4\xe2\xd5\xaf)^\xb4\
+\xdb\x9eQO\x8cXi\xaar,\x00=(\xc6\xa6a\
+\x12\x22\xe6\x1e\xbd\xae\xa0\xea\xbb$\xa4\xe0|\x8d\xf3\xdd\
+\x82s\xbe\x06\xed\x92\x91\xaav/\xb1\x89)1B\x98\
+\x84\x18cR\x87;\x10\x80\x8e\x88\x10\xda\xd0n\xc8p\
+\xcb\x12,\xb5^ ]\xbd\x91\xde\xe1\x15\xfd\xe1\xc6\x0e\
+B\x13\xa0(\xad\xb8\xc5U3\xb3\x867\xd6\x07`C\
+\x0bB\xa40\x12\x00\xbd\x22b\xc5.q\xfb\x06\xe7\xbc\
+z\xeeO\xb7\xf3\xd4\xee\xe3\xb4\xe2\x16V,?}\xf4\
+'t\xaa\x0e\x00\x8d\xb0\xc1@:\x80\xf3\x8e\xa7v\x1f\
+\xe7Z\xe7\x1a\xb3\xd9\x1cF\xcc\xa6A\x88\x88\x15hn\
+\xac\xb1N\x14%\x0dR\xf6\xb6\xc6\x88l\x845\x96\xc4\
+&\xcct\xae1\xd3\xb9F\x1a$X\xb1D6bo\
+k\x8c4H7E`\xbd\x04\xc0\x82\xaa\xf6\xa9\xd3\xe0\
+^gD\x04+]\xe6.\x5c\xc1\x07\xb3\x1fr\xf2\xe2\
+\xdf\x10\xc0\xfb\xef\xf3\xc4\xf0\xe3\xc46\xc6Jp\xcfT\
+\x02\xa8\xd7\xee\x1b\x02\xda\x06\x98F\xb5r\x95\xdb\x94J\
+W#\xb1,\x1eOVe,V\x19~\xdd\x9c\xd8\xca\
+\xb9\xab\x1c(\xa5\x15\xae\x04\x22\x9c\xf5^G\xab\xbcJ\
+\x13\x9f v\xeb\xa9\x17\xdb\x98\xf1\x81}\x1c\x1b=\x02\
+\xc0\xfe\x81}\xc46\xde\xf2\xdcr\x00UV\xe1\xbd\xcf\
+P9\x1b\xa0L\xa9\xd3#\xe5b9\xe0k\x8f\x096\
+\xe7\x82\xd5\xd3n\xa8g\x88\xef\xed}\x16\x80\xbe\xa8\xb9\
+\xa1\xce\x06\x06\xf0\xceS.\x96\xa8\xd3\xb6\x87S\xc6\x89\
+\x9e\xf6\xaaW\xab\xbc\xa2\xca+V\xf3\xc6\x9a\xc8U\xef\
+\x1a4\xad\xb8\x9fV\xdc\xbf\xa6\xda\x9dn\x9eJ\xf5J\
+\x95WTE\x05^\xaf\x22\x9c\x0e\xc4\xd5\x97$\x88\xa6\
+\x5c\xe5\x1e\xc9\xe6\xb3\xfe(\x8d\x08\xe2`\xc5\xe9\xf2\xad\
+\xb2:\xe7\xe3[\x17\x00\xb0b\xef\xca\xb5 8u|\
+|\xeb\x02Y\x9do\x88\x84\xab<\x8b\xf3\x19\xaer\xf3\
+\x08S\xea\xc2\xe9`\xfc\xe2\xf8\xdc\x85\x87?}\x0d\xc3\
+\xb7\xf2v>\x916S\x92\xb8\xfb\x88\xa8|w\xc6\x1b\
+1\xdc.n\xf3\x97\x0b'H\x83d\xd3*WU\xb2\
+:\xe7vq\xfb.\x0eP\xaf\x14\x0b9E;GU\
+/\xaa\xd7\xd7\xc7\xbf\xb2kN\xa0\xfb \xa9T\x7f\x0e\
+<\x9f6\xd3\xc1\xed#\xdb\x89\x1b\x11\xd5\xbaG\x86W\
+\xbfe\x95\x0br7\x01)\x14\x9d\x82\xf9\x99y\x8a\x85\
+\xe2:\x8e\xdf\x17\xde\xfe\xee\xc2\xcb\xef\xdd\xb4\x003o\
+\xcddCo\x8f\xcc\xe1u\x97w~\xcc\xd5u(\x91\
+\xe9\x16\xe4j\xe3\xd25~\xaf\xdfF\xe8\x94Y\xc9\xc2\
+\x8d\x05\x8av\xb1\xa8\xaao\x88\xb8W\xcf\xfd\xfa?\x97\
+\x00\xccR\xd8:@\xef\x05\x15\xfb\x07\xef\xfc\xbf\x16\xe7\
+\xb3r\xfe\xda<\xc5B\x81\xfa/\xc7h\x1bI\x17\xf6\
+\x82\xf6\x8d6\xd9\x9d\xac\xf4\xde\xbfc\x8cy\xf5>s\
+\xdf',\xf5\xda\xca\xec\xfc\xfc\xed\xcf\xfdC\xcf\xee\xbe\
+Q\x15nV\xbd>P\x97\xee\x81\xba\xa8C\xb1\x82\xb5\
+\x161\x86M\xa8}\xad\xc8R\xc7T\x9e\xfcNF\xfb\
+F\x9b\xa2]t\xbc\xf7\xffD\xf8mO;:5\xf5\
+\x9b\xa9rY}\xcd^0\xfd\xc6t=\xf6\xd8\x9e\xcb\
+.\xd4\xcfT}\x9f\xab\xdc`\xb9X6\x5c\xe5\xe8\xee\
+!\xb2\xe2d=\xd4\xaa\x8a.mHe\xa7d\xe1\xe6\
+\x02\x9d\x9b\x1d\xaa\xac\xba\xae\x9e\xbf\xab\xe8+\xbd\x0b\xc9\
+\xa9{.&\x00\xd3\xefN\xd7#\xfbw\x5c\xf1}\xe6\
+\xbc\xf7\xae\xa3N\x9bU^5\x8aN\x91\x94\x8b\x05\xae\
+r\xf8\xda\xe3\xbd\xc7;\x8f\xab\x1duYSvJ\xb2\
+;\x19\x0bs\x1d\x16\xff\xd7\xa1\xec\x14\xf3\xde\xf9\xb3\xe2\
+\xe4\xcfb\xeaW\x07L\xeb\xfd\xd57_\x05\xd8\xe6`\
+\xee\xff\xe5\xd7\x06BS\x1d0\xa6\xbb\x9cb\xba\xcb\xa9\
+1&E\x88\xd6.\xa7Z\xaa\xd7L\x9d\xb6\xf1z\x15\
+#\xa7T\xf5\xf5\xb2\x0e\xce_x\xf9\xbd[l\xc2\xaf\
+[\x12\xff\xe4\x89I\xfb\xf1\x7f/mG\xca\x9d\xd6p\
+\x08\x95\xa3\xa0\x07\x1d\x8c\x08\xf4\xd1\xb5|\xc7\xc2\x15\x90\
+\xb3\x88N9\xcfi4\xba<~q\xd7\xdcV\xeb\xf9\
+\xff\x01\xd6\x93\x06\x14\x11\xcc\xa8\xd2\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x05\x97\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\x12tEXt_q_\
+icoOrigDepth\x0032\xd5\
+\xe2\xb8\xec\x00\x00\x05+IDATH\x89}V\xcd\
+o\x5cW\x15\xff\x9ds\xef}\xef\xbe\x8cg\xc63v\
+\xc7T\xd8\xaaR\xc9\x0d\x9a\xd8\x91\x1d\xeaV\x8aH\x14\
+\x10\xd9!!\x81\x925\x7f\x02t\xc5.e\xc7\xaa\xec\
+\xban\xd5\x15\x8d\xca\x8a]\x8a \xc4\x0bP@%j\
+l\xc0EE\xa9\x0d\xf2W\xdc:3\x1e\xbf\xf7\xee\xbb\
+\xe7\xb0\x18\x7f\xc7\xe5w\xdf\xdb\x1c\x9dw\xcey\xe7w\
+>.\xe1<\xdc\x86\x99\xef\xceO\x84(3\x0c\xb3\xa0\
+\x8c[\x04L\x03\xd4\x1e*\xe8\x8eB?#\xa1\xfb\x82\
+\xf8(\x94\xfc\xe4\x9f\xff\xfed\x03\xf7\x10\xcf\x9a\xa2\xb3\
+\x82\xee\xdd\xee\x88\x15?O\xd0;0\xe6;\xc6\xf2\x94\
+\xf3\xaef\x12k\xd9\x90\x01\x00\x89\x1acYU!\x0f\
+{1\xc8\xaa\x88,\x12\xf0a\xc5\xf9'\xcb\xbfX\xee\
+\x7f\xad\x83\xd9\x9f\xcf\xb6\xd4\xd8\x1f0\xd3Olf\xdf\
+\xf4u\x9f\xf9\x11\xcf.u`\xc7 \x1e\xaa\xab(\xa4\
+\x12\x84< \xef\xe5\x92\xf7\xf2\xfd*\xaf\xfe,\xa2\xef\
+Q\xac~\xfb\xe9/?\xfd\xf2\xd0\xa69i\x1c\xce\xfe\
+\xd4:\xf3V\xd6\xf0WF\xbf9\x9a\xd6Z5J.\
+8\x18g\xc0\xcc \x22\x10\x11\x98\x19\xc6\x1aX\xef\xe0\
+GRJki\x22Q^A\xd4\xd7\x85\xe0'\xae\xbd\
+\xf4xsq3?r\xd0\xbd\xdb\x1d!\x93\xfc\xd0Z\
+\xf3V6\x9aM6;MNk\xe9A\xc4\x04\x85b\
+\xf8\x0c\xcf\xe1\xbf\x13\x08\xc4\x04\xe3\x0c\x9cw$\x22\xf5\
+X\xc6WEim\xfc{\xed\xcf\xb7\x1el\x95\x06\xb7\
+a^\x1e\x9bz\x83\x88~\xe6\x1b\xfeJ\xb3\xd3\xe4v\
+\xb3\x85\xc4\xa6\x081\x1c\xd8\x22x\x9b\xa2\x91\xd4\x91\xd9\
+\x0c\x0a\x85\xa8\x1c\xe7\x99\x08l\x196\xb1T\x95U=\
+\x16\xd5\xa8D\xfa\xc7\xd676\xfec/u\xe7'T\
+\xf4\x8e\xf3\xee\x8d\xc6D\x83\x93\x0b\x09@\x04\x1cF\x0a\
+`\xaa>\x85\x9b\x937py\xbc\x0b\x00X\xda^\xc6\
+\x1fV\x1f`\xb5\xbf\x06\x00`\xe2!\x9b\x19\xd0\xe84\
+8\xe4\xe1M-\xf4\xce\xa5\xee\xfc\xe7l\x83\xcc2\xf3\
+u_\xf7\x99\xf3\x0e\x0aE\xbf\xec\xa3_\xeeAT\x90\
+\x9a\x047'o\xe0jg\x0e\xeb{\xebX\xdf[\xc7\
+\xd5\xce\x1cnN\xdd@b\x12\x00\x80c\x07\xc7\x0eL\
+\x0c\x979\xf8\x86\xcf\x98\xcdu\xa7z\x99\x8d5\xaf\x1b\
+g&\xfd\x88g6\x07Ur\xe2d\xf6\x02f\xc7/\
+\xe3i\xef\x0b\xdc[\xf9\x08\xf7V~\x83\xa7\xbd/0\
+3>\x83\x0b6\x83\xa8 H@\x90\x00\x85\x82\x0c\xc1\
+\x8fx6\x96'Yy\x81\x15\xb8\xe5\xbc\xab9\xef\xce\
+k\x0bX6h\xa4Ml\x0e\xb6\xb11\xd8\xc4\xc6`\
+\x03\x9b\x83m4\xd3&,[\x00\x80\xa8\x1cqB \
+\xb8\xd4\xc1e\xaeF\xd0[\x96\x80i\x93X\xcb\x96_\
+0N $\x9c\xc0\x10#5\x09\xea\xae\x0e\x00H\xcd\
+P\x96p\x02:'(\xb6\x0c\xeb\xacS\xd0\xb4\x05\xa8\
+\xcd\x86\xcca\x13\x1dBU\x91\x9a\x14s\x9d94\x92\
+\x06\x16&\xbe\x8d\xf1l\x1c\x00p\xb1\xf9\x0a\x1aI\x03\
+s\x9d9l\xef?C\x11\x0b\x10\x1d\x7fOL C\
+\x86\x88\xda/\x86}\x02\x89I03\xd6Ef3\xd4\
+\xd3\x06\xf2\x98\xa3\x889\x1aI\x03\x99\xcd03\xd6=\
+\x22\xfa\xeb`\x01\xdd\xd1(\x1d\x15\xb58\xe3\x8ehX\
+\x82\x0a\xc5\xf6\xfe6\xfe\xb8\xb6\x08\x02p\xb1y\x11\xf5\
+\xa4\x0e&\x06\xbd\x98!\xa8(4jT\xe8\x8e%\xd2\
+\x95X\xc6\xb6Tb\x8d5/*c\xc8E+\x1d\xc5\
+\xa5\xd64\x00\xa0\x95\xb6@\xa0\x13\x9dr\x1aR\x09\xaa\
+P\x05\x02V\xacF\xfa\xb8\xcc\xc3l\xc8\x83\xb7\xde\x9d\
+\xa2L\x0f\xa7\x02\x11\xda\xbe\x8d\x1fO\xff\x08\x00\x90Y\
+\x7f\x94s=\xe3E\xa1\x08y@\x18\x84\xbd(t\xdf\
+\x0a\xe2\xa3X\xf1j\xde\xcb[\xbe\x9e1\x99c\x17\xa2\
+\x82\x9d|\x07_\x15\xbb\xa7\xaa%\x94\xc3\x9a\xdf\xc9w\
+N\x8d\x0c\x00\xd0\xa8\xc8\xfb\xb9\xc4J\xd6 \xf1/6\
+\x94\xfc\x84(.\xe6\xbd|:\xe6U-\x19\xf1\x88\x10\
+\xa8*\x8aX\xe0\xfe\xd3\xdfai{\xe9T\x95\x0c#\
+W\xfcwo\x1dE,N\xc9\xca\xfd\x80\xbc\x97\xef\x8b\
+\xc6\x87\xc1\xd1\x12\xe16\xcc\x95o]\xbd\x06\xe0\xedZ\
+\xabv\xb3\xfdr\x8b\xd9\x9b\xa3\xa9)*\xc7\x13\xf4\x0c\
+\x084\x9cC\x07\xc6\xc3 `w}W\xf6w\xf7\x7f\
+\x1f+\xb9\xbb\xf4\xaf\xbf\xfd\xc9`\x19:\xf6\xdd\xd6\x0e\
+\xd4\xe6Z\xc5\x85*Vu\xe3\x0c\xb1=1\xff\x89\xcf\
+}\x8fyP\x84\xfd\x80\xdevO\x8a\xe7\xf9ZT}\
+G\xbf,\x1el\xbd\xbfU\x18\x00\xd8z\xb0UN\x5c\
+\x1b_\x15\x22\x1f\x8b\xf8jUVu\x9bXb\xc3\x00\
+\x9f\xd7\xab\xc7\x84jT\x94\x83\x80\xdef/\x16\xcf\xf3\
+\xb5*\xc6\xf7)T\x1f,\xfdj\xe99pb\xa3m\
+.n\xe6\x13\xd7^z,Jk\xb1\xacF\x8b\xbd\xa2\
+S\x95\x95\x85*\x1d\xd4\xeap\xe9\xa8BD\x10\x8b\x88\
+\xa2_\xa0\xff\xac/\xbd\xad\xde\xa0\xe8\x17\x0f\xa5\xd2w\
+PU\x1f\x9c\x5c\x99\xe7.}Tn\xce\x18\xbe\xc3d\
+\xae\x1b\xc7\x93.s5\xeb\xac\xa3\xa3\xa5/1\x86\x18\
+\xc2 \xec\xc5J\xd6D\xe3C\x09\xfak\xdd-\x1f/\
+\xbf\xfb\x7f\x96\xfe\x11n\xc3\x5c\xea\xceO\xb8\xa0\x97\xd9\
+\xf0\x02\x11\xbe\xaf\x8a\xd7@46\xcc\x8d<#\xa2\x15\
+U|,Q\x1eE\x98'\x7f\xff\xec\xaf\x9b\xe7][\
+\xfe\x07\x12\x1axEBn\x92\xa4\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x0e\x22\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\x12tEXt_q_\
+icoOrigDepth\x0032\xd5\
+\xe2\xb8\xec\x00\x00\x0d\xb6IDATh\x81\xb5\x9aY\
+s\x5c\xc7u\xc7\x7f\xa7\xbb\xef\x9d;\x1bV\x02 \x08\
+\x90\xa6d-\x96\x22\xd3\xa2([\xae$\xb6\xa5r\x92\
+r\x9e\x92\xc7,_\xc1y\xd3;\x8b\xef\xf9\x04\xa9J\
+>@\xf2\x01lU\x92rX\x8e\xbc\x96\xa8\x85\x15I\
+\x16\xc5H\x14@\x82$H\x10\xc4\x80\xb3\xdc\xdb}N\
+\x1e\xee\x00\x02\xc4E \xa4\x9c\xaa\xa9;\xb8\xe8\xee9\
+\xff\xb3\xf7\xe9\x16\x0eCg\x09\xcb[\xcbYk\xa2\xd5\
+\x0e\xa3\xe6q\xef\xfd\xf3\xe6\xe4{\x98>\x05,\x890\
+\x0f\xd2\x01k\x8cg\x94 =3\xbb\x89\xc8*\xa4\xcb\
+\xa2\xfew\xb1\x8c\x1f$\x1d~\xd6\xd7\xfe\xbd\xd5\x89\xd5\
+\x8as\xc4\xc7eE\x1ew\xc2\xc2\xeb\xa7\xda\xf3\xed\xec\
+\xb8$}F\xcd\x9e\x11\xe1\x98 \x8b\xc0q\x83\x19D\
+&1\xed\x82\xe4\x82\x84z\x96%CF\x22\xf4\x0c\xdb\
+\x12\xb8\x8d\xb1b\xd8\x9a!W\x9d\x93\x8f\xac\x92KR\
+U+\xef\xfd\xe3{\xf7\xfe?\x00\xc8\xc2\xeb\xa7Zs\
+\x8d\xc6\x0cR}Sp\xa7\x81\xef\x8b\xd8i`V\x9c\
+\xe48\x17\x9c\x13'\x22\x0e\xc1\x89\x88\xc8xu3\xc0\
+\xcc\xccP3S\x14UMQ\xd5J\xe0\x96\x98\xbcm\
+\xf0[\xc4.\x88K\x97\xd7Y\xdfX;\xb76\x00\xec\
+\xab\x038\x8b{\x86339\xe9\x051\xf9\x81\xa8\xbc\
+\x8ap\x12a\xday7!N|\xc8\x02Y\x91\x11\x1a\
+\x01\x9fy\x5c\xf08/\xec\x05\xa0\xc9\xd0\x98\x88U$\
+\x96\x918\xa8\x9f\x96,\xa9\xea\x16\xb0a\xd8\xa7&\xf2\
+\x0bT\xdf\x8c\xad\xfc\xe2\x87\xa3\xdf\xdd\xe1\x1czx\x00\
+g\x09\xcf\x0eN\xcf\xe7\x85\xbd&\xe2\xfe\x98d/\x9b\
+\xc8s>\xb8\x8e\xcf\xbd\xe4\xcd\x9c\x90\xd7L\x87<\xe0\
+2\x87\xf7\x1e\xf1\x0e\x11\x10\xf79\x00S\xb0\xa4hR\
+RL\xc4Q$U\xf5\xb3\x1c\x94\xa4*Y\x8a\xba\x8d\
+\xf1\xbe\x09o\x09\xfaf9\x92\xff\xfaC\xf3\xed\x9b\x8f\
+\xf2\x0d\xff\xb0\x7f\x9c<{\xb28\x91N,\xf9L\xbe\
+/\xc8\xdf\x80\xfcH\x9c{\x22\xe4\xbe\x99\xb5rWt\
+\x0b\xdaSm\x8an\x83\xbc\x95\xd7\xd2\x0f\x1e\x19K^\
+\x9c\x8c\xe5#\x88\x08\x88 ^p\xc1\xb1\xa3\xb1\xac\xc8\
+\xc9\x1aaG\x8c\x22\x90\xa1v\x04X\x06\x99\x09\x9e\xcd\
+iwt\xbb\xf3j1\xdc<\xbf\xf9@\x10\x0f\x04p\
+\xf2\xec\xc9\xa2\xad\xd3\xcf\x0a\xee\xaf@\xfeN\x90\xef\xf9\
+\xe0\xe6\xb2f\x96wf;\xd2\x9enQt\x8b\x9ai\
+\xef\x11W3\xb9\xf7\xf3E\xaa1\xec\x19\xe3\x04\xe7\x1c\
+.sd\x8d\xac\x16B\x16D\x93ff\xd6Am\xd1\
+D\xbe\xe1\xd552\x8a\xcd\xf6k\xc5\xdd\x07\x81\xb8\x1f\
+\xc0\xbf\xe2\x8f\xae\x9f\x5c\x0a*\x7f\x8d\xf0\x97\x0ey\xd1\
+\xe7~2o7\x5cs\xa2E1Q\x10\x8a\x0c\xe7\x1d\
+\xce\xb9C\xc4\xb1\xbd\xa8\xc6\xa0\xbc\xd4\xe6\x97\x8d\x85\x81\
+8U-H6mb]1\x10\xcb?\xbb\xfd\xda\x8d\
+m\xce\xef\xf7\x89\xfd\x00\xce\xe2\x9e\xbbvf\xc1y\xbe\
+\xef\x90\xbfw\xc8\x8b\x12\x5c\xb7h\x17\xae9\xd9\xa49\
+Q\xe0\x1b\xe1\xa1R>4\x8e\xf1Z.8|^\x83\
+05I1\xe5\xa2\xcc\x98c\xc2\x8b\xacN\xa5\x85;\
+\xb7\x8f\xde\xe8\xf3\xfe\xe7\xd1i/\x009\xf3\xf2\x99Y\
++\xd2\x9f{\xe4o\x05\xf9\x9e\xcf\xfdd\xd1)\x5cg\
+\xaeC\xb3S\x10\xf2\x0c'\x8f\x96\xbaa\x8f\x0c~\x0f\
+\x03\xbe\xd7\xb4|\xee\xf1\xb9\xc7\x92\x89\xaa6,\xd9\xa4\
+\xc0\xa4\x17\xee\xcd\x1c?q\xf5\xd6\x7f^\x1d\xde\x07`\
+\xe1\xf5S\xed\xbc\xed_r\xf0\x13\x90\x1f\xfa\xe0\xe6\xf2\
+v\xc35'\x9b\x14\xdd\x82f\xa3I+k\x91\xfb\x1c\
+\x80d\xe9\xd1 \x1e\xc4$_\xae9\x91\xb1ox\x87\
+ \xa8\xaah\xd4\x5c\x956\x22\x03_\xa5[\xfe5\xb9\
+\xb9}~\xbb\x02\x08;\x13\xe7\x1a\x8d\x19\xb1\xf8'\x18\
+g\xc4\xcb\x5c(\x82/:\x05\x8dN\x81\xf7\x9e\x86o\
+\xd0\xc9;5s%T\xa9B\xb1\xfb\x94\x91\xbb\x9cn\
+\xde\xa5\x08\x05A\x02`DK\x0c\xe3\x90\xedr\x9bR\
+\xcbG\x02\xd8!\xe7\x1d\x8dN\xa3\x0e\xbbU\xf2\x96\xaa\
+9U;cb\xd7\xe6\x98\xbb\xbc\xc6Z\x7f\x17\xc0\xc2\
+\xeb\xa7\xda\x84\xea\x9b\x92\xdck&<\x172\xd7hM\
+\xb5(&\x1a\xf8\xdc\xedJ\xf5a\x92\x05p8\xdaY\
+\x9bc\x9dEN\xcf\xbf\xc8\xf1\xee2\xdd|\x02\x80\xad\
+r\x8b\x95\xde*\xef\xdc|\x87k\xdb\xd7\xb8W\xf5\xd1\
+G\xe7'DjSjL403z\xb1\xd7\xd0Q\
+z\xde\x99l\x9b\xf8\xff^<{fc\xed\xdc[}\
+\xcfY\xc2\x13~\xe9I\x81\x1f\x8a\xc8_\xf8\xe0\x16\xb2\
+V\xee\xda\xd3-B\x91\x8dcx\xbd\xa8\x9aR\xa6\x92\
+Q\x1a\x91,\xed\x93~'\xeb\xf0\xec\xcc3\xbc\xb2\xf8\
+\x0a\xa7\xe7\xbf\xc3\x13\x93O\xb2\xd49\xc6|\xeb\x08\xb3\
+\xcdY\xa6\x1bS\xb4\xb2\x16\x95V\xf4\xca\xad\xfb4\xe1\
+\xc5\x91\xf9\x80w\x1e\x90]a9_\xfb\x5c\x1cE\xb1\
+\xa4Y\xadRYm\xc5j\xfd\xe6\x8fon\x86\xe5\xad\
+\xe5\xcc\xb5\xediC^A\x98\xf6\xb9\x97\xbc\x95\xe3\xf3\
+\xfd\xd1\xa6L%U\xaav\xb5\xb1\xf7\x99\xbb\x9cc\x9d\
+E^\x9c\x7f\x91W\x8e~\x97V\xd6b\x18\x07\xdc\x1d\
+\xdd\x05\xa0\x19\x0a\x8e\xb6\x17\xe8\xe6]\x00\xb6\xcb\x1e\x9f\
+\xdc\xbd\xc2HG\xb5\xb4\x11\xbcx2W\xfb\x17V\xd6\
+\x02\x1a\xffv\xc8\x03y+'U\xc9U\x03\x9dE\xec\
+\x15q\xd9\xe5\xe5\xad\xe5+\xa15\xd1jk\xe2i\xcc\
+N\xfb\xe0'\xf2fN\xb3\xdb\xc4\x05w\x9f\xc3\xe9\x98\
+\xe1\xdd\xb7V\x83\xe8\xe6]N\xcf\xbf\xc8\x1f\xcd~\x8b\
+V\xd6\xe2\xca\xd6\x15\xde]\xbf\xc8\xc7\x9b\x1f\x03\xf0\xf4\
+\xd4S\x9c\x9a\xfb6''\xbe\xc1\xf33\xcf\xd1+{\
+\xac\x0fn3\x1c\x0c\x11j\x0d\xef5\xce\xbd\xdfE\xea\
+\xec\xdd\xec6Ie\x22\x8dRWSz\xc9\xb0\xdfw\
+\x8a\xce\xaf\x82\xaf\x8a\x13\xe2l\x09\x91Y\xf1\xe2C#\
+\x10r_\x87\xcb/\xda\xe5}oj*B\xc1\xf1\xee\
+2G\x9as\x0c\xe3\x80w\xd7/r\xe1\xc6\x05V{\
+W\x01\xd8\x1am\x01\xb0\xd0\x9a\xe7H\xf3\x08\xc7\xbb\xc7\
+)B\xb1o\x8dd\x892\xd5f\xa5\xb6\xdf?\x9c8\
+|\xc3\x13\x1a\x01\xf1\x12H2\x0b\xb6\xe4R\xe3\x84\xf3\
+></\xc8\xa2s\x92\x87\xac.\xcc\xc4\x1f<\xc3\x1a\
+F&\x81\xa9\xc6\x14\xed\xac\xc5 \x0e\xb9t\xe7\x12+\
+\xbdU\x06i\xc0 \x0dY\xe9]\xe5\xa3;\x1f3\x88\
+\x03:Y\x9b\xa9\xc6$\x99\x84}\xeb\xa8)\x95VT\
+Z\xdd\x1f\xa2\x05\x9cs\xf8\xcc\x11r\x8f8\x1ab,\
+\xfaL\x9es \xdfE8\x8es!+2B\x16\x1e\
+;\xcbz\xf14C\x93 \x81\xa8\x91\xadr\x8b~\x1c\
+`f\x98)\xfd\xd8g\xab\xbcK\xd4Dp\x81Vh\
+\xe1\xe5\xa1u\xe4\x03ID\x08YFhd8\xe7\x02\
+\xc8qp\xdfu\x98>e\xc6\x8cs\xe2vJ\xe2\xc7\
+&\x11\xdc\xd8\xe1\x0d\x1b\x9b\xc0\xe7\x96l(j\x8aa\
+\xb5M\x1f\xb2\x14q\xc1\x11\xf2\x00N\x9ca\xb3b<\
+\x15\x80%D&E\xc4\xf9\xcc\xe3\xbd\x7f\xac\x02mG\
+\xca{\x1dOMIZG\x11AP\xd3}vm\xe3\
+1jzpM\x08\xf8P\xef;D\xc4\x09L\x00K\
+AD\x160m#8\x17\xc6\xf6\x7f\x10\xc6\xf7\x84\xd0\
+Fh\xec:\xbd\x97:\xa1u\xf3\xee\xee;5\xa5\x9d\
+\xb5w\xffv\xe2h\x84\x06\xb9\xcbI\x96j\xcd\x1c@\
+j\xce\x0b>8Dp\x86tEL\x02X\x07$\x13\
+\x11\xd9\xdd\x8c\x1c@\xbdfF\xe62\x8ew\x8f\xf3\xed\
+#/\xd0\xcd:\x00L6&\xf9\xd1\xf2\x0f\xf9\xf6\x91\
+\x17v\x992\x8c\x99b\x86\xa9\xc6$\x00\xdd\xac\xc3\xa9\
+\xd9\x17\x18\xc6\x11+\xbd\x15*\xad\x0eT#\xd9\xceF\
+\xa9N\xae\xb9!\x9d\x80\x91\x09\xe2\x19\xbf\xe7\x80.`\
+\x18\xc1\x05\xbe9\xf5$//\x9ca\xa21\xb1\x07\xc0\
+\x0f\x18\xa5\x92J\xeb\xc4\x97\xb9\x8c\x86\xaf5\x050\xd1\
+\x98\xe0\xcc\xc2\x196F\x9b\xac\xdd[;p}\x84\x00\
+N\xeaof\x1e\x91<|\xc9\x94G\x92\x17\xcfl1\
+\xc3\xb1\xce\x22\xf98\x8b:\x1c\xdeyz\x83\x1ek\xf7\
+\xae\x03\xb0\xd8>J\xab=\x8f\x1bK'w9\xc7\xba\
+\x8b\xcc\x14\xd3\x8f\x1d\x8d\xbe\x00\x87\x80Pa\x80\xe1\xeb\
+\xf6\x07\x07vb\x19\x83\x08\xf2y\xe8\xad4rm\xfb\
+:\xef\xad\xbf\xc7\x87w\xfe\x00\xc0\xb7\xa6\x9f\xe5;s\
+\xa78\xd69F\xee\xeb\xfa*H \xb8\xf0x\x1b\xba\
+\xda\xfb\xc7?.\x11(\x03\xc8\xb6A\x1b\xb3\xcc\x92\x89\
+)\xe0\xe0\xb0\x1b\xaeJK\xae\xdf\xbb\xce\x87w\xfe\xc0\
+\x85\x1bo\x8f\x81\x0a\xf3\xady\xe6ZG\xc8}\xb6\x87\
+\x9f/m\xfb\xeca\xde\xc0\x0cS\x1b\x87>J\x11\xdb\
+vbz]\xc4zf\xa8\xc6\x84\xa5\xfd1\xfcpT\
+\xe7\x82h\x91h\x11}\xc4\xe6\xe7\xe0+\xd6\xbd\xa5\x14\
+\x153T\xc4z\x88\x5c\x0f&\x5c\x05\x1afv$V\
+\x11Mz\xb8d6\xa6\xcc\xe5,\xb4\x17X\xee,q\
+\xed\xde\x1a\x00K\x9d%\x16\xda\xf3\xbb~rX\x04\x1a\
+\xb5n\x86\x99\xa9\xc1\x96`W\x83\x09\x1f;c\x0a\xe5\
+\x89XFRL\x04\x0b\x8f\x95\xcc\xf6\x03\x08\x1cm-\
+\xf0\xec\xcc\xb3ux\x04\xbe5\xf3\x0cG[\x0b\x04\xf7\
+\x95bF\xdd\x10+#\xa8\xa9\xc0-3\xbb\x1c$\xb9\
+\xdf#\xb6\xa0\x9a\xbe\x13\x07\x91\xd8\x8e\xe4\xad\xfc@\x89\
+\xe5A$\x22\x14\xa1\xe0\xf9\xd9\xe789q\x02\x80v\
+\xd6\xa6\x08\xc5W\xead\x98Y\xdd\x92\x1cFT5\x1a\
+\xac\xa8\xc8\xefB,\xe3\x07\xa1\xe1\xce\x98R\xc6*\x92\
+\xca\x84&\xc39\x0e\xad\x05'\x8eN\xd6\xa6\x93\xb5\x1f\
+9\xee\xc0B2v\xf6\xc6\xb5\x09)#1\xd6,\xd9\
+\x07.\xe9\xf03C\xae\x02\xb7,Z\x8ae$\x95\xf1\
+\xbe\x9a\xfc!\xeb\x92,\x11-a\xf6x\x8e\x1f-\x11\
+5\x1e(\x5c\xa8)\xb1\xac\xfb\xa8\xa6\x16Q\xbbm\xc6\
+5\xb5\xe1J\xe8k\xff^\xe1\x8a\x8f\xc0\xbf\xad\xa6s\
+e\xbf\x9c\x1ed\x83\xba\xcb\xdcx\xb43\xab%6\x86\
+\x1b\xac\xf6V\xa1\xbbL8`R\x8a\x96X\xe9\xad\xb0\
+1\xdc\xf8\xd2\x08e\x18Z)\xc3\xad\x01\xe5\xa0D\x93\
+\xf6\x10.\x88\xc9\xa5\xed\xe1v?\xacN\xacV\xd3L\
+_\x22\xc9oEx9\x95i\xaa\xec\x97\x92&\x12Y\
+\x1ep\xaef\xaan\xeb\x7f./A\x88\x1a\xf9\xdf\xcd\
+O\x80_0SL\x13\x5c\xf8\xd2\xd8\xbe3oc\xb8\
+\xc1\xe5\xcdO\x88\x1a\x1fjJ6\x8e\xfb\xb1\x8c\x94\xfd\
+\x92X%\x15\xe1\xb6\xa9\xfc\xd6\xb4\xba\xb4:\xb1Z\x05\
+\xce\x11\xe5uY\xb1\xa6]0\xf84%\x9d\xafF\xb1\
+]\xf6K\x97g9Y\xd3#\x02Q\x81=\xd2\x12\x11\
+\xa2%>\xeb}\xc6\xb5{\xd7pu9u \xaa\x13\
+jmBq\xcf\xe6\xfdA\x03w\x98\xafF\x95j\xd4\
+m\xcc>\x05.\xdc\xca\xf3\xcf8G\xf4\x007~u\
+\xa3:\xfa\xda|2\xfc\xa4\x183\xa8\x1d\xd1\xa4\x99\xf7\
+\x9e<\xcf\x10\xef\xea\xae\x90\xed\xd7\x80a\xf5^V+\
+J-\x19\x1d\xf0Sj]\xe8\xa9i\xdd\xe0}\x00t\
+3#U\x89\xe1\xd6\x90\xfef\x9f4LC3.\x1a\
+\xf6\x86\x0bz\xfe\xf2\xb9wn\xc3\x9e\xce\xdc:\xeb\x1b\
+\xb3\xba\xf0\xa6\x89;\xa6f\x8bq\x14\x97\xfa[}/\
+^hM6\xc1?\xa0e~\x80V\xe1aI\x932\
+\xda\x1e1\xea\x8dH\xa3\x980\xbd\x81\xf0VRy\xf3\
+6\xeb\x1b;\xe3v\xbdn\xfb\xfcv\x9c\xf9\xc9\x89\x9e\
+\x8f1\x07\x991\xb5EU-TU$s\xf5i\xcb\
+\xd7\xdc\x95~\x10\x99\x19\x9a\x94rP\xd2\xdf\xe83\x1a\
+\x8c,E\xdb\x14\xf8\x0d\xca\x1b\x16F\xbf\xfe\xe4\xdc'\
+\xbd\xfb\x00\x00\xdc\xfa\xd3\xab\xa3\xd9\xb8\xb4\x8e\xb7;\x02\
+\xdf0\xb5\xe9T\xa5\x5c\xa3\x8a\xc1\xf8\xf8h\xe78\xe5\
+\xeb\x05bVw\xb5S\x95\x18\xf6F\x0c\xee\xf4\x19m\
+\x0fU+\xed\x99\xd8E\x13\xfb\x97\xb2\x94_~\x98]\
+\xbc\xc5\xf9\x07\xb7\xd7\xe1<v\xeb\x1f\xd6\x06\xb3\xebG\
+\xefys\x0d\xcc\xba\x183\xe3\x16\xb7` A\xeav\
+\xdf\xd7\x08bo\xb4\x19n\x0d\x19\xf6\x86\x94\xfd\x91\xa5\
+\xa8[\x86\xbd\x83\xf131\xfd\xf7\xf7\xf3w\xd78\xc7\
+\xbe\xb8{\x7f\xe0\xfe7\xac\xf3j1\xcc]\xf3\x8e\x98\
+\x00t-\xd9\xa4&\xcdS\x95\xdcN\xaft\xf7\x89\x1c\
+:cc\xe3\xcd}\xa5T\xc3\x8a\xd1\xf6\x88\xfef\x9f\
+8(S\x8a\xb6ij\xefb\xf233\xf9y/l\
+^\xd9<\xb7y\xdf\xd6\xed\x81\x99g\xf3\xfcfl\xfd\
+\xa8q\xd7I\xe3JPVMd\xc2\xd4:\x165\xaf\
+F\x95\x8f\xa3()\xa6\xf1\x11\xd3\x1e\xee\xf7\xa4\x80/\
+jg_\xa6605RJT\xc3H\x7f\xb3O\x7f\
+\xb3\xcf\xa07\xd04LCS\xbdf\xf0\x1bu\xfcs\
+\xf4\xf6\x1f}\x7f\xe7\xca\xa7\xe7>\x1d\xf2\x00zh\xea\
+\xdc<\xbf\x19o\xbdz}{j\xb4\xb8\xe1\x83\xf5\x11\
+\x19\x98\xe24\xd9\x94%\xcdSL\x92\xcaD*\xeb\xe3\
+RK\xb5\x19\xecj\xe4\x0bZ154\x8e\xeb\x99a\
+d\xd8\x1fQ\xf6F\x8c\xb6\x87\x8c\xb6GT\xa3\xa8\xa9\
+\xd2m3.\x9ap^\x947\x92\xba_~x\xea\xed\
+\xb5\xcd\x9fnV\x0f\xe3\xf3\xd1\xb9\xff<z\xfb\xcf\xae\
+\xdf\x9b)N\x5c\xf5U\xbae\xd8\xd0Afum.\
+\xa9LY5\xac\xdc\x0e\x08\x8d\xf59\xf0\xceY\xb0V\
+c\x86\xc7\x87\xdb\xd5\xb0\xa2\xec\x97\x8c\xb6G\x0c\xb7F\
+\x8czC\xaaA\x15S\x99\xee\x8a\xd953\xfb\x1f\xc3\
+\xdeH&?\xb70\xfa\xf5\x07\xfe\xbd\xdb\xfc\xf4\xab\x1c\
+t\xef\x19\xb7xv\xb19\xc7\xdc\x8c\x89\x7fR\x92\xbc\
+\x84\xd9+\x18/\xe1dV\x1c\x0d\xe7\x5c`|\xd5@\
+\x84\xfb[\xdb\xfb\xae\x1a\x98\xaajTe$j\xb7q\
+\x5c\xc0\xdco\x10\xbb\xc0(~\xb2\xde\xfc:\xaf\x1a|\
+\x81\x16\xcf\x9ei\x1d)\xcb\x13\xe2\xb2\xa7\x0d{Z<\
+\xc7P\x8e!,\x1b\x1c\x11c\xc2\x90.B\x8e\xd9N\
+\xa2L #\xc1z&l\x09\xdc\xc2X\xc5q\xcd\x12\
+\xd7\x9c\xc8GF\xbc\xb4~3[Y\xfb\xa7\xb7\xfa\x8f\
+\xc3\xcf\xe1\xe2\xc7\xf8\xbaM\xa7\xe8\xb4\x9c\x14\xc7\xbd\xf7\
+\xcf#\xe9eA\x9eBe\x19\xb1\x05C:\xd8\xceu\
+\x1b)E\xac\x87\xc9\x0d\x1c\xabfz\x19\xfc\xefSJ\
+\xef\xab\x0dW\xb6\x87\xdb\xfd\xc3^\xb7\xf9?\xd6\x00j\
+8Y\x19\x9b\xfc\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x03,\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\x12tEXt_q_\
+icoOrigDepth\x0032\xd5\
+\xe2\xb8\xec\x00\x00\x02\xc0IDAT8\x8d]\x93A\
+h\x5cU\x14\x86\xbfs\xef}o\xde\xe4\xcd\xa4\xbeL\
+Jm \xc6\x16c#\x94\xb8\x18\xa9hW\x0a\xd9\x08\
+B5 \xd9\x147\x12(\xe2\xb2\x8b\x82\xcbB\xc0\x9d\
+;\x11\x17v\x15\x0a\xee\xba3\xa2\x1bW\x92\x91Z\x8c\
+\xc4\x08\xed\xa6e\x8c\xc98\x99Nf\xf2\xde\x9bw\xef\
+u13v\xd2\x1f.\x5c~\xee9\xdf9?\x5ca\
+B\xf5\xf5z\x90\x9fso\x08\xac\xa1\xd5\x8a \x17\x00\
+<\xfe\x11\xd6m\xe1d38\x90F\xe3\xeb\xc6`\x5c\
+#\xe3\xcb\xd2\xad+\xb5\xd0\x14\x9f\x9b(\xf88N\xa6\
+\x92\xa8\x1aaJ\x1a\x80\x22\xb3\xa4\xdd\x94^\xbb\xdf.\
+\xd2\xc1\x9d\xbc0\xb7w7~i\xfd\xdf`\xe9\xd6\x95\
+Z\xc9\xd8o\xa6f\xca\xef\x9f\x99{A\x9bPO\xf6\
+f8\x05\xd8\xac\xa0\xf3w\xc7\xf6\xdb\xfd{Y\xde\xfb\
+dwc\xb7\xa5\xeb\xeb\xf5@\xce\xb8\xdbq-\xbe~\
+\xfe\xe5\xf3:\x0cKXo\x01(\x9b\x88@\x19\x0aW\
+ \x802\x8a\xa8\x1a)\x9b\xdbE\x9b\x11\xfd\xb34\xf7\
+\xa3\x9e}\xef\xc57\x83(\xfc\xa2\xb603\x15\x86%\
+\x00\xac\xb7\xbc=\xf7\x16\x9f\xbe~\x83w\xe7\xdf\xa1\x9b\
+\x1f\xf3\xf8\xf81Z4ZiL\xd9\xa8\xb4\x9b^:\
+\x1b\xda\x9f\x8c\xc0Z\x9cL%&\xd4d6\x1b\x91\xcb\
+\xac\xber\x8d\xbb{\xdf\x01\xc2G\xaf\xaer\xff\xe0>\
+\xb9\x1df\xa7K\x9a8)'\x9d\x93\xc1\x9aB\xab\x95\
+\xa8\x1a\x9d\xdaY\x8b&\x0e+\xec\xb4\xfe`\xa7\xb5C\
+%\xac\xa0Ec\xbd\xc5z\x8b D\xd52\xa2e\xc5\
+\x08rA\x8f\xd2\x06\xf0\xde\xb30\xfd\x12\xd3A\x95\xd5\
+\xc5\x0f\x00\x98\x0e\xab,L/\xf0\xfb\xe1\x0e\x22C\x90\
+\x0e5\x88\x5cT<'\x8fgy\xf62q\x18S\x09\
+*T\x83\x0aq\x10\xb3<{\x19\x8f\x7f\xfe9Jp\
+\x8flfO\xbb#\xca\xd3\xfc)\x9d\xbc{\xca\x1b\xcb\
+f\x16\xf1\xfe\xa1q\xd6o\xa5\xdd\xf4\xb5\xb0Rz\x96\
+\x82\x07%\x8a\x0f\x17\xaf\x8d(\x8aI\xb8\xc7\x93vS\
+\x9c\xf3\xdf\x1b\x9cl\xf6\xda\xfd\xeb\xd5Z5\xd1%\x8d\
+\xf7\xc2\xf6~cD}\xd6p{\xbf\x81\x8c\x0c\x9bY\
+zG\xfd6\x8e\xbb&8\x90F~np\xa7\xd3\xec\
+|\x96\xcc'Z\x94\xb0\xd7\xfe\x8b?\xdb{\xa7\xb7B\
+\x10\x11\x9cut\x9a\x1dkO\x06\xdf>8\x90\x86n\
+6\x9an\xe6\xea\xfc\xb6\xcb\xb2\xa5\x22/\x16\xc3r\xa8\
+\x94\xd1(\x19\x16\x8c\x0f2$\x1f=9\xb2\xfd\x7f\xfb\
+\xf72kn\x1e~\xb9}\xac\x01\x0e\x7f~r\x92\x5c\
+\x9d\xff\xc1fY\x94v\xd3K\xbe\xb0\xe5q\x91s\x8e\
+\xc1\xc9\x80\xe3\xc3\x1eG\xcdN;\xeff_eE\xef\
+\xe6\xee\xc6o\xad\xc9-\x87Z\xaf\x07\xcbg}\x1da\
+MiY\xf1\x22\x17\x87\x19\xb8\x87\xde\xb2\x85\xc8\xe6\x83\
+}~e\xe2;\xff\x07\x12M'1\xc4\xa3S\xa4\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\xa3\xd5\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\x12tEXt_q_\
+icoOrigDepth\x0032\xd5\
+\xe2\xb8\xec\x00\x00 \x00IDATx\x9c\xec\xbdy\
+\xd4-\xcbU\x1f\xf6\xfbUu\x9f\xe1\xfb\xee\xf0\xee\x9b\
+\xa4\xa7'\x09I $\xc4\xb0`a\xb0q\x14c#\
+\x1bV\x14\xac\x80\x85mH\x1c\x0f \x1b\xc8\x0a8@\
+LV\x12\xc8\x92e\x1b/\x07\x1b\x96\xc1^\xc8vH\
+\x02\xcba\x05\x10`\x08\x931`\x06\x13\xc06\x0a\xf3\
+\x8c$4<\x0do\xbe\xc37\x9c\xd3];\x7fT\xed\
+\xaa]\xd5\xfdM\xf7\xdd\xfb\xde\xd3wo\xdd\xdb_\xf7\
+\xe9sz\xaa\xae\xbd\xf7o\x8fE\x9c\xb3\xf6Io\xfe\
+\xa4\x13\x7fC\x0a\xc8\xf2Y\x04\x10a\xda&D\x00\x08\
+ \xf5Q\xe9X\x02$H\x82\xae\xac\x9d\xf7\xf0\x8b\x1e\
+/\xfc\x98\x97\xe3\xed\xdf\xf9c\xdd\xee}\x97\x97\xbe\xf3\
++:\xb7\x06\xb9&\xb9\x03b\x0d`'.\xdc\x05\xb1\
+\x03`7-;\x00\xd6iY\x01X\x09\xb0\x04d\x09\
+`a\x96\xde.\x04:\x94\xc57\x8bk\x166\x8bm\
+\xd2,\xa1Y\xc6f\x19\x00\x0c\x12\xd7\xdbf\xd9\xa4\xe5\
+\x10\x94C\x02\x87\x00\x0e\xd2\xb2\x9f\x96=\x00{\x10\xdc\
+\x00p\x03\xe0\x1e$\xef\xdb\x17\x91=\x88\xecK\x90\xfd\
+0\x0c\x07\x07\x8f_=|\xf5\x17|\xe6\xf0\xd8o\xbc\
+\x03\xe3f\x0b\x19GH\x10\x88\x08\xa0kIk}\x1a\
+\x88\xbe5P\xd2C\xa7\xb5\x93\xb8\x9d\x1f\x9e@h{\
+d\xa6\xfd\xd2\xd7\xfd\xd2\xc9?\xfa0j\xee\xb9\xbe\x81\
+\xe7k\x93\xc9\x062\xd9d\xe2w.\x12~\xd7\xa1_\
+-\xf1\x82W\xbe\x0c\xff\xee\x9f}\xb7[\xdfs\xa1\xa3\
+w\x1d\xc8\x0eD\x5c\x22A\xce\x11\xe9\x1c\xa1\xce\x11\xeb\
+\xdc\x82#\xb6\xe7\xbe\xbb\x99v\x9as\x9f\xb4\xcc=\x9b\
+]\xda\xbe\xe8\x00x\x12\xa9\xff\xd8\xd1\xbbnqy\xb7\
+{\xfb[\xbf\xdb=\xf0\xd1/\xc3b\xbd\x82\xefz8\
+\xef\xe1\x9c\xcb\x8c\xb8~\xd2\xf8\xe2\x223\xafY\xf9\xdd\
+VZ\xf7\x5c\xdf\xc0\xf3\xb1\x89\x08$\xd4\xe2\x81\x04\xe8\
+\x22\xb1w\xcb\x05\xfa\xe5\x02\x8b\xf5\x0a\x97_\xf0\x00\xbe\
+\xef\x0d\xdf\x8a\xcb\x9f\xbdp\xf7\xfd\xf6\xc3\xfe\xbeW\xbc\
+\xb8\xf3]\xb7p\xce-\xe9\xb8\x04\xb8 \xb0\x00+)\
+n%y\x87\xb3Iq\xcb t\x0dL\x09\x9d\xa7\xd8\
+n\x1bQX^\xbb=w\xee9B\xb7\xdb\x1eSB\
+o\x9f\xb7\x03\xa8}\xb1\x000\x82\x18 \x11i\x90\x08\
+pN\xdc\xb2\xc7=/\x7f\x98\xbf\xf5\x83\xffvx\xe2\
+=\x8f\x8cO\xfe\xe0a\xf8\x9c\xff\xe7Mx\xfa\x03\x8f\
+b\xb3\xbf\x8f\xe1p\x83\xe1p\x83q\x18\x22:\x90\x09\
+\x84\x8bL\xe2n\xab\xda]\x06PZ\x1e\x1d\xce9\xc0\
+\xc5\xd1\x22\x00!\x80\x88P\xc6\x11\xdba\xe0fo\x8f\
+A\x04\x12\x02?\xf0{\xef\xe0k\xfe\xdd\xc7\xf1\xe1\xd7\
+|\xb4'\xe9\xe9\x5cO\xb2\x07\xb9\x04\xb1D\x81\xf4\x19\
+\xda\x03X\x82\xb2\x04x\x14\xb4O\x84!\xa7\x85\xf4'\
+\xc1{\x1c\xb3\xff\xa8~h\xc5\xe6\x9cd\x0f\xa8\x09^\
+\x09=\x94{f\x07\x88\xaa\x0d=\x8a\xfa\xb0P\x22O\
+K@\xa5\x82\x10\xa0$}\x0b\xce\xd1y\xba\xbe_u\
+~\xfb\xd0k^9~\xccW\x7f\xdc\x08@H\x0a\x9d\
+\x13\x92pq-\xd0m\xa4W(\x02J\x5c\x9bv\x17\
+\x16\xe0\x99\xc1\xc3\xdb\xd2^\xf6\xe6?y\xec\xf7\x03;\
+\xbcw\xf1\xf1\x90_\xffF|\xcf\x15\xe0\xf3\xbeY\x80\
+\xaf\xfb\x22\xbcxx7\xd6a\x1f=\x06x\x8c B\
+\xf5p\x22\xc0\x18\x88\x07.\x1fb\x7f\xe3\xe2(\x8b\xfa\
+>\xe3\x9aL\xb6\x80\xa8*\x0a3Q\x09\xe0 \x89\xc8\
+D\x9c\xe4\xb50\xee\x17#\xe1\xd8\x93X$\xe2^\x92\
+X\x01T\xc2/\xcc\x80X\x03T\x9d\xdf\xea\xfe\xcb\xb4\
+,\x00Y\xc8<b\xc8L\x82S\xd5\xa2\x95\xbc\xa7\xd1\
+\xffs75\xcb\x9c\x1d\xc0\xda\x03\x061\xf6\x00D\xfd\
+_\xd7\x1b\x00[\x02\x1bP\xa2=\xa0,\xd1\x16 j\
+\x0f\xe0>\x80\x83\xf4Y\xed\x04\x07\x22\xa2v\x83C\x81\
+l \xd8\x08d[\xae\xcf@\x22\x00\x14\x92\x01\x91!\
+\xc45\x10\x80\xb4-\x08\x84\x08\x04\xf1\xa5\x09\xe0\x05\xe2\
+\x02\xe0\x84\xe2\x04p\x81x\xf0\xea\x0a\xbf\xf6\x92kX\
+\x0c.\xdb\x0a\xd4\x8a\x10H\x0ct\xd8\xb2\xc7\x81[\xe3\
+\x91\xee\xa5\x08\x9f\xfd\xad\xf8\xe1\xb7\x12\xff\xd9\xfb\x00~\
+\xdaW\xe0\xc5\x9b_C'\xc3\x11]\x1b\xdb\xbb\xde\xfc\
+S\xc7~\xffl\xb7s\x87\x00t\xe4V\x82,\xf1z\
+\xe7\x04\x8f]]\x22\x8c\xc4v\xeb\xf0\xe4S+\xbc\xf1\
+\x0d\xbf+\xbf\xfe[\xf7s\xb3\xf1\x18G\x17\xedC\xd2\
+\xe8\xa6b\xb6IO\x11/\xa4#\xe0Ax\x08-\xbc\
+\x8dP6B\xfe\xa5YVf\xbd\x82`\x05\xc8\x0a\xcc\
+\xa8\xa0\x22\xfe\x93\x08?-^\x00\xcf\xe3\xd5\x84\xe3l\
+\x07m\xd7\xcdA}\x95\xf0\xfa\x9b\xdc\xcd\x12\x9f\xb9m\
+\xd6\xbc\xca\x84\xa0\xc8\xa9ZP\xf7Wy\xf6\x03Df\
+x\x00\x16\xa6A\xe1F\x88\x0dAe2#\x88!\x11\
+\xfa\x08 \x90l\x0c\x952\x02\x1c\x00\x04\x08F'\x0c\
+N\x10\xfa\x01r\xe9\xc0\xe1G\xbe\xf9\xd5r\xe1\x9b\xdf\
+\x8e\xfb\xaf{,\xb7\xc4\xa3\x97\xb6\xe8F\xc6\xbb\x8e\xc0\
+\x0f\x92\xba%\x10\x90s\xa8B\x9c;\x06\x10\x9bU_\
+\xeb\xbd\x80\xc09\xa0\xef\x03\xee\xbdr\x80\x1f\xfa\xd7\xaf\
+\xc0W~\xd9/\xcb\xdb\xfe\xd5GQD8\x8el\x07\
+\xa7\xd5O#\x01\x92\x1d!\x1d\x84\x1d\x80^(]\xf3\
+\xfb\xa8\xf7\xd7\x8b\x91\xec\x861\x08Vf_K\xf83\
+D/\x13;\x81Lu\xed\xd6F\xd0J\xfd\xa3T\x84\
+V\xe7\xb7P\xbf5\x18\x9fd\xf0\x8b}\x18\x0d\xa0\x9d\
+DT\xd03\x22\x83\x05\x22aG\x86(r\x08P\x89\
+}\x03\xe0P\x80C\x80\x1b \xa1\x07bC`+\x11\
+U$o\x03#\xf2 \x86\xbc]P\xc8\x06\xc0\x16\x92\
+\x7f\x0b\x00\xe2\x03\xb0\xbb\xf1\xf2\xa3\xdf\xf4\x8b\xf2\xc0\xcb\
+\x0e\xf0\xe0\xd5\x0e\xfd\x08\xf8\x904\x8e\xd4\xc4\xb2\xb1\x99\
+\xce:/\xed\x9c2\x80\xd35R\xe0\xbb\x80\xaf|\xd5\
+\x0d\xbc\xf6\xeb?\x01(\x83\xb8CM\xa8\x0d4OK\
+\x94\xf2=\x85J\xb0i-\x8bd\xd8j\xf6W\xeb\xbc\
+H\xfd\xdd\x1c\xc1\x1fe\x1c<\xc9H\xd82\x01\xcc\xac\
+\xb5\xcd!\x00K\xfc3\xfe\x90|~\x8f\x22y\x95y\
+F)-\xe8aT\x84\xe46\xdc\xd0\xa8\x09(nC\
+\xfb9\xadY}\xa6n\x13s\xfb\x8b\xfb1\xab\x1ar\
+\x88\xe4\xf4e4\xe7J7B\xf0\x1f^,\xfd\x98\xdc\
+\x81\xb8s\xdb\x1d\xc9\x00\x92\xcb\x18c \xae__\xe0\
+\xcf\x7f\xfbG\xf2=\xef\xbb\xe0$By%\xfe\x15\x80\
+\xb5 \xfb\xee\xad\xae\xbe\x8cz\xbdD\xa6\xc0\x969\xb0\
+O\x03\x7fN\x8aW\xfbe\xfa}\xba\x87Y\x03`\x5c\
+\xcb\xb1\x1e\x81\xb3B\x7f\x9c\xb0_\x89_\x19\x84E\x05\
+\xd6N\xe0\xc1\x89\x9d\xa0\xb2\x17\xa0\x89\x1f`m;\xb0\
+\xf6\x83z\xcd\xca\xae0C\xe8\xb4q\x066\xd6\xa0\x8b\
+\xf7*\x00(\x02\x84\x00\x09\x07\xbd\x84o\xffo_\x83\
+/\xfdK\x8f`1\x12N\x087\x0f\x1a\xcf};\xa7\
+\x0c`\xfeM\xaa\xe1/\x04\xe2\xe0\xb0\xc3;\x7f\xf5\x05\
+x\xfd\x1b\x7f\x8b\xef}d\xd7\x0f\x83\xf3\x22\x95\xe4_\
+\x03\xd8\x85\xe0\x02b\xa0\x8e\xae\x95\x19\xec\xa06\xecY\
+&\xd0\x83\x99\xa8\x8b\x91N&\x06;5\xe2Y\x18\x9f\
+\xd6\xf4\xc9\xb88u\xafq\x96\xd0\xe7$\xfd\x94\xf0k\
+\x03\xc9\xb4\x8b8Q\x15\xacQ\x10(\x0c\xa1\xb1\xdaO\
+\x18\x82~\x1e\x9b}#+=\xdd\xe8\xed,\x8c\x82\xc0\
+(\x85AXF\xa1j\xc2A\xda\xdeo\x96=\x007\
+\x04\xb8\xceJ\x1d\x12\x08 \xc1\x11\x07}\xc0\xb7\xfd\xf1\
+'\xf1\xc5?}%|\xc3\xe7~H^\xf4\xc8\x12\xbb\
+\x87D/\x88\x8f\xdf\x04\x09\x01\xaa\x12\x9c?\x0eq\xee\
+\x18@-\xf2$\xef\xd4h\xbf\x87\xef\xdf\xc3\xd3{=\
+/]\xd8\xf0\x81?\xf9N\xf7\xa1\xc7\xd6N\x84^\x84\
+\xbd\x08z\x11\xacDr\x84\xde\xc5\xb4\x5c2\xdb6r\
+o\x17\xf3\x16|K\xfc\x05\xa6s\xd6?\xee\x008\xce\
+Jq\x1e'\xcd\x0bq\xcb,\xe1\x03\x98\x10\xf3Ix\
+\xf7$\xdb@\xcd\x088\xd9?\xb7\x84\x99\xed0\xb3m\
+Q\xc3\x5c\xf4\xa1E\x01J\xf8\x07\x00\xf6\xa8Q\x85\xc0\
+\x0d\x00\xd7Q\xde\x81\xf6s\xf4\xd7\x00\x12 \x1c<x\
+}%\xee\xe7?r\x7f|\xed\xaf\x5c\x0c. \xf8\xe0\
+\xe4U\x8f\x5c\x90\x9f~\xcd\x13\xe8\x87\xec@\x04\x0cG\
+\x0c'\xf7\xdf\x87];w\x0c \x80\x10q\xd4PP\
+\x07\x01\xd5]L\xe1\x07\x9e\x5c;B\x88\x88\xfat\x80\
+t\x22Y'\x8f\x92\x1fr\x01\xe0%D\xe2\xbf\x8c\xc2\
+\x04.\xa0\xa0\x01]\x8cj\x90uyK\xfc\xad\x84.\
+\xdbl\x097\x9b\x9aml\xdb\xf1\xeby\xd2>n\xa8\
+\x1e\x8d\x00\xe6\x7f\xa3L\x80G\xfcV\x8eZ\x8b\xbe\x88\
+)\x13I\xa1zG\xa2\x08!\x10\xa40\x839\x06\x90\
+%~Z\x94\x09/`\xfa>\xdd8\x11\xbd}^\x88\
+n\x14l\xe9Btc\x12A\x18\xc2\xcf\xbf\xf2)\xe9\
+\x07\x86@Hp\x22\x81\x90@\x01\xc4\x81BPZ\x5c\
+\xf0\xe1\xdf\x9eu~\xf6\xc9\xff\xd3'\x1f\xfb\xfd\x96\x1d\
+6\xaeG #\x1e\x15\x81C\xc0\x22\x0cx\xd9\xc1\xfb\
+\xf1\x03\xaf\xfdM|\xf1\xcf]\xc0\xfb\xfb{! .\
+\xca5\xfc_\xff~\x83\xcb\x7f\xea\x8d\xb8\x7f|\x94\x0b\
+\xd9\xc0I !\xba8\x00\xba\xf6@\x22|F\x1d\x9b\
+\xc6\x15%\xc2\x02\xfd\x81\x8b\x22\xb3\x0c \xa1\x00iU\
+\x02\xcb\x00T\xfa[\xc8\x8e\x18OXIh+`\xca\
+\x8e\xe3e\xf5\xe4\x08\xfbU\xfa{[\xdekq\xa8\x1e\
+A\x07r\xec\x972\x1b\x91+5#\x89\xd7\x88>{\
+\x14w\xa32\x00\xb5\xee\xab\xce\xbf\x87\x8c\x00x\x1dQ\
+\xfa_\x07p\x0d\xc0U\x02O\x03x\x1a\x82\xab\x88*\
+\xc1u@\xf6Q\xd4\x88-\xa2\xaa1\x82\x18\x052J\
+\xb2c\x08\x11\xe2\x8d0D\xfb\x81\x93\x00'[.\xf1\
+\xb8\xbf_\x9e\xfa\xa7\xdf\x8b\xff\xf2\xaf\x10\xd7\xdce\x10\
+\x82\x877O\xe3\xad\x7f\xec\xddx\xc3/\xbc\x16\xefZ\
+=\x84\x8d\xeb\x10\xe0 \xcayD\xb0\x08[\xf4'\xc4\
+\x09<\xdb\xb9\x06\xcf;\x06  Ft\x08tI!\
+\x8d]\xef1\xa0\xc3\x80\x0e\x1b\x08\x83zu@\x04t\
+\x18pe|\x1c\xdf\x7f\xf1\xbf\xc6Gn~\xd5-d\
+\xe3\x1c\x82\xa3\x88'\x94\xd0\xc5\xba\xf6:\xd6\x069\xd5\
+\xfbU\xa7\xdf\x95\xa8\xfb+\xd1_\x02\x98\x88_\xac\xe4\
+O\x89=\x95\x1f_\xe1\x7fK\xfc\xf1\x01M\x8fW\xa1\
+\xa9L\xbfi\xe4nE\xed\xd5\xdb\x22\x8euK\xcf|\
+w\xda\x97=K\xc1\xc7\xc8>\x91\xe6\x07\xd5\xa6\xd4\xc7\
+\x8a\xa1y]\xc9\xf4Xs\x9c2\x00\xab\x06\xa8\x95?\
+\xa3\x00f\x14\x90\x19\xc1U\x00\xd7\x08\x5c\x85\xe0\x1a \
+\xd7\xe2\xf7Yu\x88L\x80\xd1\xb5\x08\xc8 ,\xf6\x06\
+\x89L`\x008\x0a\x18F\xf8\xb0e\x1f\xde\xb1xu\
+\xf8\x9cko\xc3\x13\xee^\x0c\x8cD\x0e0!\x04\x87\
+\x01=\x06t\x18\xe1\xcd\x18F\x1e\xc3<\xae#\xf1\xec\
+3\x80\xe7\xa5\x0a\x10\x89^C0$wZd\x0e>\
+\xca\xf3l\xcd\x8a\x9d\xfc\x94\xbb\x17_\xf3\xd8?\xc5\xb7\
+]\xfe\xd3\xe8e \x10<\x88.Y\xe3'\xee\xb7\xe4\
+o_\xb2v\xf5\xa9\xfe\xbf\x83\x02\xf5\xd3b\x08_\x8a\
+g@\x0c\xf1\xc7\x08\xc0,\xfd\xcd\xf3\x14\xc2\xceD\xcf\
+\x99\xfds\xfb\xd2o\xe7>\xcf2\x01\xfb\xdd\xec\xfeS\
+\xb6\x09M\xce\x0b\xff\x8a\xf8g\x08\xdaf\xe7\xe96\x85\
+\x85\xc0\xeduD\x8c\xc5\xa1\xda\xd0\x80\xac\xb9\x00'\x87\
+\xe8\xcdSdg\x19\xfbRb\x9c\xc5\x0e\xe3\xbbS[\
+\xc1\x01\xa8\x11\x868\x04d\x83\x18t4\xe7\x92\xdcJ\
+d\x08r\xc8\x05\xfe\xcec\xdf\x8a\x1f_\xbf\x1c[.\
+\xa2\x847\x80\x8e\xf9s\x91\xfa\xc5u\xf2\xfc\xd4\x1e\x9e\
+\x97\x0c@[\xab\xf0\x0a`\x024\xd2\x00a\xb2\xec\x93\
+x\x7f\x87dh\xaf|\xf9u\x04^\xb3\x88\x1a\xf0$\
+\xc3x\x85\xf4V\xc2\xef@\xf2\xfe\x95T\xe7\xc8\xe9\xba\
+\xbd\xa4\x88\xc1\xd3\x12y\xfeLfOu\xcej\xd3\xef\
+\xcdq\xb3\xdb\xb9;\x8c\xde\xd0*\x15\x13\xe2?\x8d\x09\
+\x00\x98@v+\xcc\x8f\x22rC\xd8\xba\xad\x899\xf6\
+3\x85%a\xa7\xb1\x10\x08\x05\x14\xc4\xc8;\x89$\x95\
+\x18MW~U=\x9d2\x82\x0e\xc5\x96\xb3B1\xd4\
+^\x14\x16uA\x0ar(a\xc7\xb5\x1b\xf1\x00\xc0!\
+\xc1\x03)\x9d\x15\x028\xbe\xb7C\x92\xeci,\xa6G\
+`RYK\xb7D\xd2\x7f\xd6!\xf6\x19\xdb\xf3\x94\x01\
+\xb0\xe2\xa4\x85\x8bFm,~\x11G\x8d\xda\x08:\x19\
+\xf1\xbf>\x0a\xfc\xc4\xce\xd6%\xb8\xdf#AzZB\
+\x9e[\x8a\xd4\x9f\x8b\xcdOa\xbbUXo\x1adb\
+#\xf6\x14\xf2\xb7\x8f\x12W\x15\xb1\xd7\xdb\xf9\xb3\xab\xbf\
+\x9b\xac\xedy\x94\xb1\xe4\xfd\xe5b\xc5\x8cX\xad\xce\xac\
+\x03H\xfb\xd9\xec\xc8\xdb3\xc4\x1dw\x97\xcfv;\xef\
+\x0b5\xf1KP\x85\xcf\xac\x1b\xed!5\xb5\xe5\xe8\x91\
+LO\xec%F\x1a\xd6n\x5c\xe2\x02Ll\x80\xb4\xf5\
+\x08\x8a\x11qo\xb2_r7\x0b\x81\xb1\x97q|\xeb\
+\x07\x10>\xe3%\x03F\xfa\xf8\x1c\xd0q\x89\xcc\xacJ\
+g\x17\xb9\xff|e\x04\xcfK\x06\x10\x88\x9c\xca\x13Y\
+{|\x05\x84\xa0\x931\xda\x00\x00\xa8\x0d\xa0\x97-^\
+4\xbc\x17/~\xc5\x17\xb8\x87\x87\xf7t\x84\xf4\x04\x16\
+\x8c\x84\xab\x06;k\xbd/\xdbRY\xf4[\x97\x9eF\
+\xfcEH)\xb9\x08\x87\x06\xf0\xd8\xe0\x1dW\xe9\xec\xac\
+\x89\xb5\x22z-$B\x00\xae0\x01\x9am\xb8)\xb3\
+(k5'f\x03\x03*u\xa0b\x0a\x98l\x9f\xa6\
+Uj\xb9\xd4\x1b\x19\xf6K\xd9\xd6\xbc\xfb\xa3\x08?/\
+!I\x7fJ\xc5\x08\x08\x9a\xdf+\xe3\x97\xbc\x9f\x09\xe9\
+%\x96\xa0L\xa0\x0c\x91h\xd7\xd1<\x0c\x95\xfem\xd0\
+\x902\x82\xdam\xc8l<\xbc\x81\xda\x8b\xc3D\xe1\x81\
+\x90\xb1\xc7v\x5c\xbf\xf2\xcf\x87\xcf\xbb\xfe\xbd\xe1\xbd\xdd\
+\x8b\xb1e_l\x00\x00(\x1e[\xc6\xdb\x12\xc6t\xb4\
+\xd2\x8d\x84{\x1ej\x01\xcf;\x060\xd2%\x0bjb\
+\xec\x22\xf0 \xfa x\xe1\xe1S\xf8\xe1\xaf\x7f'\xbe\
+\xf0\xab\x1d>\xd4\xdd\x07\x01qA\xae\xe3\xff~\xd7>\
+.~\xec\xe7\xb9\x87\xc6G\xfa\x0eCO\xc8\x12\x22k\
+@T\x97W_\xfe%\xf3\xf9\x22$[\xf5\xadE\xdf\
+\x1a\xf3t D\x22g\x89\xccc\x0e\xd6\xa9\xf4R \
+\xfa\x1c#I\xceI\xfd9\x82w\xcd\xb6Y\x1f\x8f\x0c\
+\x94\x01(\xa3\xc1\x94\xf8\x8b\xc6Pq\x81\x96\x1fTc\
+S\x09\xdd|a\x99@\xde\x9f\xb7\x8f!\xfcP\x13?\
+\x5c\x94\xf6\x99\x010\xfd\xc6\xa8\x0e\x0c\x95F`P`\
+b\x0d\x9224\xf5\xf1\x98U>M7n#\x0f5\
+\xd2\xd0z\x0f4f \xabv\xa8\x8d\xb8\xca[\x05\x82\
+\xe0\x88\xd0\xc9\x18\x1e\x1a?\x88\x1f\xb8\xf09\xdb\xa7\x7f\
+\xe1{\xc2_\xfc\xf8\x0e\xd7y\x09\x84\xe0\x05\xdb'\xf1\
+\xbf\x7f\x95\xe0\xf5\xff\xe8\x15x\xef\xf2Al\x9d\xc7\x08\
+\x97o\xde\x81`\x88H\xf5\xf9\xd4\x9eudr\x92\x17\
+\xa0\x0b\x01\x7f\xf6\xdd\xbf\x8b\xafy\xdd\x1b\x81\x83}\xe0\
+\xa5\xaf\xc4_\xfb\xa1o\xc7o\xde\xf3\x00\xf6\xbb\x8e\x03\
+=\xb7\xec\xb0a\x8f\x91\x1eD`\x87\xc1w2x\x8f\
+\xb0p\x08KJ\xd8!p\x81\x90K\x00.\x11r\x19\
+\xc5\x95W,\xfbR\xf9\xf6\x95\x01XW\x9eB{\xe6\
+5\xe7Cn\x991z\x22K\x82\xf3R\xff\x18\xc2?\
+\x13\x13hQ@\xcd\x04\x8cFp\x8c\xa1\xb0i\x8d\x84\
+\x12C\x85\x99\xd0\xf5w\x15\xf1c\x96\x09T\x0c \x97\
+\xefB\xbd\xaf]\xaa\xe3\xccy\x91\xfc\x88Y\xfb\xd0\xc2\
+my\x891\x04rd\x80\x91\x8d!\xb0\x0c\xe0\xaaP\
+\xae!z\x0d\xaaE\xc0\xa7\xd3\xfa\x1a\xc0\xebB\xee\x05\
+\xf8\x83\x11~;\xb2\x1f\x07t\xa3\xc0K'\x03z\xd9\
+\xa0\x93-:\x19e=\x0c\xf2\x9a\xa7>\x84\xff\xe3\xcf\
+~\x09\xf0\x87\xbf\x01\xacv\xf1\xb7\x7f\xe2;\xf0\xc3/\
+y5\x06\xd7\xe6T\xd5\xed\xc3\xde\x0d\xf8\xb1_{|\
+M>/4\x09\x18\x0a\xf4\x22\xec\xff\x9c?\xbc\x0f?\
+\xfe\xa2'q\xcf\xfe\x80\x8fz\xe2\x00\xabm\xc0\x1f\xdc\
+\xbb\xc4c\xbb\x1d\xf7{\x87\xad#G\xc2\x05\x92B\xba\
+P\xf4\xee\x08\xfb\x05\x0bB\xd6\x80\xec\x12\xea\xc6\x93\xcb\
+\x8c\xc4o\x99\xc0\xc5D\xfc\x96\x01\xa8$(R \x11\
+{EN\xccDo\x89\x1d\xfa8yW\xab\xeb\xdf$\
+\x03hQ\xc3i\x19\x80Y5(\xe0\x84\x17h\xf5\xff\
+SK\x7fdB\x9d0\x81\x96\xa8\x8f!~\xb5\x05T\
+\x0c\xc3\xa2\x0a$.P\xdd\xa3\xbdSh\xfc\x80\xbd\xdb\
+\x90\x98\xc2\x88:\x88H\x19\xc05\x81\x5c\x03'\x0c\xe0\
+i\x80O\x0bp\x15\xe0\xd5\xf8;\xee\x01\xdc\x17r\x03\
+p+\xc2\x81@\x8a\x17\x92\xe0D\xc4\x8b\x84>\x04Y\
+o\x03\xee\xdb\xdb\xc8\xcb\x9e\xdc\xc7\xa1\xf7x\xc7\xbd;\
+xz\xd9\xe3\x13\x7f{\x89\x9f\xfb\xa4\x038-@\xa8\
+\x10\x07\xc0\xe8\x04\xe1x\xfe\x80_\x7f\xf3\xdbOx\x81\
+gk\xcf\xba\x0a\x104.K\xa2\x82\xa5V\xfd@\xc1\
+w\xbd\xfcQ\x5c]\x06\xdcx\x10\xf8\x99W\xacpc\
+)\x90\xbf\xb0\x8f\xbf\xf0?\xae\xf1\xbe{\x02c\xdeF\
+\x0c\xe8\x11H\xf1\xe5\x8bT~\xfcH\xfcr\x11\xc0%\
+\x96@\x9eH\xfc\x05\xf6\xb7Q}\x0a\xff5\x96?i\
+\xe10\x92\xd4\xea\xf7\xbaau}$\xc2\xac\xa1\x7f&\
+\xe49\x06p\x14\xf17v\x00{\x8e\xbcFa\x02\xd0\
+\xd5I\xfa\x7f\xc5\xcbb+\x82\xbfX\xdd\x88B\xf8e\
+\x9b\xa0\x12|\xdeN&;A\xb6\xec[+\x7f\x86\xfa\
+\xba\xed\x12\x0aH\xdb\x13\xe9o\x09\xdf0\x8f\xc2\x08\xd2\
+\xe0\xc9\x06GV\xfb\xc0b\x88\xd4\xf4^\xa1\x08b\xf5\
+!\x1b\xa0Eh\xbd\x828\x14#\xaa\xcbj\x1eM\xa0\
+\x98t\x02F\xd5\x12XR\xe4\x001\x01IS\x93\x07\
+B\x06\x07\x8cN\x04\xdd\xc0\xf0\xc0U\xc8\xdb\xfe\xd9G\
+\x00\xff\xdb\x13\xd8=\x0c\xe8Dp\xe1p\xc4\x93\x17\x0f\
+\xd0\x8d\x80\xb8d04\x0c\xc0\xa6 ?[\xed9\xb1\
+\x01\x08$\xb9M\xcag \x0a\xd7\x9d\x81\xe8\xf7\x81\xe0\
+\x05\x177\x82\xa7\xbfc\x81\xef\xfc\xe7\xff\x89|\xc6W\
+\xfe\x1c7>0\x08<)=\x04\x0bR\x96R\x5cr\
+\xd6\xb2\xdf\xea\xfd*\xf1'\xa1\xbc\x92\x8c\x7f\xacu@\
+\xd5/3\xc8\xb7\xae\xbb,y+x^\xf6M\x19@\
+\xfd\xdd\xac\x94o\x89\x7f\x16\xf67\xd2_\x19\x00`\xf6\
+\xa10\x81\xfc\xa7\xden\x1b\xedV\x04eq\x5cN\xb6\
+%nH\xb3\x0d\xc4\xd1\x9b\x08\xd5\xba\xf8\xc8\xc2\x142\
+\xf1\xbb\x19\x82\x0f\x982\x80\xa3\x90\xc0\xec6\xf2v6\
+(\xa6\xfbO\x8f\x98\xf5z\x83cl\x17D\xc3\xa2$\
+\xa1\xc2\x12K\x80\x18/\xb2F\x8c$L\x1e\x03\xd9\x07\
+\xb8O\xe0\x10\x82CBH\x01\x9c@\x96\x03\xf0\xdd\xff\
+\x9c\xb2\xf3\x89\x1f\xc2\xe5=\xc4z\x03\x22\xe8G\xe6\xb8\
+d\x98.\xd4\xee{\xf6\x15\xf2\xe7\x81\x11\xb05\x8cR\
+b8\x85\x88\xc0\x09\xd0\x05\x01\xe5\x1b\xf1\xba\xaf\xf8T\
+\x15\xbc\x9e\x90\x1e\xd1\x1f\xbf\xcbB\xc8U\xe0\x0e\x95\xd8\
+\xa5\x22z\x85\xfa\xbb\x02\xac!\x92\x8d~\x92\x0c~$\
+\x0b\x08S\xe2?\x0a\xce\xbbB\xe0\x85X-!\xc3\x10\
+\xbe\xdd\x9eA\x053\x84~\x94K\x10\xb0\xdb\x86\xf0\x95\
+I\xe9\xbd\xeb\xde\xd9\x81\xd5\xee\x94\xea\xab,\xf5\xf5|\
+\x82\xe4\x97\x07\xc88rE\xb7\xd5:O\xd6\x8c \x11\
+\xa2E\x06\xd9\x08\xe8j\x22\xaf\x88:\x94\xedJ\xbdH\
+v\x81|L\xc3Dr\x5cAr\x125L\x00\x88\xc8\
+Q\xed\x04\x01\x85=(\x03H\xb1#\x5c@\xb27!\
+y\x86d\x17\xe0.R\xb81\x81\x1b\x80\x5c\x07p\x83\
+\xe5\xc9\x03\x811f\x0c|\x04\xba\xf0\xee\x18\xa1\x04\xc4\
+\x12c\xed`\x9f\xf6\xfc\xb3\xde\x9e#\x06P\xc9\x9c\xaa\
+\x03\x02\x05\x83\x13\x8c^p\xd8\x07\x5c\xbdr\x88\xbf\xf5\
+\xb9\xaf\xe3/~\xe4U'\x10\x8f\x18\x0c\xb2D\x96\xf4\
+r\x19\x11\xea_F\x86\xf6l\xdd~\xad\x9bo\x0d\x11\
+\xeb\xd7\xaf2\xc7\xe6\x08\xf1H\x9d\xdd\x11\xce\xcf\x19\xee\
+8A\x06\xc0\x1ca\xc7\xdf\xb4\xfe\xfdYb7\xdf\xe7\
+\xfd\xb9#\xa7R\xff\xf8fD\xd1i\x86 \x81L\xeb\
+\x11gg\x14\xa2\x88.\x9e2\xfeH\xa3\xfd\x94\xf8\xb3\
+T\x16T\xc4\xdf\xae\xa7R]\x89\xbcF\x04Qm\x08\
+\xf3\x86DW\x18A\xbev\x09*`z\xd7\xbd\xe9\x84\
+\xecE`\xaa\xe5\x08\x0d\x0e+s7\x5cO\x04\x7f\x0d\
+q^\x87\xa7Q\x8c\xc4@26\x0a0\x0e\x1e\xe1\xbf\
+\xfbs\x8f\xc8\xb5\x07F\xe9?\xe0\x80m\xca\xfb\x16\xc4\
+Dg\xa3Z\xe9Z\xec\xebx\x16\xdbs\xc2\x00\x88\x86\
+\x1b2\x0e\x16\xa1\xe0\xc9\xd5\x80'^\xb0\x07\x5c\xd9\x00\
+ox\x1f\xbe\xfc\xf3^\xc7\xb7\x7f\xc4u\xb7\xed\xc4K\
+L\xd9\xceA\x1e\x84\x5c\x12\xe0\x1e\x00\xf7\x22\xae\xefA\
+\x8c\xd7O\x84\xcf\xb9d\x9d\xa8\xe7\x93\x0b\x88\xd8\xb4]\
+\xd7\x8a\xca#\x8dv\x8ep\xde\xd5kG\xd0\xcf0\x81\
+J\xfa\xc7\xa7\x9f#\xeeY\xc2>\xe9s\xdeG\xfb\xf5\
+\xa4e]~\xf2\x83y\xc2\x97c\xf8Af\xd8F?\
+\xd0\xfb\x11\x98r\x02\x86\xb7X$\x10\xcf/\xf9\xbbi\
+\xe0\x1005,6\xc4?*\xf1\x13a\x0c\xa9\xeag\
+(\xd7U\xf9\x9e\xca\x96\x88\xb1m\xa0&x \xa7c\
+S\xdd\x886j\xd4N\xdcr\x01\x99\xf8\xb1BD\xa1\
+>=f\x000\x088\x08\x116\x1e\xe1\xd7_\x12\xe4\
+K\xde\xb6\x0ao\xfd\xae_\x14\xfc\xdck\x80\xc7\x1d\xee\
+{w\x87\x07\x9fb\xacb(u\xf7\x93\xcf\x0d\x13x\
+\xd6\x19\x80\xab\xbc\x00\xb1\xa9Q\xe9\xd7\xde\xf6\xc9\xf8\x13\
+\x9f\xfd+\xf4\x8f\xee\xd2\x8f\x04~\xea\xc5|\xfb\xcb\xaf\
+\xb9\xc1\x8b\x1f\x9d\xf4\x816\xc8C. J\xfd+\x00\
+\xeeCa\x02\xea\xebo\xd3tm9\xafh@$\xeb\
+\x94\xdd\x06\xf2O\x88>M\x06BO8\xe7\xa2\xe4\xf7\
+\x0e\xce\xbb\xf4]\x8d\x12*;\x81\x95\xec@\xd9\x97\xb6\
+\xb5M\x89\xbbf\x0e\xedw\x13\xe2?f\x00\x1dG\xd8\
+\xa7j\x8a\xf4a\x84)\x0b1\xdbgS\xc9\x9b\x9fA\
+\xe3\xff\xd3\xb6\xbd)\xab\x91\xcf\xa3\x02\xc3\x00\x82\x1a\x0f\
+#\xf1\x83\x84\x8c19L \x08\xc1\xea\x00(\xeb\xc8\
+\x08\xb4T\xb8\x93\xcc\xc6r\x0d\xc8\xb9\xc4\xb06jT\
+\xc7\xd3\x02\xa50J\x895 \xc6\x00\x84\xd1Cn\xac\
+\xc0_\xfb\x88q\xfc\xf4\xaf\xfc\x94\x00@\x06/\x18\x1d\
+\xe4o\xfe\xcbK\xf2\xf7\xdf\xf4T\xf1\x02\xe4~H\xb6\
+\x91\xf3\xce\x006.\xe0\xb7~\xe8\xd3\xf0\xa7?\xe3\xed\
+\x18\x09\xacF\xe2G?\xfe\x1dx\xf5;^\xc4O\xfe\
+\xdc\xb7\xd3\x09\x9c\xf3\xd1\xcf\xc7d\x98\x11H'\xc4R\
+ +)\xdc\xf8\x12\x04\x97A\x5cAd\x02\xf7\xa6\xb5\
+2\x80\xb9\x1c}[zK\x0bt(\x051\x0dX!\
+\xc9\x1a\xee\xbb,\xe1\x9d2\x00%|\xbbOg\xa9q\
+\x05\xda[\xf8\xdfJzm\xb3\x04^\xff`f\xd7\xec\
+\xce\xdb\xdf\x0c\x13\xb0\x17mS\xe5\xb3J`~f\xef\
+\xb9$\x0c\x99\xbdb\xa4u\xda\x16A\xd2\xf5\x91\x11@\
+\x18\x03d\xd4>\x0eqJ\xaf1\x1d\xcb\x00\xa1\x830\
+ \x94\x80\xd1\xb2\x8e\xe7U\xc2\x8f\x8bT\xe5\xda\x16\x88\
+\x96\xfd%\xa2\xdb\xb0\xad\xdal\x89?@\xaa\x0c\xc2\x00\
+@F\xc2\x05/np\x1c\x0e\xfb\x88W\xc4A\x02!\
+\x7f\xffMO\x85m\x07\xf9\xd5\xff\xfe\x83\xf2\xba\xbf\xf5\
+\x22l\xfb\x98p\xfcW\xbf\xeb\x0a\xbe\xfe\xbfy\x0cN\
+\xef\xf9Yjg\x1e2\x1f\xfb\xe6O9\xfe\x07a\x9c\
+\x175d\xac\xc8F`K\xc1\xa1\x0b\x08\x04{!\xfa\
+@v\xe2\xe8\x00\xe7$\x96\xdb\xa6\xd0\xb3D\xe1-\x00\
+\xac\x841\xb2O\x88{\x00\xdc\x07\xc8\xfdB<\x00\xe0\
+\xfe\xf8\x19WP\xaa\xf6\xac\x01\xb6\xc4\x9f\xdc:T\x89\
+\x9f\xc5\xe7\x9c\xeb\xce\x22\x80\x1a\xea\x1b\xe2\xf7.~\xd6\
+\xfd\xa4\x09\xef\x8d\xcfM}~\xd3\xe3\xb3\x04<\xd7\x9e\
+\x03\xbd\xf0\x96\xb6S\xa2\x8e\xda\xb9oT\x01\xa0\x18\xfb\
+\x04\x90\x10\x10\x92\x0a\x10Fe\x06\x01a,\xfb%\x08\
+Bk\x1f(\x86\xc4h\xa9P\x83a\xb9\xb8H\x99\xc0\
+d\x80`\x00\xab\xd4c\x0d\x1e\xba\x06\xe0)\x00\x8f\x03\
+x\x8c\x82G\x01<\x06\xe0\x09\x0a\x9f\x02p\x8de~\
+\x83\x0d\x80A\x88\xb1,\x12\x82C\x18\xbd\xc8\xb6\x17\x19\
+:\x11'D\xbf!\xfa!BP7\x84hp\xad`\
+2b\xde\xcbx<\x87\xf8\x95\xbf\xf7+\xa7\xeb\xf0\xd4\
+n=\x02\xa0KF\xd6f7\x1d~\xe3\xef\xbe\x1d\x1f\
+\xf35\x9f\x00@\xe8C\x0c\xf1u\x914\x92W\x98^\
+ \x1d\xc0\x0e\x94^Jy\xed\x15\x80\x1d)e\xba\xee\
+\x01p\xaf\x00W I\xf7g\x1b\xd4\xc3\xe2\xd3\x8f\xf1\
+\xfb\xd1\xb7\xcb\xe4\xe2#2QN\x5cu\x8d\xb1/K\
+v#\xe5\x95\x01D\xe2w\xc5\x10X\xc1\x7fL\x19@\
+\xee\x10\xb3\xfd\x5c\x9a\x81ow;%\xb2!XLr\
+v\xad\xbf\x0b\xaa$\xbb\xe8%\x22\xa0\x8a~\xd2 A\
+\x0aB\x8a4d`\xcd\x04T\x85p\xb1\xe4G\xe55\
+ (\x22d\x9c\x0c&\x19\x9bs\x0dG\x8d\x0dP\xc4\
+\x10/,\xa5n@\xd2\xea\x91\x0c\xfe=X\xea\x0eH\
+,i\xbe\x95\xb8\xc4\x9a\x03\xf1\xb9\x83\xb73\x92:b\
+\xec\x9c\xbc\xf4\x97?\x80\x0f\xbc\xea\xfei_%\x06p\
+\xab\xdb\xedQ\x01\xb2E\xc3|\x06\xf0\x09_\xf7'p\
+x\xfdq\x88S\xc1\xab|\xae\xd4\xe2\x17&\x18&G\
+\x18b\x22\xa1_\x96\x16\xf6K\x96\xfc\xaa\xabe}\x1f\
+\x1a\xdc\x91\xedpi\xe3Hw\x9e\xab\xf5yW\xc3\xfb\
+,\xed\xed\xbaa\x1a\x00+&SP\xfe\xd1\xd0]\x8e\
+\xe2\x04\x1f\xae\x0c\xe2\x08\xe2?\x12\xfdd\xadA\xa6}\
+\xd5\x16&\x87K\xd4\x98\x98\xc1H\x08\x03\x18\x98\x11\x80\
+n\x1f\x19\x85h\x0c\x8bD\xaeQ\xe0\xd3\x85\xcb\x22\xd5\
+\x0d\xab\x91!Og&\xf1-w \x16\x10\xac\xa5$\
+\x18\xed!\xa6\x1fk\x8a1\xd3\xefu\x8e\x91@\x00B\
+H\xf0D\xe8\x1c\x9ex\xc9\xe5\xca\x9bR\x18\xa1\xdc\x96\
+q\xf0\xac\xda\x00\xa2\xde\x17\x9f\xca\x19\xc0\x8d\x9c\xdd%\
+\x1d\xc0\x05 k!w\x08\x5c\x90\xe4\xdac\x0a\xec\x91\
+*\xb2\x8f\xf7\xa0\xc4\xf9\xab\xde\xaf\x92?\x13\x7f\x92\xfe\
+\x85\xf8\x93{Ng\xf8\xad\x8d|\x9c\xec\xafT\x01\xe7\
+\x1a\xc6\xd0\x10?\xcfH\xfc\xa6\xe5A8\xfd\x22u\xe0\
+Mw\xfd\xb3\xdb\xceJ\xf8\xcd\xa1Z\x07\x00y\xfc\xc7\
+\x9e\x01\xd8LO\xe2\xe0\x10u~2\x19\x06C\x88\x04\
+\xad\xc4?\x13z\x5c!\x03\x96\xfd\x00\xd4u\xa9F\xc2\
+9\xfa\xa8c\x08\xb4\xa6dB\xaa$v\x11C\x89W\
+\x12\xd5\x85\x1e\x8c\x1e\xc0d<\x89\x96\x08I\xb0Cr\
+\xcfHp\x9c\xce>t\x9b\xdf\xf9\xeda\x00G@\x15\
+\xfa\x0e\xa4\x83K\xa1$\x89(\x8d\xae\x9f}\xb0;\x88\
+\x04\xaf\xc4}Or\xf7\xd9\xda|md_r\xcf\xd0\
+\xa6s:V\x16\xfeD\xf8D\x9a\xda\xfb\x18I>\xc7\
+\x00\xe6b\x01\x1a\x7f?\x8c\xcf\xfe\xcc\xddv^\x10\x80\
+\x85\xee\xd5n\xf5\x1d\x9c\xa2s\xac\x0a\x90>\xe7\xa3\x1c\
+\x13\xa3@4\xf8\x99\xc8\xc2\x13\xa5~\x10pL\x8cb\
+\x14\x04\xe31\xc8q\x0b\x10\x90\xa4\xc4\xfccM;\x16\
+\xb3\xe4;A\xb1Q\xadQ\xd4\xd4\x22\x88\x98\x8e/3\
+\x8d\xa5\xf9\x0c\xa3\xbd\xd2\x95\xccw0\x04\xb81\xd4o\
+\xfb63\xff\xdb\xc2\x00&\xef.q\xf3\xbdw\xfc\x12\
+\xfa\x07_\x96\xf8u.\x87\xed\x09\x96\x5c\xeeR\x8d\xe7\
+\x12\x8a\x8f_\x0d|\xc9\xcfo\xcbs\xd3\xe6\xf0\x17\xe2\
+g\x9e3\x8f5\xe13\x13\x7f6\xe0\xb5\xc6<\xcb\x00\
+\x1aB\xaf\x0c\x85U@\x8fY\xe7^H-\xa1\xb93\
+X\xc4\xceG\x9b{\x0e\x1e\xc3\xe8\x8e8NQ\x00\x90\
+\x02\x8e q\xe4\x08\x22S\x17\xc9L\x00\xae\x89\x19h\
+\x18@\x18C|\x9f\x033\xf1\x87\xe8#\x8c\xcc\xa3\xb8\
+5\x99\x98\x80*\x1f\x1d&,){\x0e4b\xd0\xd6\
+\x88\xd4\xca\xc4\x0a\xde\x8b\xda\x90b\x11\x9d\x03dL\xf3\
+!$w\xc77}\xe3o\xe2\x8b\xbf\xf6\x13Qs\xbc\
+t\xb9#*\xa4<\x93v\xeb\x19@\x0c\xd9\x9a\xe5\xf1\
+\xcb\x07_A\x89\xb4\xe8\xa4\x9e\x1c\xa3g4\xdai'\
+^@\x84\xfb\xf70\x12\xff\xfd(\xfa\xbe\xd5\xf5\xadk\
+\xa6\xcc\x98K\xd5\xe3\x98\x109\x85\x04k\xd8\x1e\x09\xde\
+{\x07\xd7\xb9\xc4\x00\x8a\xb5\x7f6\xb2\xaf\xf2\x14\xa02\
+\x22\xc6\x0d}\xd2\x99\xa7?/D\xfdL\xdb\xcd\xf4\x83\
+\x8e\xfdD\xfb9\x90J\x94&\x0a\x13\xd0\xd8\x01\x18\xb7\
+a%\xfd]\x8a\x1fH\xe7\xd5\x16$\x14d\x12\xbf\x96\
+\xe4.D\xf4\xd0\xe7{W|\xa7\xb1\x03\x0b\x94\xb1k\
+\x05\x91\x22\x87H\xf8\xa2s\x18\x22P9`(\xac\x0d\
+@\x80\x08\xde\xf4\x96O\x0en\x08\x11{L#\xb7p\
+\xabk\x0b\x9e\x90|x\xf6v\xf8)\xaf\x03%\x96\xea\
+BZS\x02\xfe\xc1[\xde\x0e8G\x133\xd7\x11\xec\
+\x09.\x94\xf8\x99}\xfcT\x88\x7f\x0f\x8a\xb1\xef>\x94\
+\x80\x9f+(\xa1\xbf\xbb(p\xab'\xd1\x01\xf4 \x1d\
+]\x96\xfe\xactx\xcf$\xf5\x19\x89?-\xbe\xf3i\
+\xdb\x97\xc5{\xe3\xf3/\x0b\x9d\xabP\x01\xf2\xaa\xe5\xdc\
+w\xdb\xadj\xb1oM\x7f\x1b\x86\x1e=1\xcd\xd2M\
+\x17\xef}\x5c:\xf3^]YO\x83\xb9\xa0\xa3\xc7\x93\
+\xf4`\x8e\x16l\x91\xaa\x06\xa4\xe9\x18\xd5q\xaa\xaa\xab\
+\xe6\xa6\xc4\xe43\xc1\x8a\x01K'\x5c0H\xc7\x00\xef\
+\x02\x9c\x1b\x02\x1f\xf8\x83\x0fB\xbc/\x85\xedI\x88w\
+\xb8\xfc\xfe\xa7nC\x9f6\xed\xd3\xbe\xe2\xd3\x8e=`\
+o7`\xf4S.\xe4G\xe0p%\x00<\x96W\xaf\
+\x22t\x11\x5cP\x04n\xbb\xc1\xe6\xf2\x15r\x18\x1cE\
+:\x89!\xb89\xea\x8aF\xf23v\xe8\xbd\x88R\xff\
+\x01\x02\x0f .\xf7!v\xa6\x1a\xfb\x96\xa8\xcbqE\
+M\x9cp)\xa2'\x09\xeeF\x9a\xdb \x1eK\xf4\xbe\
+\xa0\x80\x89QO%>\x14\xe2\xdf%\xf2\xe7]\x93i\
+\x10\xd1\x1c\x0a\x08!@\x06\xc18\x8e\x08C\xc8\xcb8\
+\x8e\xd1&\xd0\xba\x0e%\x9f3F\x22\xa4D\xa2t\x09\
+[lD\xeb\x0c\x5cG\x89\x13x\x14\xc0\xa3B<\x0a\
+\xc8c\x00\x9e\x04\xf14\xe2\xd4eZ\x83\xf0\x90q\x06\
+\xe4-\x04[\x8a\x8c~;\x8e\x8f\xbf\xfc!\xd9}\xfc\
+i0D\x1c\xb2]-q\xe9\xd1'\x00\x07l\xdc\x12\
+n\xa6\xb2\xd0H\x8f\x1b\xdd\xc5c\xbb\xe9]o\xfe\xa9\
+\xea\xf3\x99\x11@\xbfq\xf0\x83\x83\x1b\xcb\xd2\x0d\x0e\xfd\
+\xc6\xe3\xb7\xff\xe7'\xf0\xf4\xe5\x0e\xabm@7\x06t\
+A\xd0\x85\x80\x0b{\xd71\xd2\x03\xc9\xddG\xb2\x8b\x92\
+?K\xfd\x8b\x00.\xb3v\xedil\xbf\x1a\xfe\xda\x89\
+8tb\xce\x05\xc8\x9e\xd1\xc7\x1f\xb3\xf9r$_\x84\
+\xf9\xf4\xb5\x04\xa8\xa4B&|%~\xd7,*\xe5+\
+\xa9p\xd3\x86\xbe\xbb\xed\x166\xd6KFdM\x1d\x85\
+\xbc\xccEr\xb6\xe8\xafE\x11i\x0c \x8d*\x10\x1e\
+\xd4P\xf2,\xc4\xac\xfaZ\x22U\x81\xcb\x80\xdc\x03\x11\
+\x8dV\xbd\x02\xc1\x15\x08.3z\xb6v)XC\xb0\
+\x84\xa0\xa3\xc0S\x84\x90\xc0w\xff\x8d\x7f\x8d\xd0-\x10\
+|\x87\xe0{\xec]\xb8\x17\x8ba\x1f\x1f\xf1\xf4\xef`\
+\xc3\x05\x06v\x18\xe1\x10\xd22\xc2c\xcb\xc5\x99\xbb\xf0\
+\xcc\x0c\x80!\xce\xaf\x94\xa6J\x8a\xdb\x81\xa0\x00o\xfc\
+\xfc\x07\xf0\xfeO\xbf\x1f]\x88\x99ON\x02|\x08X\
+\x0f\x1b\x8c\xce\xa7\xe8^\xc6`\x09`Ep\x87\xe0%\
+\x82\xf7\xb0\x86\xf9s\xb1\xfdS\x9d?\xc1}*\x02`\
+\x92\xfa\x0a\x0b3\xd47/\xb9\x8fk\xdfE(\xc8\xae\
+\xa8\x049\xe4\xb7\x8d\xe4S\x03\x1f\xcc@K\xff2$\
+\xbd\xdb\x9e\xdd\x96_G\xfag\xdeCFn\x1a\xd7\xd1\
+\xb8p\x8fU\x11z?\x11\x0e\xce%F\x10\xcf\x1b\xc7\
+0ST)\xab\x10\xe2\xa4\x1aH*D+\x97\x01\x5c\
+!p/\x04\xf7\x03y\xb9\x0f\x82{\x10kT\xec\x12\
+XR\xd0C$\xce} \xc27\x93\x08\xdd\x02p\x1d\
+\xc4y\x0c~\x8d\xf5\xe1U|\xdfg\xfdX\x9ep$\
+\xd6\xc3\x8e\xc5G\x03\x1d\x02\xcf\xae\xd1\x9f\xd9\x08\xa8\x16\
+\xee\xca )\xb1J\xe3v\x01\xe0\xc5+,\x86\x80\xa1\
+\x8fa\xbf>\x8cx\xe8\xd1G\xf1\x8e\x97\xbd&u\x1c\
+;\x08zRV(\xb3\xef\x5c\x01\x98$\xbe\x5cF\xd1\
+\xa9\x94\x01\xa8k\xa5\xb2\xf2g\xb24\x16xX#\x9f\
+\xbel\x0d\xe5\x9d\x91\x00\xc5\xf2\xaf\x9c~J\xfcf\xb4\
+M\x5cX\xad\xc7\xe3n{\x16\x9a!\xfez\xb7I\xfb\
+%r\xf5a\x82\xb9\x0e\x01S\x10\x9a\x86\x11Y\xe4@\
+\xc7\xfc\x9b\xac\x0e\x8c)\xd7\xc0\xe6\x15\x84h\x91L\xf3\
+\x17\xb8d\x9c\xec\xe2\xafd\x04\xb4\x1au\x0e\x16\x02c\
+da\x0f\xe6\x18\x15\x9d\xea\x1d0\xd3\xa6Cd\x00\x84\
+?\xf3\xb9\xe4\xb0\xda\x15\x86\x1b\x08tx\xfc\x85\xaf\x84\
+\xfb\xe5\x1f\x03\x1e\xfd\xf7\xe96h\x0c\x827/\x81\xce\
+\xcc2\xa2\xefUR1%]\xc7\xfdW\x9e v\xbe\
+\xff\xfdx\xd1\xfb\x9f\xc4b;\xa0\xdf\x0e\xd8\xd9\xdf\xc7\
+\xb7\xff\xf5\xaf\x86\x0b#Q\xca7/\x93\xfb\xee\x02\x8a\
+\xab\xef~\x02\x0f\x10|0\xaeq/#\x97\xbc\x08i\
+\x88\x1fZ\xab\x0f\xb5\xfb\xadI\xde\xc9\x1c\xbcO\x92\xbf\
+\xf7e\xc9\x90\x8f\x11\xfe\x1b\x9d\xbf\x0a\xe1=\xa1sO\
+ti\xddm\xb7\xbeeO\xdd\x09}o\x18\xb6\xa2\x84\
+J\x1d0*a56\xd2x\xc9\x06\xe1\x19\xcf\x90\xb5\
+\x05)\x02E\x99\x8fb\x09\xc9\xb1,y|\x03x\x00\
+\x82\x07!\xb8\x1f\x92P\x80\xa2[1\xbdk\x1b\x1d\x00\
+\x00 \x00IDATu)\xe8\xdc\xf5\x87_\xc2w\
+~\xe9\xf7c\xff\xca\x03\xb8\xf6\xe0K\xf0\x05\xff\xe8-\
+8X\xec\x02_\xf8\xd5(\xb3e\xe9\xbcD\xba}\xf6\
+\xb1xf\x04 N N\xfd\xda\x00\x04\x08..\xdf\
+\xf6?\x1c\xe0\xe5?/\xfc\x81\xff\xfc\x8f\xc8[\xbf\xfc\
+G\xf0\xff}\x22\xf0\x0f\xbf\xe1k\xf1\xb2\x9f\xfeY\xef\
+\xc3\xa0\x95|Tg\xdaE\xd4\x83.\x9b\x0e\xba\x171\
+\xc2\xef\x12\xa6\x93o*\xd7d\xb2\xedO|\xf0\xa4\x8d\
+\xdbW\x9d\xbf\xd5\xf5\xa7\xd1|\x93\x02\x1e\x05K6\x0f\
+\x8fI\xd6\xdb]\xfa\x7f\x8eZ\x92\xf2\x13&pD\xec\
+A\x5c\xa5\x0dW\xd0\x81\xb0\xe4\x0dX\x04\xa0\xe3)\x07\
+\x0a\x01e;\xd5\x1a\x90\xa0\xe1\xba\xa2\xff\x95\x09,\xa0\
+\xb7\xc6*X\xc8J\x7f\xa0\xa9VL`\x03r+\xce\
+\x8d\xc3z'|\xea\x97\xbd\x04;O~Hd\xb1\xc0\
+\xef~\xe2\xcb\x11\xfa%>\xf3+\xee\x97?\xbc\xf8\xca\
+\x04\xfe\xcb\xc3:\x01(gO%<3\x03\xd8\xf62\
+\xf5\x02\xa4\x80\x8cW\xfdL\x0f\x17\x02\x1e\xfa\xc0\x93\xee\
+k\xff\x97\xd7\x228\xe2\xa3~\xf2']7\x8c\xdeI\
+H\xc5;\xc5\xe8I\x13\x17Jb\x00\xb8\x08`\x07\x9c\
+\xf8\xf9}\xb2\xf6\x1f!\xf9\x1b+\xbf\xd5\xf3\xbc/\x01\
+?-\xe1\xb7p\xff8\xb5\xfe.\xc1?\x7f\xdai\xde\
+\x85Q\x05\x804fLL\x1f\xc9\x98\x86fr\x08\xe6\
+\x8c\xbc\x02I\x81\xc75\x13\x88\x99\x8a\x91\x09 \x0a\xe3\
+\x88\x02T\xd3\xa8\xd3\x8cu\x1c\xabRa\xbd\x07\x9aA\
+\xb8\x15r\x0c]'\xdb\xddK\xe3\xd5\x9d\x0b1\xdf\xc0\
+y\x88sxl\xe7!\xe9d\x0b?7\xbf\x80\x00\x1b\
+\xacN\xdb{\x00n\x82\x01\xfc\xfe\xab\x9e\xc6K\xde\xb5\
+[U\xf4\x11\x07\xbc\xef\xa1}\xbc\xf4\x9d\xbb\x0c^\xe8\
+\xc2\xc8n\x0c\x8c\xf1Z\xe2)\xe8 \xb2$\xb0\xa2`\
+'\x11\xbf\xd6\xedS\x9d_\x19A\xd2\xf9\xb9F\x99z\
+K\x93y\xd4\xd5\xc7\xca\xd0C\xa3\xdb;c\xf8\xcbK\
+\x81\xfb\xceD\xf8\x15\xe2\x07,\xd5\xdfu\xf3\x9d\xb3\xd6\
+2\x01}\xbfi\x0cSX\x22\x09\x831\xf8\xaaKQ\
+\x12\xf1K8\x8e\x09DV\x12#\x89\xb5\x00\xa9\x9d\x91\
+\xdaN8\xa2\xc4og*\xda\x17\xf0\x90\xc4\x08@\x84\
+\x9eB\xb7\x85\xda\x11H\x11:\x19\xe0\xf8\xc0\xe6\x83r\
+\xb5\xbf\x076\xdc\x8e\x10<\xb0\xf9 \xfe\xa0{\xd5\x99\
+\xbafb\x03\xf0\xa3;v\xf9\xa2o\xfeX\x0c\x8b\x01\
+\xc1\x8f\x08>`\xecFl\x16[|\xd9\xd7}\x12\xfc\
+H\xba \xce\x05\xf1n\x0c\xbd\x0fa\xe1BXR\xc2\
+\x9a\x22;\x8c\x96\xd1\xb6b\xaf\xad\xcfo'\xe9\xa8\xc3\
+{I\x9f\x5c}\xce\x16\xec\xd0 \x0e\x9ap\xde\x08\xff\
+\x9b\xa2\x1d\xbe\x18\x02\x15)\xa8\xd1/[\xfa\x1bk\xf2\
+\xddv\x8e\x9a\xf5\xde\xcc\xb9\x08\x0dz\x9c\xa0\xc8*\x00\
+\xac\x19Gy\x01\x93\x80\xf2\xc93\xd0V\x16R\xf7\xa0\
+\x8e\xf3z\xdc3.\x02\xee\x82\xdc\x01\xb9\x86sKq\
+n!\xceu\x81\xce\x07:\x8e\xce\xf3\xa7\xfe\xc1{\xd0\
+\xcb\x16>9\x02=\x02:\x19\xf0\x13\xff\xc5#\x18\xd9\
+\x1d\xbb\xb4m\xb2\xe7\xc1G.\x1d\xdb\x8f\xdf\xf4\x13\xdf\
+\x83\x8f\xfa\x96\x8fG\x16\x9d\x14\x80\x01o\xf97\xdf\x81\
+O\xfd\x96?\x8a\xe0\x02\xe9\xc43\xce\x9f\xd7'\xc8\x1f\
+;!Z\xfd/#\xba\xfd\xea\x08\xa9zr\x8eD\xf8\
+,\x93s$[\x0e#\xf9O\xdd;\xa6L\x97\x85\xff\
+\xca\x10\xda\xe4\x9el\xe4\xcb\xc4~\x97\xea\xef\x88F\xbb\
+Y\xbc;9Z\xdf\x01N\x5c\x99~\x14\x8d\x9d\x81\x80\
+\x8c\x92\xed\x0f!Th\x80\x12\xc41\x06&\x03\xd1\xca\
+o\xe6!\x80 Z\xfb\x15\xf6_\x84NW\x1e\xed\x00\
+c</\xcbtt\xc0a,\xbf\xcaA\xe8\xc2\xc0\x1e\
+\x7f\xf9\xab\x88\xdf]\x7ft\xb4\x01P\xb5\x15\xc1\x17\xbd\
+\x8d\xf8\xd6\x17\xfe\xcd\x13:\xe0\xc7\xabO\x13\x06\xf0O\
+\xde\xf6\x97\x8f=\xfc\x87>\xff\x97Q\xaa\x17\x16\xeb\xe3\
+\xce\x7fx\x11\xba\xad\xc3\xb6\x87\xa3\xa0\x13\x8aN\xce\xb9\
+#\xcc\x93p^\x02p\x99\x90{!9\x9c7\xf9\xf9\
+\xd9N\xca\x99&\xe7\x88Ev\x00L8w\xe5\xd2S\
+\xc3_&~\x13\x07\x1094JFPy\x99\xa5I\
+\xbb\xe3n;\xcf\xcd\xbej\xcd/HED\xd5HH\
+\x1f\x11\x83\x93T,Z\x0d\x83\x0c\xc0\x18\x8d\x82\x8e\x13\
+\x95\x80\x12\xe2\xf4\x90\xa9,\xb9\x18\xac\xae.BE\x04\
+\x97\x00\xa4IFd\x88w\x92\xd5\x06\xadY\xe9\xe2-\
+R\x04\x1c\xb7n9>\xde\xdf3}\x06\x00\x1f\xec/\
+A\xfe\xc5?>\xf5c\x033\x0c\xe0!|\xfe\xb1'\
+p\xe1\xab\xb2\xfb\xaf2\x98\x07\xc2\x8d$\x05\x8eq\x9e\
+\xf6\xa5\xc4\xdc\xe8\x0b\x94jv\x1e\xb5\xfak\xa0O4\
+\xf8AT\xea\x1bc_\x99n{N\xea\xe7t\xde*\
+\x82K\x19\xc3\x9c\x8bOo\x97\x89\x83\xb7\xad\xf8U\xef\
+\xb2\x82;\xa8Y{\x801,k\xac\x80\xaa\x0d\x81\x8d\
+\x81\x90\x88\x05I[\xbb\x00\xa3\xdd 1\x01\x82\x19\x09\
+\xb4^\xb0\x03D40@\xa7\x0ca5\xebt\x9aP\
+\x98\xb1\xe489\x8c\xf49\x06\xa0\x8c\xd1(\x84\x85\xc4\
+\xcf}\xea\x09\xcf\xfa\xfb\xf5\xc7\x09\x03\xf8\xfa+_~\
+\xec\xf1\xfb/}\x12\xe1\xdd\xf7\x80Z@\x81@\xf0\x01\
+7^\xf44\x849\x7fZS$w\x9b\xc0\x9e$\xf5\
+\xa9\xdb\x86\x01\x98\xd8\xfe\x19\xe2W\x10e\xad\xfd\xac\xdc\
+|\xbe\xd1\xf3\xeb\xfc\xfe\x89\xf4?\xb6\xa9\x07\xe7.\x1b\
+\xb8\x93\x1a\x99\x0a\xb2$\x06\x00\xa4\x02d,\xfb\xaax\
+\x00D\x8b\x1d%\xc4J\xc7\xea&vQ *\x13\x80\
+\x80BQ&`\xeb\x07\x5cDT\x09\x22\xf7`\xa6\x1d\
+3\xdf\x00\x03\xca\x0c\xc7\x1b\x8a\xb8\x0b\xe1jx\x0a\xf7\
+\x197`d\x00\x97\xc6\xa7\xf1\xda\xb7\x9c\xe0\x1a\xf9\x8e\
+zLO\x18\xc0\xcf\xbc\xfe\xb7\x8f=\xfe\x87\xff\xd8[\
+\xf0%\xff\xf8_\x80\xd2\x81B\x04'\xd8,\x07\xfc\xfe\
+\xa7\x7f\x0b\xfe\xd2W\xfe\x13\xad\xec\xb3\x00\xb0\xa6\xc8\x05\
+aN\xee19\xfdZ\xc5\x87\xb6\x82\xafV\xf0q4\
+\xb4g-\xfdG\xbb\xf9|f\x049\x02p&\xaa/\
+\x9d\xf1\xf8\x0e\xca\xed.\xf1\x9f\xebv\x0c\x9dd/\x80\
+\x8b\x031\x07\xbb\x05\x99u\x0f\xea\xb9\x02RJq\x9a\
+\xfeL\x99@\xf2BPb\xb5\x91\x5c\xe4\x16e\x0a\xf3\
+t\xb5\xcc \xecd#\xb60\xe9a'\xdb\xedw\xfe\
+\xe4\x88?\xf5Y\x1b\x1c2\x86\x03\xc70\xc4\x01\xdf\xf1\
+\x0f\x81\xef\xba\xef\x0b\x8f}\xec\xd6y8a\x00O\xdd\
+\xb7w\xec\x09\xbe\xe1M?\x84G^\xfa\x04\x1ez\xcf\
+\x15\xb8@l\xfb\x11\x8f\xfc\xd1w\xe1K\xbf\xe8[\xfd\
+\xe8\x83\xd6\xf4\xd3tI\xad\xdd\xaf\xd1P6\xbe?M\
+\xe0A\x95\xfe%\xcaO\xeds\x0d\xf1Wu\xf92#\
+\xf0\xf0\x9da\x06\xd6\xcd\xe7\xac\xa1\xcf\xb8\xf9j\xeb\xdf\
+\xddv\xb7\xd5M%\x90\x12\xbb\x00\x8e\x11\x09\xa8\xe4\xd7\
+f'C\xa5\x10\xa9\xe6\xe8,\x13H\xd4\xaa\xb90K\
+\x94\xd2bL\xf6.\xad\x91\x01L\xb3\x0c\xf7\x09\xe9\xbd\
+\x0c\x9b\xcb\x9f\xf3F\xf7\x86k\xff*\xbc\xaf\x7f1\x06\
+x\x10\x82{\xc7'p\xcf\xdf\xf9sxh\xf3\x9ec\
+\x1f\xed\xbd\xcd\xe7\x09\x03\xd8,\x87cO0\xf4#_\
+\xff]\x9f\x82\x1f\xf8\x8e\x1f\x11<\x02\xc8\xc3\xef\xc3g\
+\xfd\xb5\xbf\xe2\xaf\xde{\xbd\x0b^zP\xac\xebC\x0d\
+\x7f\xd6\xcf\xaf\xb0?\xb9\xfad\x85X\xbe\xbbGL\xb0\
+\x88\xf2Z\x09\xb8\x81^\xc5\xedg\x8d}\xc6\x0e\xa01\
+\xfd3q\xfceu:\xe2\xbf\x1b\xe6{\xe75%\xee\
+\x9cC`b\x08t\x06\xa2H\xad\xaeJ7\xd6\x98\x81\
+\x08\x12\x8a=\xc00\x01\x12\xa4Pt\x02\xd2e\xbed\
+\xa98\xac\xde\x82\x80\xe8\x158@)G\xbeG\x91\x03\
+\xcfqs\xdf\xf0hx\xdb\x857n\x9fz\xe4\xbb\xc2\
+\x97\xdd\x03\xbch\x04\xfe\xf6\xe5\xbf\x8e\x97o\x7f\x87\x1e\
+\xe3\x99\x06-?\xe9\xcd\x9fT\xef\xd8x\x13\xe7k\xbf\
+\x10 D\x13I7xt\xdb\x0e\x14r\xf4\xc1\x8d\xdd\
+\xe8G?.\x82\x93\xb5P.\x0a\xe5\x0a\x88\x07\x04\xf2\
+\x02\x10/\x04\xf0B\x00\x0f\x22\xaa\x01\xb1\x80\xa7Lj\
+\xf8u$c\x11\xcf\x98\xd2\x8b\x5c\xa5\xd7Y+?\xa3\
+\xc4\xef\xa2\xe4\xf7\xa9p\x87\xa2\x80i\x81N\xedc\xbb\
+5\xcf\x00Z\x82\xb7\xb5\xea\xef2\x83;\xbb\xb5e\xc5\
+\xc2\x180ncM\x81q\x181\x0eq[t\xae\x82\
+\xa6\xf8h\x0a(\x0a\x10\x8c\x22\xa2:\xbd\x86\x01\x1f\x80\
+\xd8C,\x22\xfa4b-\x81\x0f\x01\xf8\xa0\x80\x1f\x88\
+k<*\xe0\x93\x02^\x1b\xe1\xf6\x07t\x9b\x0d\xbbq\
+@\x17\x1c\x02\x96\xb2A\x8fA-\x11\x98\x1f\xe3\x02\xef\
+\xeaq<A\x00\xe2c%\x9fI\xa2\x11\x913\xa0\xb6\
+\xfd\xe8\x86.D\x83\x1f\xd3\x9c}\x94\xa5@v@\xec\
+\x82\xea\xd7\xe7\x05\x88\x5c,\x9f\xab\x9c~;\x1d\xb7g\
+\xaa\xbd\xae\x08K\x89\xbf\x9au\xc7\xd6\xe27A?\x93\
+\xa0\x0c\xe6\xd4\xcdL\xf0-\xe1\x17\xe6P^p\xe9&\
+)/\x1d\x19\xbe=\xef\x98\xc03)\x22j\x7frj\
+e\xe8\x88\x1f\x9eKc)\xdb\x8f,f9\x85\xfb\xde\
+\xc5(Aq\xa5\x0cY\xea\xd9\xc0:j01\x81(\
+\xed\x09\x0f\xc9W\xb1W\xd2\x02#\x0a\xfbo$5\xf9\
+:\x80=B\x0e\x01\x8c\x1e\x01\xc4\xc6u\xb2\xddJ\x8a\
+\x14t\x10\xa1HH\xba\xb3\x94\xf4E\xfb\x10\xd3\xf74\
+e\x00:\x81y\xfb[u\xfd9\xa1H\xce|\xd2\xb9\
+\xd4\x97\x80\xac\x05\xd8\x05\xe5\x02L9oDi\x7f\x01\
+\xac\xe6\xeaS\xd8\x1f\x13#X\x92|\x22\xfag\x1d\xde\
+k#\xb1\xbc+:\xbf\x91\xf8%\xa2/\x1d\x9b\x19\x80\
+k\x18\xc1\x91\xa3xB\xf8\xf9\x9f<\x7f\x98@u\xfd\
+\x99\xfb\x11\xf3\xf7\x84\x13\xd5\x9b\xa7\xa0a\xce \xc3l\
+$3\x9f\xcfK\xabt}\x96Y\x86\xe9\x22\x03\xd0\xa8\
+\xc0\xecB\x84q\x15j\x9c@\x0a!N\xa4NA\x9c\
+\x80\xc4\xbc\xb7\x96\x01\x0c(\xd0?\x09M\xb9H\xe0@\
+\x84[\xc6\xa2\x9bpIe\x10`\xcb\xc8\x04\xe2\xbc\xc3\
+\x22\x12\xab\x8d\x1e5\x06N\xf0\x02dBh\x10\x00\x11\
+k\x18:\x80pb}\x9aj\xf0\xb3:\xbf\x09\xedM\
+3\xf4\xc6\xa9\x96\xed\x5c}\x8bt\xfd\xa4\xf7\x97\xf0\xfe\
+R\xb8\xb3)\xde0\x13\x969\x9b\xc6\x9b\x99\x80\xcb\x0c\
+\xc0\xa9m\x91\xf3\x834\x97\x90B\xd2\xf5$\x15oM\
+/of\xae\xf9g\xb5\x1dG\xf8\x85q\xa5/\xab\xe3\
+\xa6\xfb\x8e\xb8\xc0L\xab{J\xd0L\xf8\x89<\x99F\
+\xde\x7f\xa6\xd2\xdf\x1f\x86\xcdf\x9f:\x9f A\x0b\xa7\
+\xf4\xd1%\x15\x1b\xb5.BE\x01\xe5\x97\xc9\xe8\x00A\
+\xf4*\xae\x93zlC\x87S\xb4\xa0l\x81<]\x88\
+V\xd5v\x88j\x84\x10\x08\x90\x00)\x1e\xf4\xaa\xcd\xbd\
+\xe2\xa3\x93\x81&\x08\x00\x09\x05\xc4R\xde\x00\x9a\xe2\x88\
+\xa2\x95|5\xd8G]|%\xc4WR\x09/K\xfc\
+U\xa8\xaf!f[\xe4Q\xfd\xfc\x99\x09\xe8\xf7&\xb4\
+7\xddd\xe9\xd5H\xfc\x8ei\xc9H\x80\x13\xf8\xaf\xfd\
+\x0f\x89\x5c[g\x8a\xc9e\xa3S\xc5\xd89\x1b\xc1s\
+=\xd0-ji\xf7U\xbf;\xcb\xb4R\x191I3\
+\xb6\x0d\xc1\x93\xcf\x8b\xe7\xbf\x9d\xed\xc8\xe7KB\x0aH\
+a\xc3)\xc5\xa7\xa8\x9d\xccF\xc1t\xa2\xc2\x08\x22\x93\
+$A\xa4\x92\xe3\x86]`\x84\xcc\xe6\x0f\xec\x03\xd8\x10\
+\xc5\xc2W|\x14\x99\xeb\x07D\x19\x9dJ\x8cO\xdfw\
+\x94_' \x80\xa3\x86I\x82\x89D\x0c\xf7\xb1\x0c\xa0\
+\x95\xfc\x97!\x15\x0aP\xe8_\x95\xef&\xb3\xcb\x83\x1a\
+\xa4C\x22Z\xfe\xb3\xc5\xbfq\xf5um\xed~\x85\xff\
+@m\xf0\xabQ\x80\xa7\x83\xa3\x07\xa1\xa8`\xaa\xe2\x88\
+D\xc9\xef\xc4\x15\x7f.\xca  X\xe6\xb7O\xff\xec\
+\xf7\xcfUS\xa2\x8cQg\xf1\x8e*\xe8\x9a\xfe\xce1\
+\xbd\xd3\x9d}f\x0f\x8f\xfa\xf6\x1c\xb5\xa4\x09\xcf1\xd3\
+\xcaE\xe8\x91\xc7T\x86\xff\xe6\x1c\x22Ie\x08\xcc\xe8\
+!!8GR$r\xe68\xe7\x80\xe4\x99\x89\xb5\xc6\
+\xa0\xd6\xcb<\x04\xb0\x01d\xe0\x14\xdc\xab\xdd` 0\
+\xa4\x972\x05~\xba\xb7yeS\x04 \xf3L\x80\x02\
+0R\x80\xfa+\xf3\xa4\x9d(P\xc5\x86\xfb\x9a\x89:\
+3\x030\x13u\xc6\x92^\x91s\x22\xbb\xfb\x9c\xfa\xfc\
+\x8d\xb1\xaf\xb5\x01(\x03\xb0Y|\xf9!Q\xdeM\xc2\
+\x00p\xf4\x99\x11\xd0 \x81\xf2\xc8\x91\xf8\x95\x090\x82\
+\xa9\xda\x06\xf0\x1c\xb7\x8a\xd88\xf3]\xf3ro\xb5\xad\
+bB\xecs\xf7p\xde\xda1jt6\x0a&\xf5G\
+\xf3\x02\xf2q\xc6E\x98\x8b\x8cH\x0e\x0d\xd6\xdf\xa5*\
+\x96\x02\xd1  \x99S\xab\xe5\x10\x911\x8c\xe9\xf2Y\
+\xe2\x03yz\xf2\xe8U\xc8\xa1\x87\xcd\xcd\x0bf\x9d{\
+\x13\x060\x06\xc2\xb9\xe9\x93\x8f\x81\xf0N(u\x8es\
+\xeb\xef\x8f\x0b\xab\xc9:\xa7\xb3\xf6\xc4\x94\xc9\x84\xfa\xe7\
+|\xfd\x8d\x0a\xd0\xd4\xf0\xcb\x95{\xb2\xaf\x1f\xcd\x80L\
+( \xeb\xff\xcc( #\x00\x14\xd4\x90\x8d~I\xf7\
+\x07\xa2\xbe\x16\x10a\x1b\xc9Y\x03X\xe9\xdbg\x07\x05\
+\xd8k\xb4L\xccJ\xf8\xd3\x04:5\x82\xea\x14M*\
+\xd13\xb1A\x1c\xf1\xddykY\x0d\xa2\x9a\x94c-\
+\x01\x0d\x14\x02\x90%\xbf\x0b.2\x01\x9f\x98\x80\x98q\
+\x94g$\x13@\xe8\x08\xa4\x99\xb1+\xdb\xdaN\x22\xfe\
+X6<2\x00I\xeb\xaa\x9a\x10r\x04!\xe9\xc6\x11\
+\xe2\xa6\xd5\xfe\xdc8`t\xbe\xda7a\x00\xf7_>\
+\xc4cW\x97\xb0\xe5\x86D\x88\x87\xef\xdf\xc7\x07\x9e\x5c\
+9H\x8ed\xb2\x08\xc0\x96BV\xe2o\xa5\xff\x02\xc8\
+\xe5\x94\xdd\x1c\xf1\xab\xd5\xbf\xd2\xefs\xfeu\x9b\xd2\x1b\
+_G\x8d\xe6\xed\x16\xcbKb\xb1\x07\xa8\x1a\x10/O\
+(\xf9Zk\xbf\xc6pS\x8e\xf1\x1a<\x0b\xad\x95\xfa\
+Y\x15\xe1\x09k \x81+\xea\xa1\xe5\xef\x91\xcc\xc1\x1a\
+\x12\xe3\xe7\xac\xc2&\x9dR\xd0xHt[\x02\x02k\
+7X\xbd:G\x0c\x81(DL\x14\xc4\x98\x1eQS\
+\x89\x95\xf0\x99\xaaf[\x97av\x0dJ\x99\x8b\x101\
+O \xa0\xe4\x0a\xac$\xce\x17\xa0\xc4\xaf\x0c@\x0b\x88\
+j\x94\xe0\x01\xb2M\x8d^H\xf7\xceO\xf8\xe3x\xc5\
+\xaf\xfe\xbf\x80\x11\x0a\x10\xc1c/\xfeH\x5c\xf9`\x1d\
+\x0b\xd8\xb9f,\x1c\x1cz\x8cA\x1d\xf2\x89\xdd\x04\xe2\
+\xea\x8d\x9e\x8c\x06H/\xa8\xe2\x99\xad\x0a`\x17[\xd8\
+C\x8d~\x1d\x90\xa9/\xfa\xfa\xd5\xe0g\xe3\xfc\xabb\
+\x1e\xd3\xfa}\xd9\x12[\xbd\x185\x00\xd6L\xa0%\x0e\
+\xc7V\x05 ly#+\xf1\xf3u\x84\xf9|\xcf\x89\
+t3\xc4\xaf\xf7o\x11\x8d\xdd\x8e\xee\xcf\xe4\xf3\xc8\x0c\
+!=K\xd3;\x06\x8a\xc2\x98\x13\xd3\xc7\x9a\xc8C\x9a\
+\x13#HDIAF\x8c\x12\x10$`\x94\x11\x94\x90\
+\xe7\xd8\x03\xb2\xc5\xfb|\xb6\x8a/7\xaa\x99I%v\
+\xc1e\xe9o\x89\xdf\xc1!{\x98\x0c\x12\xa0\xd0\x0b\x8c\
+\x87M\xb0\x02\xb1E\x81\xf9\x16\xf6+\xf1\xef\xa1\xd4\xce\
+\xf0 \xf8\xc2w\xfd&}\x18%\xb8bcd\x08\xd8\
+y\xfa\xf1\xc9\xec\xc3\xdd\x9c\xdbh;8\xf4^\xdd_\
+\xc4\xc1\xc6Av@\xa69\xfdh\xa6CFA\x00\xb1\
+\xca\x89\x14\xe3\x9f\x00k\x88,A.X\x92\x1c\xb4\x1e\
+\x87\xb1\xf6\x97u\xa5\xebg\xe2o'\xea\x9c{\x11f\
+\xbb5xq\x861\xc4\x1f\x96\x87N\x1b\x85`\x92\xdd\
+C\x8f#\x9e\xf5\x01\xadj\xbd%\xe2H\xf0\x1e\xdey\
+t\xae\x8b\x0b;t\xe9\xb3\xa3O\x0c\xa1,5:\xe0\
+\xb4\x7f\xf4z\x8dt/D\xaf\x84\x1e0\x86\x11\xa3\x0c\
+\x18\xc2\x88!\x0c\x18d\x88\xeb\x10C\xc8\x95\x09\x18\xfc\
+\xf0\xac\xf4\xd5s\xdaZ\x9b@\x8aa\x11/\x85\x09\x98\
+\xe0:a\x8c\x16t!\xa1\x81Rr<\x99\x15\xd1\x89\
+H\xa4/I\x93\x87\x16\xf8o\xca\x89q\x1feZ\xbc\
+\x0e\xa0\x13\xd01\x8c\xec\xb7[\xd9\xf6\x0b\xe8E\xfd8\
+\x80!L\x19@;\x14D\x88\xc7\xaf\xf6\xb8\xff\xd2\x16\
+\xa4`\x0c\xc4\xbb~\xef\x1e\xbc\xe0\x8f|P'C\xf0\
+\x22\xe8\x09,\xc5\x22\x00\xa9\xca\x1cE\xe9/\x12\x13}\
+Dz\xc4y\xd5\x5c\xa6\xae&\xa9\xc7\xce\xd2\xeb\xf2\xbc\
+m\xa6\xa0\x872\x8d\xd2\xe38\xeb\xe0\xaa\xc2\x83[\x9d\
+Y\x90:G_\x94\x9a\x12\xf3;\x9e\xb6\x19\xab\xeaY\
+Z\x8b&Zu\xa3ejJ\xd0\x9d\xf3\xe8]\x8f\xde\
+/\xb0\xf0\x0b,\x5c\x8f\x85_\xa0O\x0c\xc1\xb3\x83w\
+>2\x0ae\x02\x8d+\xd4\x9e\xbfH\xfeD\xf4\x12\xed\
+\x1f\x99\xf0\xc3\x88Q\x0a\xc1o\xc7\x01\xdb\xb0\xc1f\xdc\
+`\x13\xb6\xe5\xbe\xd3@\x1e\x93\xed\xe4(\xb4d\xf7?\
+\x97*\xd6mi\x16\x05(\xaa\x15W}/\xc9\x99\x97\
+\xbdMj4\x8c\x9d\xa6L\xa0$\x0cI,\x01\xcc\x08\
+UGD\xb5`_b\x8e\x80\xda\xd7:\x01\xe2\x9c\x98\
+Ax\xf9\xa9'\xf1\xe4\xbd\xf7A\x12\xe0^\xed\xef\xe3\
+\xea\xe5it`\xd7\xbe\x22\x11\xf0\xaf\xfe\x99\xf7\xcaw\
+\xfe\xf4\x8b\xd0y\xc1\xb5\xbd\x0eo\xf8\xcc\xf7\xf0\xfd\x8f\
+/S\xb2\x82t\x88E;\x8a\xa5R&*\xc0\x05)\
+\x93v\xda9\xfc\xf2\xdbV\xe9\xaf\xe1\xbc\xf5,\xbd\xa6\
+\x9cWU\xc4\x13-]\xdeD;-\xd5>\xfb\x92\xcb\
+\x1a\x13\xad\xa1\x92\x88\xde\x0cO\x95\xfa=\x16~\x89e\
+\xb7\xc4\xca/\xb1\xf2+,\xbbef\x06\x9d\xeb\x132\
+\xf0\x99\x11\xb4\xf1\x10\x96\xf4T\xc3\x17\x09q\xee\xea$\
+\xedC\x181\xc8\x881\x8c\x89\xf0\xb7\xd8\x86-\x0e\xc7\
+\x0d\x0e\xc7\x83\x888\x86\x83\xea\xfe\x15\xee\x06e\xd2R\
+\x13\xfcd\xbc=K\x06\xd4\xb9f|\xea7\xdf\x14\x19\
+Z\x8d2\x8dU\xe7\x5c\xc9\xed\xd3\xaf\x99\xdc\x85\xa6\x05\
+\x09\x05!\x10:%yonQ\xfbH\x11\xc0\x06\xc0\
+\x1e\x81k\x92ml\xccu\x04(\xc1\xfd\x9b\xff\xea\x0b\
+\xc7\xff\xf4{\xbf\x13\x9b\xc5\x02.\x04\xfc\xec7\xbf\x0b\
+\xaf\xfe\xbb\x0fMpl\xd7\x06\x06\x04\x08\xfe\xe3\xef]\
+\xe6[\xfe\xc6o\xcb\x9b>\xf6{\xf0\x05\xff\xe7\x97\xf0\
+\x0f\xdf\xbf\xf6\xa1\xb6\xfe\x97\x82\x87u\xd4\x92\x8d\xf7\xb7\
+\xae\xbf\x5c\xdaH;\xa8\xf6\xf5\xb3\x9a\x8e)\xbb\xff\xb2\
+\xbb\xaf\x91\xde7\xd1\x8a>\x9b\xb0\xbd\x18\x0d@\x85~\
+\x9a\xd1\xb8\xf4Q\xd9\x9ee\x07\xb7x\xdcZ\xe2\xd7g\
+U\xa2u\x89\x90{\xd7a\xe1\x17\x91\xf0\xbb5v\xba\
+5\xd6\xdd\x1a\xebn\x85\xa5_b\xe9\x97\xe8}\x1f\x11\
+\x82\xeb\x13\x13\xe8&^\x90\xb9\x5c\x88#\xa5~\x18\xb0\
+\x0d[l\xc2\x16\x9b\xf1\x10\x07\xc3!\xf6\x87\x0e>\xc5\
+V\xe4s(zJ\xa5\xb5lM}e\x04\xcf\x81&\
+ud\xbb%\xaf\xafy\x18%~q\x92\x8d\xc8ZY\
+\xc8\x0a/\x0d6\xa30\xc7\x08h\xa4 A\xdf\x84\x0a\
+[^=\x22\xea\xfe\xd7\x01\xec\x10X\x09\x93\x91=U\
+\x13r!\xf8\x97\xff\xc7_\x08?\xfbM\xef\x18\xdf\xf8\
+\x17w\xf0\xea\xdf\xdc\xc7K\xbf\xf1\xcf\xf0\xc2\xb5\xab\x13\
+\xf7`\x9b\x0dH\x12\xf4^\xd0w\x01\xce\x09\xc6\xd1\xb9\
+a\xa0\x1f\x03\x97!`\x07\xc0%\x11\xde\x0f\xe0\x85\x22\
+x\x11\x80\x17\x03x\x181\xe3\xef~\xc4\x18\x80]\x00\
+\xab4\x0bpJ\xf2\x89\xfe8\xe7\x9c\x8b\xd0\xde\xcc\xc8\
+\xd2L\xce\x98\x93~&\xba\x7f\xd4\x03\xc8)YZ#\
+Y\x84\xc9]\xd1\x93\x0d$\xb6F\xc0Y\x09\x98u\xdd\
+\x01C\x22\x801D\x9dW\x89\xc3\x06\x02\xd9\xeb\x9f\xb5\
+\xcdAa\xab\xab[=\xbes\x1dz\xd7c\xe1\x16X\
+uK\xac\xbb5v\xfa\x1d\xec\xf6;\xd8\xe9v\xb1\xd3\
+GF\xb0\xf4\x8a\x04\x16\x91\x01d\xb5\xa0V\x07T\x13\
+\x03\x94\x01\x16\x03\xdf(S\xe2\xdf\x8eE\xf2\xef\x0f\x07\
+\xd8\x1b\xf6\xb0\xb7\xdd\xc3\x8d\xb4\xde\x1f\xf6q0\x1c`\
+\x136\xd8\x86mf *\xdd\xda\x98\x8as\xa9\x06$\
+\xf7\x9f\xcd\x1c\xccY\x81c\xc9\x22\x0cc\xcc \x0c\xdb\
+\x90\xb3\x08\xc7a\xd4L\xc3\x1051Qi?\x00\xd8\
+\x92<@\x84\xfcO\x03x\x0c\xc0\xfb\x01<\x02\xe0\xbd\
+B<\x02\xf0\x03\x02<\x06\xf2jpno\xf4~\xb3\
+],\xc6\xc3\xc52t\xe3\x80\xe5\xc1\x01\xbaaP\x06\
+\x90;\x7f\xa2\x02@\x801\x90a\xeb\xd4\x0e\xe6%\xb0\
+\x93\x18\xa0\xb0\x10\xa1\x86*j\xb4\x92.;\xa8\xab\xfa\
+.\x91\x0b|\xa8\xd5^a|\xf4\x008\xf5\xf97e\
+\xbd\xe7\x89\x1fS\xcb\xff\xec;0\x03\xac\xe8V9\xc8\
+\xa7\x04\xf5H1\x884\x16oQ\x22O\x88@\x9as\
+\xdf\xaa\xa6^\x05K\xfc\x0a\xd1]\x92\xd8\x9e.\x19\xf9\
+\xa2\xe4_\xfa%\xd6\xdd*\x13\xffn\xbf\x1b\x97n\x07\
+\xeb~\x1d\xd5\x81\xc4\x04\xfaF\x1d\xd0\xf3M\x18@6\
+\xfa\x15\xab\xfe\x90`\xff\x10\x06l\xc7\x0d6\xe3\x16\x87\
+\xe3!\x0e\xc6>\x19\x1bK<\x85EM\x1c\xe33l\
+\xb1\x85\x13\x97\x99\x802\x82\xc0\x12j\xfd\x5cGQ\xde\
+\x96\x96ML\xcc\xd9\x83\x9a\x15\xa8\xeegA1\x0eR\
+\x13l\x1c!!\xcd.\x00qD\x0e\x15v$m\x9d\
+\x80-jZ[#z\x0bV\xc9.\xb7\xa4\xc8\xe0\xc7\
+Qxx\xc8~\xb3\x19)\x22.\x04P*x\x0b\x00\
+\xe8,\x22 \x10-\x0d!_\xd4\x89F'\x09\x96b\
+\x08^\xa4\xb9\x89B\xf49\xe47\x9d\xa3\x9c\x9c\x90\x12\
+\xeb\xdf\xaa\x01\xd3Yz\xab\x92^\xb9g\xcd\xbd\x9e\xf0\
+.\x92\x0d;\xa6k\xb2$\xf6\x14\xff\xbe\x9ae\x8b\x84\
+\x0a\x86\xf8\x8b\x9c\xbf}\xa0\xb5%~\x95\xf8\xde\xf9L\
+\xf8\x0a\xe7\x97~\xd9H\xffH\xfc\x17\xfa\x1d\xec\xf4;\
+Xw;X%5@\x19\x80\xa2\x80\x88\x00\x8a-\xa0\
+U\x01\x94@U\xfa+\x02\xd8\x86\x01[\xb7@\xef7\
+\xe8\xc6\x0e~0j\x84}\x0e\xe3\xa1\xd8\xf0\x10>x\
+l\xc36\x22\xa8dGP\x0f\x81e\x02\xb7\xb3\xd5\xa6\
+\xcej\xe7\xd1mF\x22\x9e\xfa\xed\xa7!E\xd4\x93\x92\
+\x02\xc8\xd5\x83\xd5(\x98c\x04l2\x9b#M\xd4i\
+rl\x1b\xf5\xb9\x18\x00\xad\xf0m\xe9pC\x91\x11\x80\
+\xf8qT\xf5!\xe6\x09\xccd\x8bu\x802p\x01b\
+j#A8\x91\x9c\xee\xbb\x80`\x89X\xbakW\xea\
+\x9c\xfeV\xe2k\xb4_\x0f\xa3\xf3\xc7\xa7a\x8c{\xcc\
+\x12\xbd\xf1\xef[w\xdf\x1c\xf1\x133\x03f\x9e\x0dd\
+\x02f\xb1h\xe78~\x0d\xf2\x01\xcd\xa1\x1a\xe4R2\
+\x00#AD\x03\xac\xc8\xf1\xc3\xe0\x99\x0e\xe4\xd6\xcdg\
+\x89~\x91,\xfdK\x9f\x0c~\xdd\x0a;\xdd\x0ev\xfa\
+5v\xfa\xdd\x88\x02\xba\x1d\xac\xfb\x1d\xac\xbb\x15V~\
+UT\x00\xdf\xa3O^\x81\x8e\x1e\xce\xf9&1\xcax\
+\x00D\xa2\xb9YF\x8c!4\x0c`\x8b~L\xaa\x14\
+\xad*e\x98U2N\xf6\xee\x00\x87c\x8f\xc3\xf1\x10\
+\x87\xe3&\xa2\x87\xe4)\x18\xc2\x80\xe4\xef6\xbd~{\
+Z~'\xb3\xe3f\xca\x07d\xe6\x8b\x14\xa5\x97\xfa\xe9\
+t\xf7j\x89_`r0B\x94\xf2N\x5c\xb4\x0f4\
+U\xae\xb4r\x90f\xc55\xd9\xa7\xf3\xf6\xb7D\xf4\x04\
+vD\xb0\x0bb\x9f\xb1\xd8\x88\x1a_\x149\xc4ta\
+\x91\xb1\xa5\x99\x8c\x00\xe2\xf5H\x81V/e\x9b\xee\x1b\
+\xf3\xfaK\xd0\xcfl\x9c?R\xa4_\xee\x10\x1a\xddv\
+\x96\xe0\x9b\x08\xbf*\xe0\x07\xd9RgA\x80}W\xd2\
+\xbe\xb5\xd4\x94\x90\xb3\xb6\x1fPj\xba\x89E\x15\x89\x04\
+\x8c\x1a\xa0\x0c d_\xf8\x049\xdd\xb2\xa6\x84\xaf:\
+\xbfO.\xbeb\xe8[a\xe5\xa3\x91o\xdd\xad\x13\x03\
+Xc\xdd\xef`'!\x015\x02F\xf8\xbf\x98J\xff\
+\xd6\x06\x80\x16\x014\x0c\xc0E#`\xe7:ta@\
+\x17|\xf1(8\x97\x19\x80z%z\xdfc\xe1z,\
+\xfd\x02\xfb~\x89\xfda\x81\x83\xe1\x00\x9d\xdb\xc7\x01=\
+8\x16\x82\xcf\xf1\xf1\xb71PHUMkT\x05P\
+#\xc9\xc91\xb6/\xea/\x94i\x9d\x8a\x09\x18\xaf@\
+f\x02\xce\xdc\x87\xa0\x22z]2}\x08\xa9\xa5\xc5\xd3\
+\xdd\xe8\x99=\xea\xaa\xc2&\x13\x17i\xc6-\x1e \xda\
+\x0c\x84\x22*\xfd\x89\x94.\x8cD\x05J\xed\x80\xda\x00\
+j\x09G\xa0\xba\x90\xb9H\x95\xe5\xa7\x0c\xa0\x8e\xf3\xa7\
+\xc9\xcdS\xbd\xdd\xc2\xfe\x19\x15\xa0\xce\xe9\xaf\x89?\x9e\
+\xe7h\x09\xcb\xfa\xd5\xc5\xb5\x85\xf4\x1av\x896\xb6_\
+o\xb0\x1cY\x85\xb6&F\x90\x8d:\xa9\x8f\xf4\x1a7\
+\xab\xc3\xea\xef[g\xa4\xea\xfc\x1d\xa3\xf4_\xf9%\xd6\
+]2\xf2%\x1d\xdf\x12\xbb2\x83L\xf8\xdd\x12K\xbf\
+@\xef\x16X\xf8\xa4\xfb\xa7\x00\xa1Zj\xcf\xddo$\
+\x18\x0f \x88\x87\x97\x11#=F\x19\xe1S\xa4\xa1\xa7\
+\x87\x0fz\xae.\xc7\x22Dt\x92\x10\xca\xb0\xc6j\xd8\
+\xc7r\xbb\xc4\x9e\xdf\x83\xdf\xfad\x017\x8c\x95q\xb9\
+](\x80y]\x88N\xd1N\x14qs\xbf6nJ\
+Ib0\xed\xd6w|\x16\x0fF\xca\xc7\x99 \x01\xb5\
+\x0bL\x05!K\xc6\xa0c\xf6\xa4d5)^\xd4\xa5\
+z\x82J\x9bU\xedM\x02\x97 \xb2\x11R\x0b\x8d\xe6\
+GBq\x1f\x06\x0aF[\xc0\xc5\xe4\x02\xe8DC\x91\
+\x01H\x9b\xec#\xb8\xc4i\xae\xbfe\x00%\xd2O\xfb\
+v\x8e\xf8\xe7\x1e\xbce\x0eJ\xfc\xc7p\xec\xe3\x9a\xd5\
+\xe7\xed\xe7\xac\xfbO`\xa1\xbep\x95\xf5\xa1\x04\xc4\x1c\
+a\xf5\x8fwv\xf3\xd0?\x0fT\x13\xe0\xe3\x13\xfc_\
+\xf8\x05V\xdd\x0a\xbb\xfd\x0e.,.\xe2b\x7f\x01\x17\
+\x16\x17\xb0\xdb\xefb'\x11\xfe\xca\xaf\xb0R\xdf\xbf\xb1\
+\xfa\xf7\xbe\xcb\xb6\x03\xdf\x10\xffiZ\x0c%\xee@\x19\
+\xe1$En\x19o\x84\xcf(%\x19%\xc7EbV\
+k\xec\x0f\xfb\xd8\x1f\x22\x0a\xe97]\x9e\xd2) z\
+V\x06\x19\x11dD\xa0+\xa8\xaaI\xb2z\xe6\x0c\x81\
+\xc6NT\xd0\xd5\xd1L \x1d\x83$\x17\x99H\xbd\xad\
+\x02\x95\x0cd\xa7\x86-\x8a\x00t\x82\x90TI\x08\x02\
+L\x84\x9d\xa5\x05a\x99\xa1(\xdeUfF\x98\x17\xce\
+\x1a\x8a\xbf\x0f`K\x11e\x00\x99\xe8\x91\xbd\x09\x1c\xf4\
+a\x95\x07\xd4\xc9@\x11\x95\x95t_\xa9\xca{_\x12\
+\xe4\x19~2\x02`a\x00\x1e*\xb3\xe7\x88\xdf\xe8\xf8\
+\xb6twM\xfc\xf1\x0c\xcf\x84\xf8U\xb4\xaa\x0e\x95\x8b\
+yH\xd1\xc7\xe63\xfb\x8c\xff@\xa5\xbdA\x04\xf9\xdc\
+\xb7\xa25\xf0T\x8d\x7f*\xfd#\xfc\x8f:\xfe\xc5\xfe\
+\x02.//\xe1\xe2\xe2\x12.\xf4\xbb\xd8\xe9w\x1a\xa8\
+\xdf\x15W\xdf\x11\xc1?g\x8d\x9f \xa2\xe5:m\x00\
+\x86\x11D\x06\x90\xee3D\xc9\xbf\xf5\x1b\x1c\x8e\x1b\xac\
+\xbb\x15\xf6\xb6K\xf4\xae\xcf\x0c'\xa8K5\x0c\x18\x92\
+{P\x8d\x80\x01\x00h\x98\xeb-\xea_kS9\x92\
+\x09\xe8\x83\xa6\xeb\x0a\xe6\x89\xdf\x8a\xfd\x9baNd=\
+\xf6rI\xb1fQ\x95\xc0&\x0bij\x85*\x1f\x94\
+\xa4\xa2\xab= \x16\xd8Q\x06\x90f\x18\xca\x04\xdf&\
+\x0em\x00q-Mu\xc5\xc0\x86\x98\xab\x5c\x18@\x9b\
+\xee\xab\xf9\xfe6\xdcwG\x80\x15\xeb`\x1f\xe6\x97\xd0\
+p\xb9l\xed\xb7L\xc0\xf8\xf7\x0b\xe1\xdb\xb7s\xb6\x96\
+\xdd\x7f,\x10*\xbfvK\xf8\xac\xde\x7f5\xf8T:\
+Y\xe3_.\x10z\xd6{\xc9\x97\xcbb\xa9\x1a\xa0\x1a\
+\xe4\xa3D\xac\xd6\xfeu\xb7\xc2n\xb7\x83\x0b\x8b\x0b\xb8\
+\xb8\xb8\x14\x99@\x7f1\xb9\xfa\xa2\xe4\xd7\xf8\x86\x92\x10\
+4\xcd\x01\xd0{\xb7\xd7>M\xffYU\xc7\xc1\xc5\xc4\
+-Iv\x0a\x09\xe8]\x9f\x0c\x86#\xb6~\xc0*l\
+\xb0\x1c\x97X\xb8\x1e\xde\xc5\x995\x83\x84\x18@4n\
+c|\xc0\xb8\xc5\xe8\xa27@ 9XH\xcd\x01\xd6\
+.`\xbd/7\x8b\xb4\xa2<\x89}]\xaa\xcd\xce\x9c\
+M\xc7?\x18\xa7\xf5d,\xef\x9d\x88\xe2\x99c\x12\xd6\
+\x95\x94Z\xc1\x98\x89\xdf\xbb,\xb0\xac\x8e\xd8\x18\xef\x15\
+\x05D\xfa\x14\xec\x80Z0$3\x00M\x1e\xd2Ta\
+M\x17&bM\xc2|o]\xee\x00\xe7 c6C\
+\xda\x9a\x7f\x16f\xc4P_\xa9\xa3\xfdD\x8b|\xe4>\
+6(\xc0\xe6\xf87Ss\xcf\xc1\x7f\x80EbMU\
+\xb4S\xb5\x8a\x09@&\x12\xdf\xe8U\xd3\xe3\xe6>\x9f\
+\xe0\x058m\xa3\xfdg\xdcf1\xc2\xaf\xaf\xac\xfd\xd6\
+\xd5w\xa1\xdf\xc5\xc5\xfe\x22...\xe4`\x1f\x85\xf8\
+\x0e\xa6\xdfP\x06|fX\xb7P\xaa*S\xd1\xf8r\
+\x11A\xf0\x01\x8b\x100\x84\xa8\x82x\xc6\xd8\xd71\x8c\
+)l\xf80/\x1b\xbf\xc5 Cr\x07\x0a\xe0\xc6X\
+m\x1e\xa2\xa3<\x9e7#\xd8gp\xbfY\x0c\xa1B\
+\x00V\x05\xc8\x0c\xd2r\x9d$\xf1\x99\x89\x9f\x11\x19\xdc\
+\xcc\xed\x98\xf1[\xd1\xc4\x1c\xfc\xf7\xac&$\xcd\xb7\x94\
+f#J\xef\xb4\x08\xe8\xbap\x88\xad\x170\x99P\x04\
+m4\xae\x815\x9d\xde\x98\xef{l\x87\x030\x06\xee\
+\xcc\x19\x1a\xdap_\xf5\x00\xe4\xfa~\xb0\x08`\x06\xfe\
+\xbb\xe4\xdfw\x8d*\xa0\x1d\x93\x97t\x8f\xf9\x05\xdd\x84\
+\xc5\xf8\xb8\xc1\x7fZb~&D\x7f\xd4\xb1JHu\
+\x84_\x87\x85[d?\xff\xaa[%\x03\xdf\xbaX\xfa\
+{\x0d\xf9]G\xe9\xefRnUB\xac\x19\xb5\x00%\
+\x90I\xd5\x98\xd9H\xbc\xf6\xbe\xd2Z\x89\xc5\x22\xb8\xc2\
+\xd9\xd3\xe7Xt\x92.1\x1a'\x18B\xb13\x8c2\
+b\x13\xb68\x18\x0f\xb1\xee\x0ep\xd0\x1d\xe0`<\xc4\
+6l0\xcaX\x10I \xc64\x8d\x8e2\x85\xb9^\
+;\x93\xb1u\x82 \x15\xee\x17\xe2o\xcfU\xd0\x99@\
+R\xdd>j\xd8x\xc5\x15f:\xee\x98\xfb\x98\x8c_\
+;\xc6M\xd9{qR\xa9\x00\x10d\xfbU\xae#\x98\
+\xdct(S\x8e+}\xaeQ\xea\x05\xd8:\x01:\xa1\
+HC\x9fB\x8aK\xa6\x17A\xa7/\xd5/{ln\
+\xec\x13\x8e\xa4\x22\x00\xce\x16\xfd0q\x00\xb2\x8az\x08\
+k\x15@\x11}\x92\xecY\xfa\x9b\xd9z\xab\xba~\xac\
+\x07[\xf5RnA\xbb\x9d\xfe\xe6\x13.\x5c\x9a\x8e1\
+\xedo\xfa\x94\xc2[\x5c~\xebL\xf4;)\xc6\x7fU\
+\x0c~M\x80\x8f\xcf\xb9\xde\x92\x0b\x99\x06\xe3\xbd\xd0|\
+\xfd1\x19\xdeF\x13\x8dg\x19A\xbe=#%\x9d\xb1\
+\xfck\xf4\xa0w\x1eNJ\x94\x22\x8d}\xc1\x12\xa8\xc2\
+\xfeC\xf3<\x07\xdd\x01\x0e\xc7C\x0ca[\x06\xf6\x18\
+\xaf\xb7\x05\x81\x94J<Z$0\xd3wgmV\x9d\
+,\xb47?\xbe\xca3(\x83LJ\x01qs\xd2\xdf\
+\xde\x07L\x1fY\x04\xd0\xda\x01|\xa9G\xa9EF\x94\
+\xc9\xea\xed\xc0\xa8\x00\x12\xe7\xe0\x5cQ8\x80y\x9e\xc1\
+\x94*\x5ce\x0aj\x5c\x0e\x05\xa0\x13\x0fp\x80\x80\x11\
+\x01\xd0\x11\xddr\x01\x09\x01tt\x12\xc3p:HJ\
+Idv\x05\xeeBr\x10P\x0cA\x04\x16\x10\xe9P\
+\xc2\x153\xc7\xcd\x0f\x99\xa6\xecjk\xfbM,\xffz\
+\xf0\xad\xa3}\x007\xcf\x00\x9e)\x13j\xaf\xabDV\
+,\xe91\xab/\x07\xf8\xa4\x88\xbe\x9d~\x9d\x02{\xd6\
+\x95\xc1/\xda\x09\xa2/^C-\xd4[\xa1\xf9\x0b\xba\
+\xde&\xa3\x9b\xae\x87\x14\xde\x1b\x92\x04\x0e\x15\xccfV\
+%r\xad\x01\x8dBL\xc1D\x9d\x944\xe3N\xfb&\
+u\x8fKU\xea\x05\x92\x10\x8d\xaa2\xd1My\xd8\xaf\
+\xb1\x09\x9b\x18\x08$\x02U\x86\xca\xcb\xd6\xf8\x80\x80\xc0\
+\xa9\xbd\xe5\x99\xbc\x87\xb9#\xe7\xce\xa7D\xda\x1e{\xcb\
+D\x87Ug\x1b&`\xe7\x16\xc8\xbf\xf1\xa5\x92\xb0z\
+\x11Rs(\xe5\xc3\x16(\xb0\xdf\xc2\xff}\xd4\xa5\xf8\
+\x12\x02\x88\x19\xc5\x0e\x0ecrwv\x0a\xcf\x17;+\
+H(\xf9\xc8B\xf1\x8c\xd3v-!U\xc8aa\x00\
+%\x00\xa8\x13\xad\xef\x1f\xc5\xc8\x84\xc3\x95b\x1f&\xc7\
+\xbf5\x02\xde\x86v,\xf1\x97\xf1\x7f\xe4\xb173\xf8\
+\x8eR?\x8a\x84\xd5\x00\x9aEL\xe9MP_c\xfb\
+w\xac\xbb\xaf\xab\x0d~,Z\x16\xb4XG$\xeem\
+\x89\xdc\x1b7\xd8\x84MJ\xde\xd9`3\x1e\xa6T\xde\
+!#\x82`\x88,\xaa%L\xd2\xde\xa3\xf7J\xc4%\
+\x0a1\xa7\x1aK\x07\xb8>\xe7\xbc\xe7\xf2j\xe9<\xea\
+\x22\xd4g[\x8f\xeb\x14\x11\x18=\x00\xf1\xc7\xb6W%\
+?G \xe7=4\x82\x12Z{\xa6\xd6\xfe\xfe\xa8\xcf\
+-\xdc8\xee\xf33o\xaav\xab\xdb\xcf\xea\xfe\x0e.\
+\x97\x0a\xcb\xdf\x87\xf8]S/@\x19\x80u\xf7i\xa8\
+p[\x8a\xcf#\x86\xf5G?\x87\xb8Ho\x82\xa4\x02\
+8\x87\x8b/\xbc\x0f\x1f\xfa\xadwQ\x04\x8e\xacB\x0f\
+m\xd8\xa1\x09\xff\x15;\xb5\x97\x89\x01h\x8c\x1d9\xce\
+\xdfU\xc5?ru_5\x8eh_\x03\xe9\x85g\xd9\
+\xf0\x8c\xfa\x7f\x8e\xb3\x9b/O<\xf6f\x9bq*V\
+\xe7Q\x1b@\xf6\xf7\xfbeE\xfc\xbb)\xbcw'\x85\
+\xf6\xaa\xab\xaf\x18\xfc\xe2YK\xe6^\x94\xf0\x9bq\x9b\
+\x8bt\x1cj\xca\xee\x183\xf4\x0e\x86\xa4\x83WL \
+T\x0c@!\x7f\xbc\xaf\x1e\xcb\x14g\xb0\xee\xd6\xd8v\
+[\xac\xc2\x0ac\xb7\xc4B\x16\xd9\x9e\x00 '\x06\x01\
+\xc8^\x0dE7K\xbf\xc0\xca\xaf\xb0\xd3E\xe9\xaf\xf0\
+?u\x0c4Vc\x0c#\x06\xda\xc27\xa5\x0f+\xf8\
+\xfc\xe1\xd4Z\xa6e\x85\x8dE\x01\xce\xa4\x0b\x039w\
+\x05\x12\x0d\x80\x0c\x86\x9eb_\xa8!\xb0+\x97\x92\xb6\
+X\xc8u\xd4S\xefu\x88\xa5\xc6\x1c\x00\xfa\xd0ct\
+\x1b\x08\x80.\x96\xe2\xf2\xf8\xc1\xd7\x7f\x1b>\xe6\xdf~\
+\x1c\x11}\x85\x1e\x92m\x00-\x03\xb0\xc9?S\x03\xa0\
+y0:\xe4\xe2\x9ey\xe6^_\x8c\x81\x93:\x7fM\
+\x0f\xde*\xbe\x9b\x8d1\xa7<\xe3\xad\x1alsL \
+\xc2\xec\xe8\xf3_\xb8>\xc1\xe45v\xba\x92\xd8\xb3\xdb\
+\x15\xf8\xaf\xd0?\xeb\xdbR&/Q\xc9\xbf1\x92\xfe\
+`<\xc4\x81I\xd7\xdd\x1b\xf6S\xba\xeeAD\x02a\
+\x9bU\x81\x90\xee\xcfA\xe0C\xef \x00\x00 \x00I\
+DATQI\x22\xdc.\xc2\xf7\x9d~\x07\x1bM\xe8\
+\xe9SV_\x17\xf3#l\xf3\xf4\x95\xbf;38\x17\
+\x03\x9a\xb6a\x9b\x8c\x7f\xaaxD\x06\xa6Y\x87\xdb\xb0\
+\x85\x0f\xdbj\x0c\x1c\xc5@\xcf\xf6\x02$M\xc1Q\xce\
+\x1a\xe7\xb7,\x18\xca|c\xff\x98}\xcfl\x14\xce\x06\
+\x90\xa9\xd0se\xac\xe5\xaaA\x09\xfeK\x10\xd03\xe7\
+\x100d5@\x19@Sj\x04\xca\x00\x0e1\x9f\x9f\
+\xa34\xeav\x0f^\x88\xcd\xee;\x00\x02\x9ds\x0e\xdd\
+r\x81+\xaf_\xba\x87>\xee\x95\xb1^\xbf\xc0\x83\xb3\
+\xc9\x07f\xe1\x02\x90\xc6\xf8\xa7\x916\xc6\x08\xa8\xfe\xff\
+d\x08\xd4\x02 \x85\xf81/\x89o\x83\xdd\xee\xb9\x90\
+\x229\x08D}\xc0\x86\xd8\x16\x0a\x93\xbb\x15v\xfau\
+\x09\xf7M\xd2\x7f\xd9-\xb1p\x8b\x94\xcd\x17\xbbX\x0d\
+x\xa3\x84,\xf95O?\x16\xea\xd8\xc7\xfe\xb0\x8f\x1b\
+\xdb\x1b\xb8\x9e\x96\xbd\xed\x0d\xec\xe5|\xfdH\xd0!4\
+\x0c \xc5\x22,\x5c\x9f\xf3\x0d4\x9b/\xa4\x82\x9f\x9a\
+Xe\x0d\x88\x04\x11M\x00E\x8aU*N\x180t\
+CUKA\xa5\xfe61/\x9b^L\xb0\xb8\xc0L\
+\x00\xcd\xe9;\x1cy<\x99M\x88\xf9\xc0\xc4\x18\x9a\x17\
+\x95\xad\x22\x96\xe6\xabax\xd61y\xdc\xef\xf5^\x5c\
+\x8d\x0e\xb3;\xd0\x08H\x18\x1a!\xc9\xe4\x0e\xcc\x04\x9d\
+\x0eW\xff\xbf\x12\xbf5\x00F!\x1dK\xfa\xb9w<\
+\xfc\xa3\xbc\xf7\xc9W\x0b\x10\xd0u\x8b\x05\xee\x7f\xc5\xcb\
+p\xef\xcb\xfe \x9a|m\xe6\x91\xc8\x02\xa42\x00\xbb\
+\xd8\xe9\xbd\x5c&\xf8\xf4`\x95\x11\x90\xcc~\x7fE\x00\
+\xad\xee\x9fu\xa23\xf6\xef\xf3\xbd\xd9D+\xf3\x02k\
+\xf7_\xce\xf1_'W\xdfN\x95\xd8\x13-\xfeJ \
+\x002\x01i\xb1\x8e\x8d\xa9\xd2\xb3\x8f\xbda\x0f7\xb6\
+{\xb8\xb1\xbd\x8ek\x9b\xeb\xb8\xbe\xbd\x8e\xeb\x9b\x1b\xd8\
+\x1b\xf6\x22\x03\x187Y\x0d\xa8U\x80\x12\xde\xab\x16\xfb\
+\xd1\xa8\x09\xf9\x99\xd4\x14\x9d\xdd\x81\x85\xef\xdb\xb2\xeb\x1d\
+=\x16\xae\xc7\xe8\x17&\xc58\xd9,L\x8c\xc0\x81\xef\
+\xab\x14cs\xa1\xb2\xbe\x99\x81a\x19\x81\x8d\xc4\xd3/\
+\xa4\xd4\xc2*\x972\xd2\xffH.p\x0b\x1a\x1bad\
+\xea\x06@\x10\x93\x83<\xa3\xa7\xc4\xa2c\x9a#\xb2~\
+\x0cR\xf5\xc2\xc8\x00TX+\x8d\xe6$=\xc6\x10\x7f\
+\x7fa\xef!\xef\x86\xd50v\x07\xe8^\xf8\xd1\x1f\x83\
+\x9f\xff\x97\xdf\xee\xaf<\xfc\xe2\x9edO\xb2\x07\xf3A\
+\xbd9\xd1\xa29i\x97P\x82\xde\x99$\xf8\xcfB\xd4\
+\x06\xe2+\x1ah\x03\x7f\xac\x0d\xe0\x1c\xb1\x80\xda\xdb^\
+KL5\xb8\xa9\xc4\xd5R^\xea\xee+\xc4\xbfH\xb1\
+\xfd\xde\xb8\xdc\x90\xe0s\xc06\x0c\xd8\x8c\x1b\x1c\x8c\x85\
+\xf8\xf7\xb6\x11\xf2G&p#/{\x83\xaa\x01\x9b\x9c\
+\xa3\xaf:\xb9\xcd\xec[(\x5cO\x84\xe22j)C\
+6\x12\xbd\xab\xdd\x85.\xfa\x96I\xc2\xc3!\xb8\x0e\x9d\
+\x04,\xfc\x98\xeb\x01\xc4\xf5\x80\x8d\xdf\x96\x82%&\x9a\
+\xf1V\xaa\x00\xad\xfd G\xe2A\xd3u\xd5\xabf\xae\
+\x96\xec\x12\xf6\xdav}+Z\xbe\x979& \xa8\xd5\
+\xe2\xa9\x8b\x9c\xc2t\xac\xa4m\xc9V\xe1\x80\x9aF\xad\
+\xa0\xce\xf4L\xb0w\xd2w7\x1e\xfc\x9d\xb0\xfe\xe0\xab\
+B\xf7\xcb?\xf4}\xdd=\x0f\xbf\xa8s}\xd7\xd3\xe5\
+\x14\xe0\x05\xa7\x04_\xd2}K\x8d\xff\xf8PI$\x90\
+IIa\xf3\x00\x16\xce\x98}*\xf6\x8b\xdep\xcb\xfa\
+\xf9\xb9mF\x97\xac\xf5\x7fEsJ8)\x87\xdek\
+\xde\x7f\xf1\xf5\xc7\xa5!\x10\xb0\x94-K\xd6\xfe\xc3q\
+\x83\x83\xe1 2\x80D\xf8\x0a\xfd#\x13\xd8\xcfj\xc1\
+\xc1p\x98\xddq6 '\xc7%HW\xfc\xf4(9\
+\x0a%}\x98P'\x9e\xd6\x15P\xb7\xa1\x87\xc6\x09\xb8\
+\x8c\x00\xc4u\x08\xd2ct#\x06\x9f\x0a\x8b\xfa\x01\x0b\
+\x7f\x88ENW\xf6\xa9\xb6`\x0a.\xaa@\x80!b\
+9\xfb\xf8\xd0\xe3\xaa@\x9c\xf4jj\x06]\x1fc\xa3\
+(oy\x0cI$\xde\x9a\x09(\xf9\xdaj\xc2\x15\x13\
+P\x1a\xcb(\x9b9.(\x0e.k\xb4\x9f\x13\xdef\
+\x9b=\xc5-\x167\xee\x97\xf1\xde\xf7\x0d\xdd\xfa\xf2=\
+K\xd2\xf5\x8enAr\x09V\xc4?C\xf4\x19J\xc4\
+\xe7\xa1Y\x13\x8cD\x8e\x18;NC\xf0\x15\xdc\xd7\x1f\
+\xa3\xe8\x0d\xe7\xbce\xe8IE\x00\xa5\x90F\xac\xf5\xd7\
+c\xa1\x8c`\xa6\x9e\x1f\xe9\xa0\x95\x8b\x82\x8cQ\xfa\x87\
+m2\xf8\x15\x9d\x7f*\xf5\xf7q0\x1eD#a\x8a\
+\xc7\x1fd\xc0\x18j\x15 \xb8\xa2\xdbs,\xf7X\x8a\
+\x88\xa6\xe7\x10\x8dFaF\x0d\xbd\xeb\xd0\xb1\x87\xf7\xc6\
+\xad\xe8\x1c<\x22\x0a\xe8\xfd\x88E*0\xb2\xf0\xdb\x92\
+\xae\x9c\x9e\xadH\x7fe2\xb7\x88\xe8\x92%>\x13\x7f\
+\x22\xe8\xa3\xec\x0a\xb6^\xe1\xad\x0e\xa5\xae\x1a\x0d\x12\x00\
+\x0as\xa3\x11\x9e6>\xc6\xd0\x8e(\x0c\xac\xa3c\x95\
+\x09(#h\x99\xc1\x22\xd9\xec\x122\xe0H\xf1\xc0f\
+\xc7w\xcewk\x92\x1d\xc1\x05@5\x1eh\x95Q\xcb\
+\x04<\xd5\xe8\xa0S{\xe9\xd5\xcd\x0d\xd6\xc4^\xbe+\
+\x9f\xcbr\xbb|\xff\xcf\xe7\xa6:s\x86\xdd,L\xa0\
+\xd7\x94\xdeT]G+\xf0\xe4\xd9g\x13<U\x03`\
+\xac\xd1w\x80=\x95\xfa\x9b\xeb\xd1\xe87D\xe9\xbf\xb7\
+\x8d\x86?\xf5\xc3k]\xff1\x147\xa0 )\x94*\
+\x81B\x22\xfc\xb1\xcd$,s\x06\x80\xc6\xd0\xa7U\x8b\
+\xdc\x08I\x1aa\xc9\x19\x88n\xc2Qz\xf4n\xccE\
+J\xf4\x19#\xb2\xd1*E\xbce\xc3a\x96\x81\x18\xb7\
+\xdcq\x93\xbdZ\xc9\xdf\xfe\xbb\xd5M\xa5\x7f>w\xcb\
+\x04\xd4\xb1n\x98\x815\x9a\xe7;R[n\xf1\x0eX\
+&`lx\x5c\x12\x92\xe6\x1a \x01\x0c\x1d\x1dW\x04\
+; \x16\xfbdd\x02\xd5T\xde(\xdcE-5\xd9\
+*\x91\xa1Ia\xe0\xb3L\x80-\xf5\xdf\x01\xc4?\xb5\
+\x00\xc4F\x05\xd8\x93\xda\x7f\x9a\xdak\xa4\xbf3\xb9\xfc\
+\x82\x14\xf2;f\xfd_+\xf4\xde\xd8\xde\xc0\xb5\xed\xf5\
+(\xf9S\x95\xde\xfd\xe1\x00\x87c\xd2\xfb\xa5\xf6\xffW\
+y\x014>\xf9$\xa9m\xd5?\xeb\xba\xd3\x0cKu\
+c.\xfd\x12\xab\xb0,*\x85\xbeo\x89&ga\xc0\
+\xa8\xcf\xe5\xbbXZ\xccV)r\xd6\x90hm\x00e\
+}\x96\x91b\xd5\x05+\xc1u\x0e\xbf\xb9\x08\xc39C\
+gk\x0f\xb8-\xea\x80\xde\x871\xf2\xb5\x92\xbf&\xfc\
+\xdafF\xbdO\xe6\x8f\xc72\x01F\xef\xdd6\xbdD\
+\x07\xe1\xd0\x11\xdc\x01\xd8!\xea\xfd\xd6\x85P1\x016\
+\xc9>5\xf1\xb7\xb0\xa5\x96\xfe\xd5\xef`^\xa8\xd1\xc9\
+\xceg\x9b3\x02\xaa\x0e=3\xcd\x17Kn\x7f\x97\x0b\
+y\xc4\x00\xa0l\x90\xca\xfe\xf3!\xeb\xff{\xdb\xfdl\
+\xf4\xbb\xbe\xbd\x81\xfd\xed^\x81\xfd\xe3\xa6\xe4\xe1\x9b\x0a\
+G\x93;\xcd\xeaEr\xd1\xe57\x95\xe0p\xb2=\x00\
+\x80\xa7C\xef\xfb\x9c\xb5\xb8\x1d\x07\x8c\x9dQ!\x92D\
+\xf0\x04\x04\xd1\xb6P=\x1f;\x83n\x94\xc1\xb5\xa6\xbe\
+g\xe6\x06\xc8\x858\x1a\x02\xce:7f\x08\xba!r\
+\xdb\xe7\xb7\xa5\xcd\x8c\xff\x1c#`\xe9\xc8\xb8\xcc\xe3\xf7\
+\xca\xa0\x98l\x0a\xc9\xa2\xc0\x09\x13h\x10\x00V\x00\xb6\
+\xf1\x04\xf0\x00\x86\x0e\xe4N$n\xc6\xd4_\x99T\xf7\
+m\x89\x9f\xb9\x13+\x22\xb7\xf0?\xfd\xca\xd5\xdf\xa7'\
+\xcc\x5c,??qn\x99\xc0\xd4\x97]\xfaC\x8dl\
+Zf\xcb\xbbB\x18\xde\xcc\xf3\x17O\xa4\xab\xa4\x02\x88\
+\x1a\x01\x0fp\x90\xdd\x7f\xd1\xe7\x1f%\xffa\xa5\xefW\
+Yx\xf9V\xa6\x84%\x22\x181\xa6b\x14:YH\
+)\x8fF\x10\x9d\xeb\xb0\x1cV8\xe8\x0ec\x5c\x81\x0c\
+1\xc7 \xbf\xc4\xc8\xe0$\x1b\x09C\xac+h\x0a\x97\
+x\x97\x8a\x94j\x81\xd2\x06\x01\xe8#\xdf\x0cN\xcc\xc6\
+\xc3R\xfa\xae\xfa\xee\xb4c\xadB\x10\xb7z\x80\xb6C\
+\xc2\xa8\x03\x8a\x88j\xa9\x9f\x98\x80$\x91\xcftW\xd1\
+\x11\x98xB\xae\x03hQ\x80\x9d\xc9{\x85\xe8*\x8c\
+\x9c\x19\x18;\x82k\xd8\xd9~\x89\x15\xa4\x0a\x22\xa8\xa2\
+\x88`X\xb5\xb5n\xc3r\xaa\x1c\xc0\xc0\xa2\x1e4\x0f\
+\xcdj\xc79\xa5\xfe#\x9a\xb5\xb0k\xfc\xbd\xda\x03\x22\
+\x1a\xf0\xb9\x16_9\xa8\xc0\xd5\xe8K\x1f\xf24]\x1a\
+\xfd\xb7\x9f\x96\x83a?\xfa\xfbe@\x08%\x88\xa7\xd5\
+e[\xe2\xd2\xefs\xc0\xceXf\x0a\xb2.\xc3\x85_\
+`gX\xc7k\x8c\xdb\xca\xa6`n5!\x1d\x0f\xcf\
+\x10\x99[S\x9e<\x161\xa1Q6\xda\x1b\x92\x9bV\
+\x15\xad\x81\xed\x99\x10\xef\xed\x82\xfd\xc0\x11*\x88Q\xa5\
+a\x18\x81U\xa53\x99#\xe2~[\xefE\xe6\x89_\
+\x05\xfa\x1a1Z\x90\xe9\xfb\xa1C\x0c\xef\xf5(\x5c\xa2\
+\x0d#T]BK~\xc5[\xcb\xc4=\x07\xff\xe7\x0c\
+\x82\xac\xe0\xd7\xcd\xf1\xf6\x0f\xff\x96\xd5 F)\xe9\x8d\
+\x1a\xa0\xf6\x00%\x12\x8b\x1c2\xab4p\x5cg.\x8a\
+\x89?\x87f\xd9\xe4(\xbeJ\xd7W8\x8f\xf2\xb9j\
+ROX\x19\x182\x13\x80 \x050\xf5yR\xd0\x18\
+\xe2\xab\xb6\x05\xa9U\x80\xd4\xe23\x16&\xa7\xcfiK\
+\x8b\xeb\xd8\xb8\x1df\xa1\xdbI\xc0\xb7\xaae\x8f@B\
+\x02\xcc\xeb\xda\x86V\x8c\x83\x06\x99(|&\x10\x0d{\
+UU/\x15\xec\x16\x01(\x03\x88\x08\x00\xb1\xde\xbf-\
+1T\xab\x001'\xa0F\x00z\xe3\xd5M\x99\xf5\x11\
+9\xfew\x0a\xcd\x9b0\x80\xaae \x94\x07|Sl\
+\xd3\x94\xdbvlC\xbd\xcb\x194\xf7\x7f\x0cv\xfa\xae\
+2\x85\xd76\x11g\xc9\xff\xb7X\xcb\x10\xbfT\xa7\xad\
+\x8c_\xfa \x81!\xc6\xa5\x83pc\x94\xfe\xca\x5c\x86\
+0V\xb6\x85\xfa)K\xab*\x0b\xe7E\x9f=\xe2!\
+\x85\x91\xf3H\xc0\xa0\xde\xf3\xde\x92\xe4W\xe4l\xe9\x0b\
+&{\x10\x0e\x90\x00\xc4\xd0\x9b\xec\xd9\x98\x83\xff%\xa1\
+O\xb0F):\xde!2\x00\xec \xea\xf9\xb6\xc2\xc8\
+Jb\x1a\xb0\x8d\x01\xa8\x88\xbf\x8cfL\x99\xc0\xc4\x1e\
+P~_\xa3\x80\xf3\xda\x8e\x92:\xa6\xfb\x98\x03i\xab\
+\x0aAE2\xce\x1cM\xb5\xc8#\xc7\xe7\x8f:\x91\xa7\
+\xcea\xa8:\x7f\x86\xe5\x8a\xa2\xcb\x09\xe7\xa4b\x151\
+\x07c\xf8\xd2\xf0\x85\xa4\xfb\xc7\xb9\x12\xe3\xf5\xc2d\xee\
+\xbfy\xc4\x1e\xd1\x8e7\xf6\x0e3S1\xf2\xccq\x93\
+>\x9a\xf6\xe9y\x1a8\x9c|\xac\x02\x84\x14\xf7\xdb\xe0\
+9\x83\xa6%}\xad\x95}\x1a\xcdN\xcb\x86E\x15 \
+N\x1e\xba\x12`\xc38q\xb3C*!\xd61\x16\xf9\
+hK\x0c\xad\x19k\xfdE;\x80@C\xb5\x98\x09\x1e\
+\x9c'|\x1b\xe9g\x8c\x1bG\xf0\xf6s\xdb\x8ec\x01\
+\xc5v\xd2\x12\x7f\xd9>\xee\xccJlV\x1d\xd0IM\
+\x83\x94I9suY9\xe2\x1d\x1c\xf1Jj\xdf7\
+\x01\x09pf\xd2P\x1b\xd7\x9f\xe6N\xd2;:\xf2\xae\
+\xa3\xcb\xb3)ZZ!\xc4\xa3G\xc8y#\xfd\xd8\x8e\
+~\xaa\x82\x14\x1b\xe1\xea\x22\xc5S\x93\x7f\xa9\xd0?\xfe\
+\xb8B\x01\xd3IDV\x00\xb6\x09\xe0yDc\xe0\xd8\
+A\xb8\x8b\xc81\xfa\x14)\xd4\xba\x01\xdbz\x7f\xc5~\
+\x979\x15\x8e\x8ca\xc6D\xf7\xbfS\xda\xf1\xba\xa7\x9a\
+\xbe\xd4\x16P\xcal\xf1\x04\x06P\xce\x9fg\xf3\x815\
+\xd6\x19\xf2\xad\xacCgx\x07I\xa0\xc4\xc3C\xac\x92\
+\x8b2]\xda\xf4\x1a'\xeb\xd9y\x9a\xf3L\xfc&\xca\
+\xf0\x8e\x13\x0f'\xb5\xe2\x01\xc8n@N\x19\x80\x98\x08\
+B\x94\x9a\x81\xea\x0al\xdd\x80\xc5\x03\x80\xcc\x00\x82\xaa\
+\x00\xa9\xc0\x00\x13\x03H\xb5\xfe\xa6\xb9\xc4z\x7fG\x1b\
+\x00M\x91\x8f\xe2\xca\xc8\x8f\x157\xce'K?eK\
+\xd2\xce0G\xfdw\xea:\xfe\xa6\xd0g\x8a\x0e\xaa\x08\
+\xb2\x82\xe4\xb3w0W\xfe\xaa\xfde!\xec2;\x92\
+J\xfb\x99)\xbfO\xf0\x95\xc7\x09G\x92\xceo\xd4\x9f\
+<F\xac\x9e8}\xe0c\xbe;'\xcdv_&\xfe\
+\x02\xf9\xb5&@\xfe\x9c\x85\xef\xac\x99\x93He\xc3\x08\
+, \x5c\x82\xa7b\x00y.\x80*\x08H\xb4\xdc\x97\
+5\x00\xea n\xa7:\x9a\xb3\x05\x14\x0epG\xb5#\
+\xd5\x00\xd3\x1d\xdaG\xce\xf4\xd7Y\xce\xabF>k\xe1\
+\xb7\x92\xf9\xa8\x5c\xba\xd3\xca\x5ck4\x94\xccl`\xae\
+1\xbd\xa7\xa3\x9a2\x81J}\xd4\xbb\xb9\xc3\xc6\xc6Q\
+\xad\x0a^:N\x05\x08\xe9\xb7\x89\x19\x98\xca\xd9\x95!\
+Pb\xc9~E\x00\x95\x0b\x10\x89\x01\xacQ3\x80j\
+\x8ao\x14\x03`5\xe9G\xa6\xe9V\xfa76\x80\xa3\
+\x18{kt:\xcfm\xee\x09U\xeb\xcdk\x83\x06N\
+{\xce\x82\x01\xd4\x17\x5c\xfb\xfa\x93}\x187\xcby-\
+\x8a\xb0v\x01\x8b0\xce\xf2\xfe\x0a\xd2a\xfd\xecG<\
+_y\x86\xf3\xd9\x8e\xa3\x81\xca\xce\xe6\x00\xe8\xbc\x81:\
+u\x87\x93\xc8\x04`\xd3\x9b\xe3\xa1\x00\x9c@\xe6b\x01\
+\x8ee\x00\x95\xce 5\xfc\xf7H\xfc(Y\x93j.\
+~\x94!\xd0H\xff9\xc9v'\x10\xff\xd1-\x9bz\
+\xa0Qp\xa7E\x00\xb1\x15\x12\xc9\xd2\xde@u\x95\xd6\
+\xd18\x843\x15\xd5,\x0c\x05Q\xe2\xb3V\x03\xec5\
+\xf5\xf7\xa7i6\xe2\xaf\x8e\xfc;\xaf$~\x93\xcdv\
+\x8bQ\x07HB\x14\x05\x84\xb4\x1d\x94\xec\x0d\x0b\xa8Q\
+\x80M\x0b\xaeb\x00\x90\x18\xc0\x0a\xf3\x81\x036\x08(\
+\x97\x1e\xe2\xe4\xe6\xa60\xa5u\x01\x9e\xac\xd3\xdeT7\
+=\xff\xdb\x09\xcfU \xb0\x95\x84\xa7'\x06\x85\xff\xf1\
+R5\x19\xe6\xefD\xb2\xaf\xf8lM\xaasX\xf3\x8d\
+E\x18g\x8b\x93/R\x1f(*\xd0\x09\xb7q>\xf9\
+\x83:X\xe6\xa4\xbfJ\xf5V\xc0j\x85\xe0\x19\xdb\x9b\
+A\x13\x95\x0a\x80\x1a\xd9k\x0c\xc0\x84\x01\xd0\x1c\xd0K\
+\x05\xff\xc5\x03L\x08\xa0\x01\xf4J\xdcnj\x10\xb4\x8c\
+\xe1Nn\xea\xad\xa9\x07\xb1\xf9\xc0I\x97\x9e\xf2\xac\xba\
+i\xad\xf0\xd20\x82[A=E\x91\xa8]}\xad\xe1\
+\xefdFP38\x1aib\xf7\x9b\xd3O\xf7\xde1\
+m\x96\x09\x18c`\xa6+N\x0e\x22\xa6L@\x03\x82\
+\xa6\x08@\x22g \xa2\xa1\xcf#\x16\xfalB\x80%\
+\x99\xfa\xca;\x9c\x10zU\xf5\x07\x957\xe0(;\xc0\
+\xdd\xd6\xb6[\xd5I\xb7\x03R\x9dW\x98\xf6<l\x06\
+9\x1f\xc9\x04\x14i\x1b{\x9c\x1e*\x8d!\x10E\x0d\
+P\x9e\xaa\x0c@\xba\xe4\xfbw\x88\x13\x07\xa8\xce\x90\x16\
+\x99\xcc\xf9\x17/b$V\xc3\x08Z\xe60\xfbpw\
+\xdb\x11\xedV\x11\xd9\xed\xe8\xe4\xbb/\xee\xb6\xb7J\x8d\
+O\xbb\x94\x09\xd8IDBCo(j\x00\x8a\xb85\
+\x9e\x00\xe9\x08\xf6@\xae\xe7>\xa6\xed\xa0\xd1\x7f\xad\xd1\
+`Z\x08\xe4(\xf8\xaf\xdcJ#\xff&q\x00\xf3\x9c\
+\xca\x98\x97\xcf\x7f\x9b\xd0N\xfb\xd0g\xed\x84\xf6\x84\xd6\
+\x92p\xfb\xc8\x7f\x02\xe1\x8f\xbd\xa7\xa3\x9a4\xebv\xbf\
+9\xdd\x9d06\xda\xa6\x22<\xd1\x90\x22\x80\x09=5\
+B\xb79\x83\xad\x09\xa04=\xa2P\x9d2\x80<\xbf\
+\xd8\x9c\xe1\xa0\xcd\x01\x98\xbe\xe1\xf6\xa6\x9a8\x80\xea\xa8\
+;T\x80\x1c\xf7\xd8\xd9\xc0\xd6\xee;\xcb\xb9'6\x96\
+c\xf4\xea\x9bj\xc7\x9c\xef\x8c\xf6\x9d\xc9\xb3\xc9\xf1\xfe\
+\x83s?d\x8e\x10\x82d\xa9e\xd02\x82S\xda\xd7\
+,\x13\xb0\x86\xc0\x13\x19\x80\x8d\x078\x1a\x01\xe8\x8d\xd9\
+\xcb\xb5\xd0\xbfA\x08Gv\xc0yn7%\xc5n\xa5\
+\x1a\xf0L\xcdh'\x9f\xe3\x19\xb2\x80\xd3\xdd\xc2\x9d\xd8\
+\x8c2\xaf\xe5\xd6[&0\xa1\xb3r\xa4.\xb6P\xa8\
+E\x00\x1e\x86\x01\xf4\x98\xc2\x86\xae\xd1\xff\xad\x0d\xa0\xd8\
+\x02f \xc9\xc4@x\xc7\xbeAd\x09\xc7\x99\xca4\
+\xb7\xe4\xf4'~\xab\xbf\xb8\xd9\x8b\xdbs\xdc\xcc=<\
+\x83V\xf5\xdd9\x1eC\xc7t`$zdG\x11\x1d\
+cjvKw\xe6\x10\xb3n\xd5\x80\xce|\xa7\x93\x89\
+f\x04\x00L\x18\x00t\x9a0[\x08\x94\xd5%\xf2\xc2\
+\x09\xe1\xe7\x97\xd6\xa2\x85;\xaeE\x0f\xed\x5c$]\x0d\
+\x81\xcfBJ\xc6\xff/\xf6\x9c%)(\x87\xea\xb28\
+\x07\xab\xc99O8{\x15RL\x98\xf3\x86\xea\x9a\xe5\
+\xce\xcfv\xff\xf9\xaf\xd4}2\x17\xcbx'\xb6\x1c!\
+\x98\x18\x80L\x04\xeb\xecA\xfawF\xa0g\x03\xe0\x84\
+\x01\xf4\xe9\x0b\x87Z\x0d\xb0\xf0\xbf\xae\x05P\xe1\x0dF\
+\xfag\xba\xd3\xcc\x99\xa6j\xc2\x9d\x84\x06Z\x02\xd2\x22\
+\x1eb\x88\xb3f\x08\xa7#\xa1\xfc;s\xbc\xcd\x04\xb4\
+\x99\x81Z\xc3O\xdbY\x22\x01\xdbs\x10\xac\xea\x03\xda\
+\xea\xc2\xb8\x89\xfb\x9f>\xbf\xe4\xd4\xe6:\x92\xf1\xce\x8a\
+\x18\xb5\x84\x9f?g\x14 \x15\xadU\xa8\xbb=\x0d\xc0\
+$\xbc[\x04\xe0\xd00\x80\x0eS\xae\xd1F\x00Zy\
+\x9f\x84{#\xed3\xd1\x97\xeb\xdf\x89\xd2\xbf\x95\xe9:\
+\x90\x03\x5c#\xad\xebp\xda3\x5c _\xa7\x0d\xfd\xcd\
+\x8c\x00\x85@)\x0d\x0381\xf2\xae>\x97\x9e\x83\xe4\
+\x04]Ta\xc7\xe6\xde\xce\xf20\x93>A\xca8\x14\
++\xb0\xca3\xdf\x11B$\xeb\xff)\xc2/\x91\x93\xb4\
+t\x96\x84j\x11\xfcU\xb3\x02\xdd\xa3\xbc\x9dL\xfc@\
+L\x17T\x04\x90\x19\x80\x14\xe9\x7f\x04\x020\xe3\x88\xac\
+9\xc3\x84\x11\xe4/\x9fI\x97|X\xb5B\x10b@\
+\xac\xc6\xd0[\x88\x8d\xf49\x1fx\xaa\xb3\xd7?\xd4\xf3\
+\xaa\xd4D\xb9\x86A\x1f\x19N\x9ep\x8d\x8a\xb8\xabs\
+ E\xe7Y\xc65\xbd\x8f\xd36\xfb\xec\x05\x09\xe8N\
+\xa3\x00\x18\x14pG\x10?2\xfdg\xc9\x9e\xcb\x7fg\
+f\xc0Lw\xf9\x0f\xab\xc3\xe7\xd4\x809\x06\x90%=\
+\xcc\x01d\x9c\xfa\xcbr\x90\xe3{>\xddT\x03\x11\x8c\
+\xb0\xb93^\x9c\xb6<P\xc98\x80\xd3^\xa8\xba\x94\
+\xffe\xf3I\xf9\xc9)\xcen\xc0\x989o\x89\xb5 \
+\x91\x0b\x80h\x90H\xf9\xfe\x84W\x998\x16\xc1\xe6\x1c\
+\xa8\xce7w\x0fgy\xcf\xf6\xd9s\x7f\x98\xc1\x9dQ\
+\xb0\x8e\xa5;m\x0c)\xd3U\x16\xd0 \x80I\xf77\
+\x87\xa3\xd0\xb3\x12\xbf\xca\xa2c\x19@\xcb5\x0a\xfcW\
+U\xb0\xb9\xcb,\xe9\xed\xcb\xd3'0\xeb;\xe5\xf5e\
+\xd8\x86X\xf4BRu\x1f\x9fKb\xf9\xaa*\x8e\x16\
+\xc4<5\xf9\xe4n\xb5s\x0c\x96\xf2\xe2\x1d;\x8c\x1c\
+c\xd1\xc8d@\xb7\x95xNs\xfe !\x13\xba\x9e\
+\xa3\x9d\xcc\xa3\x94\xf7:\x22.\xfd\x98\xdbW\xc2\x8e\xf5\
+\x00m\x99\xb0R\x0e]\xfb\x8df\xd8\xdd9L\xc0\x10\
+\xbd~\x92\x86\xbc\xd2\xdfY~.\xb9\x9b[z\xb6\xfb\
+\xa2\x0a\x90\xbe\xc0\xcc\x01-\x028\xe2-3sr\xfd\
+U\xab\x02\xdci@\x80\x8cu\xff\xed\xe7Ng\x02v\
+v\x96\x1c;/\xde\xd1\xec\xdc\x9c9\xbe \x96Y\x85\
+:\xe7\xd1\xa5\x89E\x97~\x81!l\x01\x00^|\x1e\
+=\xb6\x1c\xd7i\x9a\xb5#\xe89:vX\xfa\x05\x96\
+:k\xb1\x99\xd9\xb7T\xf7=\xf9\xfeK\xff0\x95\x19\
+o\xa7F\xeb1\x86\x90\x18XDO\xa7\xaa\x92t^\
+Z\xa4\xfd\xbc\x91\xff\x12\xc8\xfa[\xf6\xba\xcd\x1ej\x07\
+\x92\x12zK\xe3Y_\x9bc\x00-\x13\x98\x17Nl\
+v\xce\xa8\x00\xd5o\xee\x98\xf7\x17\xff\x09%\xd7\xbc\xf3\
+.\xd6\xd3_\xf9\x15\x96~\x85\x95_a\xe1\xcb\x0c\xc0\
+\xdeU5W\x8f9w<\xbfK\x93\x88\xf4>\xcd\xcd\
+\xe7WXwkl\xfa\x0d\x00D\x22J3\xf5\x10\xf5\
+,\xbf\xa7i\x13# bm\xff\xa5_`\xa7\xdf\xc1\
+\xba[\xa7gY\xa2\xf7=\xba\x84\x0aN{\xffD3\
+3\xb2_\xe4\xbe\x19\xc2\x08\x00\xf0\xc1a\x0cf\xb2\x91\
+t\xe6;\xc9#\x10\x09(=\xbf(#`%\x5c\x8f\
+ ,bJ\xcfV\x17=\x92\x01\x00\x85\xe8[\xeb\xbf\
+\x05\xfb\xcde\x0c\xdc7\xdb\xd5}\x9e\xb3\xd6\x0e\xc4\xa2\
+\xc7\x96u\x91\xd2q\x22\xcdU\xb7\xc6\x85~\xb7\x22\xa2\
+\x85_$h}:)\xa7\xe7\xec\xd3\xc4\x9c\xebt\xce\
+m\x92\xfc\x0b\xbf\x88\xb3\xf54\x0c NFz\xba\x97\
+\x11LL\x81e\x00\xbd\xef\xb1\xee\xd6\xb8\xb4\xb8\x84\x0b\
+\xfd.\xd6\xdd:2\x01\xd7g$pR#\xe3d(\
+\x1d\xbbL\xf8\xebn\x8d\x9d~'?\x83\xa7\x8bS\x8e\
+\x053\xa1\xa95rf\x13j\xdd\xff\xe7\xa6\xd9G\x91\
+\xa4TrB^\x0de\xea\x81b?X\xc2\xb7?\xa8\
+\x18@\x1b\xe5g\xb9F+\xfd\x0d\xca\xab\x01\x1f\xa7\xbf\
+:\xb7\xc4\x9f[\xdb\xb5Tx\xee3\xe1\x17\x09\x17\x89\
+u\xb7\xdf\xc5\xc5\xc5\x05\x5cX\xecb\xdd\xaf\xb1JR\
+TQ\xc0qM\x99J\xe7<\x16~\xf1\xff\xb7\xf7\xe6\
+\xc1\xb6\xa5W}\xd8o}{\x9f\xe1\xde7\xf4\xa4\x99\
+\x96Dk\x00\x8c\x00[\xc8\x98\x12H \x0cq\xb0\x8c\
+S\x98!DF@\x22 )\xca!6U\xb8\xcaI\
+*A\x05\x14\x86\x80c3\x08+fH\x8a!\xc6\xc8\
+\x89\xe3\x88`\xca\xa0\x02\x19\x8c#\xb0$$B\x0b\x19\
+\xa4\x96\xe8nM\xdd\xfd\xfa\xbdw\xef=\xf7\x9c\xb3\xf7\
+\xf7\xad\xfc\xb1\xbe\xf5}\xeb\xfb\xf6>\xe7\xbe\xd7}\xdf\
+\xeb\xf7\xee;\xeb\xd6\xbeg\xdc\xfb\xeci\xfd\xd6\xbcV\
+d\xfe\xf3\xe8C\x0f\x100u\x13,\xfd\x12]\xec\xd9\
+/v#e\x10\xb8F\x00H9\x0b\xd1\xe3O\x048\
+j0q-\xe6\xcd\x1c\xe7&\xe7p\xd7\xec.\x9c\x9f\
+\x9c\xc7^\xbb' \xe6\x9ak\xfa\x0d\x95\xfev\xb8\xa8\
+\x00\xd8\x1a\x81\x03\x1c9L\x5c\x8b\xa5_\xc9\xe8\xb1\x02\
+\x08<\xbc\x9dW`\xcf\xfdY\xa6\x82\xafa\x98m\x94\
+\x1d\xd5m0\xa6\x05\x00U\xb8f\x0c\x00\x80\xcdZ\xc0\
+\xf8\xceU\xa8t\xd6\xaf\x87\x95D\x96t\xd0EK-\
+&Mf\xfcy\x1b\xa5\x5c\xbb\x8f\xf3\x93s\xb80\xbb\
+\x88\x0b\x93\x0b8\xd7\xeec\xde\xce1uS4\xd4\x96\
+\x0e\xb5\x0d\xa4\xe3\xb9f\xcd\x0c\xfb\xed>\xfa\xa9\xa8\xcc\
+\xadk\xb1\xdf\xeec\xe5\xd7qhG\x8c\xa3G{;\
+E\x01\xe2\x05\xaa\x7f\x85\xcd?e\xfc\xa01Eh_\
+\x7f\xf1\x03(\xf0\x5c\x98^\xc0~\xbb\x8fY3C\xeb\
+&'j\x00\xea\xb8l\xa8\xc5\xd4M#\x98\xec\xc7\x11\
+c\xe2xT\xd0\x9c\xf4\xc7X\xba%\x96\xfd\x0ak\x92\
+\x19\x84]\xecnd\xe7\x10\x02\x90\x81\x1a\xd7\xd1\xf2\xec\
+\xb6\xa2\xc4\xd2j\x0e\x9cx\x8c\x16.,\xe3\x07\x18\xe7\
+\x9f~\xb95_\x18\xd3\x02\xb63\xbf]\x91\xccs\x0c\
+\x1d\x14g\x8dr\xb2jy\xe3\x09\xa34\x98\xba)\xf6\
+\xda9\xf6\xdb}\xecO\xf6qnr\x0e\xe7'\xe7D\
+\x03\x98\x5c\xc0\x85\xe9\x05\x9c\x9b\x9c\x8bf\xc0$I\xd0\
+m\xa4\x92|\xe2Z\xcc\xdb\x19<+\xf37\x98\xb7\xb3\
+8\x11\xb8O\xea\xbf\xac\x83\xc24\x19\x5c\xa8|@\xe6\
+\xc8lbN\xfem1\x03\xdadz\xe8\xb1\xcd\xdb\x19\
+&\xae\xbd&?C\xd6`&\x98\xb7s\x9c\x0b\xe7\xe0\
+\xed\xd8q7\xc9\xbe\x91^\xfc\x0a\xe8\x11\x07\x9f\xf8t\
+\xcc\xf6\xdc\x9f\xfd\x1c\x01#\xd8\xad#p\xfb\x0a\xb56\
+`\x99\x7f\x14\x00tE\xbb\x01\xfb\xde\xe0\x17\x06\x9f\xd4\
+p\xa1\x8fg\xd4o\x934\x01\xca\xe9\xb2\x8e(\xdf\xe0\
+\x8dQ\xf9'\x17paz\xde\x00\x81<\xdfk\xc5\x0f\
+\xd0P\x0b:\x81\x81\x14\x00Z'L\x08\x00\x0d\x899\
+\xb0\xdf\xaa$\xadf\xf5%\xe7\xec\xc9\xdaE:.\xcb\
+\xfcq;\xd6\xa7\xa1f\xcd\xac\x99a\xde\xce\xa2\x06p\
+2\x00\xc8>\xb8\xa4\x01\xec\xb5\xf34\xbeL\x87\x88N\
+\xdcD\xc6\x87\xc7m\x05fx\xf6\xe8C\x87>\x81\xd8\
+\xf0\xdc\x9fi\xaaM\x00\xfb~\xf9\xa4\xfet\x13\x0f'\
+\xcel7|\xe9d\xc9?f\xf3\xdfi\x14\xcd\x80\x94\
+nKH7\xf8\xa4\x99b\xde\xce\xa2\xda\x7f\x1e\x17g\
+\x17q1\x02\xc0\xb9\xd68\x02\xdby\x94x\x0d\xdcI\
+'\x92\xc4\xcch\xa9\x05\x9al\x0e\xcc\xc3L\x06u&\
+\xe6\x0f#&r\xfc\x7f\xc2Op\xa1\x09\x94\xdb\xd0\x98\
+\xbd\x0d?\xda\xb0\xa6#w\xe2\xbd\xe0 \x009i&\
+\x98\xf3<\x0d\xb4i\xccv\x89DXy\x0e\xe8B\x87\
+\xb5_\xa3qk\x90w\xe9\xbc\x17\xe7\xfeN\xb8\xff\x9e\
+\x1a\xbfY-\xa0~\x0f\x00\xe8Z\x00\xe0d\x1f\x000\
+\xbc\xb36\xfd\xe4Y\xa0*\x9d7\x1d\x1c\xe5\x9by\xe2\
+TU\x9eG\xb5\xff\x1c\xceO.\xa4(\xc0\xbc\x9dc\
+\xde\xcc0\x8d^t\x17\xc7\x81\x9f\xa8\x01\xc0I\xcfE\
+\xce\x123\xf0\xac\xca\xd3\x97}\xca\xa7\xfc\xa9\x9e\xfc\x02\
+:R\x16\xa3\x9d\xefW,\xb8\x16\x0d\x80\xa2Cq\x22\
+\x9d\xeb\x91\xb5\x0bM\x8ebf\xf8\xd0c\xed\xd7X\xf6\
+KL\xdcq\x8e\x92\x90\x1eQy\xee\xcf$\x10\x0c\x9c\
+\x7f\xc5\xc3\xc8\x8b\x8d[\xd9\xb8\xe5m\x00\x90\xe9\x1a|\
+\x0f\x856r\xd6.\xc4V\x92\x93\x93Cn\x1a\xa7o\
+S\xa8.9\x01'\xfb&\x048K\xb9\x00Y\xe5=\
+Y\x82j\x92\x91\x83\x03\x93a\x03\x1e>W\x15\xbe|\
+\xae\xfb<\xba\xf5h\xdae\xb3a\xcc\x84\x18<\x87:\
+\x16\xaf\xe5nth\x88\xc1\xaeM\x9dh,\xf0\x05f\
+\xf4\xa1\xc3\xd2\xaf0\xebc\x9e\x81kc\x06e\xcc\xb1\
+H\xfb\x7fMN\xb1\xdb\x9bFA\xe0\x9a\x1c\x81\xd7D\
+\x16\x00\xea\x95\xaf\xc1\xf97.\xf5mN\xd8Y\x12\xfc\
+5q\xf5(\x14=\xddN\xc2f\x93d+\xcf\xb1\xd7\
+\xcc\x07\x92_\x9c\x7f\xa2\xf6^\xab\xe3t\x94\xe1\xaau\
+\x93'?j\x05\xb9|W?\xad\xb7\x99\xb6\x9c$\xb2\
+\x0d\x1f\x9e\x8a\x9dMzS9\xc9Ku\xfaf\xb6\xeb\
+={\xac\xfd*\xe6\x17L1q\x9a~\x5c\xde\x8ew\
+\x0e\x04\x08\x17\x95\xc0g?\xbd\xe6\xa3\xb7_L\xa7\xad\
+\xdd\xf0\x05J_{Z\xd6\xfe\xa6\xdd>+\xc41\xd6\
+nBR\xa0l+\xc7\xf4\xd6\x89\x9b`\xea\xa6\xe28\
+\x8b\x8f\xd3f\x22v\xb3\x8b\xaa\xf3i1\x99\xd9\x0f}\
+\xc6\xd1)\x18\x8af\x1e\xd5\xf7\xc9\xa8\xe8\xecD\xa39\
+M\xe67\xfb%\xfdc\xc5\xe3A.\xbb\xf5B\xb4\xf9\
+\xa7\xcd\x14\x93f\x82I\xd3\xc6\xf0\xa8\xd6M\x94\xf7\xb0\
+\xea^g\x17\x02h\xb3\x10\xbd\xbeC\xde`L\x94N\
+\xc0\xa7M\x9b\x9d\x04g\x17\x02j\x19$\xc57\xea1\
+w)\xc7]\xf2\x02&rck\x98Kc\xff\xa5\xfc\
+=\xb5=\x0b\x88\xa1\xb3\x98H\xe3u\xbc7\xd8\x98\x03\
+\xaaUj\xbe\x80\x8b\x85K\x8dHi\x96H\xc3\xe9\x90\
+\x81%\xadPdq\xec1\x18\xdeyLc\x18p\x12\
+\x1d\x8b\xa9\xe8\x08#\x85/g\xbc]\xd8v\xa7\xdb\x89\
+_\xb4\x9f\xd6i\xc0\xe9\xb3v\xf8\xfd\x1d\x9dD9i\
+\xa6\xa4\xec,\x8bvzL\x8fmR\xf1\x8f\x16\xd1d\
+\xafy\x1d\x9a;\xad\xdb\xd9\x07\x8f\x9e{I\xa0\x09=\
+z\xee\xe1\x83O\x85>\xf5H\xaf\xbc\xcf1O\x9f[\
+L\x5c\x000\x01\xdc\xe9\x80\x00\x01\x92\xd2j\x00\x8f\xc0\
+ \xd7\x82\xc1\xc5\xf9iT;\x22\x9ba\xb8A\x17a\
+\xdd\xee\x8e\xae\x97Z\x94\xe8\xf0\xb4h\x5c\x19;\x8b\xd2\
+\x7f\x93Y\x93\xd5\xee\x9c\xf5\xd6d\x89\x1a\x8bx\x9a\xb8\
+\xd4\xcc\x7fZ\xc6\x92\x0f\x1e]\xe8R\x08m\x1d\x9f\xf7\
+!\x82\x801\x05\xe2\xde\x0ej\x17&n\x82\xd0L\xf2\
+\xf7N\x09\x04\xf4\xf7\xd2\xf3\xa8\x01\x05\x0aR]\x18\xcf\
+S\xe3\x5c\xb2\xfd\xa9\xb0\xff\xc7\xef\xb0\xb3h\x0a\x5c3\
+?m\xbfmx\xc3s \x9a\x00\xf5\x87\xaa&\xa8\x01\
+b\xf7\xe3:\xcf\xf2Y\xb6\xff\xc7\x89\xd2\x12\x83vE\
+\x9d\xbb\xde\xdcC\xe6\x07\xae\xcb\xa1\xb3\x91\x94\xf9\xd7~\
+\x8d\x95_c\xe5WX\x87\xb5\xc9\xab\xcfZ@v\x04\
+\xe40\x5c\xebr\xa2\x8fg\x8f\xd0\x98|\xc0S\x00\x81\
+\xb1c\xa4\x04\x94\x99\xf9\x93\xe47U\x92g\x8b\xbd\xaf\
+\x85$\xb6\xb4\xe1\xa3\xeb\xdb\xd0\x86\xd7c\x1a\x802\xf9\
+\x89\x9a\xc1\x80\xbd9\xbfO\x11\x93\xcf.m\x0e\xa5\x81\
+\xb2\x06\x90\xe3\xe6\x02\x02\xd7\xdc\x98\xe3z\xf7&e\xcc\
+\xf5X\x87.1\xff\xd2/\xb1\xec\x97X\xf95\xd6a\
+\x1d\xfd\x01\xa1\xc8\xa7\xd7}l\xa2\xb92uS\xf4\xa6\
+\x9e\xc0*\xdf\xecX\xb4\x97SfG\xe7\x1c\x5cp\xf1\
+\x1c5&\x0aa5\x80M\xbfy\xf6\xa4\x7f\xa6Mq\
+\x1bl}\x7f\xc3\x86\x06\xda@\x8b\xadw\xf2\xe0\xd9\xd6\
+\xad\x17?sV\xaf\x87\xa1\xf10`\xa9\x05\xa8\x03\xcb\
+&\xcc<\x1d\xe6).x|\xaaI@\x9e=\xba\xd0\
+\xa3\x8b\xcc\xbe\xf4K\x1c\xf7\xc78\xee\x97Xy\x01\x81\
+\xba\xc4\x16\xc0@\xfd\xef\x9b\xae\xaa'\x88L\xa8\xe1\xba\
+\xd8\xeb`\x0c\xc8\x9e\xea\xb1\x0d\x12\x8c\x90C\x91\x12\x9a\
+\xac\xcfC~<\xd3\xb7\xda\xa8\xec>\x91\xe9y\xcbR\
+li\x1b\x00\x8c\xd1f\x93\xa4\x8e+\xd5\x86\xc3Y$\
+\x8e\x879z\x17R\xf6t\x9b\x1e\x01\xf4t\xa5?g\
+\x10\xd0\x8a\xbd\xc0A\x9c~\xa1G\x17\xd6X\xfa\x950\
+~w\x8cE\xbf\xc0\xa2?\x8eZ\xc0*\xd5\x0b\xf8\x0a\
+\x00\xd4D\x99\xb8\x09\xbaf\x86\xbe\xf5`\xa8\x06`\xe2\
+\xef\xcc\x988\x8eR\x9a\xcb(\xc6\xd3\xf4\xc8\xdb\xb0c\
+9\xf8bd\xbb[\xcf\xfd\x19\xa1\x0d\x8a;o\xfb\xce\
+\xf8Vj\x00\x185\x016\x9d\xca\xf1\xd3\xbb\xcd\xb5p\
+\xc7\xd0\xc9\xca\x93\xbc2 \xf0\xb4~\xcd\xfc\xc5$\x1f\
+\xaf\xcc\x1f=\xfe\xeb\xb0N\xcc\x7f\xd4\x1f\xe1\xa8[`\
+\xd1\x09\x08\xac\xfc2\xf9\x01<\xfb\x0a\x00\x9ad\xff\xcf\
+\x9a9z\xee\xa3\x96P\xedC\xc3`\x0e\xd1S\xdf\x80\
+S\x0a/\xa5;\xe8\xa9k\x01\xe5\xb9\x1a~:~V\
+\xce.\x02\x18zj\xfcfy{\x0c\x00X'\x86l\
+r\xf2\xd1\xc8{y\x0bc\x08eM\x80;\x06\x18\x86\
+\x07z\xa3nI\x06\xe2p\x0e\x1f\x99\xbf\x8f\x92?\xdb\
+\xfd\xca\xfc\x87\xdd\x11\x0e\xd7G8\xea\x8e\xb0\xe8\x17X\
+\xf6\xcb\xaa\xc1\x86H\xf8\xda\xfb?o\xd7\x19\x00\xcc\xb1\
+)\xf8\xc8\xef3Z\xc7h]\x03\x06\xd0\xe0\xc6\xf5\xed\
+;Y\x02\x9dq\xdat\xa8\xbc\xf5\x0b\xdb\xcc\x80B\x03\
+\xb0\x00\xa0lk\xbb\x87\xe8\xe3\x16g`\xfef\xe2}\
+>\xd39\x1a\x15\xdd\xcc\xe0'\xa7\x09:>\xf4\xd1\xe6\
+\x17\xc9\xbf\xecWXzQ\xfb\x8f\xba\x05\x0e\xd7G8\
+\xec\x0e\x04\x04\xfa#,\xfbe\x8c\x06\xc4\x9e\x01\xea\xe4\
+K\xea\xbf\xb4\xe9\xea\xc2\xba\xd4\x10*\xa9\xcc)2 \
+K\x1bK\x18N;k0\x1f\xf1\x18\xddI\x12\xc6\xb0\
+\xe1&\x93{\xb8B-\xfd\xc3\xc8\xfb\xa3\x00@\xc8\xdd\
+C\xea.\x22\xe3w\xba2?#6/\xbc#\x942\
+\x5c\xd7Mx\xc2(\xeck\xdbF\xb6\xfb=\x07\xf4\xb1\
+N~\x1dD\xf2\xaf\xfc\x12\xc7\xfd\x12\x8b\xfe\x18\x8bn\
+\x81\xa3\xa8\x01\x1ct\x078\xea\x8ep\xdc\x1f\xa7p\xa0\
+\xe4\x03\xc8\x1e9h\xed\xc2$\x02@g\xb4\x83\xec \
+t\xa6AT\xfa\x8b\xd9|.V\xf1\xa5\xd3\xf2\xd4\x0f\
+\x11\xd7\xc7\xd8g\xfcN\xb3\x0c\x7f\xed\x0e@\xfb\xdc\xce\
+\x01\xa8A`04\x10([\x84\xd5M\x05\x85\xb7\xcd\
+\x8e\x8c\x02\x925\x01\xce\xf8\xf5\x01\xb0\xc9@2\xaf6\
+\x17\xe1\x5c/q\xa1\x01x\xf4E\xdc_@`\xa9 \
+\xd0/\xa2\x1f \x9a\x01\xddq\xe1\x08\xacM\x00\xad^\
+\x94\xf7s\xf7\xe14\x13\xc0\xe5\xbe\xfd\x1a\xd2\xd4\xb0]\
+`\x86{\x9a\xd7:\x9d#\x1e;S\xd5\xeb;Q\x01\
+H\xafKS~\x8c\x1dG\x96b$\x98~W\xe7\x86\
+\x03Y\xfa[\x13\x80\xaa\x15J\x01\x9f>1*\x00\xc7\
+\x8f\x99\xc1Dy\x14\xd5Y\x04\x02\xc2\xd6Q[ra\
+N\xb8\x91\xaf\x83,\x8ch\xe8\xafg\xf5\x01\x94\xf1\x7f\
+\x05\x82e/\xa1\xc0E\x8c\x08$\x00\x08\x15\x00D\x0d\
+@[ni\x13\xd0\xa9\x9bb\xd6\xac0\xf33\xac\xfd\
+Z\xea\x18B+\x8bk\xe19\xa0M\xbe\x02\x81\xba\xa7\
+n\x06T\xe7\xe6\x04\xad\x89\xd2\xbf3F\x5c\xbeP\x06\
+7S\xd3\xd2\xa8\xb6R\x9eW+f\xa6\x0f\x10>\xbf\
+&\x00\xa8\x93\x80\xe4u}\xa2\xad9\x12\xf7(\xa3D\
+t\x000r\x8e\xf6\x9d\xa2\x0d\xdc`\xd2\x9b\xc0\x82\x80\
+\xe7\x00\x1f\x81@\x1d\x82E*p\x02\x85U\xec\x1b\xd8\
+E'_4\x01\x88\xd0\x86\x16\xa1\x11@h\xa9\xc1\xda\
+O\xb0\xf63\xc9\x224\xa9\xc4}*,\xb2\xdd\x87b\
+\x0f\xc1\xdd5>e\xe2\xc4\xaaI\xc0\xeby.\xb9\xaf\
+$\x9dF?\x94\xfe\xb5\x16\x80\x16@\x8f\x92\xf9k\x7f\
+\x00\xa10\x05F$\x9a5O\x14\xa5\x18\xb1L\xd6d\
+i\xefn\x90S\xa0(i\xcd\xf0N1\x07B\x8c\x0c\
+\xf8\x98\x11\xe8\x0d \xf4\xd2S\xcf\x00C\x0d\x00L\x0c\
+\x904\xe6\xecB\x06\x13\xa9\x1f\xc8L/\xd5\x85y\x04\
+y\x88\xfbP\x89\xa2\x1d=U\xaa\xa4\xb9e\xfc\xda\x1f\
+0\x96z\x83\x12\x19\xac\xf4\xf7\x181\x03\xc6\x00\xa0l\
+\x12J\x83n\xa26+$\xa3\x91\x9a\x02\xc6\x04\x10-\
+@\x1ew\xbc\x7fz\x94m\xe5<J[\x06y\x98\x11\
+\xe1\x86aS\xc80\xfa\x0d\x84\x89}\x02\x00&\x029\
+\x82\x0b\x0e\xde\x85\x94(Tj\x18\xc1\x0c\xe8\xb0\x83:\
+\xee\xbcz\x8f\x1bO\xf1\xbaX\x81\x8a\xca\x04\x88\xff7\
+\x04\x03dM\xda\x08\x02[\x01\xa010\xa4\x80\x10\x90\
+'\x08m\xf8\xb9\xa1\x09\x90C\x81;\xf6?m*T\
+B\xe8\xcd\xa1\x1a\x81m\xebm\xb5\x85P\xbe\x8e\xfe_\
+\x86+4\x8a\xe4h\xb4\xeb\xd7\x0b\xd4Y'[\xd8\x81\
+\xc0\xe9\x92m\xce\x9a^\xb31\x01\xac\xc25<\xf9V\
+\xf5\xf7#\x8b\x01\x00\xe2>\xae$\xde\x7f.6\xad\xcc\
+?\xd0\xef\xf2N\x98\x1b!\xed \x15&@D\x05\xec\
+@\xe0\xe6\xd0f\xe7X\x99\xe3E\x85\xb57\xfc.a\
+\xcb\xc7;\xbaady\xbf`|\x0c_\xa7\x7f\x5c\xac\
+^\xdb\xfd\x1e\x22\xe8=(\x01@\x00\xc4\x07\xd0\xc1\xaa\
+\xff\xea@\x90r\xbez\xbex\xe2s\xa8\x9f!\xed\x00\
+'\x15%\xd5\x01rl\x96y\xe7d\x04\xdd4\x22\xfd\
+\xafM;\x09U\xed\x81v\xe9\x8d#\xb8\x91\x1b\x95\x10\
+98\x0e\xf0#\x19\x8e\x00\x00 \x00IDAT\x08\
+\xf1\xbah' mMf'\x09\xc9\x96\xaa\xba\x86\x94\
+\xaf\x9f\xf7cw\x85O\x91\x92\x9a\x9f\xa5\x7f\xad\x01$\
+\xf3 \x7f\xab\xdeB\xd6\x00(J~\x8a `\x84\xfa\
+\x10\x00\xf2\x87\xce\xbc\x0e\xe5/X\xb8\xd1\x1db\x94*\
+J\x0c\x1e(\xf33\xee\x8c!\x0e7\x81\x12\xd3\x996\
+^:\xfc\xb3n\xd5\x9dK\x90\xe3(o\xe7\xd0\xb0\x03\
+;\x97\xe6\x19h1\x90KM8\xca\xd2e\xfbZ\xc1\
+%e\xfd\xd1\xee\x8a\x9e&q\xe6\xfe(W\x95\xa72\
+\xe3\xdb\xf7\xd2\xf7\xec&\x84j\xe9\xdfCx}\x00\x00\
+kd\xe6\xb7\x89?*\xfdk\xc7A\xb1\x83\xd9\x00\xcd\
+6(\xb1u\x02b\xa7\x05\x9c*\xc5L<S5'\
+q\xfc\xcc\xe4\xb6\xf1\x88\x8c\xe16\x9dv\xa8Ap\x01\
+\x1c\x90|\x00d:\x16\xd9\xf5\xd2\xba\x83\xed\x96e\xbb\
+\x83\xb1c;z\xdad\x81\x80\x0d\x18(\xd3\x8f\xfa\x5c\
+\xc6\xcd\x00\xb5\xfb{\xb3$\xa1n5\x80M\x00\xd0\xc2\
+2\xbf\xe9\x10T;\x86\xea\x9d\x94$\x80\x9d\xd4?M\
+\xd2\xb2\xfc\xdcxT\xb3\xf3\xe2\x84\x1e\xbb\xc4\xf7\xe4\xb3\
+&\xf5\xfacf\xc0\x01!j\x00.\x8e\xeb\x96\xf5\xe2\
+\xd4\x1f\xb2\xdbh\x8a\xed*\x10\x14\xddzi\xa4i\xe7\
+\x8eN\xa6-\x19\x8d\xa5\xf4gp(y,\xf1\x9aY\
+\x05#\xccOY\xfaw\x18\x01\x00\xab\x01\xa8\xbd\x8f\xf8\
+\xba\xc5H\xf2@RM\xcc\xcfZ\xe9_h\x01fl\
+\xd6\xf5\x1c\xfc\x8e\x86\x94\x9bi\xba\xdc\xbd7\xa6\xf0\xf6\
+\xae\x8f\xed\xc7\xb5\x05y\xecB\xecb'b?\x89S\
+\x84|\x01\xd6\x80\xce\xe5k\xe3\x98\xaf\xbc\xce\xd4M0\
+i\xa6i\x80\x89]\x04\x1c\x0c\x10\xa8f\xb2\x03\xfb\xd3\
+!c\x09dS\xa0\x16\xb0\xe5g\x86\xc6\x1c\x80\x0a\x02\
+\x85\x1f`\x13\x00\xc4p\xe0 v8\xd8\xc91\xe9\xaf\
+ \x00F\x1a\xd9$s\xe6w7\xc7\xd3%m\x93\xd5\
+\x90C\x88\x12=\xb5\xff\x8e\x15\x82\xeb\xb6\xc3\xcc\xcb\xf0\
+\x91Y\x9cE\xb0rSL\x9a.\x0f\xe3\x0cTf\x02\
+\xba\x16\x13\x05\x0e7\x8d \x12\xd7of\x98\xc5!\xa0\
+3\x05\x848\xb1\xa7\x89S\x8d\xdd\xce\x17p\xfdd\x83\
+0V\x9e\x9a`\xff&\xedzD\xfa\xa7\xd5\xcdb\xd5\
+\xff\xce,\x05\x00\xac\x90\xd5\xff\x04\x00\x044\x8c\xdak\
+(>\xfe\xfcK\xe3*Ib~\xe4\xb1 \x94\xc2\x81\
+\xdb\x0f~G[\x88\xa2\x8c\xe5X\xa8\xe3Lu@,\
+\xd1\x0d,\xc5A\xabv\x8e\xb9_b\xd9\xcf1k\x97\
+\x98\xf9)\xfa\xd0\x81\x1bY\xc3\x93\x8b\x00\xc0\xc9\x04\x98\
+4\xd3<\xc0$2\xfc\xbc\x9dc\xde\xce0o\xe4q\
+\xd6\xcaH\xb3\xa9S\x10\x88\x93\x8d\xa0m\xc3\x9e\xc1\xf3\
+s\x16Hy\x7f\x84\xd97\x99\xdc\xe3\xa2yT\xfa\xaf\
+Q\xf9\x01\xac\x06\xd0 \x03\x80\xaa\xffu\x0aa\xdc\xfa\
+p\x078\x88\x8d\xc2$\x0b\x915\x05\x90o\x0c\xfb|\
+G\xd7M\xda;O\xa8\x05\x5c6\x0c\x00\x9d\xae\xd3c\
+\x15\xd6\x98\xf7s\xcc\xdb%\x96~\x8eYl\xf2\xc1\x10\
+\x89\xdf\x87\xa6(\x06jc\xe1\xcf\xbc\x9dE\x86\x97\xc1\
+\xa6\xf38\xcel\xaf\xd5\xb1fs\xcc\xe2\x5cC5\x03\
+N\xa3\xd7\xe1\x8e0*\x08\x07\xfc\x15Fx\x0f\x856\
+`}\x00\x81\x84\x7f\x93\xf4'\xe1\xf7\x94\x10\xa4\x1a\x80\
+\x02\x80:\xfc\x14\x00\x0a\x0d Y\xf4\x15JmZ\x92\
+?`wc\x9c*I\xf8\xaf\x89c\xbcr\xf7aP\
+\x1c\xae\xd9\xf6X\xfb\x15V\xed\x1e\x96~\x85=\xbf\x92\
+&\x1f\xc1\x03 4\xde\xa1w}\x09\x00$\xcd@\xe6\
+I\xea\x9b\xa5\xd9\xcb\xcc\xdf\xce0s\xb38\xb6\xcb\xb4\
+\xee\xde]\xe2\xd3\xa3\xca\xb6\x1f\xf0\x96\x01\x82\x9c\x8bc\
+W\x06S\xa1\x01\x90e~\xd5\x02<\xa2\x06\xb0D\x19\
+\xf2S\x00\x98``\x02\x183\xa0rB\xa4\x1ds\x15\
+\x08\xc0h\x02\xbb\x9b\xe4i\x912y\xea\xcc\x13\xb5\x01\
+\xc7\xce\x00@@\xcf\x1dV~\x8e\xb9_a\xcf\xcf\xb1\
+\xf2{X\x87\x0e>\x04\x10\x11ZjR\xcb/\xc0\x02\
+\xc0\x04\xf3F&\x19\xcb2O\x8b\x9a\x02\xb3f\x86\xa9\
+\xd3\x89\xbd\xda\xb57_\xdb\x1d\xd8\x9f\x0em4\xafC\
+~^\x05\xe6\x81a\x04\xa0V\xffW8\x01\x00&(\
+\x01\xc0:\x0c\x02\x90\xbd\x00E\xee\xb8e~5\x03\x5c\
+\xa5\x09`\xa8\x09X\x1f\xc1\x8e\xae\x8d(sZzn\
+\xd5\xef\xd0\x04tAmv\x05\x80\xb5\xd8\xff,\xf6~\
+\xe7\xa4\xb4W\xf3\x00\x1ct\x1e\xc0\x04\xf3v\x8e\xfd\x08\
+\x00\xaa\x01X\xe7\x9f\xce\xeek\xdc\xe9\xcf\x06\xb8\xa3\xc8\
+\x00f\xcd\x03\xa3\xcc\x1fJ\xe6\xdf\x18\x82\x1f\x82\x80\xaa\
+\xff\x16\x00\x12_\xb7\x00\x8eQ\xda\xfc\x0c\x01\x83)2\
+\x82\xd8\x02\x82\x8c:\xaa\x01\x04N9\x83\xca\xfcE3\
+\xb1k9\x19;\x1cx\xcaD\x90\x96^\x0cF\xcby\
+\x12\xf1\xbc\x99a\xd5\xeca\xbf\xed\xe0\x83\x94|\xb4\xd4\
+\x886`z\x02\x16\x1d\x81\xda\x19\xf6\xdb}\x01\x80f\
+/\xd9\xfb2\xaa;{\xfew\xcc\x7f\x03\xa9\xe2\xaf\xc2\
+\xeb\x1fE\xb1f\x06n\xe0\x9b\x00\x90\x07\xb8\x96\xfe\xba\
+\xa4|\x80\x1a\x00zd\x0d`\x1aW\xec\xa9\x0a\x052\
+\xb2}\x9f$|\x94\xfc\x09\x08\x1c\x17&\x81\xa6\x9d*\
+e\xd7\xd5N\x0b8\x0dR\xe7`k\x9a{\xce\xa2#\
+\xaf\xe7\x1e\xcc\x01\x8e\x1c\xa6n:h\x0a\x9a\x01@\xd6\
+\xdbk\xf7pn\xb2\x1f\x9d\x80\x0a\x00m\x15\xf3\xdf\xd1\
+\xd3\xa5m<Ph\xd8A\x18\xbfP\xff\xa3W\xce:\
+\x02uUd\x0d\xa0\x07\x91\x05\x80e\x5c\x0a\x00X \
+\x03\xc04n\xa9A\x89\x14\x83\x5c\x80\x04\x02\xc6\xf3\xaf\
+\x92\x9f)3\x7f\x1d\xdf\xdc\xe5\x02\xdc8\xb2\xed\xbd\xa7\
+\x8d\xa8\xf3}\xe8\x11\xa2\xf9\xd56\x13\xe9\x06\xa4\x00\x10\
+/\x8ed\x15\x9a\xf5\x9a9\xf6'\xfb\xd8o\xf70k\
+\xe7\x98j\xcc?\x02\xc0\x8en\x1c\xd9\x1c\x80\x8df\x80\
+\x05\x02]'\xf3\x99Q\xffI5\x80\x15\x80%\x8b\xb0\
+_\x92\xf1\x03d\x00\xe0\xc2\x04h\x01\xcc\xcc\x17\xcbD\
+\xa0M^\xca\x10\xfd\x83\xee\x848\xe5\x0e\x03n\x08I\
+,\xbej\xf09\xc9\x8e\xbf\x99\x9f\xa1\xaf&\x03I%\
+!\x15f\xc0\xb4\x99\xc6\xd0\x9f\x98\x00\x137I\xd3\x8c\
+w\xd2\xff\x06\x915\x83M\x94m\x10\x02\xdc\x00\x02\x86\
+\x04\x00\x08\x1e\x8c\x1e\xa5\xf4?\x06\xe8\x98\x0b\x00`\x1c\
+!\x87\x00\xbd\x14\xee\xf3\x04\xc0\x1cI\x03 \x01\x01\x8e\
+\xac\xaf;k|\x00\xaa\x05\x80\xb0!^\xb9K\x00\xb8\
+\x19\xe4(\xb6\xf8\xe6I\xec\xf1'\x8e\xbf\x89\x9b`\x9e\
+\xa6\x03\xfb\x94\x04\x04(pP*\x04R\x10\x98\xc5E\
+\x9d~;\xe9\x7f\xf3\xa8`~\xeb\xfd\xafxK\x96\xa4\
+5\xa8R\x17\x00x\x8e\xf6?%\x00\xa0c\x88\xc0O\
+\x8e\xc0\x16\xc0\x11@\x1a\x01\x88\x0dBi\x0a\xe6\x81\xc7\
+\x10\xea\x03\xa8\xd4\x14\x0b\x02\x05\x00\x04\xa3\xa6`\xc7\xfe\
+7\x83\x92/\xc0\xb5\xf1\x9cK\xa1\xd0\xd4M\xe1\xb9\x8f\
+\x92_[z\xe9:Y\x0bp\xb1\xb0(\xd5\x054e\
+\xc8oG7\x9e\xf4\xca\x0cB\x7f6\x0aPh\x01\xb0\
+\x9a\x80\xb1\xffE\x03``\x05\xd01\x01\xc7j\x06 \
+:\xf8[\x80\x16\xc8!@\xf5\xdd\xcf\x00\xda\x08\x00f\
+O\xc1\x81\x93\x13\xc3\x02@\xed\xc1\x84\x01\xa9\xdd\x8dt\
+c\xc9A\xe2\xfa\xe4\xa4f`\x12\xda\xd8\xd3\xcfg\xc7\
+Ru)\xed\xf4\x1f\xad\xff\xb7%\xc2\x0e;\xe9\x7f\xa3\
+\x893\x93T\x12~h\x06l0\xaf\x95\xf9m\x080\
+\x99\x00\x91\xf9\x17\x10m j\x00\x0c\x05\x80)r\x04\
+`\x06\x9b4@EJp\xa1\x05h\xa2O\x02\x03\x97\
+\xa3\x03E\xc2\x82\xee\x9e>\xee0\xe0\x86P\xee\xfa#\
+5\x03\x0d\xc7\xfa\xff\xe4U\x06\x8c\x8c\xd1\xb5\xb2?\x9a\
+2\x18\xa4\x0eA\x9a\xf0\xb3s\xe0\xde8\x1a\xe1\x91Z\
+\x03(L\x82\x81y]l\xc9&\x02%' \x04\x00\
+\x8e\x19\xb4DL\x09V'`\x9d\x03\xa0_\xa8k\x88\
+%\x1dX\x19X\xc3\x0f\xd6c9\xe2\xa4P\x15E#\
+\x07u]\xd0\x8eN\x8fl\xb6\xa0\x83\x8b\x17\xab\x08\x13\
+\x01\x06\x93\xf3z(.\x88\x0dQ\xed\xb2\xfcn,\x15\
+\x92\x1f\xa5\xf0\x1c\xb3\xfd\x07\x09@i\xddQ\xe6\xd7\xf4\
+\xdf\xa8\x05\x90\x9a\x00k\x00}\x0b\xc61\x80&\xda\x0b\
+\x0a\x00{\x18I\x1bDLAP\x0e\xd6\x16_\xcc\x00\
+i\xf8\xcf\xee\x5cJ 6\xea\x0c\x90\xf6\x98M\xbb\xb0\
+\xdb\x92x;\x90\x09S\xd5\x9f\xdex&\x1a\xcb\x16\xbc\
+\xc9\xbb\xf0\x14\xa9\xda\xb1\x13J\x8c\x19\xb8}{\xcd&\
+I\x8a!oT\xe6\xf3\x80\xe9mb~\x81\xe6\xc9\xb3\
+kA\xa0\xce\x018\x86\x98\x03k\x80\xfa\x96\x99\x17D\
+h\xc1\xf0\xf1\x8ei\xe3\x174\x0f\xa0+\x12\x81\x18\x9c\
+z|\xb0\xda\xf4\x06\x85\x0c\xb3\xd7\x1a\x00T[Q\xa1\
+\xa2y\xc5\xb7;\x0dn\xc2a\xd2\x13\x91>\xdb\xd1&\
+\xaa\xcd\x90\xb1O\x13\xdd\xaeB\xa3&\xe3\x1b\x1b+\xfe\
+\x19\xf5\x03\xe8\xe7%\xf3\xab*a\x01\xa0H\x03\xe6\x08\
+\x02\xd1\x17\xb0\x02\xc1\xb7`>f\x90\x98\x00\x92\xb4?\
+\x01%\x07\xe0\x1a@\xcfQ\x0b\xa0\xdc\x17 \xfe$%\
+\x10\x10\x14\x18\xda\xffjs\xeaAR\xf2\x09\xd0\x19H\
+\x01\xbe\x9e\x9d\xdf1\xff\xb5\x10\x99\xff\xd7F\xb7\xab\x0a\
+\x80Q\xa9?0\xa9kS`\xc4\xb7\xc6\x99\xc9\x0a\xe9\
+O\xc2\xbb\xea\x03\x88Z\x00\x1f\x03t\x0c\xc2\x9a\x81\xbe\
+\xe5\xc0\xc7 \xb4D\x08Q\xe7\x9a\x00\x1a\x02$\xeb\x03\
+\xf0,\xf5\xc5\xeaB\x96\xa7\x84\x98\x16\x8c\xc8\xdcT2\
+\x7f\x05\x06\x96en[\xf5m@C 8\x13\x87u\
+\xd3\xa9\xd6\x9c\xc6\xdeU\xba\xad%GAl\xffj\xfb\
+\xber\x02\xd6\xe6A\xb1\x99\xb2\x15X\xe5\x03\xe0\x15\x81\
+V\xa2\xd9\xf3\x92A+\x06\xf7m\xe8\xfb%5\xae\x85\
+sR]*\xe1?]l\x07\x11\x0f f%\xcb\xa4\
+ \xed\x0d\xc0\xc4\xa2\x09\x0c\xd4\x17E/\x80\x93\x0b\xd1\
+ W\xec\x1a\x5c;\xa0n?\x1a\xee\xfc\xd9\xb9=o\
+&\xf1\xe8\xab\xf1sy\x9b\xab\x8fIcG)\xbbC\
+\xcdC\xe3~\x80\x91\x0c\xc0\xd1\x1e\x80\x04t\x9c\xfc\x00\
+,Z\x00\xd1\x92\xc1\xeb\xe0\xa8s\xcb'\xae\xae\xfc\xaa\
+[\x85\x10V`^1x\x0dN\xea\x7f\x07J\x1a\x80\
+]\xbc\xdd\xefd\xdb3x\xe8\x030\x07\xa0\x05\x0dA\
+\xbf\x1fW*6v;\xd1&\xd4\xaao\xe4l\xb3\xdd\
+v\x87x\x93iS\x9e\xc2f\xba\xcd$\x87U\xf5\xe3\
+\xebM*~-\xf9\x8d\xaa_l+\xfe\x1fk\xff\xad\
+\x99\x806\x12\xb0\x06\xc2:\xb8\xb0:\x9auk\xf7Y\
+o\xf8+\xfd\xe5?\xfb\xd8:\xf4\xfd\x9a\x99;0\xd6\
+\x9cB\x80\x9c\x81\xa0\x0c\x09\xcab\x198^\xb6\x8d\xb6\
+K\x95\xb5\x94M\x04\x88\xa6p;\xb2\x06m\xd3^\xaa\
+\x8b\x99^\x87\xb1/\xef\x080\xc3GkI7\x22\x1d\
+\xb6\x9e\xfb[\x9b6\xda\xf9ca\xf4\x91\xc2\x1fN\xac\
+&g\x0a<\xda\xf8\xb3\xe0[\x12~\xee\x00^3\x85\
+\xf5\xe5\x0b\x97\xd6\xf7?q\xce\xbb\xc7\xff\xe8\xc3x\xd5\
+\xb7~mX/\x8e{\x0e\xa1cp\x07Q\x1b\xea\x18\
+\xe2\xda,\x1d\xa4\xd68v\x95\xe0`\xf6\x863\x93c\
+\x08\x02!\x8c\x173\xf0\xe0\x12\xdf\xf2\xb4\xc9F\xcd\xa0\
+\xcdi\x84v0\xd3voK\xb0\xbb\xc1\xa4\xe7*M\
+%\x8e\xafU4\xd4\x1a\xefv\xff\xc0\xadKln\xf4\
+\x13\x99~\xa8\x15\x98\xd3\xc1u\xbc\xdf\xf2k\xbdD\xe6\
+GG\xe0\x9e\xa9\xeb_\xf4\xc9\x17\xf3j\xe2\xe1\xfcz\
+\x8dK\x1f\xfa3\x5cz\xf8c\x9e\x99\xa3\x1a\xc1=e\
+\xf5_7\xb2D\xd9T@\x11F[\xcb\x18_$\xe7\
+\xfae]<#\xf8\x80\xe0\xeb\x03\xb6\xce\x8c\x0dW\xf9\
+\x96\xa4m\xea\xbf\x5c\xb0\x10\xafW\x1e\xd7\x9dA`G\
+%e\xe6\xcf#\xcdu\xe4\xf9F- \xd1-|\xa3\
+l\xd8\xb51\xe6\x17\xfe\x08\x89_\x06\xf6~f\x93b\
+\xe2\x0f\x8b\xa6nyS\x13}\x8ad>\x09\xe7\xb3_\
+\xee}\xccwM\x87@\x0c\xc7>\xa0_\xad\xf1\xe4\xaf\
+\xac\x02\x83\xed\x10\xc1\x9a\xf9S*!2\x18\xa4D!\
+F\x1c\x1ao\x0f01\x7f0\x92?\x14Z\x00\xc2\x06\
+\xd1\x7f\x9bB|\xbeUE\xddO\xcc\x1f\xb4w\xbf\xdf\
+\x01\xc0\x08\x15 \x19\x8c\xb6d\xb5\x80\x0d\xeb\xde\xb2\xb7\
+\xc8\x86{8\xf9\xcd\x8c\x90\x0cVP\x8e\xe6\xfd\xeb\xba\
+\x09\x0dm\xae\x7fU\xf2\x9b\xf85\x0bi\xc0\x8b\xa9\xc0\
+\xe1\xf9\x8f|53\x05\x80\x18-\x87\x80\xe0=\xbe\xfa\
+W\xde\xa4\xfb\xa6\x13E#\x08\xf0\x0a\x92;\xac\xcc?\
+\x83t\x13\xb6\xd5!\x0cI'&k\xe3\x8b\xa2\x12\xc0\
+\x81\x10|\x88Yq\xd2'\xcc\xc5\xba#6\xa5\xc5\xb7\
+O\xae\xf9\xa6>F\xea\x91\x89\x1a\x80\x0e\xec\x08>?\
+\xc6E\x0bnv\x84tn\xfa\xe0\xe1C\x8f\x9e\xfbx\
+\xce\x02\x02j\xb3\xe96\x81\x81*}\x9a\xc9\x08\xba\x82\
+?\x22\xc3G\xe9\x1fB\x90\xe7\x09\x00\x90\xbf\x1b\xd7F\
+\x95\xe9G\x99\xf1\x17\xd8\x22\xa4\xe3z\xe1x\xff\x91\x18\
+\x83\x07Zf\xf9\xf1+\x9fx\x0cD\xc4D\x08\x94\xe3\
+\x88\x1a>\xd0f\x02G\x90\xa2\xa1\x06%\xbe\xc9\xb8:\
+\xc0\x09\x5c\xc5Ta\xa3\xda\xc8\xec\xb8\x90\x87\x0b\xc0\xc1\
+!\x80\xc9\xc9g\x8ak\x84[\xeeZ\xd6\x14s\x9e\x06\
+\xf7\xa2 \xbb\x5c,\x95`zc\xf7\xa1\x97\x85\xe5\xd1\
+\x91\x03\xc52\xdb;\x99\xf29\x92s\xd3\xe9yR\xb0\
+T\xc7`\xc9\x04%\xd1\xady\xcb\x8c\xa6~%\xe7\x1f\
+\x0a\x0d9\xa4E\xf8%\x81\x80:\xcb\x01kdW\xfc\
+\x99\xea\xfc\x17\x00\x8eP\x02\x80\xed\xea%\x06\xba[C\
+]\x88-8\x80\x19X\x1f\x1f\x83\x9cc\x101\x88\xac\
+sa\x09\xc21\x01\x0b\x80\x8f\x00L\x99\xd1 v\x92\
+\x02\xa7\xa9B\xd2YX\xf6\x99\x0a\x1b\x87\xe2AR\xee\
+\x13\xca\x0409\xb0\x93\xec\xc0\xbaH8\xb7\xbe\xe6[\
+;\xe4[i-ru\xa2C+\xe4\x9b\xbb\x0b\x1d\xd6\
+a\x8d\xb5\x9f\x16\xad\xb5\x1a\xd7\xde\xb1\x9a\x80J~9\
+7\x1d:\xbfF\x17:t\xa1C\x1f\xa4uY\x08\xbe\
+p\x06\x16t\xdbh\x8c%qD\x006\x1a\x800~\
+\xf6\x93\x85\xc2\x04H~\x00\x81\x8f\xb2\xdb\x8f\x95\xfeG\
+\xc8@ \xe9\xbeI\x03\xa0\x00p\x90\xe2\xae>\xf1U\
+\xcb\xcc@\x10?\x009\x82d\x04\x0a\xc2\x10%\xdb\xe2\
+8n|\x0f\xc0\x84dl\x98N\x12j@\xa9\xa3P\
+H\x87h\xfa\x05\x06b\xf9\xfd\xd8n\x04\x04\xc0\x13\xc8\
+\xf4\x0e\xd4,\xc2t\x95\x8d\x0au\xebz\xcde\xef\xac\
+\xfc\xb1\xb6\xbf\xe7>\xde\xd0k\xac\xbd,+\xb7J\xcc\
+\x1f8\xa0\xe5\x80\xe0\xee\x9c\xe9:\xd9)\x9a\xc1q\x1d\
+:\xac\xfc\x0aK\xbf\xc2\xca\xaf\xe4\x5cE\x00\xe8S\xfb\
+\xb2:z2<\xf7\xb74\x19\xc9\x9f\xc2\x7fF\xfd\x17\
+S\x5c\x9d\x80\xd9Of\x98_)@\xb8\xa7g\xb0U\
+\xff\x8f\xe2r\x88R\x0b\xb0&\x00\x83I\x5c\x01j\x02\
+\xa8Z\xd5\xaf\xd7p\xce1@LTT\x12-\x91\xd1\
+e\x0ei\x1c\xd2\x920|\xcb\x84\x96r7\xa1\x9c\x18\
+\xa0a\xc0\xa02\xd1\xc9\xc5\x87(\x19L\xe2\x1bHZ\
+\x82\xcb\x18\x7f\xbb0\x81*&\xb5\x0e\x10\x98\xe19K\
+\xfe\x95_c\xe9W\x98\xf6\xcb\x82\xf9}\xe3\xd1\x866\
+5\xdeH @n\x18Z4\xffo}\xb2W0\xab\
+o\x89\xf1\xa3\xc3\xaf\x0f^\xd4\xfex~\x96\xfdR\x16\
+\xbf\xc2\xda\xaf\x12\x08\x04\xf6\xa8\xc3\xa7\xe3\xe7\xfe\xd6$\
+NW/G\x88\x0a\xef\x7f\xd4\x00\xd8\x87\x18-\xe3\x1c\
+-3\x89@\xc8\xcf<\x80\x8e@\xc2\x9f\x94\xf8\xf3\x10\
+\x19\x00b\xe3\x8f\xe4\x08\x0cPC\x9b|\xda\xb3V\x7f\
+\xc0w=\x88\x88A\x83n\x22\x16\x00f\x88\x00\x10\x1f\
+'$>\x81\xdc3@\xb4\xf9\xb4\xe3\xda(4\x04\xd1\
+\x02\x1c\x01!\x00\x14\x08!\x04Pa\x17 ]U\xe6\
+\xdcA\xf8\xa9\x01\xc2\xcd\xd2\x1b\xf2>rd~\x99\xce\
+\x13U[\xbf\xc6\xd2/q\xdc-\xd0R\x03\x00q~\
+_\x87\xa9\x9f\xa6>\xfbMt\x0a\x0a\x00\x94\xcd7o\
+/\xe6W*\xaf\x9a:F\xbd\xf1\xf6\xfb 6\x7f\xa7\
+\x1a@\xbf\xc4Q\xb7\xc0qw\x9c@\xa0\x0b]\x9ab\
+\xa4a\xf0\xbc\xe5[\x98\xfd\x19e\xb9\xaf>Z\x1f@\
+r\x92\xcbc\x08,N\xc0\x10\x86y\x00\xb2\xbe\xc8\xd0\
+\xec\x00T\xed\xfc$\x000N@b\xa6\x8c(\xad\xee\
+\x19'/}\x11b\xb0\xea\xbf2\xbf\xaa\xfe\x13\x08\xf3\
+\xcf\x01\x9aC\xc2\x0c\x89\xf9\x09\x94\xe6\x03\x88a \x0e\
+\xbf\xd42|C\xb2\xc3`\x8a\xb0\x12\x8d>\xad\xcfy\
+\xb1B>\xff\xa7\xcc<\xb1\x00J\xb7\x9en\xc8xQ\
+E\xfa\x8b\xe4?\xf6KL\xbb\x05Z\x92S\xdd\xb3\xc7\
+\xda\xafb\xaf\xfd\xdcn\xbbq\x0e\xce\xf4\xdd/#\x22\
+\xc6\x11t\x9b\x90\x96?+)\xf3\x8a\x06\xe0\x11BH\
+\x0e\xd1\x0c\x94+\x1cw\xc78\xec\x0eq\xd4-\xb0\xf4\
+K\xac\xfd:\xb61\x0fY\x1aB\xe1E\xce\xbdmZ\
+rK\x91\xb9f\xa3\xf9\xfc\x86\x07\xea\xd0_\xfe\x0c\xea\
+\xba\xd3-j\x94n\x0d.\xf8\xf3\x00\xc0\xd5\xf8x\x80\
+\xd2\x0f`\xdb\xfa\x15;\xd6&ha\x16\x13\x80\xd9j\
+\x00K\x00\x0b\x16FW\xc9\x9fg\x08\x08(\xec\x01\xd8\
+7?\xc0z\xc0\xe9\xb7\xf4gI\x1c\x81V\xfa\xeb\x09\
+\xc8\xc8hf\x07D \x18\x8e\x14\x1b?\xd7\xb5*\x9e\
+\xfb\x16\xdc ?\x82\x02\x81\x89\x5cp\x0c\xfdu^\xa4\
+\xdaqw\x8c&J\xfe\x9e{,\xfd*v\xda\x8d\xd3\
+u]\x13;\xeeF\x13\x004\xd0\x00\xe2\xd1\x9c\xfe\xfe\
+\xdf@\x1a\xdb\x7f\x09\x8drR\xe9s\x84D\x9c\x80\xeb\
+\xe8\x078\xea\x168\xea\x0e\xb1\xe8\x8e\xb1\xf2+t>\
+N2\xd2\x1b\xc9\x5c\xd7[\x92\xf1k\xe2\xf2\xfe\xd6\xfc\
+\x97avl(\xc1@#\x1f%\xfag\x01MI;\
+?D\x06\x00\x05\x81C\x94\x00\x10\x1b\xfe\x103\x85$\
+\xc0Z\xbb\xd9hW\xd9R\xc2\x15\x80\xe3h\xef\x8b\xe7\
+_\x0a\xffZ$\xe6\xa7s\xc8#\x87\x03\xc3\xb4\xfd\x8a\
+\x19\x81\xaa\xe2\x87\x008\xe2\xcc\xfc\xb5&\xe0\xaa\x89\xc2\
+\x86\xf9\xd3\xff\x0d\xd7\xbc\x08\x14\x98\xa8\x82z;o\x04\
+\x08\x10(uE\x02\xd4\xc1\xc5\xc9\xb3\xbd\xecW\x89\xf9\
+={\xac\xfd:I~m\xb5m\xed\x7f\xed\xe8\xbb1\
+\x1f\xe2vQ\x03\xcc\xfe\xdb\xeb\xc2\xac\xe9\xbd\xd9\x17\xe0\
+M\x884\x83\xc0\x12\x8b\xee\x18\x8b~\x81e\xbf\x8c\x83\
+M}\xca\xac\x94\xed\x96\xe7\xfe\x96$V\x8f\x7f\xd6\x00\
+\xec\xf3R\xe2\x1b\x10\xd0\xef\x06\x13\xfb\xe0\xa4\x07\xd6\xfc\
+\xa9\x00\xa0\xcc\x7f\x05\x19\x00\x16H\x00@F\x03\xc8\xd4\
+\x12\xec}\xa5\xc6\x01\x0b\xc2\x88\x8a\xe1\x90e\x1cA&\
+\xd2OY$\xff9\x94vF\x1a\x22jmy\xfb\xb3\
+\x85\x090\xda?\xd0\x8c\x11\x8bwO\xea\xa6\xa3\x8f\xfa\
+Yu\xb2\x13%\xed\x5cv\xe2FHO\xb5\xf9\xeb\x1b\
+P\xbd\xff\xeb\xd0\xc1\xf9%\x80\xc8\xfca\x8desl\
+\xd4\xfe6\xaa\xfd.6\xdfti\xcc\xf7&\x00\xb8M\
+\xd8\x7f\xb3\x89\x96\xcc\x80\x18)At\x08\x06\x8f\xde8\
+M\xd7~\x9d|\x02\xcb\xe8\x07\xf0f\x9aq\xfe\x9d\xa7\
+\xe3#\xba\x81dMOF\xc9\xf8\xd5}\x1f\x8c\xc4/\
+B\x7f\xaa\x01\xc4\xed\x19}\xda:\xe8\xd5\xfeW\x0d\xe0\
+\x0a\x13)\x10\xd8H\x80\x9a\x00L\xeaN\x88\xa7\xac\x15\
+\x01\x19O\xa4\xb0\xbf\x0e\x16\xecP^K\xe2\x9c\xca7\
+\x85\xa8\xfd\x17Pz\x1a=\x18\x81)q^\x0e\xe3)\
+\xb4l\xb2\xff\xb5\xd3\x00!#{\xd2\xeb\x93\xa5\x87\x8d\
+}\xe2\xd2\x9b\x0c\xcd\xd2\x91~\x03\xb1e\x19\x016\x19\
+\xeb\xe9P\x92>f\xde\xa1vGfb\xf4\xc1C\xca\
+(\xe2\xb8\xee\xd0a\xd5\xac\xd0\xba\x09Z*=\xfe\xd6\
+\xe9G4\xd0wn\x1b\xa6\xdfD\xe51D?\xb8\xf1\
+\x07\xa8V\x90\x22\x03\xea\x17\xf017 tq\x9cY\
+ni>\xb8\x03F\xcc\xc4g\x8cT\xea\xebs\xe3\x0c\
+\x1f\xdc\xfb\x1b\x04!\xac\xb6\x90\xcf^\x00\x17%\xbf\x9a\
+\xfa\xbb\x00p\xc8\xc0Ud\xe6\xb7\xa1\xc0\xa2\xb5?'\
+\xe9\x19M\x00J\x97H\xc4uD\x88\x00\x99\x06\x14\x0f\
+Ce\xa9t\x9a\x060'\xf9Q\xfd\x91\xd4?\x10)\
+\xe7X\xcc\x8b\x94\x02\x99\xfc\x00\x9bOD\x88\xf3\xeb\x89\
+(\x99\x03iw\xa9B\xfc-\x1a\x802\xbb\xbe\xc9\xf6\
+\x18O\x93\xa5F\xee\xb9\xc0\x01\x04\xa0\x0b\xd1\x1f\x10<\
+\xd6\xaeC\xe3-\xe3\xcb\x08/\x07\x8a\x80V\xb6\xe5\x1e\
+\xdf\xf8\xed\x06\x05\xe3\x9e\x1a\xf5e1\xb2_@\x1eC\
+\x11&\xcc)\xd4\xbd\x99f\x14\xb6o\xfeV\xa2Z\xf2\
+\x8f\xdc\xeb\xb5\xc7?\xa6\x063\x07\xa6A\x01PY\xef\
+_\xe7\xe7\x1c\x02\xa4\x11\x80C\x00\x87Ld\x13\x81<\
+\x80 \x1b\xa5\xe2Fj\xe5e\xbc\x01\xe3Uq@ \
+\x05k2\xe5:\x92\xf9\xd72\xb0\x0f\xda\x98w\xbcF\
+\xac\x0b\x80d\x06\xc6\xe3\x90X\x06\xb3\x1c\x9c\xaa<\xae\
+F@\x0a`\x8a\x8c\x90`'\xef0%\xa6\xa9\xce7\
+E\x95#I\xff\xf4\xe6\x0d\xb1\x9d\xc7$\x8e\xa2\xb5\xe7\
+ \x98\xe7\x03\x1cy\xb8 M\xba\xa5\xc7>\xa1\xd6h\
+d{\xf9\xff\xd9'#\xd7\xd8\x80\x81\x02\x023\xb4\x12\
+P\xe3\xff9\x1b0\xfb\x00nE:I\xed\x97\x5c\xff\
+Z\x08f\xbb\xdf\x94\xfd\xe60\xd3\xb0\xc5W\xd5\xe7\x1f\
+\x0b\x90\x00\x01\x13\x1d\x018\x8e\x00`[\xfa\x9b\xc1>\
+\xf9\xdc\xb5\xc5\x89\x14|`\xc7\x08\x8d$\x0dr \x84\
+@\x8c@\xa0\x004 \x9e\x028\x06cA\x84\x05\x0f\
+A`\x05q\x18*\xdeG\x01NY\x15r\x0a\x02\x01\
+!\x10\xc8\x93d!\x06JY\x83D\x928D\x8e\xc1\
+l%\xa3\xdd\xfd|\x8e\x94\x81D\xe3\xb0\xe7\xee\xe6\x92\
+\x22\xb7g\x0f\x22\x92G\xdd\xcf\x8d\x11\x8d[\xf3f\xbe\
+\xf14\xf4\xce$s\xd1|\xaa\xe7\xf4F\xf8rN\x95\
+\xd4\xcc\x1da\xfeT\xe6\x9bb\xfd#>0\xeb\xe5\x04\
+\x98\xe5\xc0\x03\x11Y\x95\xdf\x16\xe6E\x1f\x00\x15\xc2\x98\
+\x89\x96L\xb4\x0e\xce\xf5L\xe4\x89\x99]\x08\xba\x87\x05\
+\xb5T\xbdE\x0cLz\xc7\xe7\xd6\x8e[O\xbc\x9c\x84\
+\xb0\x9c0\xfa&\x10\x13Z6;\xc2\xc5N\xa4e\x02\
+\xc0\xc5\x0b\x19\xa0\xd1\x03y\x8f\x08Du\x9f\x00&F\
+p\xa1P\xf1e\xa45G[;2\xb5\x09\x8f\x95\x8e\
+22aRM\x11-\xaf\xcb\xcd\xb4\xa7\xf5\x1a\x16*\
+kuS\xefh\x9c,X\x0e\xde\xbb\x8dh\x8c\xf9S\
+\xaa\xaf/\x01A\x05#\xa4\x86&\xfaI\x8d\xc7\x9fS\
+\xc8\xaf\xe65e|\x05\x86\x15\x80\x15\x13\xad}\xd3t\
+\xddt\xe2W\xd3Yh}\x8f\xd9r\x85\xb6\xef\x85\x97\
+\x0c\xb5\x8e\x8b\x93\xcb\x14\x80\x8b\xc7-~\xed\xc7\xff\x1d\
+\xe3\x8f.\xf2\xcf~\xcb\x97\xe3\x17_\xf3q\x1c\xce\xd9\
+y\xe2\x0e\xa05\x88W#;\xa4\xb5\x02\xaa\xfe\xeb\x01\
+L\x00\xb4\xa2\xd3\x90S/\xbf=9Du\xc8O\x9e\
+\x85h\x0a\xd8\x92\xe1R\x8a\x96\x1a@\x9eRX\xd2\xcd\
+v\xa6%50\xf9 \xea\xd7\xf9\xffp]\xfbQ\xf2\
+\x82\xde~J\xc2\x86c\xd8|\x18\xf6\xaa\x8ex\xf7o\
+%G\xdf\x06\xaa\x9d\x7fcL_/\x05\x08\xe4\xab_\
+u\xfba\xad\xf8\xb3\xb9\xfe\xea\x7fK\xda7\x83\xd6L\
+\xd41Q\xbf\x9a\xcd\xfcG\xbe\xfb7\xfd7|\xdd9\
+|\xee\x1f,\xf0\xd6\xff\xfa+\xe8\xc2\xc1\x81n?\xd1\
+@\x03h\x98\xf0\xaf~\xe2/\xf3\xb3_z\x05\x13O\
+\xf8\xce7=\x88o\xff\xf5\x17\x87w}\xc6\x93\x9e\xc0\
+=\x88\xebi#6\x0dq\x0e\xa0\xa9tp\xfd\x05\x89\
+ \xd4N\x11\xd2r\xe1\xbc\x86Z\xc8Z3\x00\x22\x0c\
+s>\xc80v\xc5\xe2j\xff\xa7]x\xe6\xc82\xff\
+\x80\xfd7\xf8&\x86\xfa\x0b\xe2y\xb9=hxT\xf1\
+*\xf1\x86\xabA\x16\xb8#\x94\xf3m\x10\xe7\x1f\xb9\xc5\
+r\x0c\x1f\x85\x96\x9b\x98\xbe\xcf\x80\x904`\xe3\xf5G\
+i\xf3\xd7\xe5\xbe\xd6\xd1\x97@\x80d\xe8\xc7\x9a\xc0=\
+\x83\xfa\xe0\x9c\xff\xc8\xab\xfeB\xf8\x92\xef|)\xfe\xec\
+\xc5/\xc2#/\x0cx\xf8\xbb~\x83?\xeb\xfb_M\
+\xd1\x14H\xd4\xd6W\xc4\x05\xe2s?\xf96<\xf7\xf2\
+\x1c\xc4\xc0\xb4w\xf8G\xdf\xf8\x01~\xcd\xbb\x9e\x1fX\
+Q\x89\xd0q\x99\x87|\x08\x09\x0bN\x01\xb8\xea^%\
+H\xee\x80-\x19\x16t\xa4*/\x81\x0d\xfa\xc7h\x80\
+s\x12\x11\x88\xc9\xd3\x18A\x82\x0dW\x86\xab\xe7\xcfL\
+P\xad\x0c\x19\xca~\xa4\xff#\xf1~F\x19\xc1\xd0\xad\
+\xd8\x87[\x9d\xb2P\xa9\x8e\xe1z4\x80\xdb@\xe2\x17\
+\x87\xc7yQ\x86\x0e\xa6\xc2/\xf4\x01\xde\xfb\xa16\x90\
+\xaa\xfe\xd2vj\x00\x10\x1ec\x1c\x80\x06\x99~1\xdf\
+\x9fW`\xea M|\x02;\x0a_\xf9s\xbf\xc4\x97\
+\x9eu/\x82\x93\xc2\xb2/\xfd[/\x01S-\xee\x81\
+\xb6>\xc7\x8e\x81g_\x9da\xe2%\x97\xbe\x09\x84\x17\
+|\xe4\x22\x5c\xa0\x00\x89\x08xN\xdeH^\x028\x02\
+\xe1\x10\xc0\x1e\x03Spj\x16\xa2\x9a\xbce\xfc\x16\x00\
+\xb3\xa4\xe5\x09JB:\xe7\x14\xba\x02\x80@b\x1a\x04\
+\xe7\xe0\x9cx&\x13Hr%\xe4\xb7]\x98g\x8ab\
+\xcc4\x9a>\x95M\x9b\xff\x1b\x9f\x17\x923\x93\xcc\xe7\
+\xb7#m\x0ce\xe6\xf7\xb7}\xa5\xac%\xbc\x16\xc0\xbf\
+u\xa8\x96\xfe\xca\xe8\xde\xfbB\xfa'G`\x8az$\
+\x1b\x80\x01\xf4\x04\xea\x18\xbc$\x91\xfee\xaa/G\x00\
+\xa0a\xc1\x0f1\x87@\x8e/\xdf{7\xfa6'\xfa\
+\x1e\xef\xed\x81\x1d\xe5\x92\xfcHm\xcd+.\x10f\x9d\
+C#3\x80\xe0\x08\xd8_5h\x02Ii\x02I\xd3\
+P\x00+.s\x91\xa5TXB\x85\x96\xf1[\x92\xd1\
+cZK\xd0\xea}\xceA\xc2;d\xfb\x00 :\x01\
+)\xc09Bh\x02Bp\xa0\x10#\x02\x81S3\xb2\
+\xccH\xc6u:\xbc$[m\xee\x1bA)5\xb8R\
+ai\x04\xb1R\xf82\xaeyg\xd1II][\xbf\
+u\xeb\x90\xb1\xf9\xf5y\x0a\xf7\x8d\xd8\xfe\xaa\xfe\x87`\
+\x0a\x9c\xf2MjZ}Q\x99\xeb\xcfI\x03\x90d\x1f\
+\xce\x05?D\xdc1K\xba/7\xc4\xddd\x8a@.\
+\x9f\xcb\x16\xe2\x82\xaf\x9d\x80\xc1\x95o<\xe7\xea\x0c\x8f\
+\xdd\xb5\xca7+3\xa6\xec\xf0\x99\x1f?\xcf\xff\xee\xe5\
+\x97\x98\xc1\x9e\xc9t\x0b*\xab\x05\xb5XH$\xbe)\
+\x1b\xd6\x85\xc1\x9e\x98\x9cJF\x86 \xa6m\x16&\x92\
+? 4\x0e\xceK\x84\xc09\x97|\x06\x99\x97K\xb5\
+\xbep\xba\xc5e30\xdcx\x1a\xcbX\x1b~g\xc3\
+\x07;\xbau\xc9\xda\xfc\xc8L_\xc4\xfc}N\xf6)\
+<\xff\x95\xf4\xd7u\xa3j\x9b\x93}\x08+\xf0\xd6b\
+\x1f-\xf9\x95$<FO$\x85\x16\x8f\xbe\xe4\xd3\xf8\
+\xc2\xe5\x83<}\x1b@p\x0e\x07\xf7^\xc4\xb3>\xf6\
+Xq(\xcd\x0b^\xfb\x82\xe2\x8dG\xee[\x22\xe6\x00\
+\x18=\x9e\xf0\xd0s\x16\x88\xc9yZ\x0e\xac\x05B)\
+\xccgVI\x000\x90\xfe\x84\x86rJ\xf1@\xf2\xab\
+\xed/\xdd\x89\xa2\x1f@\xd3e5i&\xaa\xc8\x5c\xae\
+\x5c\x5c\x9d\xca\xa2\xd8\xd1\x8eN\x87\xd8\x88\x95\xca\xe6O\
+\x19~\xca\xe8}\xc8\x8b\x86\x02\xc3\x88\xe7_6\xe7y\
+$\xc5\x17\xb9\xc0G\x17\xab\x05X X\x02X\x13\xa1\
+\x7f\xf6\xa3\x8f\x85\xe0$l\xae\x0b\x83p\xf1\xc9\xab\x08\
+mS\x1cN\x8b\x8a\xa6\xbd\xcb\x8d\x0c\xccAOzB\
+\x10g\xfcX\xb7 [*\xac\xcc?\x01HK\x86\xe7\
+\xf1\xb1\x83\x84\x04\xc5O\xc0pV\x0b`\x88c\x90b\
+rPp\x01\xc1\x05x\xe7\xc5\x16!\xf5\xa6\x8b_\x80\
+\x88bfAm`\xefX\x7fG7\x98\x8c\xe4\xae\xb3\
+\xfc\x0a\x95?\x84\xd1\xc4\x1f\xc9\xf7O\x1b\x93\xb0\x1f\x17\
+U~\xd2\xe9\x87S\x84m\x9c\xf19\xfa\x00(\x96\xe3\
+\x07\xb0o\x86\x1d\xa5@\x80o\x86\xbd'\x07\x00\xa0\xa9\
+\xc1\xd6\x5c\xa5\xe8t\x0b\x8e\xd9q*J\xd0P\xe0\x02\
+\xb1K0\xa9\x06\x00j@\x98\x80\xb5aHZf\xe0\
+\xd4TDX\x95\x98\x88\x89$\x01\x92\xa9v\xa0\x08\xf3\
+k\xe2\x8fq\x9a8\x07j\x8c\xb60p\x16\xed@`\
+GO\x93j.2\x12{\xb4\xb2o,\xce\xefk\xc6\
+\x8f\x9bHJ\x043\x86\xa3\xbdr\x84\x8dphl\x7f\
+\xd1\x028\x15\xfc\xc4\x1c\x00\xee\x22x\x04bfvM\
+\xddC \x1e\xcf\xd0\xd4\x1c\x02\x006\xb0\x0eC4\x00\
+1\xde\xe3\xe4QZF\x87^\x92\xbb\xf1'D\x03 \
+\xcc\xc1\xa9a\xc8>\x044l[\xf1\x16\x0c\xc7\xc4\x82\
+\x031\x07:\x15\x06\xf9l\x0a\xf4\xe8\xd1\xa0\xc9\x00\xd0\
+\xb04\xcfp\xb1\x83\x8e\x82\x80\xb9p\xd9\x17\xb0\xa3\x1d\
+]'\xa5[):t\xad\xaf\xa9\xb2\xf7G\x13}\xfa\
+a\xb2O\xe1\xf1GN\xf5E9\xe2\xcb\xe6\xf9k\xa7\
+\x9f\x03$\xe6\xe7\xab\x00\x0eX\xc3\x80R\xb2\xbf&\xed\
+\xc9\x19\x98\xb9\x19\xf7*\x8dE\xcd\x06\x00\xc0\xb5mm\
+\xceH \x86\x93.~\x1e2?0\xf3\x5c\xe4\xb6\x18\
+\xdd\xce\x0dC\x08\xfb\x90\xbe\x01\xfb\xd0H\x01'\x7f\x01\
+ \xe1A\x17\x91\x87\xc0@\x08\xd2A\x98\x88\xe4\xb4\xc4\
+\x0b\xc0\xcch\xd8\x80\x00;\xb8\x86A\x88\x95u\x11,\
+\xc0\xf9`\xcb\x08\xc0\x0e\x0cvt\xed\xb45\xfa\x105\
+\xd5\x22\xd3\xaf\xdf\x22\xfd\x93\xb7\x9f\x95M\x95\xf9\x03t\
+\x8a/a\xc5\x5c0\xbfq\xfe\xf1U\x00W\xb9\x8c\x00\
+\xc4\x1c\x00\xf4L\xf0$\xd3\xb96\xef\xf3\xc8G\x03\x00\
+\xd0C\xaf\xbf+\x22\xde!\x1eB\x88\x0e\x0b\xc4\x00^\
+\x00\x10\x03\x87 \xc8\xe4 m\x17v\x0e5\x00\x94\x83\
+E\xe26Y\xfc\x07\x11\x04\x98c\x86`\xfa\x91\x8c\xa0\
+\x8e\x1d\x1av`4`rp\x04\x80\x1c4_(Z\
+\x0b\x03\xb6\xdf\xb1\xff\x8e\x9e\x0a\x15\x021\xda\xfc\xc9\xae\
+W\xc9\xdfg\xc9_k\x03\xa5\xf4Oji9\xddG\
+Z\xf0/\x89\xb0\x04\xc7\x0a\xbf\x04\x02|\x00\xe0*s\
+\xb4\xff\x99\x8f\x98\xb1\x04s9\x9f\x93\x10\x1d\x0b\xfc\xd4\
+M\x80\x10G\x03\x15' Iy\xe1\xcd\x00\xd2\xdc\xa5\
+@\x80'\xb0w$\xb3\x01c\xde\xdb\x84\x80=\x80\xcf\
+\xc9\x01\xe0<2\x00\xb41W\xc0\x9c\xd2\xb8\x1f92\
+(f\x00$E\x98{s\x02\x93\x0a\xc5\xb2_\xea\xa0\
+ 9@\xe92L\xc5\xc6\xe5\xc9\x8e\xfdwt}4\
+`\xfc\xb2d7\x87\xf9\xfa0*\xfd\x0b\xe7\x1f'\xfb\
+?\xb08\xfdzT\xad\xf7\xa0\x92\x9fpD,\xd2\x9f\
+\xc1\x07 \x1c\x80q\x08\xf0!3\x8e\x10x\xc1\xcc+\
+\x0e\xdc\xb1\x0c\xf4er\x14\x9c\x8bQ\xfe\xc0\xe3\xf7;\
+k\x7f\xbeL\x03\x00\xe8\xc9\x15\xf1C=\xfa\x00\x80\x98\
+8\x00\xe8\xa8\x0d+\x9a\x22\x80\xfc\x84\xbd\x9f\xa0\xf3-\
+\xfb\xd0P\x00\x18\x0d\x81g\x90&\x05\xe7\x00V5f\
+\x0f\xa2\x15h\xd8\xd0\x0afN\xba\x03\x0b[kZ@\
+@n`\x98\x9aG\xe8\xaaT/\x14\xf3\x05J\xb0\xdb\
+\xb1\xfe\x8e\xae\x9b\xea@X\xed\xf43I>\xb5\x16P\
+\x94\xff\x96\xdd}D\xf2sb~\xed\x9fa[{\x8b\
+\xd4\x17\xe7\xdf0\xf7\x9f\xc3\x22\xf8p\xdcw\xbe\xeb\x96\
+\xeb\xbe_v\xecZ\x87\xe9\xfe\x0c\x93\xd9\x84A\xc4\xe4\
+\xfd8\x00\x04\x02\xda\x92\xe5\xdbw\xff\xc0\xbb\x8b7^\
+\xf6=_<~BH\xb7\xd1\xe0\xc3\x93\x97\x87\xef}\
+\xe2g\xf0H\x0b\xfc/\x9fD\xd8\x7f\xd9\xd7\x87\xe7\xf9\
+Ob\xc6kj\xe0\xa3\xfa\xcf\xd6\x86\xd9\x87\x00\xc0\x14\
+\x19\x82\xd8,\x80\xb8\x11\x88\x98B\x92\xed\x0c\xc9\x00L\
+\xe92\xd9'@V\xea\x93y\x83\x01r\x1a\x1e\x1c9\
+\x88]\xce\xcd\x8e\xb6Q2\x1dG\xa4\xbfQ\xfd\x8b<\
+\xff*\xaf\xbf`\xfe\x0c\x02\xb5\xf4\xb7]}\x94\xf9\xcb\
+d\x1f\xc2!1\x8e\xc4\x1c\xe0\x053/C\x08\xabn\
+\xb5^?\xfc\x87\x1f\xea\xde\xf8\xa3\x7f\x87?\xf6\xe0C\
+\x98\x9d\xdf\xc7\xbf\xf8\xe6_\xc0\xcb\xbf\xe93\xa8i\xca\
+8\x7fM\x7f\xfc\x83\xef/^\x0f\xbe\xbd\xff\x97?\x13\
+=M6.\x97\xdd=\xf8\xca\xc5\xaf\xe2\xc1\xd9\xf3\xf1\
+Xs\x1f~\xfe\xe2E|\xe1\xea]\xfc\x07\xb3W\xf1\
+~X\x90\xa3\xd0\x10\xb8!M\xfc\x11s@\xa5~\xcd\
+~\xfa:\xcf\x17$8\x22r\xc8\xf9>\xa3k(\xd3\
+k\xe6\xd1\x80RrU\x5c\xc9zuw \xb0\xa31\
+\xaa\x92|6\x85\xfc\x8a\xe4\x9e\xe8\xfc\xb3\xfe\x80\x81\xd7\
+\x9f\xd3\x86U\xfa\xd737\x0eI\x0a}.C\xbc\xfd\
+O\xc6\xe5\x92y\xef\x80\x99\x17\xbe\xef\x97\x9f\xfa\xf0\xc3\
+\xdd\x17\xbd\xe1\xf5\xfc\xe8\x83\x0faq\xe5\x08GO\x5c\
+\xc5\xcb\xff\xdag\xe3\xa1\xf7<\x88v\xda\xc2w\xdd\xc6\
+\xe5\xf2\xbf\xbfR\x1c\xf2\xc0\x04\xf8X\xfb\xa2\xad\xe7\xc8\
+\xbf\xe5g\xf1%oz\x00\x1dM\x01\x00=5x\x98\
+\xee\xc7\x95\xdf\xfb?\xc2K_\xf5:\xdfr\xdf1\xd1\
+\x8a\x80c0\x1f\xa2L\x11\x06\xb2\xe3\xc3\xb6)\xb6\xa9\
+\xc3-33Ql\x0f\x1ec\x8f\xf9\x1aI\xd20U\
+\xd2?\xa9\x13\xcc \xe7\xe0\x1c\x01\xacy\x02Z_3\
+\xde\xc9wG;\x02\x8cM\x1a\xbd\xf5\xc2\xf8\x00\xb3\xe9\
+\xe63\x12\xebO\xda@]\xe0\xa3\xc9>\x8a)2s\
+C\xbd\xfe\x9aD\xa7R_\x19\xfd22\xe3_\x05\xe1\
+\x08\x1c\x9b{2w\xa1\xef\xfd\x1b\x7f\xe4\xbf\x0f\xefy\
+\xfb\xaf\xa3\xef:p\x90\x84\xb8\xe3\xab\x0b|\xdb?\xfe\
+\x01\xfc\xf0W\x7f\xe7u\x1d\xf3\xd0\x09\xf8U?\xb3u\
+\x857\x1c\xfc\xaf\xe8\xa9E\x88~<\x02\xa3\xc3\x04\xdf\
+\xf0\x8a\x16=M\xfc\x8c\x97=$DxL$\x03E\
+\x98\xc9\xc5\xb8\x82\x0e\x1c\xd1>e@\x919\x88\x09X\
+\xd2\x85#\x08\x94\xcd\x11C\x1c3@2;\xad\xec7\
+\x1e\xb3\xab\x1a\x09\x0d2;8&\xc0E\xdcq\xda\x83\
+\xaf:\xa0\x8d\x89\x0f;:\xf34v\xed\x95\xf9\x8dh\
+\xf7H\xd1\x00\x00 \x00IDAT\x0a/s\xfa\xb2\
+c\xcfz\xfc\xd5\xeb?ht[\xd6\xf8\xc3@\x81\xad\
+\xa39\x02p\x95\xb2\xc4\x7f\x12\xc2\xf8\x97\xe59_\x05\
+pH\xd2}k\x0d\xc0\xfb\xbe\x0f\x1f\xf87\xbf\x07\xdf\
+y\xf9]\xf5\xf8{\x8f\xf7\xfc?\xef\xc0\xcf\xfc\xee{\
+\xb7\x1e\xf2\x9b\xe8\x95\xc5\xeb\x01\x00\xfc\xea[\xb7K\xc7\
+\xb7\xdcswd~\x0d\x15\x12\x029\x1c\xb8\x8b\x08p\
+\xca\x95\xaa\xe2\x1cA\xd4zf\xa6@RE\x98z\x94\
+C\x93\x81\xf2\x94!\x99@$!\x0d\x171 1\xbf\
+\x8e\x19cR= _4m\x17\xe0\x98\xc1\xc1\xc15\
+\x00\x1a\xadGv\xc6t\xd8i\x01;\x1a\x92\xda\xfd\xa9\
+\xed\x04g\xc6\xd7\xc1\x9d[\xbb\xfb\x84\xa1\xea_0\xff\
+\xf8L\xbfCd\x95\xff\x09\x94*\xbf\x0e\xf8\xd0<\xff\
+\x0e\x80g\x0e\xdc-W\xa2\x95\x18\xf5\x82C@\xb7\x5c\
+\xe2\x1d\xef\xfc\xb9\xeb:\xee\x01\x00\xfc\xd5G\xb7\xaf\xf0\
+\x93\xf7h\xbe\x0e\xa9\xd7>E\xef\x1a)6V'\xc7\
+*f\xeb3d\x96Y\xcfL\x1d\x80.\xbeW3\xbf\
+\xd6\x0bH\x9e\x80\x8e\x06\x10\x10 5\x07\xe0$\x0e+\
+?Tj\x00r\x01\x22\xf3\x03\x10\xd6\x0fQkp)\
+\xf6P\xf8\x01v\xd2\xff\xce%.\x9f+\xe3g{\xbf\
+\xca\xe8\xab\xe3\xfb\xdbm\xfe\xb8\xd9\x82\xf9mW_U\
+\xff\xaf@\x18\xff\x89\xb8\x5c\x89\xfe\x00\xf1\xfc3\x16,\
+9\x02=\x11\xb8i\x9a\x94\x9b\x98v\xda\x0c\xd1\xbd\xfb\
+y\xcf\xbd\xaeS0L\x05~\xf5wm]\xe1\xdb.\
+\xffC|\xaa}>R\x1f^\x22\x80\x03\x9e\x15\x9eD\
+\xcbk\xc4`c/\xb2\x9b\xa3\xe4\x8f=\x04\x08=\x18\
+\x9e\x01\x10\xa1A\xae\x15\xd8C\x0e\x13\xe6D!\xc1\x16\
+\xd1\x04b\x830\xe8\xfc\xe2H\xdaL\x84\x1d\xc5D \
+.\x90\x11pp\xc4\xe2G \xa0\x1e\x11\xb6q\x0c\xd7\
+\x8e\xee\x08J\x16\xa6\x9a\x90F\xed\xcf\xcb\x08\x10\x84\x91\
+X\x7fH\xde~N\xdb\x1c\xb6\xf4\xb6m\xf4\x04\x00(\
+\xd9\xfd\x97\x88p\x05\x92\xfc#\xb5\xfe\x84\x15q\xd4\x9a\
+\x89B;\x9db~a\x0f\xc7\x07WQG\xd2\xf7\xee\
+:\x87\xb7\xbc\xf6\xef]\xd7\xf1\x0f\x00\xe0\xfe\xf5\x1fn\
+]\xe1\xa7\x9f\xf5\x0e\xfc\xc5\x83\xbf\x8d\x10g\xde\x09G\
+6\xf8\xb9\x172>\xf3\xb1/\x02\x81\x19R\x99\xc4\x0c\
+\xca\x0dD\x98z\x92zg\x06\xa8a\xf0\x8c\x84\xf9\xf7\
+\xcd\xa2y\x02zT\x13H\x87!\x17\x8b\x86\x1c\x07\xd6\
+r\xe3\x04\x82\xa9\xa9\x08P\x8e\x15\xb3\xb5\x01$Z@\
+@lB\xea\x90\xb2\x8e\x94v\x11\x82;\x80\xea0\x9f\
+\xa6\xe6Y\xfb=\x0e\xec(\xf2\xfa\xab\xdc\xfe\xd4\xf0c\
+<\xd4\xa7 \xb0m\x94\xb7\x0d\xf9\xa9\xf3/\xaa\xfe|\
+Dd'n\xc5>\x01\x8e\xb8\x99\xb4\xf8\x1b\xdf\xf4\x06\
+\xfc\xec\x0f\xfd\xcf\xd0\xcc\x22m7\xf7\x0b\x7f\xf3m\xf8\
+\x8b\xbf\xfd\xc0\xd6\xc3\x7f\xe8\xad\x1f)^\x0f\x00\xa0\xe5\
+\xbe~\xab\xa0\xd7\x1d~+.\xb9{\x93\x06\x00\x00=\
+Z\xbc\xf6S/\xc3\xe3\xf4,\x06!0\x113\x91z\
+<=1{\x82Lv I\xf9\x9d\x024\x07xX\
+'\x90]3\x01v*1\xa3\x89EC\x0d\x83\xc5K\
+\x10S\x84\x89\x09\x8e]N\x1a\x22af\xcd$\x94\xb2\
+a\xf1\x1b8\xce\xa6\x80M\x22\xd2\xde}\x03\x13aG\
+\xb7?eu\xdc\xf2=RIn|Lj\x7fJ\xf0\
+\x19\xaf\xee\x1b\xd8\xfb\xa1`~\x1dc\x5cO\xf2Q\xe6\
+?\xa8\x16[\xe2{\x10\x99\x7fA$]~ \xa1\xc3\
+\x10\x18\x0c&vM\xc3\xbf\xf8c?\x01\xdf\xf5)\xdd\
+\x97\x01\x10{\xfc\x8d\xb7\xbc\x0e\xcddCv\xff\x06\xba\
+\xbeo\x03\xf8\x04=\x0f\xae\x1a2\xcaDx\x0c\xcf\xc6\
+\x04\x1d\x07r\xe8\x9b\x16}\xdbr \x17\x1a\xefC\xeb\
+\xfb\xe0\xe4\x10\x08\x84\x96\x98\xb5P\xe8*\xa4Zp\x8e\
+\x9c$dQS\xcb\x885B0a\xb1\x05\x885A\
+9\x10\xe0b\xf5`,\x0bb\x9f\xd3\x88\xd3\x82\xa8\x1d\
+4\xf2h\x9b\x8e\x14\xdf\xb1@\xb03\x0fn\x7f\xaac\
+\xfb\xca4\x83P_\x0e\xf3\xb1\x95\xfc\xde\x02\xc2\x16\xe6\
+\x8f^\xa8\xc8\xfc\xa2\xf23\xd6\xa0\xc1\x10\xcf\xab\xc8\xde\
+~m\xf0q\x08\xe0\x88\x88\x8f!\xd1\xb3\x95s\xbcv\
+\x8e\xfb&\xd6\xbeyO\xf0\x81\xb8i\x1b\xbe\xf2\xd8e\
+\xb8\x91\xda\xfe\xcb\x9fx\xf2\xbaO\xcf \x11\xe8\xee\xd7\
+}\xfa\x09\xe7\x93$\x9eN\x04&\x07&\x87@\x0e\x1e\
+\x0d\x9e\xd7~\x12\x0b:G\x87\x17.\xf0/\x7f\xf7o\
+\xf1\xf4\xeaG\xf9_~\xfd\xd7\x86\x0bO<\x86&\x04\
+\xc4$cG&\xeeO4H\x12\x0af\x91\x9f\x14\xe0\
+ \xa4d!rT*\xf9\x86h\xf4i\xda\xff:E\
+\xd2\xbc,2\x0ei\x83&P\xa7\x1f\xef\xe8\x99\xa3A\
+*\xf8\x96\xef*\xf3\x1b?\x11\x07\x98\xf6\xdc#\x85<\
+cj\x7f\xc5\xfc\xd1\x89@\x90>\x19\x96\xf9\xb5\xaaO\
+\xd2zs\xac_\x13|\xd4\xeb\x7f\x89\xc4\x07p@\x84\
+#\x22,\x9d\xe3\xf5d\xc2\xfd]wu\xfe/\xbc\xf2\
+ \xec\x9f\x03\x1f-&\x08\xdc\xe0\xaeg]\xc0\xd5\xc7\
+\x0fr\x96\xab\xfa.B@\xbf\xee\xe1\xfb\xc1\x04\xf0\x82\
+.\xfd\xde\xa5\xe2\xf5u\x03\x00\x99\x7f\x9c\x16\x01\x81\xf7\
+\x1f\x7f\x1e\x9e\xbd\xff\x18^\xfa\xfe?\xc1\xbf\xfc\x8aO\
+\xc3C/\xbe\x0f\x9f\xf1\xc1\xf7\xe1\xbd\x9f\xfbj\xdc{\
+\xf91\xb8\xc0D\xd2\x9b\xb4h%\x16\x07\xfe\xa8\xda_\
+\xcd1K\xcc\xaf\xdfo\x00\x92\x8cA\xf3\x85\xbcs#\
+\x92\xdb\x5c|9gV\x0f,\xd7\x1f\x80@\xd5mH\
+3\x0f\xf5o\x07\x04\xcf\x10\x19\x8dmp=\x94\xaal\
+\xbe\xc4\xfc\xa9\x83\x8f\xc6\xf7\x03B\x9fA \xf4\x01l\
+\xa4\xbf\xfa\x03\xc6\x98?f\x9bF8I\x9e~\x1b\xe6\
+;\x88N>e|]\x14\x00\xae\x80p\x95\x80#\x22\
+\x1c\x13a\xed\x1c\xba\x0b\x17z\xff\x1b\xff\xf4E\xfc\xd0\
+'\xa7\xf8\xe3\x07\xe7\xf8\xbe\x1f\x5c\xe3\xdd\xef\x9e\xe27\
+\xff\xd6\xef\xe0-\xff\xfa'$\xd1\x0d\xc8\x00\xc0\x0c\xdf\
+\x85\x5cA\xbb\x81j\x00\x18\xea\x11'\x10\x93e\xfc\xbc\
+\x00\xc0\xbd\xcd%4\xfb\x01O>\xfb^t\xed\x04\xfd\
+\xa4\xc5b\xef\x1c\xfe\xcb_\xfe'\x1c(\xe5\x08H\xc3\
+C\x13\x07e\xe0\x12\x03\x8f\x83\xf0\x18\x80O\x01x\x0c\
+9&z\x80<\x81\xd8f\x10\x06\xd6\x8b\xac\x177^\
+\x9c\xba@\xc3\xf7\xd2\x92\xd9w^\x96^\x1e\x13\xe2\xd7\
+U[\xc8j\xe3\xb0\xac\x92\xaaW4\xf6\xf6\x8en\x02\
+\x9d\x94\xcb\xb1\x95\xf9U\xd5\xb7\xf7E\xa7\xf7\x85\x87\xaf\
+\xab\xfb63\xffX\xa8/\x87\xf9(\xc5\xf8\xf5\xde\xb6\
+\xf7\xb7\xc6\xfa\x8f!a\xf3\x0e\x80w\xc4\xe1U\x9f\xff\
+8\x7f\xda+/\xe3\xfcy\x8f\xbb\xee\xf6x\xc3\x7f\xd2\
+bo\xbf\x85f\xc8\xe6h\x17R4p\xb4\x00\xe8\x04\
+\xban\x1f\x80\xb2\xbc>7\x15\xbc\xe8x\x02\xf6\x0e\xa1\
+q\x08j_\x03\xf8\xe8\xf3\x9f\xad\xbb)!B`M\
+\xc4\xc7\xc83\x04\x02t\xde\x00a\x0dFOe\xa6\xa0\
+\xd6\x15h#R\x87\x9c\xcb\xe3\x14\xe9\x092r\x0c\x14\
+\xab\x08!'\xcb\xb1t\x14\xd6\xce\xc2.8\xd9J\xa5\
+\x018\x83\x87\x92\xbb\xc8\xe9\x84\xe7F#u\x12Q\xa9\
+M\xec\xe8\x99#\xeb\xe4\x03og\xfeM\x09=\xb5@\
+\x08V0\x84\x01\xe3qd~u\xf8i\xa8\xef\xb8R\
+\xfbU\xda?\x89\xb2\xb1\xa7\x0e\xf8\x88\xa9\xbe\xf0 \xa9\
+\xeb\xff\x9f^\xf3\xbdx\xe0\xbb~\x16M#\xed\xf0\xef\
+\xbe\x8f\x10BV\x8a\xed\x9cL\x10\xa4\x95\xdfS\x10B\
+\xd7\x0f\x00\xccpq\xa2\x8f2>\x000\x13\xbe\xe2\xfc\
+o\xe0\x03\x8b\xcf\x96!\x1eNR\x85\xd9\x11\x96\xb3)\
+\x9a\x10b\xf7\xff\x04\x02\xabX\xcb\x93\xc3%\x1c\xd3\x84\
+\x09\x81\x85\x8f\x9b\xc8\xf4\x1a\x0d(\x9b\x890\x1a\xa6\xd8\
+.4:\x06c\xbe@6\x22\x02d\xf0h\x9c0\xe4\
+\xd8e\x04\x8dw\x8b\x83L\x22\x0e\x08\x920\xa4}H\
+b\xf4 e\x0f*\x08H\xa8\x00q\x1fv\xf4LP\
+\x04c\xfb:=\xad\x99\xbfH\xeb-\x0bwD\xd2\x97\
+\x13{\xb6\xa5\xf5\xaa\xc3\xcf0\xbf\x8d\xf3\xdby\x99\xd6\
+\xe1gU\xfe\xc8\xf8\x14K|y\x01\xc6\x92\x09\x1d\x01\
+\x9e9\xce\x94\xfd\xdcwD\xe6\x07\x1c\x13\xda\xa9\xc3\xe2\
+\xa0\xc3\xeb\x7f\xe1\xaf\xe0#\xef{\x18\xce\xb9\x5c\x05\xcb\
+\x00\x9c\x08\xb8\xc1\xe4\x8f\x13\xe8\xba}\x003\xac\xd1\xc0\
+\xc3\xc5\x84`y\x94\xe7O\xfa{\x10\xb8\x81C\x0fn\
+\x1a\x04'\x16\x7f\xdf\xb6\xe8\xdd\x8cb\xf4\x80L\x13\x0f\
+M\xeb\xf1\x84\x88~\xc2~$\x8e>\xb2-\xc8U\xfa\
+\xd78'\x17\xc4\xf61\x8d\x0a\x8a\xf5\xfe\xa6\x8f*5\
+)E\x01\xf4yM#\x8c\xbeK#\xbe\x05i\x93\xbd\
+_d\xf6\x95\x1a\x80,~\xbc\x7f_\x02\x01\xa86a\
+\x19\xdeG\x8f\xbfM\xf0Q\xb5\xff\x08\xa5\xc3\xef\x09\xb3\
+<\xc9\xa0+\x00\xa9\xe7\x7f\x01\xd0\x92@kP\xec\x11\
+@\x14\x1c!\xe09K\xec\xcd=\x9c\x83\x80@\xeb0\
+k{\x1c^^\x02\x00\x5c\xdbH?L\x8df9\x07\
+r\x0e\xdd\xaa\xdbz\x9aj\x1f\xc0@\x03\xf8\xc8\x9b\x7f\
+k\xeb\x06^\xf1\xe6/\x18}\xbf\x81G\x80\xc3\x95\xf6\
+e\xb87<h\xaf\x0b\xd6\xed\x1e>\xf0\xdc\xb7\xf3\xe7\
+|\xe2+\x19\x14\x9d%\x845\x03L\xd9\x9e\x97<\x01\
+\x02\xc0$L\x9f;\x0bO\x91+\x0a\x19)L\xc8\xfa\
+~\xcc\x13@CL\x0e@\xc3\x9a5\x18\x9dt\xccL\
+6_\x00@v\xf2Y?_#\xdf\x11TEV\xfb\
+m\xb8P\xf5\x96\xb8\x0d\xb3v~\xb9\xc3\x88\xd3'\x1b\
+\xd23\xef\xa5\x87\x8a\xf1\x93\xf4O\xea|9\xa6{[\
+\x17\x1fht\x8fY\x7f6\xde\xa7E\x9c\x7f,\xc3/\
+7\xf0,\xf3\xfa\xaf\x08\xf3\xa7\xfc\xfe\xe3\xb8\xde\x9a\x81\
+\x1eL\x9ed\xfb\xe1\x85\xcf\xbd\xca\xc7\xab6z\xfa\xe5\
+\x00\x9b=\xc6=\x17\x16x\xfc\xf2>\x9av\xbc\xe6\xbf\
+i\x1b\xfc\xe9\x8f\xff\xe9u\x9d\xd2\xeb6\x01N\xa2{\
+\xba?\x1e\xe9(\x04|\xce'\xbe\x12@`\x10\x89%\
+C\x09[\x03@\xdam8\xc6\x19\xd3D!U\xfd\xad\
+\xaf@\xd1V\xf3\x07l\x11\xd1\x84\xc1\xad\xd8D2\x8c\
+4\x02Ab\xc8\x80 *?E5\xd0\x0c(eD\
+\x13\xc1qD\xd5\xe1\x90\x92\x0c\x1a\x94z\x0f&\xcd!\
+\xea\x1c1Ci\x07\x02\xa7I\x96\xf9\xd90<FT\
+~\xab\xba\xdbG\x9b\xc2k\x1bwz\x1e\xd8\xfeF\xa3\
+`D\xc6D\xee\xe4\xa3\xc9=u;/m\x80\xa3\xa9\
+\xbd)\xde\xcf ;\xc4c\x81\xec\xf4K\x8em\x06\x07\
+\x0e\x8e?\xf4\xe8\xddh\x1a.|z\x0e\x8cO]:\
+\x07WM\xf2z\xbat\xea\x00\x902\x04\x07~2\xc2\
+d\xef\x11\xeeV\xf73\x13B\xee3\x98\xbfF:S\
+\x90\xd0\x82\x91\x1d~B:\x8b@\xed,\xed3\xa8Y\
+\x84s\xa89\x90o\x16\x1d<-\xdb\x08\xba;\x5c\x84\
+K\xd4\x1f\xe0\x82\x037\xc2\xfc\xce\xb9q\x00\x883\x0a\
+\x14\x04\xacV\x90ZH\x8f\xa4\x0f\x0c\xce\xc9\xf6\x93x\
+6i\xc3\xf1[\x85*\xd1@\xd0[\x8f\xb7\x95\xf4\x80\
+\xcd\xe1\xd7\x82\x1eX\xc6\xafb\xf8\x03'`\x95\xcf\x9f\
+2\x04\xc5\xe4W\xb3\xd42\xfe\x0aej\xaf\x1d\xdd]\
+\xc7\xfb\x9fDN\xf6I\xb3\xfc\x18\xb4\x86\xf8\xc2T\xa3\
+`\x86\x0b\x7f\xf4}\xbf\xcf\xaf|\xf3\xe7\xcb1\x14\x99\
+.<\xd6\xd3\xf3i\xd3\xa9\x03\x00\x80\x91\xe4\x19\x91\x88\
+\xdd\xe1g\x02\xd3\x03fG\x90\x11 \xc4`\xb0\xe8\x04\
+\xa4\xe8\xe1\x004T&\x07Y\xe6_\x00\xb8\x08\xf01\
+\x80\x0b\xc8\xfd\x05\xec-\x93\xd8\x92\x99\x1b\xa2\xa4_H\
+\x98\x90\x03\x5c\xc8\xa6\x80Jln\xa4\xe2P\x1d\x86\x05\
+\x00lz\x1eAAo\xe34\xc0\xa4\xf6\x14\xd0\xc9\x9e\
+\x83t\x93\x8f}\xf1v\x04\x85\x8d\x0c?\xfc\xa0\x94\x17\
+\x5c\xa1B\xc9\xfc\x89\xf1+&\xdf\xf8\xbcN\xe21\xce\
+\xc0\x22\xc9'\x01K\xfc\xb9\x5cUfSzm'\x1f\
+\xdb\xb7\xbf\xce\xedW\x13\xe0\xb2\x91\xfe6\xdc\xd73\xc8\
+\x83c\x0bO&\x0e\x0c\xbc\xfa\x07>7\x9d\x10b\xbd\
+\x936\x9f\xcb\xa7K7\x06\x00\xc61\x1d \x1f#\x04\
+\xe0\xe0\x08R.D\xc1\x11|\x0cc\x88_Q\xe7\x06\
+\xc8&<\x95\x92?\xf6HK6\x94m.\xa2?n\
+\xd3s\x88\x99\x1d)\x0aD\xaf\x83\x86\x09\xe5\x0b\x91\xe1\
+Cf\xf0Q\x00\xb0\x9a\x81#I)\x8e\xf3\xd7\x89\x90\
+\xba\x11\xa7\x0bv\x9df\xc0\xd8\x10\x8a\xe2\xa80~Z\
+o9\xba\x0e\xc6\xbf\x162\x0c\xb9\xc5\xb1\xa7\xcf\xc3H\
+\xb2\xcf\xf0\xfd\xc2$\x88\xb6~ifp\x8eN\x95\xb6\
+\xbe\x1d\xd81f\xebK\x0boq\xf4i\x98OC}\
++d\x81\x15\x99\x9f\x82\xfe\xb4\x0f\x8eC(o\x9c\xf2\
+\x8c\x9d\xfe\xc5\xbfA\x00\xb0\x89(zSA,-?\
+U\xad\x11\x06ft\xc9\xa2\xe64\x87P\xec,\x9d\x94\
+J8\xa2\xdc!\xc52\xbfj\x0fc\xc9M\xdav\xdc\
+\xa5\x0b\x1c\xc3\x84\x81Cb|U\xef\x9d\xab\xfc\x00\x86\
+\xf1\xe5}i9F\x8d\x83\xe3\x00h\x81\x11\x90\xb4\x01\
+\x8a\x1e\xcd\x14\x9f\xe5\xf8z\xcb\xd9\x19e\xfc\xfc\xe1\xed\
+C\xa3\x0e\xd2||\xdb\xceB\x1d\xb9\xc9\xb9\xfbC\xe6\
+/\x1av\xa4G\xc3\xf0U\x1c\x9f\xb3\x83o\xe0#\xb0\
+\xa6\x85|:\x88\xed[\x95\xdf6\xf2\x105_\x12~\
+T\xda+\xd3\xab\xa0:F\x9c\xe0\x03\xc3\xfcPn\x10\
+\x1f\x98$\xb7\xdcHq?B7\x08\x00\xea\xbbU\xb8\
+\xe0\xcaC\xff\x0d\xeez\xf9\x0fJS\x0fy\x8b\x0d;\
+\x02\xf9\x84\x8b\x9c\x96\x84 \x95\xfeK\x96QH\xc7 \
+\xacI\xec'e/\x87aM\x81\xdeMj%\xb6$\
+&GS\xdb\x93D\xa2\x15\xa8\xc4\xe78x\xd42\xbf\
+\x02\x82k\x1c\xc81\xa0\x03\x18\xd9\xc5\xe2(\x83;\x84\
+\x0a\x86*\xd9>\x16\xc8<\x8b\xb4\xe1\xb86\x9a:\xe6\
+\xfb\x96\xf1\x0b\xd5\xdf2\x7f\xea\xc6\xa3\xcf#\x10D\xe9\
+n{\xf9\x15\x0d;B\xc9\xf0\xac^\xc5\xa8q\x9a\xa5\
+#\x0c\x0az4\xccw\x85\xcb0\xdf%\x06]Fn\
+\xe1\xad\xa3\xbb\x85\xf1\xa5\x17F\x07\x99\xa3\x11D\x17\x15\
+\x13Cy\x9e\x1a\xc6s\xef>\xc0\x9f=vOvt\
+\xaai\xc9@\xf2:\x9f\x22\x9d:\x00\x905\xa2*\xba\
+\xfb\xa5?\x04f\x070\xb3w\x01\xc1\x01-\x03\xce\x13\
+\xc0\x08\xc4\xe2\x15 y\xeec#\x84UZ\xa4F\xba\
+cI&\x02I\x8e\x84\xcd\x13P\xb6\x13\xc7\x8dNL\
+\x95\x81\xa4\x9eebQ \xa6F\xac\x818\xe9D\x93\
+}\x0239\xa2d\x0a\x18\x7f\x80k\x5c\xbad\xaeQ\
+\xd3\x011\x93\x82\x12\x0a\x89\x1a\xc1rYuo\x88s\
+\xc2\x86F\x0e\xae\x15\xe5o\xf7H\xc2\xb6\xfb\xd52\xfc\
+\x16\xc9\x9f\x00\xc0\xda\xf3E\x16\x9fI\xed\xdd\xa0\x01\x18\
+G\xa1X\x82\x99\xc3\x8c\xa0`\xcf\xe5\x94\xde\x0e4\x98\
+\xd5\xa7v\xfee\x02\x9e\xe4\xa4\x05\xd0\x13\x10\xad\xe0\x90\
+\x89\x94\xf9E\xe2\xeb\xe0NJ!\xc4@`\xa6\x90\xb3\
+\xd18\x96\xb7}\xf8\x13\xf7\xc1\xb9\x00\x0d^\x09e\xf1\
+\xd1\x9c\xf2\xfdp\xea\xb7\xd7\xe7\xbc\xf9\xf3\xb7~\x1e\x1c\
+\xf0w\x7f\xf2Y\xf8\xdf\xfe\xd3'\xc1\x0e\x98t\x84w\
+\xfc\xf0\xc7\xf0\xe7~\xe494\xe9A.\x90L\xfe\x0e\
+\x88\xfd|\xd10q\xcb\xc0\x8c\x09s&\x9c\x07\xf1]\
+\x0c\xdc\x0b\xe0>&<\x1b\xc0\xb3\x00\xdc\x07\xe0\x1e\x88\
+cP#\x04{\xe0\x14&\xcc\xbd\x05r1Rn.\
+\x02P\x0c\xf3\x11\x11\x91u\xf69M\xb4h\xa2)\x10\
+\x1f]\xe3\xc4\x0ch\x9c\xd1\x0e4b\x808\xab02\
+\xbb\x8d\x14\x8c\x9c\xf5\xad\xa5\xc7c\xdf\xaf\xdf\xbc\xd9@\
+1\xc6\xbc[\xbe3\xf8hLHXi\x8c,\xf5\xb7\
+\x03\x00\x8f\xc6\xf1-\x08(\xe3\xb3&\xf4\xc8os\xdc\
+u\xeb\xe8S\x0d4M\xe9%\x19\xd3\xad\x0d<\x15\x00\
+T\xf2?\xce\xc0\xe3\x00=\x0e\xc2\x93,\xe1\xbeC\x06\
+-\xa5\x8d\x17\xf5,>\xac@\xcc\xac=1\x5c\x08\xfc\
+\x9c?\xfe\x14?\xf2\xf9\xf7\xcb\x8c-\x02\x1ey\xe5\xfd\
+x\xe0w\x1f\x1a\x0d\xa1[\xfa\xc3\xef{\xf7\xd6\xcf\xaf\
+\x97\xb6O\x11x\x0a\xf4\x9c\xd7=\x7f\xfb\x0fz\xe0\xf7\
+_y\x8c\xd5\x8c\xb1\x9e2\x8e\xf7\x18\xcf\xff\xed\xf3 \
+\x06\xfe\xdb\x9f\xbe\x9b\xdf\xfd\x8a5O{\xe2y\xe7\xc2\
+\xb4\xa7\xe0\x18\x81\xa4\xb3P`\xad;\x92s\xe4\x22\xf3\
+Z\xa7\x9f\xbd\x90\x1ey\xec\xb2U\xeb4IXM\x03\
+e&\xaa\x96\x91\x1b8^\x1c+\xac\x8a\x82\x0c\xa3f\
+2\xe2\x88&T*\xa7\xe8/\xc9\xf1T\xaf[\xaa\xa3\
+\xe9\xf3\x93\x18~\x13\xb0\xdc\x10RF\xad\xde\xcbOy\
+\xb0\xff\x05\x13\xab\xad\x1d\x90\xc2v\x1c\x18aS\xd8N\
+Gp\x15\xe1\xbb\xcd&@\x92\xfcI\xddgp`\xdb\
+a:5\xabA\x8e0\xa9\x9do[v\x1dB\xba\xf2\
+^\x05\x15\x9d{\x9e,\x16\xa2\xe8\x00\xa4C\x10\x1d\xb3\
+\xa3ep\xcd\xbao\x9a\xaek'\xbeo\x9a\xc0\xce\x05\
+8\xf0\x83_\xfb\xc5\xfc\xec\x0f<\x8c\xc3\xe7\x9c\x07y\
+\x96\xc17\x9eq\xf7\xa3\x97O\xf4\x11\x01\xc0\xa7\xfe\xcd\
+\xc7\xaf\xf7jm\xa5\x9b\x0e\x00\x00\xa2/P\xb4d&\
+\xf1\xa11\x01\xbf\xf9\x85K<\xfc\x5c\x8f\x0f~\xde\x9a\
+?\xfa\xaa5\x7f\xf4\xdb\xdf\xc7\x7f\xed\xa7_\xc8\x07{\
+\xcc\xbd\x03\xb3\x8bi\x03Y\xe3\xb6\xde~\xeb\xb1U\x15\
+\xce&nX\x00\xd0\xe9\xac\x9c\xf7(i\x1c\xda\xef\xbc\
+\xa41\xb7\x06\x8ctBy\x83\x0f\xec\xce\xf4\x9eQk\
+M\xcc\xb9\xa8\xec*\xd5\xd3\x14\xa6\xcc\xa7\x8f\xec\x8b\xfc\
+\xf4&50\xe1\x92\xdb\xf3{f\x9f\x0b \xd3\xe3\x8b\
+\xd0\x9b\x18\x9b-\xc3\x9a\x5c\xfc\x91\x84\x9da\xd6^\xed\
+\xfc\xb3\xea\xbf\x01\x9a2\x97_\xdc\xb1\xcc\x85w\x9f$\
+&\xbf\x04\xa5\x98\xbe\x0d\xef]&u\xf8Q\xc1\xf89\
+\xd1\x87\xe8\x80E\xf5?frK\xef\x5c\xb7\x9c\xcd\xfb\
+\x0f?\xf0\x19\xe1\xef\xfe\xfc\xff\x15\x98\x0e\xf8\xfc\xc1\x11\
+88\xdc\xf7\xc1GS\x98\xa8\xe8E\xc3\x88\xb9q\xdb\
+\xe9\xb4\x01\xe0&G\x01 \xcc\x1fMb\xa5\x94\x14\x14\
+\x80{\x0e\x08\xe7>8A\xef\x80\xe5\xbb_\x89\xb7~\
+\xdd\x92\xff\xf6?\x9b\x85\xf7>\xe0\xbdo\xd0\x11\xc11\
+h\x89\xe8>\x88\x9b\xf0\x00\xdba\x0bG\x103\xe0<\
+\xca\xe9\xc4\xfb\x0c^\x83S\xe2\xd0\x0c\x06\x04\x98\xd9%\
+Ij\xa5\x9cT'\xc4\x9d\x95E\xfb\x10jT\x80\x02\
+\x17\xb9\x01\x14#\x0a d\x93\x80\xa8z\x9e\xdf\xb3\xe6\
+A*B2\xa6C\xf2\x1dP\xeecH\xd6\xaf\x00d\
+\x87\xe6\x86\xf3^\xbe\xac\x03LC\xa6\x1e\xa3Bu\x1f\
+Q\xd9\xd3\xfb#\x0e\xb6\xfa\xbd2\x91G\x1f\xcb\xe7\x85\
+v4\x1a\xdf\xaf\x98\xde2|0\xdb\xcb\xfb\x1fu\x8f\
+<\xa1\x87\xc1K\x02-\xa1M<J 8d\xe0\x88\
+\x10\x07t\xe6*?S\xd1\xc7G\x90{r\xcd\x84\xde\
+\xb7\xad\xff\xe8g\x7f^\xf8\xabo\xffe\xfe\xd5W\xbf\
+\x1c}\xd3\xc2S\x83\xbei\xca\xebp2\xbf\xdfp\xba\
+\xf9\x00\x00d\x10\x809\x07\xf1\xc4\xb8@h|t\xb0\
+1p\xe1\xb1\x06\xff\xe8\xff|\x01\x7f\xf9\xdfy8v\
+\x17N\x0d\x16\xad\xc3\xafg\x90)\xc6`e\xfe\x0bq\
+\x89\x99\x83\xac\x1e\xd9.\x9a\x07u\x08Q4\xa2x\x93\
+j\xb1b\x12l\xca\xe4\x1c\x17\x0d\x1f\x12\x17\xb6\xbfm\
+5\xa6``\x99\x9fb_\xa4!0X\xc00\x95\x88\
+d\x18\xdb\xf8\x12\x12\x10 \x7f\xb6\x11\x04\x0cP\x8c'\
+\xe2\x94\x0dR\xc7\xc82\xff\x80\xd9\x81\x82aa\x18{\
+4U\xd7\x98I\x5c|O\x99X\xd7\xaf\x9e\x17\xe1;\
+\x8cJz\x0e\xf9\xfby'\xd3\xae\x0f\xaa\xf7\x08d3\
+\xfa\x8e\xc08\x8a\x8c\xaeZ\xc0!\xcb\x88\xeeC\xb0\x19\
+\xde\x09\x8a\x03;\xb1\x88\x91\x82\x8eA\xde7M\xf8\xf9\
+o\xfe1\xfe\xa9o~\x09z\xd7\xc0\x93\x94\xc7\x9fd\
+\xdf?\x13\xf4\xcc\x00\x006\x9b\xabj\x16\x04\xc8\x98\xf2\
+\xde\x01\xc0G\xa5\xfd\x98\xe0\x86g9\xd1\xa2\xceIQ\
+P\x15\xa6\xa1C\x80/ \xc7a\x97\x89\xf9\x91J\x8e\
+\xbd\xb9\xe3\xc5e\x17g\x12\xa2\x00\x02\x89l\xb02P\
+\xdc?\xb2\xe1CS\x1b0L\x19\xb6\x0co?\x1f\xa6\
+\x19\x97@Q\x82\xc0\xc0C\xa1@@\x15\x10\x90aN\
+\xaa\x98\xdd\xaa\xeb\xd7J\x5c~\xffZ\x18\xbfft\x04\
+\x8c3\xfd&f\xae\x01\xa1b\xear\xfb\xf9\xfd\xc1>\
+\x98c\x8e\xe4\x89(\x86\xe3x\x85\xcc\xf8\x87\x83\x85S\
+\xbd\xfeU\xe8\x88\xee\x1c\xdb\x97p4X\xc2\xd3D+\
+0\xaf\x01\xf2\x00\x07b\xc6\x1b\x9f\x04~\xca\x07p\x1b\
+\xefZ\x05\xc5[\x8cn>\x000r\xfe\x7f4\x05\xd2\
+\xb5r\xc0b\xc68\x9c5\xe8\x89p4s\xc0\xb7\xdd\
+\x8b\xaf\xff\x83\x8f\xd3\xaa\xd5\xd8\x09y\x06\xc0D\x0cm\
+\x22\x02ZAR\x83\x17\x90~\xea\x0b\x8a\xb9\x03\xc8\x0e\
+\x1e\xeb\xdd\x15\xe9\x9f\x19\xc4\xfa\x12\xe2\x9e\xa5\xd9\x04\xf1\
+\xba\xc5\x86#,\x07\xc0 \x10\x19U\x5c%\xb9\xbe\xde\
+\x06\x00\x1b\xd2\x8a\x11\xc6@!2\xf5\x09@P\x98(\
+*\xe9u\x06\xc2\x09\xea\x7f>h\xae\xdf(\xdf\xb7\xaa\
+~\xa5\xca\x17\x0c_03\x0a\xb5\xdc\xfaAF\xeb\xee\
+k\xbfH\xa1\xc6\x1b\x07b\x0d@q\xff\xe4k\xd5\xeb\
+\xba=7a\x99\x98\x9f\x07]z\xab\x94^\x96\xe7\x8c\
+T\xbf\xcf\xc3\xfbJ\xd2z\xc1\x81\x02\xf3\xa4\xef\xf1\x82\
+\x7f\xfc\xd7\xf1U\xff\xe4\xed\xf8\xe0\x17<\x1f\xfdt\x86\
+\xe0Z`6Gh\xa6\xf5\xc5(\xce\xed\xcd\xa6\x9b\x0e\
+\x00\xc4\xa2\xe6\x03(n\xd6\xe0\x18_\xf6\xfbs\xfc\xc1\
+g\xadp\xd7j\x8d\x97\x5cZ`\xe6=>\xf2\xde\x03\
+<vq\x8a\xbee\x0e\xe4B\x00!\x88\xfc\x0dL\x14\
+\xf3\xb3\xb9\x05xE\xccK\x00+\x02\xafd\x0a\x11w\
+\xa4CI\x86\x91\x80@\xc9\xd0H\x8b\xde(SH\x1b\
+r\xe9Y\x18S5\x84\xf9\x11c\x11\x1cMr\xa3:\
+S|\x83 \xe6\x81\xb1\xf5\xcb\xda\x81q\x00H\xcf\xd9\
+\x00\x80y\xce\xc6\xd4\x18\x98\x07q\x8flys6c\
+P\x80\xc05i\x00c\xda\xc2\x06\xa6\x07*\x86\xaf%\
+\xff\x98\xc4\x1f\xe4\xecW\xdfM\xcc\x8fB\x9dg\xf5\xb8\
+\xea.*2\xe4\xdd\xe5\xf4Q\x5c\x1be\xc7\x1e\x1b\xd3\
+?\x84t\xa6\xael\xfa\x22\x9f\xff*3\xae\x02|\x08\
+\xe0\x88\x99\x97\x10?R\xc7`\x0fP\xec\xe2\xe3\x18N\
+\xaaZ\x1b\xef\xf9\xee+W\xe8\xb7\xbe\xfd\xab\xb8{\xee\
+sA\xeb5&\x9f\xf88\x9a\xa3#<\xf1\x82{\xf0\
+\x9c\x8f|*^/sQ\x12h\xdf\x5c$\xb8\xe9F\
+\xc9\xab\xfe\xbbWm\xfd\xbc\x0d\x01\xaf\x7f\xf8\x8f\xf1=\
+_\xfe7\x81\xe5\x11\xf0\xe2W\xe0\xbfx\xfb[\xf1\xe0\
+\xdd\xcf\xc1q\xdbRO\x0d\xf5n\x82\x8e\xa6\xf0\xae\x01\
+q\xa0\x86\xfb\xa6\xe1\xaei\xe0'\x8e\xfd\x9c\xc0\xfb`\
+>Gb\x06\xdcE\xe0\x8b\x00\xee\x02p\x11\xe2\x13\xb8\
+\x08\xe0\x22\x81\xf4\xf5\x05dGa./6\x8dK\xa1\
+~\x022\xcf\x8d\xfc%ukF\x1e\x97l\x02\xfd\xa4\
+\xf4\x0dl/,\x1a\xf9N\xed#p\xd9W`\x1f\x01\
+\x14\xbe\x82k\x0a\x1db\xb3\xe4\xcf/\xb3(\xdd\xa6\xf6\
+\x17\xcfC\xf9\xbc\x94\xf8\xd8\x00\x02\x1b\x1cx\x1c\xf7\x80\
+\xb3=\x92\x98\xbb\x04oF\x0e\xf1Y@\xb7\xbe#\xf5\
+\x15\xe5\xea\xbdM\x00\xc0|\x95\xe3{\xcc|\x04\x0e\x8b\
+\x10\xc2*x\xbf\x0e}\xef\xfb\xbe\x0f\x1c\x02\xbb\xb6E\
+;\x9d\xc2M&\xa0\xa6a7\x9f\xf1\xe4\x85/\xc4\x83\
+\xdf\xf26<\xef\xd5@\xf7\x08\xf0\x82\xb7\xfeWX\xbe\
+\xe7}`\xbf\xbdc\xcf\x1f\xbd\xf9\xf7\xb7~~\xdat\
+\xcb\x01@O\x0dVn\x82\xa0\x03=\x19h\x100\x09\
+=\xee_}\x0a\xbf\xfa\xdd\x1f\xc6\xb7\xfe\x10\xe1\x93\x93\
+{\xc0\x04\x9c\xf7W\xf1K\xbf\xeeq\xd7\xd7}\xad\xbb\
+\xaf\x7fl2\xe5\xd5\xb4A\xd8#\x0e\xfb$\xce\xc0\x0b\
+\x00_\xa4\xcc\xe8i!\x90>\xd7h\x81$\x0f\xe5\x11\
+eu\xe2P\xb9pr\x1c\x0a\x18Dp \x02\x95^\
+~\xe3'0\xe5\xc4[\x01\xa0b~\xeb\x1c\x1ce~\
+\xda\xc0\xfc\xd7\xa8\xfe+m5\x03N\x0d\x046\x9b\x00\
+\xe0\xfc9J\x00\xd0\x1fV&\xcf\x0cN\x05\xa3\xdb\xc5\
+\x86\x84m\xed\xbe\x8d\xf3\x1fD3\xc0\x16\xef\x1c\x08(\
+\xf0\x01\x03\x07`>\xe4\xc0\x8b\xe0\xfdq\xb7Z\xaf\x1f\
+\xff\xe8#\xfd7\xfe\x83\xff!|\xe0\x9d\xff/\xba\xe5\
+\x0a \xc2\xec\xc29\xbc\xe9\x8do\xc3?x\xcb\x7f\x8c\
+\xa3\x8f?\x06\xbf\xeeR\x01\x92\x80\xbfC3\x9b\xc2\xb5\
+\xdb\x95\xee;\x1e\x00\x18\x94\xc6\x8f\x03*j\x03\x1a\xee\
+\xd1\xa2\xc7\x84\xd7`\xf21t(-\xc9&\xdc\xe1\xfe\
+\xfe\x11\xfc\xf3\xf3_\xe3>\xad\xff\xd8d\x82\xf5\xdcq\
+\xd8#\xf0>\x01\xe7\x00>OeX\xf0<\x80s\x04\
+\x1a\x0b\x15*\x00\xe8\xb0\x12\xd5\x06\xa6\xe0\x04\x08\xd2x\
+\xa4lU\xa6\xf3\x88]\xf6\xd4c\x08\x00I\x82\x8f0\
+\xb9\x05\x07c\xffod|\x94\x00\x90^\xc3\xbc\xdet\
+\x89\xeb\xb77h\x9e\xa3\xf6\x7f|=j\x0e\x9c\xe0\x13\
+\xd8l\x1a\x94L_\x03\x80\xf9\xcd\x9a\xd9{\x02z\x80\
+zP\xe1\xe7\xd1\x22\x9e:\xc9\xc7\x02\xc0Q\xb4\xedu\
+9J\x8f\x8cC\x06\x1f\x82q\xc4\xcc\x0b\x0e\xe1\xb8[\
+u\xab\x87\xdf\xf7\x1f\xd6\xaf\xfd\xcf\xff:\x1f<q\x05\
+\xbe\xefe\xdf\xa3-\x1b\x08\xe8\xd6=|\xd7\xc3{\x9f\
+\x00\x00\x90l\xd2\xa6m\xe5\x9an\xa1\x9b\x0d\x00\xcfX\
+\x14`\x1b\xb9\xa4\xdd\xe9\xbd\x1d%\x0e\x08=5\x80\xda\
+\xdd\xc4\xd2\x8d\x90\x1c\x1e\x9d\xdc\x8f\xa3G\xdf\x16>\xfd\
+y_\xea[\xee:\x94\xaa;P\x8e-_\x02\xb4`\
+\x8d\xef\x96\xf3\x09uP\xe9\xdc<\xce!)\xc53\x00\
+3\x96Vd\xba\xe8\xf5w\x88\xb2J\xe7\x13j\xb4@\
+[\x1d)q@\xd4\x0e\x18ll|\x8d(\x9c(\xf1\
+q\x8d\x8c\x7fZ\xf0\xce#@\xa0\x1a\xc1\x18\x10l\x01\
+\x86B+\xa8\xa3\x02\xc9\xde\x8f\xbf0d~\xdd\x03\xdb\
+\x82;2:\xaf\xc1\xb4\x02\x15\xcc\xae\xcb\xb1y\xb4!\
+\xbfm\x8b~o\x09\xe65\x07\xee\xba\xe5\xba\xff\xc6\x1f\
+\xfb.~\xf07\xde\x0d\xdfu\x92\x90\xa4\xdaP\xdc)\
+\x88\x9f(\xfag\xa4\xa7\x1c\x11 \xcd\xfdN\xe9z\x9c\
+\x22\xdd\x92\x00\x00\xd8s\x95\xc1@\x9eEH\xa0d!\
+ \x80\xd0\xa3\xc5w\xdc\x03\xf4h\x03\xc7\xe8\x80\xc8T\
+\x06r\xec\xd76\x15\x99\x03\xd8c`N\x99\xe9u\xb1\
+\x80`5\x03\x0b\x0e>\xed\x18\x15\xbe\xf8\x0c:\x8c\xb4\
+\x93\xf24\xba\xe5\x98E\x83I\x0b\xc74\xd0\xd2\xa9\xa7\
+L\x5c\xa8\xf6\xb5\x9ao@\x000\x9fo>\xa1\xd7\x16\
+\x05\xd8\xa4\x11p\xf9\x9d\x81iP=/\x80\xc2\x02\x81\
+|\xa9dz\xc3\xfc\x1b~\xdf2\x7f\x0f`Me\xa1\
+\x98et\x9b\xccc\x18\x9b\xb4<7\x82\x01\xdb\xf5\x0c\
+p\xf0\xca<v\xcc\xec\xfbe\xc7\x8f\xfe\xd1C\x08\xde\
+\x0b\x90\xa5\xfb\xd2@\x93\xeex\xba.\xb7 \xd7\x1b\xba\
+e\x01\x00\xc8\xfcc\xffS<\xddzZ3\xd7\x05|\
+\x9a\x87\xce-\xd4\xa4\xa1u\xdc\x8cu\x02M\xabe\xc6\
+\x84\x198\x8f)\xa7l\x12\x9cO\x0b\xe1<\xa4w{\
+G \xdb\xc7-\xdd\xaaj\xf5\x83r\xf7be|\x80\
+\xb2D#A\x05}\xca\x88\x8f6\xac\x18\x0f\xceJ\xf2\
+\x82\xb9\xb7\xbcW\xd3Iv\xff&\xda\x18-\xa8\xb5\x00\
+\xf3\xfe\x98\xaf`\xd4|H~\x04\xfdW\x9b\x17\xf9\xfd\
+x\x10LL\xda\x0c6W\x89\x12\x8dI\xf5\x94\xc7\x9f\
+\x97\x94\xb4\xa3\xdf\x8f\x0cOQc`\x0d\xe9\xd9\xf0\x9e\
+\xd6\xef\xf7\x00\xd8\xb5\x0e\xf3\xf3{Y\xfbb\x15A\x94\
+_V\xe7\xc8\xde\xc5\xb7\x22\xdd\x92\x00\xc0 \x04\xca\xbd\
+<\x1d\xab\xa0e4\x08`\xf8$)\x1c\x02Z\xf4\xb8\
+\xc7_\xc2\xf7\xdc\xf5mx\xc9\xfa\x03p\xf2\xa9Jh\
+\x9b\xf9\x95\x07\x8c\x906\x1e%q\xf6Q\xb2\xfb\xf7\x98\
+q\x0e\xe0\x0bdz\xb8Ao\x0a2\x1d]\xcaP\xa2\
+uL\xd9~\x86R\x0c\x1cmAP\x96\x84D\x94\x19\
+\x81\xb4\xf5S5\xb2|\x0b\x83_k\xda\xef\xa9\xd1\x08\
+\x1e\x0c@\xc0|\xaf6\x1b\x00\x8cJ\xf8\xa1V\x91V\
+\xb2\xe7\xd6\x83\xf4:\x92\xb5\xe7\x0b\x9b\x9e\xa2\x13\x8fa\
+\x1d{$\xf1}\xc9\xe2;\xe6*\x8eO\xb2\xcd\x1e\x12\
+.\xd6k\x9bC\xc7\x84@\x8e\xc2\xec\xdc\x0c\xff\xe2[\
+~\x01_\xf6\xf7_\x8f\xe3\xabGI\x13\xd0\x9d$\x00\
+\x08!\x1fS\x08r<\xc4 \xbe\xee!\x5c7\x85n\
+9\x00\xe8\xa9\xc1\xda\xb5\x19\x00X\xa4\xfa4\x00\xf7/\
+?\x85\xff\xfb\x8b\xde\x89\xef\xf8\xed\x07\xf0\xe8\xf4.\x04\
+\x22\x5c\xf4\x97\xf1\x8b?\x02\xdc\xfd}_\x83\x07\xba\xff\
+@\x13\xf4L\xcc\x81\x90[\x8eS\x06\x00\x07P#\x12\
+Z\xdaz \xb7\x1f\x9f\x90\xda\xfd\x84c\x80\x96`\xb6\
+-\x9c\x867\xc6\xb8\xc7\xb9\x0c!\xb2\x14-\x89\xb0g\
+\x9b\x0f\x9a\xf3\x0a\x80\xe2\xc6\x8f\x8c\x1d5\x88\x01\xd7\x9d\
+(\xd0Mr\xd3i\x12o\xd4\x08\x8aom1\x1e\xc6\
+>\xc9\xdf7\xd0\xc06\x9eo+\xf7\xea\xee<\xa97\
+\x1fQ!\xf5\xafR\x0c\xef\xc5V\xdc\xb1)'\x1d\xb1\
+\xa8\xffK\x98\xa40\x06<\x88=\x81\x02\xc0\x9a$\x16\
+\xa2\x8b&\x10\xc0\xce\x11\xb7\xd3\x09\xbf\xfc\x8d\x9fA\xef\
+\xff\xb5\xdf\xe6o}\xeb\xdf\xc7{~\xe57R\x14`\
+~\xd7\x05\xfc\xda\x1b~\x09_\xf8\xd6\xd7\xe3\xe0\x91O\
+\x80\xd7\x1d8xu\x09\xc8\xa0\x1c\x9a\x82N\x88\x02\xdc\
+l\xba\xe5t\x93O\x7f\xf3\xeb\xb6~\xee\xa9\xc5\xc3\xf3\
+W\x80\x7f\xeaG\xf1o\xff\x12\xf0\x9a\xefe4o{\
+\x13\x9e\xbf~\x18\xf3p\x8c\x96{8\xf6D\x1c@\x1c\
+\x94\x15\xd4\x9bFL\x14\x19\x92\x1c\x88\xd4Q\xd8\x12\xf3\
+\x04\xd1\xfbO\xcc\xaa\xfe_$\x1e\xe4\x10\x9c7\x8b\xfa\
+\x08\xd47`s\x08\xac\x16`s\x06\xca<\x02k\xdd\
+d\xab\x91\xf2Ca\xe5\xd7\x8f\xd7\xfa|\x8c\xea\xcfO\
+\xe2n\xbe\x8e\xe7\xf6\xd1*\xf4\xd5\xfb\x89\xfdk\x0dj\
+\x8c\xf9\xeb!\x1cI\xed7\xcco\xab\xf8\xae\x02t\x85\
+5\xc6\xcft\xc8\xc0\x11\x98\x96\x0cZA\xda\xcfE\xf0\
+\xe6 *\x9a>\xc6t\xc4h\xe1\x89\xf3\x92\xa4ow\
+\xd7c\xb5X\xe0#\xef\xfb(~\xe6w\xdf\x8bw\xbc\
+\xf3\xe7p\xf7\xf3\x9e\x8b\xb7\xbc\xf6\xef\xe1\x81\xaf\xfdt\
+4\x93\xed\x0c~\xbd}\xfbo4\xddZpt*$\
+\x0a7\x5c\xec-jtN\xe7=\x1e\xfa\xf3_\x84\xe7\
+=\xf4 Q\xf0D\x81\x8988\x17BC\xcc\x1d1\
+\xf7\xc4<\xe8\x19\x80\xaaz\x0cY\xfd\xdc\x87\xdcx9\
+ZP\x02@\x0d\x02\xf6\xb9\x96\x1e\xdb\xd7b\xf1$\x80\
+(\x5c\x85u\xef\x83\x0c\x06\xbc\x15$6\x81\xc26\x86\
+?\x89\xa9\xf51\x0f\x8a,\xcfW\xcd\xc8c\x0c\x1e\xb6\
+,\x1eC\xe6\xaf\x87p\x8cU\xee\xe9\xa2\x15{\x07\x94\
+\xcd\x81#0-\x98\xdd\x92\xd9u\x1c\x5c\x1fB\xe39\
+4!\x84\x86\x99[\xfe\xd3\xf7\x7f\x07\xff\xf9/\xfe\x1f\
+\xc1\xdc\x82\xd5\xa0W\xbf\x061\x88\xfb-\xa7\xec\xf6\xa4\
+3\x08\x00\x04\xed4\x91]\xf1\x10\xcf\xbbsx\xc9\xfb\
+~\x17M\xf0<\xe9:\xbe\xeb\xf2\x93\xf8\xf5o\xfav\
+\xff\xc0\xef\xfd\xdb0]\xadB\xe3\xbd\xde\xac\xa0t\x07\
+\x0c\x9c\x88z\xb3\xd9\x88\x80e~M\x22\xd2\xe1&\xda\
+\xb2L\x93\x87\xda\xc1{\xc5\xb8tNc\xd0\xb9\x06\x8b\
+\x0c\x04\xa3\xd9\x88\x1b\x96\xa7\xe2\x85\xda \xc9G\x16\x1e\
+e\xea\x82\xc1\xa9dj\x0f\xd0X\xe2\x8e\x14h\x95&\
+\x965\xbb\xac\x83N3\xfa\xac\x1f\xa0\xf6\x07\x98\xd8>\
+\x1d\x01\xb4\x00h\xc9\xecV\xc1O\xfa\xd5\xe2b\xff\xe1\
+\x9fx{x\xed\x8f>\x0b\xcb\xc3{\xd0w3\x08\xf3\
+\xeb\xf0\xa9H\xc4\xb1=w(\xdf?#t\x06\x01`\
+\x84\xecu#Bp\x0e\xddd\x8a'\xef\xbd\x0f\xaf\xf9\
+\xe7\xff;~\xe7\xc7>\xec_\xf2\xc3\xaf\x03\xadV\xd4\
+xo\x19\x0b\xc87\xafm\x09m\xfb\x09\xe8RG\x17\
+2\x08p\xa1\x11LP\x02D|\xbfL,\xe2\x12 \
+\x5c\xf5\xbc\xd6\x1cj@\x18\xeb\x94T\x83\xc06\x13\x80\
+1\xce\xfc\xdb\xa58\x15R;1<K[,\xc3\xcc\
+\xeal\xa3\xb2y\x0b'\xbb\xbc\xcf\x0e\xbf\xe4\x83\xa9\x13\
+{j \xb0\xb1\x7f\x1b\x15P`X\x01\xb4fn\xfa\
+ny\xbe\xff\x96\xef\xff\x95\xf0\xaf^\xf4\x22,\x0e\x9e\
+\x85\xe0[p(\xc7N\x96\xae\xd8\xb3\xc7\xf8Jw\x06\
+\x00\x0c(\x86\xe1\xc8\xa1\x9bN\xf15\xff\xd99\xbc\xeb\
+\xd5\xaf\x09\x93\xf5\xda\xa3T\xaf\xad\xfa\xafv\xe7\x18\xa3\
+\xdb\xe9\xc5\xf5{c\x8f\xdb\xd6\x9f\x00\x98P\x04\x03\x03\
+\x04\xa5\xc6@\xa3\xa6\x05W\x8f\xb5\xb9P\x9e\x80!m\
+\x93\xf8cL_\xab\xea\xb5ST\x19\xbfN\xc9\xed \
+\xc31\xea\xd0[~\xcd\xb1oC\xf9\x9d\x93\x1e7\x01\
+C\x8c\xe5\x93\x07\xbb\xb0Z\xdc\xc3\xbf\xf5O\xe7\xf0\xfd\
+\x14\x1c\x1c\xc0\x0e|\xddJ\xd2\xd9\xa0;\x14\x002\xb9\
+\x10\xf0\xb2?Y\xe0\xdd\x7f\xa9\x8fn\xf9\xc2\xe3\x0c\x94\
+\x19\x84#\x92\x1bM\xf5\xbe\x05\x82)rSR\xfb(\
+\x0bY\x0d\x82\xc6\x80aB\xccVsP\xcd\xa06\x1f\
+\x94\xe1\xeds k\x03\x9b\xc8\x02]\xfdx-\x8c?\
+`z#\xe9%\xb4VJ\xf2q\x09\xce\xa6\xf3s\x0e\
+\xb9\xae\x22\x08\xacP\x82\x83\xd5\x12\xea\xb6o5\xd0\xe4\
+\xfe\x0f\xb2o\x01`n\xa7\x0b\xec_\x5c\xe2\xe8J\x80\
+\x8c\x8b\xa9s5\xef\x1c\xba3\x00\xc0^]fP\x08\
+h|\x8f\xf9\xf1\x12\xbf\xfc\xe3\x0f\xe1\x0b\xff\xe1\x7fD\
+{\x8b#\xb8\xc0@\xbe\xb1\xad\xf4_cT%g\xab\
+\x9aG)M\xb5\x94\xd7\xfc\x82\xfcHbBP\xe9?\
+\x98s\x06\x87\x0e\x0a\x02D\x0a\x06\x1evR\xf6\xfa\x00\
+\x00\x03-IDAT\xa2\x19(\x13\xb6(\x19U\xfb\
+;\xda\xfb\xd8\xc5\xefZ\x10\xb0&\xc1&g\xdf&\xe6\
+\xdf\xc8\xf8\x182\xa0U\xdb\x0b\xfb\x9d\xeaT]\xc2\x92\
+\x01m\xc9U\xab\xf4\x16\x00\xd6\x90$ \xf5\x17x\x00\
+^f:\x15f\xc7x\xa8\x968\x90\xf3\x98\x9d{\x12\
+\xef\x7f\xe77\xe0K\xbf\xfe\x9f\xe1O\xdf\xfbBt\xab\
+}9P\x9f\xd9\xa1\x04\x83\xb3\x0b\x0fg\x10\x00\x18Z\
+\x99\x9b\x0c_\x16\x7f\xba\xf3=\x1e\xbf\xff\xa5\xd8\xbf\xf2\
+\x04(\x04\x5c\xbd+\xe0\xcb\xbe\xffyt\xfe\xe0\xaat\
+\x18`\xe6\xf8hT[\xea#\xa3\x1b\x07\x5c\xf4\xce\x93\
+\xf5\xd8\xa3!F\x03p\xd4\x00H\x99yN\x22\xe1\xad\
+\xc3p\x0f9\xf3L\xa5\xa4\xa7\xf2\x86\x0d\x5cV\xbdm\
+\xbb\x03k\xc7_0\x9fU^\xad\xf4}\xeb\x178I\
+\xf5\x1fu\xeea3\xf3\x17\x8cOT\xa8\xe5\xd9y\xc7\
+\xd9\x89G \x9b\xa1\xb7\x04\xf8\x98\x0b\x10H9\x19\x9d\
+a\xfe\xb8\x1f\x92Z\x15\x93\xb2\xea}e\xfd\x0e\x10\x98\
+\x08\xdc\xb4+\x5c\xb8\xe7\x11\xfa\xf7\xff\xfaK\xc0\xc11\
+s\x03f\x87\xabW_\x8e\xe7\xbd\xe0w\xc0a\x92O\
+\x8dF\x01\x12\x96\x9e-:s\x86\xcf+\xde\xfc\x05'\
+~\x87\xa9\xec\xcf\x16\x99\x9e\xf2\xf3\xf8\xad\x18@\xd0\xb5\
+\xf4\x91c\xb5\x8f\xa4\xee2A\x9a\x86H\x92\x11\xa3%\
+\xd0\x14\xa0\x19\x183\x91\xf2d\x8b\x8b\xf6@\x1aA`\
+\xa97\xa0A\x9dA,:\xc2\x0c<4\x0bP:\x12\
+\xc7L\x02\xeb8\xac#\x07c>\x81tj0d|\
+\x8d\x82\x9c$\xf9\xc7+\xf1\xc8\xe4\xeb\xd7\x9e{Vg\
+\x1d-P\xe4\xe7\xa76n\x92\xb5G\x0a\x00\xbcfB\
+\x0f\xb0gb\xd3\xd4\x85\xb4]\xb4\x82\x00\xa0\xb3\xda\xb5\
+\xc5\x06\xc7\xb8\x10\x13\xa4C\xbfc\xe6|*\x88\x02\xc8\
+\x9d\xcc\xe0\xff\xdf\x0f\xbc\xeb\xc4\xef\xdcNt\x065\x80\
+\xa7L\x5c>e\xd6\xdc|\x00\xb1\xc2\x8f@\xec\xe0B\
+\x03\x17\x1c\x88\x1b4~\x8a\xf3\x87/\xc0\x87^\xfa+\
+t\xfe\xf0\xf9\x8d\x0b\x93\x16\xecz0E\x89\x9eR\x85\
+\x81\x92\x01\x85A\xc9\x9a\x0fui1\x1a\x96\xe7\xcap\
+\xca\xd4c\xb1s\x95\xf4\xb5\x07\xbf\x96\xf2\xe9\x90F\x8e\
+\xbf^\xdf\xae\xb7M3\xa8\xb5\x82\xb4lv\x02F\xfb\
+\x9e\x0b`\xb0\xcb\x02\xa0%\x81\x8f\x99\xb1\x02\xf1\x8a)\
+\xac\xbd\xeb\xfa\xa3\xf3\x1f\xf7/\xfd\xf0W\xf1\xe1\xf9\x8f\
+!4k\x04\xf1\xed\xc52q\x13\x9d\xd4\xc1\x8c\x0c\xc4\
+b\x0b\xec\xa8\xa4\x1d\x00l\xa4(\x19\x0a\xb6\x89U|\
+\xe8\xe1\x1b\x8a\x8fk\x5c\xba\xf7Op\xef\xa5?\xc7.\
+L\xfb\xc3\xf3\x1f\xf2\xb3\xd5}\x9c\xef\xba$}-s\
+\xb7\x18\xce-\xa8\xe7\x17X\xa9\xbbI\x05\x1fS\xd9\xf3\
+\xce\x8e\x03\xc1\xb5R\xcd\xf8\xf5v\xaf\xc5L\x18\xd3\x1c\
+Nr\xda\xd5N\xc2u\x94\xfe\xab\xf5\xf4\xd2\xfa\xfc\xe1\
+Ky\xb6\xbe\x1b\x97\xee\xf9\x93\x8c\xad\xa4\x0c\x9fw;\
+^\xbd\xfcj\xc7\xfc\xa3tkV(\xdc\xd2\xa4 \x10\
+%\x0d\x85\xb8x\xf8f\x89\xfd\xc5\x03\xcc\xe8\xc4\x1b\xce\
+f\x19g\xf0\xca\x96\x1de$\xfbx\x12\xc3c\xcb\xfb\
+\xc3\x03\xb9\xfe\xef\xf0\x96\xf7\xc7@a\xcc\x91\xb8Q[\
+@\x0d\x10\xf1\xdc\x11\xd03\xba\xfe\xdc\xe2\x01\xf6\xcd\x12\
+\xec4\x97(\x80\x95\xf97\x1d\xc6\x8e\xf1\xb7\xd2\xff\x0f\
+\x87\xa6Z\xe31{I\xbb\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+\x00\x00\x13\xd8\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\x12tEXt_q_\
+icoOrigDepth\x0032\xd5\
+\xe2\xb8\xec\x00\x00\x13lIDATx\x9c\xcd\x9bK\
+s\x1cW\x96\xdf\x7f\xe7\xde\x9b\x99U\x85*\xa0\x00\x02\
+\x84\x08\x92\x1a\x11\xa2H\x092)\x8d\xd8\x0f?{:\
+\xa6\xdb\xe1\x08{-\xaf\xbdw\xf4\xce\xde\xcc\x86\xad\x85\
+\x1d^\xf8Kx;\xfd\x01:\xc2\x11=\xd3\x0a\x8f\xe7\
+\xd1!j$H\x82$J\xa2\xd4\xd3|\x02|\x14\x89\
+\x02\xaa*3\xef9^dV\x01 @\x8a$(\xb5\
+OE\x12\xacG\xde\x9b\xf7\x7f\xcf9\xf7<\x85\xe7M\
+\x17qg\xfa\x17\xe6\xd2\x86\xbe$\xce\x9dAx\x15\x93\
+S\xa0K\xc0\x82@\x17h\x03\x0d \xd4w\x95\xc0\x10\
+\xe8\x1b\xf4\x80\x0d\x11\xbbf\xc2\xd7\xa8\xfb\xdcT/\xe7\
+C\xf7\xcd\xe5\xf6\xa5\xbb\xbc\x83>\xcf\xc7\x95C\x8f`\
+\xc8\xf9\xffz\xbe%\x99tqtK\xa4\xeb\x94y\x11\
+\xbf\x84\xd8\x09\x8c\x93\x06\xc7\x80# ]\xd0\xb6@\x13\
+H\x0d\xf1\xd5CX\x04rC\x06 }\xb0\x1ebw\
+\xc4\xb8\x81\xc8\x1f0\xb9j\x16\xaf\x1blxg\xf7Q\
+z6\xb2\xde\xea\xff\x5c\xdd\x06\xec\x8f\x07\xc0E\xdc\x0a\
++-O\xf3\x04\xc69A^GuY\xc4^0d\
+\x1ac\x0a\x91)\xc3\x1a\x82e )\xd5\xae\x07\xc0\xed\
+\x9a\xdf\x00\xa5\xe2\x84\x12,7d$\xc8\x10\xb3-\x1c\
+}3\x1e\x18r\xd3\x99]1'ki\xc1G\x83t\
+pu\x8d\xb5\xed\xc3p\xc53\x01p\xfa\x17\xa7\xb3F\
+\xe7H\xd7%qA\xb0%\x8d\xf6\x8a\x88\xbd)&+\
+&,\x03GD$\x11'\xec\xb9\xa4\xba\x90zb\xa9\
+\xa77\xab\xb6\xd1\xc0\xcc\xaaK\xf7^j\x96c\xdc\x01\
+\xbe\x16\xf8\xc4\xc1\x878w\xd9\xac\xb8\x1ec\xbc\xad\x89\
+\xde[{g-\xff\xee\x01\xf8\xcb\xb7\xfd\x1b\x1f^}\
+\xc1\xc2\xe8\x1c&\x7f\x8ar\x0e\xb1e`\x01\xac\x0b\xd2\
+\x11'\x89\xf3\x0e\x9fxB\x12\xf0\xa9\xc7'\x1e\xe7\x1d\
+\xe2\x1d\xce\x09\xe2\xf6\x0ek\x0a\xaa\x86E%\xc6H,\
+\xeakT\xfd\xd5\xa8\x98Y\x01\xb6\x09\xd2CX\xc7\xec\
+\x8a\x09\xab\x0e\xf9\x80\x18?\xfe\xf0\x8d37\xf9\x8f\xbf\
+\x8a\xdf\x0d\x00\x17q\x17\x86\x17:e\xeaN\x98+_\
+\x13\xe4\x87\xa6\x5c\x00^C8\xea\x9c\x0b\xe2\x05\x1f\x1c\
+.x|\xa8\x16\x1d\xd2\x80Oj\x00\x82C\xdc.\x00\
+v\x09\xc0\x04\x00U\xb4Tb\x19)\xf3\x92\x98\xc7\xea\
+*#\xb1T\xb4\x8cX4\xd4\xb44\xb3[\xc0\x1a\xe2\
+\xde\x17\xd1\xf7J\xd2\xb5\xe6\xb0\xbcv\xa9qi\xf3I\
+\xc5\xe2\xc9\x00\x18\xcb\xba6\xce:\xb1\x9f\x1a\xfcXL\
+\xce\x18,\x013\xce\xbb\xd4\xa7\x9e\xa4\x91\x90\xb6RB\
+\x16\xf0\xa1\xde\xf1\x87D\x00\x91\x09\xe7\xef\x92\x80\x9d\xbf\
+\xfbD@\xd1h\xc4\x22R\x8eJ\xf2\xed\x9cbX\x8c\
+\xb9\x22\x07z\x98\x5c7o\x97\x9d\xda?\x98w\xbf-\
+mp\xf9Iu\xc3\xb7\x01 +\x17W\x92f\xd1<\
+\x12\xbd,\x1b\xf1\xc7\x06?\x03\xde\x10\x91yq.\xf3\
+\x89\xc3g\x81$KH\x9a\x09i\xb3\x02\xc09\xd9Y\
+\xe1!\xc9\x0c,*e^\x030((FE\xc5\x19\
+EDUG\x98l\x18\xf6\xa13~#\xe2~\x97;\
+\xf9\x0a\xb6\xee\xae\xfdr\xad@\x1e}R\xf8\xc7M\xbc\
+rq%\x85\xa99u\x9cC\xf4\xdf\x83\xfc\x1cdE\
+D\xe6\x9dsY\xd2\x084\xa6\x1b4\xa7\x9bd\xed\x8c\
+\xb4\x99V\xac\xee\x5c\xb5x\xe1p\xe7L}\xbf@\xa5\
+@\xbdTb\x95\x05\x924\xc197\xe6\x94`X&\
+0\x8ds\x8b&\xb4\x81\xbed\x8d\x07\xf3\xbf\x99\xc97\
+\xde\xddx\xa4^x4\x00\x17q\x0b\xbc4\xef\xcc\xce\
+\x89\xd9OD\xecg \xe7\xc4\xc9\x9cO|\x924S\
+\x1a\xed\x8cF\xa7A:\x95\x12\xb2\x04\x1f<\xe2\xe4y\
+X\x17\xfbI@\x9c\xe0B\xa5\x5c\xc7\x226!#\x98\
+Y\x1b\xe3\x08\xd0\x02\x22\xd1\x86Z\x86\xfe\xed?\xbf\xb1\
+\xcd\xbb\x07s\xc1\xc1\x00\x18r\xfe\xbd\xf3-\x8a\xf0\x9a\
+3\xfe\x83`\x7f\x0erZ\x9cL\xfb\xe0]\xd2Ji\
+\xcd4it\x1a\x84F\x82\x0b\xbe\x92\xef\xef\x89D*\
+\x9d\xe2\xbc#\xa4\x01\xe7\xddXo\x88\x99%\x98\xb5D\
+lN\x8c\x10\x90\xf5\xeeh\xfa\xee\x9d\x9f\xdf)\x0f\x02\
+\xe1@\x00.\x0c/\xcc\xa8\xf9WP\xfdW\x82\xfc\x1c\
+8/N\xa6}\xe2]:\x95\xd2h7\xc8:\x19I\
+#A\x82\xfb^\x17?&\x91\x0a\x00\x17\x5c\xa5l\x91\
+\xdd 40\xba\x08A\xc46]H\xfbK\xb2\xb8}\
+\xf3\xdd\x9b\xc3\x87\xc7\xd9\x07\xc0\xdbo\xbf\xed7\x167\
+\x96\x05\xfe-\xc6\xcf\x80\xd7j\xb6wi+\xa59\xd3\
+\xa4\xd1\xce\x08i@\xea\x89\xff\x98$\x228\xe7p\x89\
+\xdb\xad\x13\xc4\xcc\x02F\x02\xb4\x9c8+\x84[\x1b\xff\
+\xf9\xdf\xdc\xe5Wk{\xb8`\x0f\x00\xa7\x7fq:{\
+\xf0b\xb1\xe8\xe0-3\xfbw\xc0\x0fDd\xde'>\
+IZ)\x8dN\x83F'#mf\xa4!%q\x09\
+\xc1\x85J\xee\x01\xfb\x16\xb3\xdc\xa8\x8f8\x0cE\xab\xf7\
+\xf5kr\xbf\xf0\xd4\xa0\x8a\xc8\x8e\xfe1*\xcb1\xaa\
+\x98Z\x0a\xaec\xce\xd4\x1b\xeb\xdd\x8d\xbb\xf7\x16\x7f:\
+7\xda\xad\x14\xc3\xee\x81\x1a\x9d#](\xfe\x99\xc2\x0f\
+\x05y\x05a\xde9\x97\x85,\xa1\xd1i\x90\xb53\x5c\
+\xe2\x09.\xd0\x0a-R\x9fb\x18y\xcc\xd9.\xb7\xd1\
+\xf8\xf8cW\xd8Q\x90\x82\xec\xb81\xf2\xd0o\x9e\x91\
+B\x12h\xb4\x1b\x00X4,Z\xa6\xaa\x0b\x12\xe5\x8c\
+\x89\xfd\xa0\x81\xf4c\xe9>\x00n\xed\x07\xe0\x22\xce\x11\
+\x17D\xe5M\xc3\xde2Xr\xcee\xa1\x11\xc8\xa6R\
+\xd2VF\xc8\x12\x9c\x13\x1c\x8e\xd4\xa74B\x83\xf1*\
+\x86e%^\xc6\xc1\x87\x80\x13G#4\xe8$\x1dZ\
+I\x05\x9e\xaf\xed\xe1\xa8\x91\x5c\x0b\xb6\x8bm6\xf3M\
+\x86q\x88\xda\xd3\xfb7\xe2\x84\x90\x052\xcd\x88ye\
+>\x97\xa32S\xd3%\x90\xb7\xd4\xb8\xe7\xbd\xbf\xcaE\
+6\xc6FR\xa8\x9fZV~\xb9\xd2\x12l\xc9\x8c\xf3\
+\x08\xaf\x013>qd\xed\x8c\xac\x9d\x11R\xbf\xc7~\
+\xaf\xd8\xf6\xdb\x98\xbe\x22/\x9eFh\xb0\xd8Z\xe4t\
+w\x99\xe3\xed\xe3t\xb3\x19\xb2\xd0\x98\x80\xd7\x1b\xdd\xe7\
+Z\xff\x1a_\xf5\xbe\xe2\xd6\xf6:\xc3rH\xb4\xa72\
+\xeb' \xf8\xd4\x93u2\xcc\x0cUE\xa3v\x05[\
+\x11\x93\x0d\xf5\xee\xfd\xf3\xed\xf3\xdf\xac\xda\xea6\x82y\
+\x80\xf3\xed\xf3S\x0c\xd2\x17\x81\x1f\x8a\xf0g\x08\xaf8\
+\xef\x92\xa4\x95\xd0\x9cn\x92N\xa5{\x8e:q\x82\x13\
+\x87a\x94Z\x92\xc7\x9c\x5cs\xd4t\xdf\xee{\xf1\xcc\
+d3\xbc4\xfd'\xbcz\xe4U^\x9f_\xe1\xec\xdc\
+\x19\x96g\x96y\xb1s\x92\xa5\xa9\x17Xh-0\x9b\
+ui\x85\x16\x89\xaf\xf6d\xa49E\xcc\x0f\x84X\x10\
+\xbcTJ\xcf\x89\xc3=4\xeb\xd8\xf4\xc6\xa88\xa1T\
+oU\x0cb \xea\xae2\x0aw\x16\x7f=?\xb8\xf5\
+\xb7\xb7\x8aj\xb6>\xb3\x08\xe7\x0c{C\x90\x05\xe7\x5c\
+\xf0\xa9'\xc9\x12|\x1a\xf6\x9d\xf3Q#\xdb\xe5\xf6\x84\
+\xed\x15%\xea\xfe\xdd\x1a\xb3\xfd\x89\xf6q~|\xecG\
+\x9c\x9d;\xcb\x91\xc6,S\xc9T-\x02\x95\x0eN\x5c\
+B\xe63\xdai\x9b\xc5\xa9\xa3\xcc7\xe7\xe1\xc6\xef\xb8\
+\x12G\x0c\xca\xfd\xe2\xe0D\x08.\xc1\xbb\xb1\x08)\xa5\
+\x16\xc4\xda\xa9\x10\xd9e16\x12b\x11!'\xd1\xa8\
+GE\xecM3\xdd\x90L\xfa\xc0V\x00\x10\x95\x19'\
+\xac\x98\xc9\xeb`]\xf1B\xd2\xa8l{\x9f\xec7r\
+\xd4\xf4\xb1\x0a\xcf0\x04\x99\xb0\xfdrw\x99\xb3sg\
+yi\xfaE\xd4\x8c\xad\xa2\xcf\x8d\xad\x9b\x13\x00\x1b\xa1\
+\xc1t:M'i3\x9dv\x00\xb8=\xb8\xcdV\xb1\
+\xc5\xcd\xad[l\x97\xdb\x931\xeb\x15\xe2\xc5\xe1\xa5V\
+aRR\xca.\xa5\xba\x0b\x84\xa4\x99L\xdci\xa2\xcd\
+\x9a\xf1\xba\x88\xbb\x86\xe8\xa7\xc0\xb5\xc0E\x5c,e\xc6\
+\x09\xcb\x08\xa7@:>8\xd2VJ\xdaL\xf7\x9a\x9b\
+\xfb\x16ZO\xf6\xf0\xe7V\x1dg\x9d\xa4\xc3\xe9\xee2\
+gfOs\xa41\x8b\x9aqwx\x87+\xf7\xbf\xe1\
+\xf2\xbd/X\xdf^\x07`\xb1u\x943s\xafpj\
+\xfa\x14G\x1as\xcc5\xe6x\xa5{\x9a\xadb\xab\xba\
+\xca-\xcclg#lo\x1c\xcc&\xff\xec%\xe7\x1d\
+i3EK\xad\x9d'i\x03\xa7\xcct\xd9\xc4Mc\
+H8\xc3\x859!.\x98\xb0\x08\xcc\x89\x93\xc4\x85\x8a\
+}*\xaf\xee\xd1\x00|\xdb\x81\xd5JZ\x1co\x1f\xe7\
+D\xfb\x04\xadd\x8a\xad\xa2\xcf\xd7\xf7\xbf\xe1\xa3\xdb\x1f\
+\xf3\xe9\x9d\xcfv\x00\x98:\xca(\x8e\x10\x84\xccgL\
+%-NtN\xb01\xb8\xcd\x97\xbd\xaf\x0e\x00\xdeP\
+SJ-\x81\x8a#\x0f\xd2\x15\xce\xb9j\x1dy\xe5\x9e\
+\x97\xaeLMm\x1e\xe4\x051[x\xf5/~4\x17\
+\x12\x8d\xa7Dd\x09\x98\x11\x91t\x8f\xb3\xf1\x8c\x8e\xcd\
+\x98]S\x9f\xd2\xcdf\x98m\xcc\x92\xf9\x94\x9b[7\
+\xf9\xfc\xde\x17|z\xe736\x06\x1b\x0c\xca\x01\x00\xeb\
+\xdb\x1b\x80\x90\xf9\x06\xc7\xa6\x8e1\x9bu\x99\xcdf\xe9\
+f]R\x97N\xc6\x9c\x8coF\xa1\xc5D$\xc6\x06\
+\xd6>\xaa\x1d(\x1f\x5c\x15\xa8\xf1\x82\x1a\xa9a3\x02\
+KI(_\x0aN\xdc\x19\xc4N\xa2LU\x11\x9d\x9d\
+\xf0\xd5\xc4\xa5}\x96\xb8\xabA\x10O+\x99b*i\
+\xe1\xc53(\x07\xdc\xdc\xba\xc9\xcd\xed\x1d\xf9\x07\xd8*\
+\xb6\xab\xcf[\x8b\x0c\xca\x01\xdey\xa6\xd2\xea\xbe\xe0\xc2\
+\xbe\xf9\x1f\xb9\xe0\x83\x00\xa0\xf2\x19\xc6Q)\xd3\x88\x95\
+\xd66''\x04\xbb\x1f@\xce\x9aqRD\xa6\xc4\x09\
+!\x0d\x84d\xc7\xbc=\x0cy\xf1d\xbe2\x99\x01\xa2\
+EFq\xc4\xa8\x1c\x11Mw\x0c!\x8b\x0c\xcb!\xc3\
+\xb8s\xf6\xa7.!\xf5\xd9\xe4\xa48\x0c\x89s\xf84\
+\xe0\x93@,\x14\x84\x16&'\x11\xca\x80\xc9)\xcc^\
+0\xb1\x868\x99 5\x01\xe0\x10Qw\x91\xca^\x18\
+\x93Y%\xbb\xd5\xb1\xb6W\x8d\x8d?\xdf\xbd\xb3^\x0e\
+\xe9i\xd6C\x89\x93*8[\xaf\xcb\xa0\xe9T\x8f\x99\
+s\x84:c3+Xv \x00\x87\xa4\x87m\xfb\xc7\
+\xd9\x8e\x0f\x7f\xf7\xbc<\xcd\xb1\xb34^\x97`\x99\x89\
+\x1c\x01\x93\x00,\x80\xb4\x81t\xb7\x8f}\x18\xe4\xcd\x0c\
+\x15=P;\xab)\xd1b\xc5\x055sD\x8d\x98\xd8\
+>\x83g\xac\xed\x15\x9d\x1c\xad\xcfB\x93H\xd2\xc4\xa0\
+\x93\x04\x98\x11\xf0A\x90YC3\x90P\xc5\xdd\xaa\xd0\
+\xf5a\x02\x9a2~\x1d0\x86\xc3!\xe2p\xf5\xff\x01\
+L\xac\xfel\xff\x91+\x22\x87\xe6\x04\x11p^p~\
+\xf2L\x09\xd01H\x02X[\xc6\xe9*aW\x08\xfb\
+\xe9'\x1a\x1f\x7f\xad\xa4\xc5\x5cc\x8e\xe3\xed%ZI\
+k\xf2};m\xf3rw\x19\xa4\xe2\x92\xb1\x82\x8b\x16\
+\x11\x11^\x9eY\xa6\x9d\xb6'\xbfo\x85\x16\xc7\xa7\x96\
+\xd8h\xdf\xe6\xee\xf0.\xa38\xdak\x11>\x05\x02\x13\
+\xff\xa0\xba\xd5\x1b4\x05\x0b\x01\xc8\xa0\xde\x10@\x1c\xfb\
+\xb26O\x0c@\xcd\xa6s\x8d9\xdeZ|\x937\x17\
+\xde\xe0Hcn\xf2\xfdb\xeb(?=\xf9\x13.,\
+\xbeU=\xd7\xaes\x1c\xa0\x93\xb69\xda::\xf9\xfd\
+\x91\xe6\x1co\x1d\xfdS\x9c8\xde_\xff\x80\xeb[\xd7\
+\xf7Z\x84OC\xb2'L\xef\x80\x04\xc4\x07*4\xdc\
+8\xf4\x5c?\xd93\x9d\xff\xe3\xdd\xe9\xa4\x1d^\xee\xbe\
+\xcc\xcb\xdd\x97\xe9\xd4\xb6=@;i\xd3\x9ei\xa3\xa6\
+\x0c\xe3\x88R\x0b\x00\x82Kh\xf8l\xcf\x89\x01L\xc6\
+\xd9,\xfa|\xd1\xfb\x0a\xb6\x9e\xd4\x01?\x80&!v\
+\xa9\xdf\x99\x07\x91\xf0-\xb7==\x19\xa4>\xa1\x9b\xce\
+\xd0\xcdf&6\xc0n\x1a\xc5\x11\xeb\xdb\xebl\xe6\x9b\
+@\xb5\xd0\xc5\xd6Q\x9a\xa1\xb9\xe7w\x89K\xe86\xaa\
+qR\x9f\x1c2\x11~0\x05 \x0ab\x80\x9b\x9c\xc1\
+\x87\x9c\xa82\x80\xb2}\x8b\xaf\xdc\xe8\x017\xb6n\xf0\
+\xc5\xbd/Y\x1fl\x00p\xb4\xb9@>\x9b\xb3\xd4>\
+F34\xf7\x18?cW\xf9\xd0\x06Q\x15\xbf\x19s\
+\x90\x81D@\x030\xa2\x02\xc2\x03\xce\xb4JT>\x07\
+\x03l\x1f\x0d\xeb\x9d\xff\xe2\xde\x97\xbc\xbf\xfe\x8f\x5c\xed\
+_\x03\xe0d\xfb\x04\x00A\x02\x8bS\x8bL\xedR\x9c\
+\xcf\x8d\xccv\x92\x90U-B\x01V\x84\xaa\x22\xa3:\
+\x061\xc2$)\xf9\x8c'\xc1d\xbe\x03\xd8\xa8\xd4\x82\
+\xcd|\x93\xf5\xc1\x06\xd7\xfa\xd7\xf8\xfd\x83\xdf\x03\x95\x5c\
+\x9e\xe8\x9c\xe0x\xbe\xc9\x91\xe6\xdc\xbe\xfb\x9eY\xee'\
+\x03\xec$[\xeb\xa1\x220\x00\x19:D\xef\x22\xb6\x09\
+\x94fU~\xdeTw\xa3\xf5\x9d\x90\xed{\xf7\xdd\xcd\
+g\x06\x1a\x0d\x8d\x13'\xaa\x10a\x13\x91\xbb\x01\xd8\x00\
+\x17\xc1\xbafF\x8c\x11-\xb5\xb2\x06\x9fs\xd2#\xb8\
+\x84N\xd6a\xae1\xcbl\xd6\xa5\x97\xf5\x00\xe8f]\
+f\x1b\xb3Lg\x9d\x03\x95\xe6a\xc9\xd4&5\x07\x15\
+\x00V\x80\xf4\x04\xbd\x1b\x80\xeb\x82\xa9\x22/\x98Vy\
+\xf8XF\xbc\xfao\xc9\x1d?=U!\xb2\xa3<\xe8\
+<\xe0\xea\xf45J\xab\x02\x1a/N\x9f\xe4\xc5\xceI\
+\x8e\xb6\x16\xeaP\xfb\xf3%3\xab\x0a,\x8aX\x89\x02\
+2\x02\xee\x007BU\x8a\x06\x22rz\x0c@\x99\x97\
+$\x8dz'\x9e5\x1ep\x00yq\xb4\x936\xc7\xda\
+\xc7xm\xee,3\xe94\x02\x1ck\x1fc\xa9}\x8c\
+v\xd2\xfe\xd61\x9e\x8a\xeag75\xca\xa2\x9c\x00 \
+0\xc0\xec\x06\x22_\x07\xd4}\x8eX\xc0l\xcb\xd4\xaa\
+\x9a\x9c,Vz\xe0;\xa2\xd9\xac\xcb\xebG^\xe7\xe5\
+\x99e\x00\x9a\xa1\xc9L6\xf3\x9d\xcdgj\x93R\x1b\
+S\x03\xd82q\x7f0\xec\xb3`\xaa\x97E\xdc\x0c\xce\
+\xfa\xa6;\xacR)\x8cgO\xf5?N\x7fd>c\
+q\x97\xc9{\x98\xb1\x1eKu\xd5\x99F\x9dT\x93\xd4\
+\x00\xf41\xbb\xea\xbc|\xe1\xf2\xa1\xfb\xc6,^7\xe3\
+\x81\x9a\xe5\x1auG^\xa2~\x97\xca\xf9\xbb'\xabr\
+\x84c\xbdVW\x9a\xe5\xc0\x03q\x5c/-\xfd\xc6]\
+n_\xbak\xb0a\xc8M\xb0;\xa6V\xc4B)G\
+%e^\xa2\xcf \x0a\xe3\xd0\xd78j{\x18*\xb5\
+d\x14G\xcf\x94&SU\x8a\xbc\xa4\x18\x95\xe3\x13 \
+\xc7\xb8\x8d\xd9M3\xbb\xbd\xf6\xcb\xbf\xbb\xe7x\x07\xf5\
+\xce\xee;\x89W\x10\xbe\x06\xdb\xd4\x18\xc9\x079\xf9v\
+\x8e\x96O\x09\x80@\x1e\x0bz\xa3\xfb\xf4F\xbdC\x81\
+Pj\xc9\xbdQ\x8f\xde\xa8G\x1e\xf3'\x97\xc7\xfaw\
+Z*\xc5vN1Y\x87\xf5\xc1\xbe\x16qW\x1c\xfa\
+\x00\xc1*gH\xe9\x99gMT\x8e#,Zis\
+\xc5\xa0\xc0\x87*\xb3\x12\xd2\xba\xeakWa\x9f\xd9~\
+\xfbl,\xab\xfd|\x93\xaf\xeax~7\x9b!\xf3\xd9\
+\xf8\xae'|\xfej\x9cQ\x1c\xd1\x1b\xf5\xf8\xb2w\x85\
+~\xde\xdf\xf3\xddc\xa9\xd6\xfc\xb1\x88\xe4uE\x99F\
+\x03\xe4\x9e\x08\x9f\x98\xe9\x9a\x18=\xa8\xb3\xc36\xb2^\
+:\x15>\x8a\xc2\x82\x8a\x9dS\xd5?\xa1 \x14\xa3\x82\
+8\x8aX\xaa\xb8\xba*\x0b@\xcdP\xe2\xbe\xd0\xf48\
+zso\xd4\xe3\x1f\xd7?\xe0\x8b\xdeW\xa4>yf\
+G&Z$\x8f9\xfd\xbc\xcf\xbdQoO}\xc1c\
+\xd7_+\xf32/)G\x05e\x1e1\xd3\x02X7\
+\x93\x0f\xc0}d\xa3\xd8\x83\x9d\xe1d\xe5\xe2\xcaTj\
+\xad\x7f\xa1\x16\xff\x93\xc1\x9f\x09\xb2\x10\x1aI\xda\x9an\
+\xd2\x9ai\xd1\x9cj\x92\xa4\x09\x02\xc4:+\xf3\xb8\x1c\
+\xfed\xb7\x0f\xabDw\x17T<!\xc5\x22\x92o\xe7\
+\x0c7\x87\x0c\x1e\x0c(\x87e\x8e\xc9\xba\x89\xfd\x16s\
+\xffKf\xf2\xbf[\xfd/Uz|\x1c\x81\xb05\xd6\
+\xb6\xcd\x8a\xeb&\xac\x02k@O\x8b\xc8\xb0?d\xb8\
+9$\xe6\x11\xf4\xc9\x98x\x9c\xb8\x18\x074\x0f\xf5\xaa\
+C\xe5O*>\xe33\x7f\xd4\x1f1\xea\x8f\xd0B\x01\
+z\x98}\x22\xc6j\xf0\xf1\xfaj\x7fu0.\x9e\xdc\
+\xe1\xcdw\xb1\x85\x7f\xbd\xe0\xbc\x0b\x98\xb8\x86\x98,\x1a\
+6kZ\xe9\x09\x1f|\x1d0\x95IL\xefQ\x0f5\
+\x0e\x88:q\xcf\xe5z\xd2\xc0\xa8\xa9U\xe5\xb4[\xd5\
+\xee\x17\xc3\x02S\x1d\x02W\xc0\xfe\x8f:\xff\xf7H\xf9\
+\xf5\xadwn\xf5\xc7\xf7\xec\x89\x08i\xa2\xf7|\x19?\
+\x96\xe0:\xe6\xe5\x94\xa8\xcc\xab\xeaB1*\xb2\xad\x07\
+[D\x8b4\xa7\x1b\x84,\xfc\x7fi\x1e\x94y\xc9h\
+s\xc4psH9*1\xd5\xa1\x19\xebb\x5c\x06y\
+/\x96\xf6\xb1&eo\xf7={\xb4\xd3\xc6\xbb\x1b\xf1\
+\xd6/~\xb2}d\xa3oAc\xd3\xa0%0mf\
+mU\x15\xb3*z(R\x07O\xff\x08\xf5\x81\x07\x91\
+\xaaM\xea\x88\x87\x9bC\xf2\xed\x9cXF5c]\xe0\
+C\x1c\x7f\x13\x8d\xbf_\x0b\xef\xff~\xe3\x9d\x8d=\xe7\
+\xf2~\xf5\xfc\xab5{\xf1\x9f\xbf\x90\xc7T\x1e\x88\x11\
+\x11\x16\xcd\x98\xc3,151\xadMd_\x17(\xfe\
+\x91A\x18\xb3\xfdx\xe7\x8b\xed\xa2Z\xbc\xda6\xc2g\
+\x82\xfd\xda\xbc{7\x1d\xc9?\xdd\xf8o7\xbe\xbdP\
+\x12\xe0\xc6\xdf\xdc\xc8\x17\xdf[x\xa0e\x12\x9dZ\xbb\
+J&\xd24\xb3\x86\xc5\x0a\x84I\xe7\xc78\xe6\xfe=\
+\x031\xf6\xf1\x8bZ\xe6G\x9bC\xf2AN,\xa2\x9a\
+\xda=\xc4.c\xf2\x7f\xc5\xb9\xbf*\x19|\xb2\x1aV\
+\xb7\x9e\xb8T\x96w\xe0\xd6\xbf\xbc\x15\xe79\x9e\x8bh\
+\x1f\x88\x82\x9b\xc3\xe8\x9aY\xa2\xaa\xa2\xa5b\xd1\xf6\xf7\
+\x03|\x0f4>\xe7\x8bA\xc1\xf0\xc1\x90Q\xad\xf0b\
+\x19U\xd5\xfa\x22|n\xf0\xbfM\xfc_\xa7%\x9f\xaf\
+\xfa\xd5\xde\xa3z\x07\x1em\xa1\xbc\x8b-\xfc\xb4\x9bK\
+\xdaz@d$\x22\x01\x11_\x8bB\xa6\xa5\x06\x1d;\
+K\xb5\xd75\xa61w\xb0\xdbx|\x16\xdak|\xa2\
+\xaa\x93\xc6\x89bP0\xda\xaa\x8e\xbabX\xa01\x0e\
+\xcd\xe4\x96\xc0\x9a\xc0\xdf\x9a\xf1\xd7\xc4\xe4\xa3\x22\xd9\xba\
+\xfb\xb0\xdc?\x19\x00\xc0\xc6o7t\xfe73\xb9I\
+\xba\x19\x8cuL7Mh\x09\xd21,3\xb5\x10\xcb\
+8.Ec,\x1aR7K</~\x18w\x90T\
+\xec>b\xb89b\xd4\xaf\x95]\x1e'\xda\x1e\xf8\x10\
+\xf8\xb5z\xffW*\xees\xf3\xfd{k\xef\xac\x15\x8f\
+\x1b\xfb\xf1\x89\x11\xc1\xd6X\xcb\xb9\xc8\xfa\x8a[\xe9\x07\
+i\x0e\x5cTQ\xc7\x96D9\xa3\xa6K\x1a\xb5\xab\x85\
+\xa6\xe3&'-\xb4j\x99I|\x95\x8ctn\xa7c\
+\xcc\xed\xe8\x8dG-t\xccM\x93n\xb1\xaa\xee\x17-\
+#\xc5\xa8\xac\x9c\x9bAAY\xb9\xebU\xcb\x0c\x5c\x13\
+\xe32\x8e\x7f\xc0\xdc\xbbnjt\xf9\xe3\xfe\xea\xe0y\
+\xb4\xcc\xecP\xdd45h\x84\xe3\xc1\xf2\xd7\xcc\xf8\x01\
+pA`\x05\x91\xc5q\xd3\x94\xf3\xbe\xaa\xc9I\xea\xb2\
+\x94\xba\xe2\xc4\x87\xbai*\x1c\xac/\xc6\x8b\xae\x16\xab\
+\x93\xae\xb1r\xdc\x163\xf6\xe9K\xad\x835Z`r\
+\x0b\xb5O\x10{_\x90\xf7\x22|\x9a\x15r\xfd\xd2\xff\
+\xb8\xf4\x80\xc7\xb4\xc9<\x1b\x00c\xfa\xcb\xb7\xfd\xd9O\
+\xbe\x5cl\x98\x9cS\xe3\x0dg\x9c\xaf{\x05\x8f\x82\xcd\
+\x82\xb4\xabb\xabq\xb1\xc5N\xd7XeM>\x06\x00\
+{\x08\x80|\x07\x00\x9b\x043\xac\x0fr\x0fX7\xf8\
+J\x8cUu\xee\x83X\xda\xc7\x9f&\x97n=m\x13\
+\xe53\x89\xe9\xca\xc5\x95\xd4\x15n\xd6{?\xaf\xce\x1d\
+\x13ug\x04{\xc3\xcc^\x079\x850/B:a\
+\xff\x03\x1a'\xab\xc9\x1f*\xb3\x7fD\xe3\xa4\xaa\xc18\
+\x98\xe1\xb8b\xf0\x89\xa8|\x88\xd3\xcb\xbe\xe0FL\xe3\
+\xed\x92\xb2\xf7\xfd4N\xee\xa6\x8b\xb8\xf3\xed\xf3M\xee\
+\xa7' \x9e\x13q+f\xba\x8c\xc8\x0b\x083\x18S\
+\xc0T\x9d\x8b\xcf\xea\xca\x8c\x84:\x0d\xc7\x1e\x1d\x8fR\
+el\x0a\xb0\xa2j\x9de\x00l!la\xdc\xc7\xec\
+\xa6\x88\xbbb\xa2\x9f\x88$\x1f\x05\xe2\xd5K\x5c\x1a~\
+\xef\xad\xb3{\xe8\xa1\xe6i\xc5M\x8b\xc8\xbc(K\x06\
+'\xc1N\x98\xc811\xe6\x81\x19\xa0\xc3\xa4y\xda\xea\
+\xe6i\x89@N\xb5\xe0M\xe0\xbe\x09\xb7\xc5\xec\x06N\
+\xae\x8a\xf2\x07s\x5c7\xb3\xdb\xc1q_K\xbd\x1fB\
+\xb8w\xe9\x9dK\x03\x0e\xe9p\x1f>=.\xd8*\xab\
+[\xc0\x16p\x0dC^\xfd\x8b\x1f\xcd%\xa1|Ip\
+\xf7\x11-*}$N\xaaZ\x84\x04,Pi\x83\xf1\
+\x06\xc4:[3\x94\xaa\x85\xfe\xaeH\x15\xb7\xc7\xdc\xe7\
+*\xfaEQ\x84o>\xfb\xef\xbf\xbb\xfb\xa4\xca\xedI\
+\xe9\xff\x01\x80v\xffK\x97\x02\x9f\xfe\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x007\xd5\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
+\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95+\x0e\x1b\x00\x00\x00\x12tEXt_q_\
+icoOrigDepth\x0032\xd5\
+\xe2\xb8\xec\x00\x00 \x00IDATx\x9c\xed\xbd\xdb\
+\x93$\xf9u\xdf\xf79\xbf_f\xd6\xa5\xef==3\
+;\xbb\x0b`\x17\x17\x11\x94H\x8a\x94\xe0\xb0AJ\xa0\
+DJ!E8\xfc\xe2P8\xfc\xe8\x90\x1f\x1c\x96\x9f\
+|\x099@\x0bd@\x22-\x996\x15~\xe0\x83C\
+\xff\x81\x22\xf4\xe2\xb0\x1f\xecp@&\x19\x94DQ\x14\
+DS\xa0\x08\x80\x0bb\x81\xdd\x9d\xd9\xb9\xf4\x5c\xfaV\
+U\x99\xf9\xfb\x1d?\x9c\xdf/3\xab\xba{\xa6\xb7w\
+\xa6g\x17\xe4\xd9\xcd\xa9\xea\xae\xea\xac\xac<\xe7w.\
+\xdfs\xf9\x09\x1f\x13z\xf3\xbfx\xc3O\xb766]\
+Q\xec\x88\x93k\xc05D\xae\x037\x80k\xc0\xae\xc2\
+\x16\xe8\x06\xb0\x0e\xac\x01S\x811vT@\x09\x14\x80\
+\x07\x5c:\x00b:\x02\xd0\x02\x0dP\x03s\x859p\
+\x02\x1c\x03G\x88\x1e\x08<\x01\x1e\x02\xfb(\xf7A\xee\
+\xa3\xeck\xd4\xfd\xd8\x86G\x8b\xc7\x87\x07o\xfd\xa3\xef\
+\x86\xab\xb8/\x1f\x96\x8a\x97}\x01\x00?\xf6\xf3?F\
+\x8c\x0e\xe7\x9c\x80\xa0QEc\x90\x10\x02D\x95\xd0\xb6\
+EQU\x13\xe7\xfd&Bf\xf0:0\xe5l\x06\xaf\
+2Y\xce92\x9d\xf7z\xfe{?8o\x99>+\
+\x7f\xee\x04\x13\xb6\x05B-\xde\x85\xd1\xce:?\xf4_\
+\x7f~&\x85oED]\xe1q\xce\xab\x88SPh\
+\x82\xba\x08\xbf\xfb\xcb\xbf\xfbbn\xe8\x07 \xff\xb2/\
+\xe0\x0b\xbf\xf8#\x228'\xe2\x0b\x90\x0a\x18\x0b\xb2&\
+\x22\xeb\xce\xbbM\xe7\xddvQ\x96\xbb\xce\xf9=\x9c\xec\
+\x89\xad\xfa\xeb\xd8\xaa\xbf\x86\xb0\x03l\x03\x9b\xf4+\x7f\
+\x821g$\xc6\xb0\xa1`8\x96W?\xf4\xc2\xa0\x83\
+G\x1d\xfc\xcc\xf0u9%$\xe2\x81\x12\xa1\x12'#\
+\x9c\x9b\xf8\xb2\x98:\xef\xd7|\xe1'\x22n,\x22\x95\
+@!*\xe2E\xa4T\xe1\xcd\xff\xe0\x15\xde\xf9\x17\xef\
+?\xb7{y\x19\x92g\xbf\xe5\xc5\xd3\xbf\xf7K\x7f\xd6\
+7\xb5\x1f\xa9\xcaT\x95u`\x03\x98\x82NQ\xa6\xe9\
+\xf9\x1a\xc8\x1a\xfd\xea\xcf\xef\xdb\xd0%\xc6\xebP#\x0c\
+\xb5B\x89\x09\xbc\xa7_\xddC\x8a\x18\x83C:\x1a\x96\
+\xcdA\x8d\x99\x83l\x12N\x04\x8e\x80C\x90C\xe0H\
+\xed\xe7#\xcc\x5c\x1c#\xf9}\x92\xdf\x7f\x88\xca\x91\x8f\
+\x9cLkY\xfc\xe6\xff\xf2\xaf^\xba\x99x\xe9\x02\xf0\
+\xd3\xbf\xf2\xc3rt<\x1a\x85\xe0\xd6UeG\x95\xbc\
+\xc2wA\x87\xab{\x8d\xac\xf2\xb5S\xbfc`\xa40\
+\x02*\xd0e3\xa0\xdd\x8a_e\xfc\xaa\x09\x80~\xc5\
+\xaf\x0aBDh\xa1;:\x81\x10X\x80\xcc1\xf5\x9f\
+\xfd\x85Y:\x8e\x80\x03\xe0\x89 \x8f\x80\x87\x02\xf7Q\
+\xee;\xe5a\xd5\xca\xd1\x8d'R\xff\x1f\xff\xdb\xbfZ\
+\xd52WJW&\x00\x9f\xfd\xf2O\xe0D\xf0.\x8a\
+\x17\x11\xef\x10\xef\xb4\x00\xca\x18e\xaa*\xdb \xaf\xa8\
+\xf2\x1a\xf0\x1a\xf0\x0a\xe8\x0d`\x0f\x13\x82\x0d\x8c\xd1C\
+G\xae@:\x06;t\xc9\xe6\x9fg\xfb\x9f\xf6\xbd\xcf\
+2\x01\xbd`HzT\x22\x92\x9cF%\xd2\x0bGP\
+\x13\x909&\x00\x8f\x80}A\xee\x01\xef\x03\xef\x89\xf2\
+\xae\xc0\xfb.\xf2\xd8)3\xd0:8B\xe3\xa26N\
+\xb5QQ'\x05o}\xf5w>\xdc\x0d\xbf ]\x89\
+\x00\xbc\xf1\x95\xbf\xc8HjW\x10\xbcCKAK\xcc\
+>\x8f\xb0U\xbd\x01\xec\xaar\x0bx\x1d\xe45\xd0W\
+0\x0f?\x0b\xc0\x1afg\xbd \x82\xf4\xd7.\x22\xf9\
+\x9b\x88 g\xb0y\xe9\xb7\x17\x22\xcd\xff\xa7\x1f\xfa_\
+\xaa=\xd3\xee\x9f\xfc\xba\xaa\xaa\xaai\x8d\x1a3\x03\x8f\
+\x81}\x81{ \xef\x03\xef\x0a\xbc\x8b\xea\x1d,\x8a8\
+D\x98)\xbaPa\x11\xa1Q\x91\xa6\xa1\x08\x0dU|\
+\xfb\xab\xbf\xf9A.\xf9Rte\x1a\xe0s\xbf\xf0\x17\
+\x8a\x8a\xf9\xc4\xa9n\x88\x85j\x9b\xe9\xd8F\xd9\xc6\x9c\
+\xba\x1b\xc0\x0d\xcc\x0c\x5cS\xd8\x01\xdd\x026Dd\x04\
+Hf\xb6\x88 N\x96\x1e\x87\xbf\xcf\xcf\xed[\x0a\xdd\
+\xd3\xe5\x7f\x06\xb4\xc4rT\xf3?\xa0\x9a^S\xb5#\
+\xa6\x9f\xa3=\xef~\x9f\xfeFM2\x92\x16\x90'\x98\
+\xfa\x7f\x08\xdc\x03\xee!\xdc\x13\xd8Wx\x0c\xfaX\x85\
+\x03\xe0@\xe10\x8a\x1c-\xa8f\xdf\xf9\xeao\xb5\xcf\
+\x9d\x09g\xd0\x95\x08@\xf5\xf7\xfeS\xdel\xbf7)\
+iv\x9c\xea\xf5\xa4\xda-\x86\xd7n\x95\xef\x02[\xc0\
+&\xe6\x08\xae+:\xc5<\xfa\x91\x88\x14C\x06;\xe7\
+\xec\xd1/?\xf6\x87K\xef\xcd\x82\x90\x84@\xe8\x84a\
+\x954\xadf\xcd\x8b\x5c\x15\x8d\x89\xf11v\x0c\x8f\xe9\
+y\x0c\x11\x0d\x8a\x06%j\x1c\x08\x04\x80\xb6\xc0\x02\x98\
+\x81\x98\xc3(\x1ca\x18B\xc6\x11\x1e\x00\xf7T\xf4\x1e\
+p_\xe1\x9e\x8a<\xa8)\x1f}\xcf}bV\xff\xc2\
+?y1\x0c\x19\xd0\x0b\x11\x80\xcf\x7f\xf9'\x08~$\
+37\xc1K\x90\x92PU\xd4\x9b^\xe3MA_\x03\
+>\x01\xbc\x8a\xd9\xfbW\xb1\x95\xbf\x8d\x99\x83\x8a\xdek\
+7[/x\xc9\x94\x99\xedM\x08\x5c\xe1p~\xf9X\
+\x12\x02\x97\x19o\x8f\xf9\xf9\xf0\xcbw^XZ\xc5\x83\
+\x95\x9c\x98\x1a;\xc6\xc7\x10M\x00Z\x13\x80\xd8\xc6N\
+\x10b\x88Y#t\xe6@  \xb4(\x0d\xbd\x03y\
+\x82\x99\x87{\xc0m\x15}\x0fxO\xe1]\x90\xdbQ\
+\xfc\xdd\x9a\xd1A+e\x1d\xd4\xeb$\x1eS5\x8d~\
+\xe3\x1f<\x7f\xbf\xe0\xb9\x0b\xc0_\xff[?\xce\x83M\
+\xef\xea\x82\x228W\xa6\xb0l]\xd0]Ao\x891\
+\xff\x93\xf4\xce\xde-L\x03l T\x9d}\x17S\xf7\
+\x03\xd5.\xab+\xbe;\xb2\x10\xb8$\x18\x9d\x10$-\
+ @\x12\x84N\xfb\x8b,\x0b\x80\xf6&@\x15\x88Y\
+\x18\xce\x10\x80\x01\xc3c;\x10\x82\xac\x15\xccLh'\
+H\xd9a\xd0\xce@,\x80C\xe0\xbe\xa2w\x80\xdb\x08\
+\xef\x82\xbc\x03\xbc\xab\xc8\x1dE\xf6\xc1\x1d\x0b\xcc]\x8c\
+M\xd9\xc6\xf6\xfaQ\x1b\xff\xaf_\xfd\xbd\xe7\xca\xaf\x17\
+\xa2\x01\xbe\xf8\xdf\x7f\xa1\x98\x95:\x89N\xb70[~\
+\x1d\xb8)p+1\xfe\x16pS\xe1:\xaa\xd7\x80-\
+\x11\x19#H\xb6\xe7\xcb\x8c\xeeWs\xf7{\xe7\xceT\
+\xff\xd94\x90\xb5@\xf6\x052\xc3/b\x02\xd2\x0f\xba\
+\xa4\x05\x14\xd5^\x10:\xd5\x1f\x97W\x7f\xf7\x18\x15\xcd\
+\xda\x22\xf4f#\xf9\x13\xaa\xe8\x1c\xe51\xc2>\x9do\
+ \xb7\x81\xdb w\x80\xbbb&b\xdfE\x9e\x8ck\
+\x9d\xfd\xd6/\x7f\xfd\xb9\xfb\x05\xcf\x1d\x09\xfc\x1b\x7f\xf3\
+'\xe5\xf1z[\x05\xa7[\x08\xb7@\xdf\x14\xf8S\x02\
+\x9f\x03\xf9\x0c\xf0)l\xe5\xdfDu\x07\x03qF\x22\
+\xe2\xb3Z\xf7\x85\xc7\x97\x1e_y\x8aQA\x99\x8eb\
+\x5c\xda\xe3\xa8\xa0\xa8\x0a|\x95\xdeWz|\xe1{\x13\
+\xe0\x05\xe7\xecXe>\x9c/\x00\xa4\xf7Hz\x93)\
+\x8a$D\x8e\xde\xefH\xc2\xe7\xbd}\xae/<\xae\xec\
+\xaf\xc5\x15>i\xa5\xe4\xa4fM\x069j\x10\xb4\x0b\
+U+\x11\x19\x0b2\x15X\x13aC`C\xcc\xf7q\
+\x02AT\xe6N\xa5\xfe\xf7\x7f\xe8\xb5\xf0\x07\xff\xe6\xf6\
+s\xe5\xd7s\xd1\x00?\xfc?\xfcY\x99\x86\xc2y\x15\
+\xa7B\x19\x9c\xaeE\xaf7\x15\xfd\xb4\x0a?\x04|\x0e\
+x\x1d\xb8\x8e\xca6\xc6\xf4\x09\x16\x06\x9a\x8dw\xe22\
+\x03}\xe1p\xa5\xa7(\x8d\xc9Ei7\xb4\xb7\xe9\xc9\
+\xd3g\xe8\xe9\xb3\xfcs\xf7\xbbe\xe6_\x98\xba\x88`\
+\x18\x0d\x0e\xc2\x04\xfa\xe8\x00\xe8\xa3\x81\xa8\xc4\xa0\xc46\
+\x12\x9a\x96P\x07\xda\xa6%4\x91\x18B6\x17\xd9K\
+\x08\x82\xb4\xf4~\xc1\x11\xd2\xf9\x06\xef\x01\x7f(\xca\xb7\
+\x04\xfe\xc8\x05\xb9\xe7#\xc7\x12i\x82\xd7xR\x85\xf8\
+\x07_\xfd\xff>4\x88ti\x01x\xe3\xcb\x9f'\x14\
+\x22#)\xa5R\xe7\x0bu\x95\xc0X,^\xdfU[\
+\xfd\x9fS\xf8<\xc2g\x81WAv\xb0\xd7\xc7\x82\x94\
+\x08ND\x10/\x9d*\xb7\xd5d\x8fE\xe5\xf1Ua\
++k\xa0\xe6;'n\xb8\xaa>\xf47\xba \x9d\xf1\
+YY0\xba\x88!(1\x04B\x13h\xeb@\xa8[\
+Bk\xcc\x0fm\xe8\xa3\x87\xde$DE\x1b\x94y\x8a\
+\x14\x1e\x01\xb7Q\xde\x12\xf8&\xc8[\xa2\xdc\x06\x1e)\
+\x1c\xabc\x1e\x9c\xd6u\x19CS\xc4XD\xc7[_\
+\xbe\x5cb\xe9\xd2\xd9@\x8f\x88\xa8\x13\xa7x\x84Q\x14\
+]w\xc8\x8e\x9a\xad\x7fE\x0d\xd0y\x03\xf4S(\xaf\
+`q\xfe:\xc2X\x90\xc2\x18.H^\xf1\x85\xc3\xf9\
+\xa4:\x8bd\x06\x0a\x97T\xaa\xebm{\x17\xd3/\xaf\
+t]Z\x9a\x97\xfdV\xcf\xa0\x01\x968\xc0\xa1\x10\x04\
+\x15\x10QT\x05\x15\x1dz\x9bf\x8eZGl#>\
+\xf8\xcei\x1c\x08\x83#R):D3#\xd0$\x1d\
+3B\xd8\x02\xee(\xdcSx\x88p\xe4\x91:\x9am\
+\x8a\x97\xfdJ\x97\x16\x80\xc2Yb\xcb!%0\x11\xd8\
+\xc1<\xfc7\x15\xde\xc4T\xfe-\x90\x1bX\x8c\xbf\x86\
+\xa1\x7f^\x1c8/\x9d\x9d\xf7e\x91\x84\xc0w\x1e}\
+\x17\xe6\xf9\xde\xa9\xcb+_\x07\xff.\xd1\x8bF\xd5\x87\
+2&g\x7fX\xe6\xbb\xf3\x82\xe0\x10\x07\xb1\x10c|\
+\x8a \xb2&p\xb5\xa3\xad[\x82\x06TU\x04\xf1\xaa\
+:\xa2\xcfI\x08\x96\xef\xd8R[@[\x08U\x86\xa4\
+]D\xcbFT\xed\xb6\x5cJ\x08.\xe5\x04\xfe\xf0\xdf\
+\xf9qq\xce\x15\x82\x8c\x1c2\x15d[\xe0\x15\x90O\
+\x0b\xfc0\xf0y\xe0\xd3X\x8c\xbf\x8b97#qR\
+\x88s\xe2\xbc\x13_\x18\xf3\xcbqI9*)\xc6%\
+E\x95\x9c\xbb\xa1S\x97\xed\xfe\x07\x06s_\x12I\xaf\
+\x1d\xba\xc8d5\x5c\xcdB\x9diY\x96\x5c\xcao\x14\
+\x18\xf3\xd7@6\xd2sAR\xaeAh@\xa2\x8b\xa8\
+\x0f\xa2{_\xba\xa9\xf7\x7f\xfd\x83\xa7\x96/\xa5\x01\xc4\
+\x97\xe24T\x09\xb1\xdb\x06n\x02\x9f\xc4<\xfcO\xa5\
+\xe771g\xaf\x12\x11'\x0e'\xe2\xc4y1\x15_\
+\xfa\xde\x9b\x1f\x15\xf82\xdf\x98\x8f\x19\xc3\xcf\xa2\x01\x0c\
+-f\x9fPg\xf6\xde9Gt\xd1^\x1f\xa6\x9a\x04\
+b\x88\xa2AEUK\x8d\xea\x15F)\x1d>\xc1\x16\
+k\x8d\xea\x09\xc2\x5c\x22\x88P\xa0\xe2A\x0f\x8b\x10r\
+E\xd3\x07\xa2Ki\x80k?\xf3\xc9\xc2\xa9\xae\x09\xec\
+\x09\xf2\x09A>\x0d|\x06\xf8\xb4\xf4\xcc\xdfF\x98\x88\
+H!N\x9cx'\xbep\xb6\xcaS(W\x8eJ\xfc\
+\xc8L\x80\xeb\xc2\xb8\xd3\xf8\xfe\xc7\x962t}N\x9e\
+\xa2\xfb~\xce\xb4\x85\x137\xf8\xcb\xa5J$\x0f*\x83\
+\x17\xbd\x08\x85\x00\xa24\x02\x0b\x09\xb1\xf9\xe1\xbd{\xe1\
+\xedo~\xb0K\xbc\xb0\x00\xbc\xf1\xf7\xbf\xc0\xe3\xaf\xdd\
+\xe6S\xff\xd3\x97\xa4j\xdb\xca\xabn\x03\xaf\x0b|N\
+\xe0\xf3\x82|V\x94O\x017\x92\xc32N\xccG\x9c\
+\x98SW\xa5X~\x5cP\x8e\xcb\xce\xfeg\xc63\x8c\
+\x97O\xe1\xb4\x1fCZ\x15\xde\xa1\x03),a\x0a\xce\
+\xbbN0T\x97\xb2\x902xtHW\x8eVav\
+\x7f\x8er\x22\xe8\xbc][\x0b\x9f\xf9\xf4\xb1\xee\xfd\xd5\
+Oq\xe7_<\xba\xd0%^H\x00~\xf4\xcb?\x81\
+\x17\xef\xae\xfd\x95O\xb8\xaam+\x17\xe3\xba\x18~\xff\
+\xa6\x98\xbd\xff<\xf0&\xc2+\x89\xf9\xa3~\xe5\x9b\xca\
+/*OQ\xf5\xcc\xcf\xb6\xfeL\xe6\xff\x00\xd3\x926\
+\x10Y\xf2\x09\xb2YX\xc2\x1b\xfa\x05 \x89\xf9\x13,\
+gR`\xb9\x85c\xe0H`\x11\xcb2\xd4\x9b\xd7\xd0\
+r$;?uK\x1f\xfc\xe6\xb3}\x82\x0b\xf9\x00U\
+(E\x9aPh\x8c#+\xcd\xe2\x1a\xc8-1O\xff\
+u2\xb2\x87l\x82\x96f\xf3\xc5g\xa7\xa7G\xf5R\
+\x5c_\x99\xd7/\xce\xf5N\xd3\x0f>\xef;\xea\xfc\x03\
+/(\xba\xcc\xfc\x9c;\x80.\xec\x8c!z\x02\x95\xaa\
+\xd5Q`\x89\xb2\x16\xcb*\xee#<Qq-8\x8f\
+\xe7(\xe2\xe6\xb1(se\xd3S\xe9B\x020\x9ay\
+B\x19\xca\xa8\xba\x85\xd9\xf7\xd7@?\x05\xbc\x81\xe1\xfa\
+; \x1b\x08c\x11q\x22\xd2\xc7\xf2U\x0f\xe8\xd8\xa3\
+O\xd8\xbetUy\x9a\xbc\xa0?F2\xd017\x7f\
+k\xe7\x1d\xbe\xf2&\x10\xf4\xf0q\x10\xf3\xeb\xa2F\x9f\
+\x04\xc4\xa7\x1b\xb6\x8b\xdd\xfb\xc7 s\x04\x8f\x95\xc7\xdd\
+U\x5c\x98\xfb\xb5\xe6\x22\x97q!\x01\x88^E`,\
+\xca\x9e\x8a~\x0as\xf8\xde0\xa0'y\xfbB)\x03\
+d\xcf\x15.\x85y\x05\xc5\xa8L\xa1\x9d\xeb \xdd\xd3\
+\x80|\xfe\xea\x7f\x8c(/t\xb1\xc5\xe0\x0aGAa\
+\x1a!/\x12\xfaB\x94\xe4\xe3\x8b\xa2%\xca\x1a\x96d\
+\x9b\xa5\xb3\x8d\x80\x02\xa4\x01N\x9c\xc6\x19\x17\xd0\x00\xab\
+\x95\xb1\x1d}\xe9o\xfe\x05\x00\xfe\xea\x7f\xf63\x12\x0b\
+\x1d)\xba\x0ez\x1d\x0b\xf3>g\x87~\x02\x03\x80\xc6\
+\xe6\x99\x0e\x98_\xda\xca/F\xc9\xee\xa7\x90\xcfy\xdf\
+\xe3\xf9\xa7\xfe\xfbcLb\xc9&\xbbo\x05\xc5\xd8\x22\
+\xa5\x9c\xf0r\x85\x81c\xe9\xbe9\xcc\x11\xdc\x01^O\
+P\xfbg1 \xee:\xe8Z\xa1MU}\xf5?\x01\
+\xe0\xf5\xaf|\xf1\xdc\x8f=\xd3\x09\xfc\xf1\xbf\xfd\xe7h\
+\xd6\xa3{\xfd\x8b\x9f\xf0\xb3\x8dz\xdc\x96qS\x9d\xde\
+T\x917\x10>\x97>\xecu`\x0fd\xa3\x03y\xbc\
+\x13W\x98g\x9f\x99\xdf\xc5\xfa\xa5\xb7\xec\x99s8\xf1\
+x\xf1\xe6\x01\x8b\xc3\xe1\x96\xc3\xa2\xe7H\x97\x82\x88\x97\
+P\xe6\xab\x11\xcb.k\xe8\xe4\x14H\xa4\xda\xeb\xc6T\
+V\x90A\xe9\xdc\x8fP`\x11\xc1\x02+Q?v\xc4\
+zC\x0f\xe2\xceO\x7f\x82\x11\x81\xeb_\xba\xa1\x0f~\
+\xe3\xb4Sx\xa6\x09h\x1d\xf8\x22\xfaP\xc4\x09\xa6\xde\
+\xf70{\xf3**\xaf \x5c\x07\xdd\x01Y\x07F\x88\
+xqN|\xb2c]\xac_\x15\xb8\xd2!\x09\xd1\xf3\
+\xce\x1b\xf3qH\x1f\xf3\xa6J\x09%h j$\x10\
+\xfaP\xe8\x12\x94\x99\x9e\xcf\x91*1\xb8\xa8\x04\x88J\
+g\x9f\x15]\x06u^$\xad\xfa\x04\x85G\xab\x14\x03\
+\xa6\xc5\xa1\xaa\x10\x91H,\xd4\x8am\x04c\xfe\x0ce\
+\x1f+\xbay\xe4\x08MI\xf0X\x840\xd7x6T\
+|\xa6\x00h\xa1\xa2B\x891\xff:V\xbeee\x5c\
+p\x1de\x1b\x91u`,V\xae\x85s2P_\xa5\
+9|)\xcc\xcb\xea\xde\x89\xa7t%\x85\x148q\xdd\
+\x8d\xcd\xccocK\x13\x1b\xab\xafK\xff]\xfa\xa6\x0f\
+R\xb8CA\xc8\x9fw\x8ad\xe5\x93\x12:\x97\x91\xbc\
+\xab\xb2O\xf9\x1as\x88XT\xc5R=A.N\x11\
+\x15!R\xa8\xaa`\xa5\xe9[\x90x\x05\x87\xa0\xd1\xf5\
+W\xdd\x0a\xb1\xe5\x8c\x15p\xa6\x00x'\x82\x85\x1a\x1b\
+X\xbc\xff:\xc2'\xb0\xb2m\xcb\xeau\xb1\xbe%>\
+z\xbb_P\xa6b\x0d[\xf9Y\xad\x0b\x1eG!\x05\
+\x95/\xf1Rt_*j$h\xe8\x9f\x0f\x10\xcd\xcb\
+\x08A\x07\xb4dL\xfe\x92\xf8\x82^Pc<7Z\
+I5\xe7\xc5\x93\xbf~\xae8\x8am\xb4\xfeIK \
+\x89\xa2c\x94\x0d\xe0\x1a\xe8-\xac\x0b)7\xba.\x80\
+\x13\x9c_pQ\x01p\xa2\x12UFX\xd9v\xd6\x00\
+)\xd6g\x1b\x98\x08R\xe6\x94nW\xc1\x93\xe2}\x97\
+\xaab\x86%Y\x16\xda\x98\xcd\xf7RP\xb8e\x01 \
+\xd2i\x85\x0f\xa3js\x08\xe5\xc4Q\x88\xc7\xbb\x02/\
+\xd9\xf7\xb0<K~\xcf\xf0\xcek.\xdb\xd3\x98\x042\
+vZ)\x9b\xa6\xa5\x18\xfd\x05Sw}\x1e<\x1e\x14\
+b\x88\xf8\xd6\xd2\xc9\x83B\x14!R\xa6\x0a\xea\x9c\x97\
+\x99\xb3\xd4\x9b \x8f\xa3\x97\xa3\xb3>\xe7<\x01(T\
+e\xa4&\x007\x12\xf3_K5|V\xa3/\xb8.\
+\xa5\x9b\x12;\x06\xf0\xe4,\x9epV\xfb\xe5\xb0D\xca\
+\xb0\xef\x84\x01X\x0c\xd9\x83B\x17\xbc\xcfgi\x08'\
+\x8e\xcaU\x8c\x8b1\xd3r\xca\xb4\x18S\xf9\x11\x95\xab\
+(\x92@\x98\xb0\xa5s\xa8&\x86GBl\xa9c\xcd\
+\xa2]0kg\x9c\xb43f\xed\x8c&6\x9d\x96z\
+\xdag?W\xcaZ\xcc\xd1\x01jE[X_Br\
+\x03C\x1bPU\x87R\xa9\xaa-X\xa1\x11\xa4V\x03\
+\x8a\xee\x22T\xea\xbc\xe7\x8cdQ'\x00_\xf8{?\
+\x22\xbf\xf3\x95o\xe8\xcf\xfc\xca\x9f\x96\xc7G\x94\x18\xdc\
+\xb8\x8d\xd5\xed\xbf\x0a\xdcJ\x05\x9ckt!_\x8a\xf5\
+G\xa5\x01=\xa3\x22\x15o\x5c\xd4\x9b\xffp\xab\xa9\xb3\
+\xe9\x19<A\xf0\xc9\xcf\x18\x17c\xb6F\x9b\xec\x8cv\
+\xd8\x1am\xb1^\xad1)&\x8c\xfc\xa8\xf3CVM\
+P\x13\x1a\x16\xc1\x18\x7f\xd4\x1c\xf3x\xf1\x98Gs\xc3\
+\xd4\xb55_b\xe8\x9f\x0c?\xfb\x85R\xce\x1bxG\
+12\x96\x0d\xfd'\x0d\x8a\xa2\x05\xc6\x1b\x15D\xb1\xde\
+\xc5\x07\x0a\xdb \x13\xa0|\xe3\x97\xffR\xf3\xf6\xdf\xfe\
+5\xfd\xcc\xff\xf8S\xf2\x9d\x9f\xfbg\x0a)\x0c\xfc\xb1\
+\x9f\xff1\xc4y\xf7\xfa\xcf\xdet\x8b\xa6\xa8B\x90u\
+\x90\x1b(o\x00\x7f\x0a\x03~nA\xc2\xf9\x0d\xe6\x95\
+.\xceO\xe1\xde\x10\xdb\x17\xe9]\x10+\x8d\xb0(\xe0\
+\x94\x03\x88\xdd\xd4\xa8\x816\x06Zm\x0910tZ\
+\xcf\xbb\xc1\x9d\x8d'\xa9|WR\xf9\x92i1e\xb3\
+\xda\xe4\xdad\x97\x9bk7xe\xed&7\xd7^\xe1\
+\xe6\xe4\x067\xa77\xb91\xbd\xc1\xf5\xe9u\xf6&{\
+\xecM\xae\xb1;\xdeag\xb4\xcd\xc6h\x93\x8dj\x83\
+I9\xa5\xf2%N\x1c\x11\xcd\x05\x1bO\xbd\x86\x17I\
+Vq\xa4\xcb\x05\xa6IKv\x15\xcaf\xc3\x0a\xa0\x14\
+\x11\x8f\xd9\xff\x03\x81}D\x1e\x01'^c\xd8\xfe+\
+\x9f\xd4\xaam\xe5\xc6O\xdf\xd2\xfb\xbf~\xbb\xd7\x00!\
+\x8a\x8fQJ\x85)\xc8\xb6\x1a\xd4x\x0d{\xdc\xc6\xda\
+\xb3\xc6\x90J\xb7]\x86{\x1d\xae\xf2\x96\xcf\xefV\x7f\
+\xef\xf81X)\xd9\xdb\x0f\x1a \x0e\xa58&;\x1b\
+\xac\xf4\xfa\x03h\x86\xcc\xfc\xbc\xea\xa7\xc5\x94\x8dj\x9d\
+\xed\xd16{\xd3=nL\xae\xb37\xbd\xc6v\xb5\xcd\
+Z\xb9\xce\xb4\x98P\xf9\x8a\xc2\x95\xf8\xf4\xf9A#m\
+lX\x84\x9a\x93v\xc6z}\xcc\xd8\x8f\xf0\xc9O\xf1\
+\xc9\xa4\x1c6\x87\xcc\xda\x13\xe6\xed\xa2\x8bV>\x18#\
+\xfb\x7f\x19(\xc9\xe5\x08\xf5\x8co?4\x05\x85CQ\
+\xbcz\xab*J\xd5S\x12\xc5\x9aa\x15\x9f\xce\xb6\xcd\
+\x80\x87N\xf5\x80\xb6\x8d\x1ef\x826\x04\xbb\xf8\xa4O\
+\x0aQ\xa50\xe6\xb3\x83\xd5\xf0\xdd\xc2\x22\x80-`\x8a\
+e\xa2\xba\xe6\x0c;\xfc \x8f\xdf3\xbf\x8f\x9b\xad\x02\
+:\x7f\xad\xecT\x81\xd9i\xd7\xa9`\xed4@X\x11\
+\x80g\xad0S\xfb\x85\xa9\xfcj\x8b\xdd\xc9.{c\
+[\xd5\xbb\xe3]v'\xbbl\x8f\xb6\xd8(\xd7\x99\x96\
+SF~L\xe5+\xbc\xb8%p\xa5\x8d\x81:6\x8c\
+\xfd\x98\xb1\x1fQ\xf9\x8a\xcaW\x8c\xfd\x98\xf5r\x8d\x87\
+\xd5#\xf6g\xfb<\x9c?\x04\x9e\x10\x9b\x0f\xe6\x14\x8a\
+\xdd\xbc\xce\x01]\x12\x86\x04\xedt\xe7\xd3x\xea\xac\x19\
+.F\xc0\xa9C\x0b\xedJ\xd2\x83\x0fhT\x89Xt\
+\x00T(\xd9)\xbc!\xaa\xb7Td\xeeL\x8b=\xc6\
+\xaa\x8f\x03\x98\xdd\xc8\x1fV\x00\x1b\xc9\xe6\xe7,\xdf\x0d\
+1G\xd0:vRm|W\xbd\xdb\x15s\xf6\x95<\
+\xab\xc6\x7f\xf0\x15\x89\x1a\xbb\x953\xf4\xf6\xb3\xf7\x1d\x92\
+\x07\xde\xc5\xc2Oa~~\xcdl~\xc1\xb4\x98\xb2;\
+\xde\xe5\xb5\xf5Wyu\xed\x16\xd7&\xd7\xd8\xae\xb6X\
+\xab\xa6L\x8b)\xe3\xc2\x18_\xba\x12/\xfe\xd4\xb9*\
+\xef\xf0\xceQ8G\xe1,T\x9d\x94\x136\xab\x0dv\
+\xc6\xdbl\xcf\x1e0\xf6#\x10\xa5\x8e\x0dMh\x92\xe9\
+\x8a\xddwx:e,\xc4\x0d\xa2\x9d|o\x8c\xf9\x91\
+\xfc\xfd\xcf\xf6\x82\xf3\xc2r\xde\xa1Q\xbb23_\xf8\
+\xbea\x95\x88F\x9c\xa29\x8a\xbb\x01\xbc.\xaa5\xcb\
+\xa1\xe1\x02\x92\x06\xd0\xa8\x22\x22\x06\xfcX\xd8\xf7\x1a\xa9\
+\x8e_\xadI\xa10\xc1\xcd\xa5\xdb\x0eW\x0e\x99/g\
+2\x7fH\xaaJ\xa0G\xfa\x96R\xc09\x04\xcb\xff\x9d\
+co\x87\x82\x91\xa3\x88\xd2\x95L\x8a\x09\x1b\xd5:{\
+\x93k\xbc\xbav\x8bOn|\x92k\x93k\xac\x95S\
+\xca.\x0c4\xcf_Ui\xb5=\x85\x0d\xe4\xcf\xf4x\
+\xc6\xc5\x88\x22\x09\xd5V\xb5\xc1V\xb3\xc5Z1\x01`\
+\x1e\xe6\x1c7'\xd4aADicC\xcc]D\xcf\
+\x10\xdc|\xcd~%\xdc]u*\x9f&K]=A\
+\xd6\xc4\x99\x17\xd1\x81BP5(S)\x136p\x1d\
++5O\x8d\xaa\x1cb\x83+\x84N\x03\xc4(\xe2|\
+\x81XM?\xf0\x0a})w\xee\xcb\x97\xfe\x03\xfb\x8e\
+\x98\x9c\xb5\xcaLy\xda\x178\xa52/\x13\x04$T\
+n\x18\xeamT\x1bl\x8f\xb6\xd9\x1d\xef\xb07\xd9\xe3\
+\xdad\x97\xdd\xf1\x0e\x95\xaf i\x9e\x10#\xb5\xd6\xbd\
+\x93\x99\xe2\xfa!c\x0a)\xf0.a\x07\xceSI\xc9\
+\x981#?\x02\xe0\xb8=\xe1\xf1\xe2\x09\x07\xf5\x01u\
+\xa8\x01\x98\xb5\xd2\xfb\x03OC\x0c%Gn\xc3\x108\
+\xbf$D\x22\xa2\xb2\xea:\x9dq\x8e^\x00\xa40\x0c\
+&\x16\xb1\xd7\x00\xe6g\x09\xb6\xb8S\xed\x063\xac\xf1\
+\xe4!p\x17(R>\xc14@l\x03R\xbaB\x90\
+l7lL\x8b\xb5n\xad!RX\x0e*U\xf7\xa4\
+d\x8f\xcf\xf5\xfa\x1f \x89\xf3,U\xf94\xb5\xdf1\
+\x0c\xa1\x10\xdf\x85z\xbb\xe3]\xf6\xa6{\xecNv\xd9\
+\xaa6Y+\xd7\x92\x9d\xf7\xc9\xb9[\xb0h\x17\x1c\xb7\
+'\x1c7\xc7\xcc\xda\x19u\xe8\xe3z/\x8e\xcaWL\
+\x8a\x09k\xe5\x1ak\xe5\x94\xb1\x1f\xe3\xfc(\x99\x83*\
+i\x83-v\xc7\xbb\x1c5G\x04\x8d\xdd\xb5\xc6&\xd2\
+\xd2v\xc2\x7f>\xf2(K\x8fC\x0d\xb0\xfa\xda3n\
+\x92\x09Q\xea\x8e\xf6\x95\x01E\x19)L\x0b1\x83C\
+\xbb\x82\xd4\xd8\xc4\x92;\xa4j\x22\x153]\xa6\x01\x82\
+\x0a\x85\x96\x88L0\x01\xd8#\xd7\xa1\xc3X\xc1w\x9d\
+;\xb9\x96\x7fP\xd25\x0c\xe9\x9e\xb5\xaas\x82\xe5\xbc\
+\xd7\xce\xa3%\x15\x09xW0-\xa7\xec\x8cv\xb81\
+\xbd\xce\x8d\xc9uv\xc7\xbb\xacUk\x94\xce|\xdb6\
+6\xcc\xc3\x9c\xa3\xfa\x88\x83\xfa\x90G\xf3G\xec\xcf\x1f\
+\xf2d\xf1\x84\x93vF\x1b\xadf\x22\x9b\x91\xad\xd1V\
+\xd2\x1e\xbblT\x1b(\xca\xd8zV\xa9|\xc9z\xb9\
+\xc6\xeex\x87y;\xefr\xf4mlY\x84\x9aEX\
+t\x98\xc0\x0b\xc3\x06\x94\xae\x1f\xa13\xc7\xa5\xef^\x8b\
+\xb1\xefV\xc6B\xfc\xa9\xbdb!!\xc6\xcfI\xd2\xfc\
+\x03\x0d\x10\xda\x02\xca\x0a\xd5)\x22\x1b\x98\x10\xe4\x1e\xbe\
+R\x0c?M\xb0\xaf\xa3(\x079\xea!\xe8sA\x95\
+~\xd9\x9b\x93\xfd\x03\x0b\xcd<\xd3b\xcc\xd6h\x8b\xbd\
+\xc95\xf6&{l\x8f\xb6\x98\x16\x13\xbcx\xa2\x06\x16\
+\xa1\xe6\xa8>\xe2\xf1\xe2\x09\xfb\xf3}\xee\x9d\xdc\xe3\xfd\
+\xe3\xbb<\x98=\xe4\xa89\xa2Ij\xbc\xf4\x15\xeb\xe5\
+\x1a{\x93=\x16a\xd1\x87\xaa\xe9ZK_\xe2\xc43\
+)'l\x8f\xb6\x93\xf6hY\x84E'\x5cB*\xe6\
+\x94s\xbe\xdf\x80yf\x0a\x87!\xf2r\xe6\xf2\xa9\xf7\
+1\xbf\x96\xfd\x80\xc2L\x89F%\xb4\x01\xf1\x9d\xadq\
+(#{'\x01\xab\x1d\xd8$\xcf`\x90\xe8\x81\xb6x\
+\xe3\xbf\xfaDQ\x8c\xca\x09\x22S\xccf\xe4\x11lk\
+\xe4\xb8_D\xc5\x89H\xae`-\x1c>\xa5xq\xf2\
+b\xa4\xfd\xac\xef>\xb81\xa6\xb6G\xacWkl\x8d\
+\xb6-\xd4\xab\xd6\x19\x17c\xbc\xf3\x84\x18Y\xb4s\x0e\
+\xeaC\xf6\xe7\xfb\xdc?y\xc0\xdd\x93{\xdc=\xb9\xc7\
+\x83\xd9>G\xf5\x11u4\x01\xa8\x5c\xc5q\xb5N\xd0\
+\xd0A\xd2\xf6\x19\x16a\x14\xae\xa0p\x9e\xb17g\xb3\
+\x0e5\xf3v\xce\x93\xf2\x09\xa3bd\xadN\xddEr\
+\xbe\x16OB\x90#\xa2U'\xf0\x22\x1a4S\x87\x0b\
+\xe0\xc0\xb3<#A\xcc_O\xaa\xd9a\x1a\xa0\xe7+\
+L\x9d\xfa\xc9\x8f\xfc\xe2\x0f\xb5\xc5tkk\xd3\x89\xdf\
+\x10\xcb\xfcu\xa3\xd8\x04\xaal\xce\x8c\xf9}/_\xd7\
+\xbc1h\xd7z\xe1\x94\xd0\x92l\x02\x9c\x1b\xd8\xedb\
+\x8d\xb5r\x8dI1\xa5r\x15\x0eG\xad5\xc7\xed\x09\
+\x8f\x16\x8f\xb9wr\x9f\xbb'w\xb9w\xf2\x80G\xf3\
+G\x1c\xd6\x87\x9c\xb4'4\xc1L@\xe3\x1b\x03W\xc4\
+\xe1\xc5#b\xc2VH\xc1\xd8\x8f\x18\xfb\x09#\xef\x19\
+\xf9\x8aI9e\xbd]\xb0^\xad1.&\x94\xae\xec\
+\x1c\xba\xce\xb4\x9d#\x04\x99\xf1pZK\xe4\xd7.\x0c\
+\x82\x0d\xc0!\xd1\xe56\xbaTq%*\x0a\xd6k\x98\
+K\xc9\xd3\x22\x97u`\xd3\xb7\x13\x0a\xe7\xbd\x15t\x9a\
+}\xb0\x1c\x7f?\x8d\xcbf\xect\x83\x17\x0c\xec\xb9r\
+\xe6\x9f\xf9\xfd-\xab8\xf2#&\xc5\x84I1a\xec\
+G\x94\xbe\xecl\xf3qs\xcc\xfe\xec!\xef\x9f\xdc\xe5\
+\xee\xf1=\x1e\xcd\x1frX\x1f\xb2\x08\x0b\xda\xd8v\xcc\
+0;\xbe\xe0\xb0>BDR\x84\x00\xa3b\xc4f\xb5\
+\xc9V\xb5\x85+\xc6x\xf1\x06\x14\x95\x13\xc6)\xaf`\
+Y\xcds+\xeb:\xca+\xbc\x8b>\x06\xa6\x22\xaf\xfc\
+%Mp\xd1\xfb0\xa8\x22\xca\x8b\xd4y!:\x87h\
+\xccg\xf7(%&\x04\xeb\xc0\x96 G\xa8\xf8BD\
+\xae\x81\xac\xa3\xd84.{\x93\xa7_\xfd=\xdc\xe8\x97\
+\x99\x9f\xbb\x9b.\x15\xce]\x92V#\x81\xd2\x95\x8c\xfc\
+\x88\x91\x1fQ\xf9\x11^|g\xc3g\xed\x8c'\x8b\xc7\
+<\x98=\xe0\xc1\xec\xc1\x12\xf3\x97\xbcu5!8i\
+O\xecoc\xc0\x8bg\xab\xda\xe4dzB\xab\x86^\
+z\xe7\xa9\xa8\x96\xd0\xc2B\xfc\x80\x91O\xf7\xe1\x87j\
+\xff\xdcP\xf9\x83\xdc\xcc\x8c*/\x95\x93\xa5\x85\xea\xa3\
+u*G\x10U\xa7}\xafan\xe7\x9b\xa1T\x05\xb8\
+kX\xad\x7f.\xf1\x1a\x03\x85\x90\xd4\xbe\x0cF\xb5\xa4\
+\x93\xf7a\xcey\x01\xeb\x8b'\x1b:i\x02P\xf9\x8a\
+\x913fd\x8a\x1aY\x84\x9a\xe3\xf6\x98\x83\xfa\x90\x83\
+\xfa\x80\x93\xc6\x18\x8cB\xa4W\xb7\x11\xabG\x18B\xd5\
+\x93b\x9a\x00\x9f\xbaC.\x01J)\xa8\x5c\x95P\xc5\
+\x02\xe7\xfc@\x90\xf4\x99Z\xf1y\xd7\x13tQ\x873\
+\xdf\xc5%-\x10\xbd\xe0\xa2\x10\x15T\x91\xe4\xf9\x0f\x05\
+`\x01\x8c\x0a\xb1\xa9\x1d\x13`[\x0d9\x1a#\xf4#\
+\xd9\xfc\x00\xfb\x1f0\xff\xe5w\xf1\xe4\x0c`A\xe9\x0a\
+JW.\xb5\x95\x19J\xd7R\xb7\x0duk8@\x1d\
+j\x145Dp\xc0\x08%\xc1\xb01\x12\x88\x14\xb2`\
+\x11\xe64\xa1N\xa6\xa2\x0f\xebD\x84\xd2\xdb\xe7\x15.\
+e6\xaf\xc8\x09>M\xcb\xbc\xb0r\xf2\x9eW\xea@\
+4\xe4\xd9G\x056bw\x03aG\x95\x16\x98\x16\xa8\
+\x5c\x07\xc6\xa0\xbb\xe4q\xac)\xec\xeb\xc0\x86\x95\xf6\xa5\
+\x97\xc5\xfc\xe5$\x91\xf5Q\xfb$\x04\xde\xad\x148k\
+\xca/\xd0W\xf5\x84d\x13\x97PK\xe8B8c\xb4\
+\xa5\xa4\xdb\x18:\xe8zU\xcb\x15bQ\x81\x17o\x15\
+\xcdK\xd7x\x9540:\x1d\xbfz\x888FE\xa2\
+\x80\x0d\xacp\x9d\x00XH\xa8\xc0\xbc\xc0\x00\x9f1\xe6\
+\x04\xaei\x1e\xe2\x90\x90\xbf%\x0d0\xeck\x7f\x96\xc1\
+{\xd14\xa8*r\x92B\xd2\x01i>Tm\xb8\xaf\
+\xe6\x11\xbf\xfdE\x9f^\xb9\xfd{-1s\xb6\xc2\xb6\
+\xcf\xf4}FS^\x9e\x08\xe4\x8f\xb4\x88 i\x80\xc2\
+\xe1\x82\xc39E\x9d\x22!\xa2\xe0S\x82h]\x90m\
+\x8c{\xf3\x02\xc3\xfe+\xfa0\xb0\x02y\xaa\x06\xe8\xfd\
+\x98\x97c\xff3\x0dq\xf5\xb3\xd4p\xf2\xbb\xbb:\xbf\
+\xec}\x9fG\x19h\xb2\xf7\xc6\xf3k\x13\x06\x9f\xf9\xf2\
+\xd4\xbfQw}\xd9dgG\xd0;\xc4GC\x00,\
+\xae\xcd\xe1\xe0\x1a\x06\x08\x09P\x17\x0a[\x02\xa5\xf6\xf3\
+\xf6+\x8b\x1d-_\xb9\xec\x00\x9e\x81\xf9_\xa5\x0c\x9c\
+\x89\x93\xb8sX\xa00\xc8\xd2\x99F\xd0\xae\xe6\xff\xfc\
+\xf3\xf7\xef\xcd\xcfV)#\xf9\xc8\xf2\xb9\x14\xd3\xb6W\
+&\x13+\x9f\xb5\xba`\x07>\x9b\x95hYs\xa9\xf5\
+z\xd8_6\x05\xe8F\x0a\x11\xa6X\xa3A?\xbdK\
+d)\x0c\xcc'|\x11\x1d<\x97\xa7\xf3$p\x18\xa9\
+|\xb0u\xda1\xf8\xa9\x7f\xf5r\xb5\xdf\x12\xa5K\x1d\
+\xf2\xab\x1b\xad\x93\xf9\xa5\xd1A\x87\x05\xac\xa5\xbfj\x0b\
+L\x1ar\x880\xc66Z0\xb1Y\x02\x18\xf2\xb0\xa6\
+\xc1\x07_\xf5=H\xfe\xcc\xf2\xc7?3\xfbt\xde\x0f\
+\x17\xf9\x833\xa9\xfb\xc4\x15\x1fA.\xfa\x11\xcf\x93:\
+\x0b \xa8S\x9c\x13\xd4-\x0b\xc0\xe0\xf22\x9f\xa7$\
+\x888\xe7\x8c=\xdd\xae\x1b\xdd.\x1b)\xe10\x80}\
+\x97Ox\xf5\xb4d\x02.(}K\x10\xf2\xe0_]\
+}\xdb\xb2\xf2\xbfXF\xa6?\x7f\xfe\xf7JM\xc0\x0a\
+I2K\xdd\xa2]\xd6\xd4y\xf0T\x1e2\xe1\x80\x90\
+T\x7fj2\xb4Z\xb2\x22\xfb6\xbd\x19X\x9e\xd2\xf9\
+\xb2\xbe`\x86Rs\xa3Fv\xec\xce.\xcd\xd4\xae\xa2\
+7\xc4\x1c\xda\xb5\x86\xdb\x0f\x0aR\xbbw\x0fz\x13-\
+\x99\x14\xd2\xcf\xe7\x9f\xbf\xafh\xee\xaf\xe9\x22\xb0\xf0\x0b\
+\xa1\xc4/\xdc`L\xee2\xbf$\xf1\xb6\xc2\xb2\x83\x1e\
+\x08\x85\xf4\xd2P\xa8IG\xde[\xc7\xfe*\xe5\x02$\
+A\xbf\xdd\xa7]1-\x15M\xad8w\xe7\xfcA\xf7\
+$\xd2\xbf?j4!8C\x03t5\xff)t\xcc\
+\x13\xc4\xcf\xd3\x06\x9d\xbe\xd0\xd3\x1a\xe6\xaa\xa3\x03\x81\xd4\
+3\xbc\x92\xab\x91\xa5\xb7\xe4\x85\x1e\xd3\xf3X`\xaa\x7f\
+e\x22\x15ybQ\xc7\xf8\xdc\xe2\x85\x5c\xf5WKW\
+\x9f\xca\xb3\x9dX~~\x88\xc4\x9d^sv\x9d>\xf5\
+\x0a\x8c\x9c\xe1\xf7\xf9<\x85\x14gf\xe3\xbc\xf3\xa8*\
+c?6h\xd9\x97xwV\x88i*\xb2G\x22\xed\
+z2\xd6\xffr\xcc\xa4 bP\xb4J6\xd7K2\
+0\x14\x00e \x00\x15\xfd>z\x9d\xfd\x97NK\xa6\
+\xb3\xb8\x01\xf3\xaf\xe8\xfb\x0d\x91:\x8f\xcd\x17(]\xc1\
+\xb4\x5c\xb3n\x9fr\x9d\xb1\x1f-\xd5\xd7\xe5\xcb+\xc4\
+[\x95O\xb5\xc9\xdet\x0f\x80E\xac\x0d=t\xc5\x99\
+\xd1l\x88-\x11e\xe4*\xf6\xa6{lU\x9b\x8c\x8b\
+\xf1R\x8e!\x9f\xdf\x89c\xe4G\xac\x97\xebl\x8d\xb6\
+\x98\x859'\xcd1MJ4\x0ds\x0dW\xb2d\x92\
+\x0a\x10\xd1\xe5\x05\xdbG3\x06\x9e\x1a\x8f\x97\x04\xa0\x1c\
+\xbc\xe8\x87\x7f\x91O\xbc\x04v]\xa5p\xa7\xb8\x5cD\
+(\xbc\xd5\xfeo\x94\xeb\xec\x8cw\xb89\xbd\xc1\xf5\xc9\
+\x1e\xeb\xe5:\x85+O\xfdi\xe9+6\xabM^]\
+\x7f\x15\x04\xaeO\xf6hck+\xd7\xf9SLQ\x94\
+\x18\x03\x8aR\xb8\xa2\xfb\xdb\xadj\x8b\xcaW\xa7Vu\
+\xe1J6\xcau\xaeO\xf68n\x8e\xf0\xe2y\xb4x\
+\xc4a}\xc4<\xcc-\xef\x90s\x08Wu\xcf:\x1e\
+\x0d\x96\xferL\x9by\x0c\xa9O0\xef\xa69|\xc3\
+\xd2r\x92\x818\x5c\xa5f\x1b\xe6\xc6\x05\xa1t%[\
+\xd5&7\xa6\xa9\xd5kz\x93W\xd6^as\xb4I\
+\xe9\xcb%\x06\x09\xc2\xc8W\xec\x8ew\x00\xd8\x1am2\
+o\x17D\x0d\x9d\xea>\xf5e\x06}\x7fN<\x93b\
+\xccf\xb5\xc9\xee$W\x17\xb3t\xfe\xca\x97lV\x1b\
+\xbc\xb2v\xb37\x1b'#\x9c\xdc#\xcc\xad\xcfp9\
+wqE7O\x06\xb1\xf2i\x86e\x1e\xe7\xe7\x9d\xca\
+\x1f\x0a\xc0i\xb9Y\x96\xa6+\x8b\xff;\xe7J\xacp\
+s\xa3\xda\xe0\xc6\xf4\x06\xaf\xaf\xbf\xce+k7S\xf1\
+\xe6:\xa5,79\x8b\x08\x95\xaf\xd8\x1am1.&\
+\x5c\x8f{\xb4q\xb9\xbf\xef\x0c\xfew\xe4R\xcda\xee\
+\x0e\xaa\x5cu\x8a\x81\x85\x94lT\x9bDU\x0a)(\
+}ITe\xd6\xcc8\xac\x8f\xba\xeb\xcf\xd7s\xa5$\
+\xe7.\xd6U\x01\xd0U\x01X\x81M\x06rp\xd5_\
+bP!\x03V\x8c1)&lwE\xa0\xd7\xd8\xac\
+6\x19\x17\x13\xab\xcaYaP\xae\xde\xc95\xfd\xe6\xe5\
+[\x0bZ\xae\xf8\xe9m4Hj\xd8X\x9dQp\xa6\
+S'P8+\x12\xcd\xf7\xa6\xd5\xc0\xc1\xe2\x80{\xe5\
+\xa4\xcbL>\xabD\xecE\x91,\xad\xe1\xa5\xd0m\xb8\
+\xd0\x15\xfa\xf2`\xe9.\xf4\xa5E\xf9gS^\x99\xb9\
+v\xdf\x9a?7\xd8(7\x98\x16S\x0a_pV\x1c\
+\x00,1\x12lk\xd1z0\x07 /zA\xba\xce\
+!\x7f\x86\x7fp\xc6\x99ScJ\x89+-\xad|\xd2\
+\x9c0-\xad&1\x17\x89\xbe\xec\x84)\x9cy\x01\xc3\
+\xdf\xac\xe8\xce\x8f$e\xa9L={E\xc5\xa4\x18w\
+\xbd~\x17\xd5L\xaa\xca\x22,8iO\x98\xb5s\x9a\
+X\x13\xa2A<\xde9Jg\xe7U\xa6\x8c\xfc\xe8\xa9\
+B`>\xb5t\x83&\x82\x06&\xe9z\x0a\x9fw\xb3\
+\xe5B\x15B/\x9brH\x00Y[\xe8GCpa\
+\xd9\xd5\x10\x01\x8f\xa3\x94\x92\xd2\x99]^\x0d\xff\xce=\
+Ob\xfea}\xc4\x93\xfa\x80\xa3\xe6\x90y\xbbH\xb5\
+\xff\x9a\xba\x8bGl\x94\xebV4Rq\x01!H*\
+V\xccA-s\xe3\xe9K-\x109\x83N_\x80\x0e\
+\x8f<_n\xd5\x09L\xef\xec1\xee\xe1\xac\xba\xab\xa3\
+\xe5TKn\xac,\x9c\xc7\xadV\x00\x9d\xfa\xcb>\xb7\
+\xdf\x84\x86\xe3\xf6\x84'\xf5\x13\xf6\xe7\x0fy<\x7f\xcc\
+,\xcc\xba\x98\xbdt\x05\x93r\xc2bT\xa3\x98\x13\xa8\
+\xaaV\xf2\xed\x9e\x9d\xf7\xf7\xce\xa7\x0a!wF\x84q\
+\xf5\x220\xcce\x0c\x22\x91!\xe3s\x99\xd3)\x01 \
+=\x9a\x16\xe8\xcbj\x18\x9c\xf3\xea\xe8\x8c\xfc\xbft\x83\
+\x9e\x9e\xf6g\xc6\xf86\x06\xeaP3kg\x1c\xd4\x07\
+<\x98=\xe0\xee\xc9}\xf6g\xfb\x1c\xb7\xc7]_@\
+\xe9K\xd6\x8a5\xe6\xed\x02M\xa5\xe2\xb1\x8aL\xd20\
+\x09\x9f\xca\xbf\xce\xa3\x1cZ\xae\xe6I^ZrH\x97\
+\xa3\x9a\xe5W\x88\x83\x83\x82T3\xc2rx\xd0\xe9V\
+\x1d0\xfec`\xd2:\x8a\x1a\xa9cFp\x9c\xbe\x00\
+\x00\x17]IDAT\xcdI{\xc2\xc1\xe2\x90\x87\xf3\
+\x87\xdc=\xb9\xcf\x9d\xa3\xdb\xdc\x9b\xdd\xe7\xb0>\xea:\
+|+_Y\xc7O\xac\x13\xcag\xcc\x8e(*0\x96\
+\xd1S\x05\x00>\x02\xaa>\xd3`+\xbb3\xa4 \x0b\
+@H\x8f\x9ag\xce\x0f\x01\xa0\x1c\x22t\x7f\x92\xf7\xd3\
+\x95|\x8a+D\xb6V\xf7fzv\xaa\xd6^\xce\xaa\
+\xdf\x06>\x1d\xf2x\xf1\x98\xfd\xd9>\xf7f\xf7\xb9{\
+|\x8f'\xf5\x93%\x018i\xb6\x00\xe9\xf2\x06U\xc2\
+\xf7+W\x12]\xf5\xd4\x04O6\x91\xa7\xb4U\xf7\xcf\
+\x15\xd1\x92\xc6^\xd2\xdaC\xd5\x1f0\x9eG\x12\x14\x5c\
+\xb3\x0c\x11\xfa\xf4\x17\xaa\x8ah\x96\x80\xa8\xe0\x14\x15y\
+i9\xef\x0b\x15\x80$\x8a)\xbd\xdb\xc4\x86yX0\
+\x0b3\x8e\xdb\xe3\xd4\xcc\xf9\x84\x83\xc5\x01\xf3\xb0\x00`\
+\x9c\x1c\xbe\xb5rj\xed\xe3a\xc6<,,RHs\
+\x8b.re\xab\x05\x22WJ\xb9\xeea\xb0`\xb5S\
+\xdf]J3b\x1a\xbf!i\x81\x02\x1b*\x98\xcb\x85\
+\xa0\x1b<\xac.\x9fixB\xcb9\xbc\xecR\xc8\x8b\
+P*\x0b\x8f\xd1\xea\x01bK\x13\x1a\xeaXS\xc7\xf4\
+\x984\x80\x13\xa1\x8e5MlhbK\x13m\x88D\
+\x88\xe7W\x06\x7f\xf4H{\xa6\xa7\x05;T\x04\x80\xd5\
+\xbc\xf7;\x987@,\x105\x01P\x02\xb6\xaem\xac\
+\x86\xfd\x89\xed\x86\x99\xb7E\xd5\x5c\x13\xf0\x91\x89\x14/\
+N\x9d\xff\xd2\x0b\xef\xd0\x9f\x91\x95\xf7~\x84\xac\xfa\x85\
+\xa8\xbbd\xd5n\x9e\xf0\x92?`\xcf\xb2\x00,\x10j\
+\x92\x068\xa6/\x09\xcb\x8f\xdaA\xb1\xaai\xfb\xf4\x88\
+\xc6\xb4C&W\x98\xe1\xba4I\x07\xefZ\x98VP\
+H\x99\xda\xbd\xfb\xfc=\x90j\x0b\xcaA\x97Q\x91F\
+\xcc\xba4\xbd\xf4c@i\xf5\xe7\x9d\xcbc\xb7\xe3\xb9\
+\x0e\x96s7 j\x96\x1eC\x16\x80\x1c\x0e\x16X\x85\
+P\xecN\x9a\xb7=\xcf\x87{\x09y\x81K\x90\x93\xd4\
+<\xea\xadyt\x9c\xd0\xc3qa\x8d\x9d\x8b\x94#\x00\
+R\x0b\xf8\xa8C\x18\xf3{\xca4f\xe6\xe3\xf0}a\
+\xb8`\x93 ,k\x80l\xffkL\x00\xe6\xa4\xa2\xd0\
+#z\x01(1\x15a\x1a\xa5\x93(\xeb\x9b\x13\x15\xd0\
+~_\x9b\x0e1\xf8\xa8\x91X\xc1F\xe9K\xa6\xc5\x84\
+\xa6jX\xb4s\x9e\x8c6\xd8\x98\xafsP\xae\xd1\xc4\
+\xb6K\xda\x8c\xfc\x98\xb5r\x8d\xf5r\x83\xcd\xca\xa6\x85\
+\xaeW\xebL\x8aI\x9a\x0e\xf22\xfb\xff\x9eA\x89\x07\
+\x8aB$\xad~\xe3W\xa7\x01\x8c\xb2\x00\xcc\xb1\x81Q\
+3\xac/\x80C\xfa2\xa11\xd0 \xc4\xae\xee.\x8f\
+(\x0f\xd1\xe6\xd3ij\xae\xf8\x88\xbb\x01\x96\xac\x19!\
+\xa5]d\x1b[\x0e\x9aC\x1e\x8f\x9ep\xd4\x1c\x11Q\
+\x16\xad\xe5\xf9\xf3\xb0\xa9\xed\xf1\x16\xdb\xe3mv\xc6\xdb\
+lV\x9bi\xcc\xdc\xc5!\xe7\x97F\xc9\xd1_\xe2\xd7\
+@\x00\x92\x10(\xd0H\x12\x00\xb1\x85\xdf\x14\xd8D\xe9\
+\xec\xf8M\xe8cD\xd5\xa8\x92\xa5)\x9f\xd4Ew\xc9\
+\xfdF\xaf\x8e22\xe7\x5c\x82\x8d\xc5\xd1j\xcbN\xbd\
+\xc3\x93\xf1\x01'\xed\x09\x22\x8e\xc5 \x0c\xdc\x1em\xb3\
+\x93f\x06o\xa5q3]>\xe0\xa3*\xe8\xa7j\x1a\
+\xb4\xe7U::\xe6\x0bA\xb4S\xff\x87\xe9\xa8\x0bl\
+v\xdc\x18\x13\x805\xccF\xc4N\xaa\xa2\xda\xa4l\xaf\
+6\x94\xb8\xd0\xc1\xe7\xa7\xad\xd2?\x82f 3\xce\xaa\
+\x83FL\x8b56G\x1b\x5c\x1b\xef\xd0\x84\xda\xfc\x80\
+X#j@\xd0f\xb5\xc9\xeeh\x87\x8d\xd1\x06k\x85\
+e\x04?\xf2+\x9f\xc4\x83\x84\x99w\xf6?\xa4#j\
+\x8f\xfa[1|\x8dp\x8cM\x0c{Bj\x0e\xdd'\
+\x09\x80X\x83\xe8\x02\xb0\x01\xe4\x03\xf5\x9f\xf6\xb97\x84\
+\xe0\x19M\x96\x1f5\xb2\x02\xce\x8a\xcdj\x83\xc5d\x0f\
+\xe7<\xdb\xcd6Ml\x10\xac\xbeo\xad\x98\xb23\xde\
+a\xa3\xda\xa0\xf2\x1f\x03\xb5?$\xe9}\x00\x0d\xfd\xae\
+\x221.\xcd3N\x9bJq\x04<V[\xf8\xb3\x02\
+\xe5>0\xb1\xa8X\xb7A\xe6\xe4\xb2\xf8$M\xb1\x8d\
+D\x1fm\x22\xa5~4W\xfc\xb3\xa8p\x05k\xe5\x1a\
+:\x81i9\xa5\x0e\xf5`P\xa4\xef\x8aM\xd6\xcb5\
+\x0a\xf71(\x93X\xa5\xa4\x01V\x17l\x9e \x8a\x12\
+\x10\xe6\x0a\x87\x82<\x04\x1e\x00'\x05\xc8}L\xf5\x17\
+ {\x98\x94\xb4\x9dJ\x09Jt\xdd>5vBx\
+*6\xfeQ$/\x9e\x89\x9fP\x8eJ6\xaa\xf54\
+\x03\xc0\xbe\x8b\xa3\xaf\xf1\xcf;\x8a|\x9c\xa8K\xdb\xe7\
+\xf0\xaf\x1d\x08@_\xfb\x160\xde\x1e*<\x02\x1e\x80\
+\x1c\x17(\xfb\xe9\x85\x116F|\x0e\xb4\x9a\xb0\xc5\xa8\
+\x11\x09\xd2KV\xec\xa5J\xaf\x98\xff2\xf8\xf7\x83R\
+\x0e\x0bKW\x0es\xe4+\xe7\xef\xfd\x86\xcb\x5c\xd9\xcb\
+h\x9a\xe9\xec\x7f\x5cv\x005\xe8\xc0\x04\x00}\x08\x98\
+L\x80<\x04\x8e\x0a\x8d\xba/B\xad6&\xf6\x08\x98\
+\x0b\xb6q\x9f\x22\x10\x95(\xe6\xfd\xeb\x00]\xd2\x88u\
+\xa2\xbc\xd8owF\x86\xedT\xed\xea\x85\xe9\xf2\x0c~\
+\xd6ys\xfd\xe12)/\xb8\x1e \x83\xfc\x1dO\x06\
+ P\x18\x98k\xcbf\x0d\x05\xe0\x09\xf0H\x85\xc3\x22\
+\xb6\xe1\x91\xf3.\xe0Y\x079\x02f\x9a\xb2E\xa2\xe6\
+\xf3\xeb\x12\xb80\x8c/\xaf\xb6S\xe8\xa3L/\xe5\x16\
+,\xc1\xf5\xcbN\xfb\xd0\x5c\xd3\xe7\x00f\xc01\xe8\x81\
+\xc2\xe3\x88\x1c\xb8\xf9\xe3\xc3\x83\x18\xc3\x81*G\xa0\xc7\
+\xf40a\xdd'\x97T\xbb\x0f\x88J\x1c\x84\x19/\xd4\
+)<#\x04O\xad\x9e\x1f)?4\x97\x9c\xeb\x8a\xca\
+z\xa1\x8bc%\xec[b\xbc\x81?\xb9t\x22b\xa1\
+\xfd\x1c\x98%\x00\xe8\x10\xe2\xe1\xa2\xac\x8f\xdcw\xfe\xd1\
+wC[\xd73\xd0\x13,/p\x94\x8ecT\xe7\xa8\
+\xb6\x9a(\xe6\x88\xa0\x8d\xc4\x10:5\xf3a\xb6y}\
+:\x0d\xeb\xabl\x94[\x881\x8dn;\xb5\x03\xdaK\
+#\x9b/\xd8\xf4\x9b]-\xdd\x8f\x17#\x01\xf9\xbew\
+\xbeY\x1b\x87\x08`^\xb2\xad\xa2s\x96\xf9z\x22\xe8\
+L$\xcc\xfe\xe8\xef\xfc^\xb0F\xd0\xc2[\x92@8\
+\xc1@\x82G\xe4\xbde`\xa1j\x1bQh\x88\xc46\
+\x10\x9a\x96\xd0\x04\x8b\x0c\xc2\xaa\xc8??Z-\xad\x0c\
+\xd1\xb6\x9c\xa9C\x93f\xfe\xbd|R\xd4\xea\x0cB\xd3\
+\xd5\x11\xbc0\xf6\x0f\xdc\x1f\x85.D\x0fM\xe8\xf8\x11\
+\x83f\xf9[\x8a\xfb1\x9e\x1e`y\x80Z\xb4\xef\x0d\
+D\x9c\xa8\x08\x8d\xbd\xa8O\xb0\x18q\x13\xc1\xa3\xa9\x22\
+;j\x11\xa3}\x98s\xb9\xf2Ul~\x80\x0e\xaaf\
+\x9fw\x82(e\xe2Tm\xe5\xd7\xa1f\x1ef\xcc\xdb\
+EW\x8e\xfd\xb2\x5c\x90\xcc\xfcy;g\xd6\xceY\xb4\
+\x0b\xda\x18\xba4\xf3\x8b(\xa0\xec\x91?\xf3\xcbB\x13\
+h\xeb\x96\xb66!\xd0\xd8i\xa0\x801;\xf3\xf3A\
+z>\xc3\x1cB\x85$\x00\xce\x17 \xd2\x8ai\x80G\
+\xc0=\x94u\x85\x0aa\x04\x8c\x15\x1de\x89k]k\
+\x197'\xc4\x22\xcd\xacW\x96\x86/>\xbf/l\x14\
+\x884\xb1\xe6\xa49\xe1\xb0>bZ\x1c\x000.l\
+@\xb4\x97\xd3-\xdf/\x8a\x14%\xc4@\x13[\xe6\xed\
+\xac\xeb58iO\xa8c\xdd\xedy\xf8\xc2\xaeg\x00\
+\xfa\x846\x12\xea\xa4\x95\x93FN<h\x04\xc9\xdb\xc4\
+\xdcK\xc7#\xe0\x04\xa4\x155\xa43\x09\x80\xa8\x08-\
+f+\xf6\x81\xf7\x81\xa9\xf4#\xc56P4\xc6(\x12\
+\xc4N\xed\x02\xaeu\xf8`;V\xa9\xd7N\x08\x9ev\
+\xe5\x17\x16\x0f1\xcd\x92)\xc4\xc0\xac\x9d\xf3\xa4~\xc2\
+\x83\x93\xfb\x00\x9c4'\x8c\x8b\x09\x95/W\xfa\x03_\
+\xacO\xa2\xf4%\xe7\xf3v\xc6As\xc4\x83\x93\x07\x1c\
+\xd4\x07\xcc\xda\x19!\xf6\x9bM<\xd7d\xd2\x8a\xd7o\
+>Y \xb4\xc9\x04$\x1f \xdd\xe6U~\xbe\x8f\x09\
+\xc3\xb1\xbd\xe6\x06\x1a\xc0\x02\xfa\x06\xb3\x17\x0f\xd4\xe6\x06\
+\x8d\x80u\x90]`\x0fEs\x98\x81@l\xa5G\x9c\
+r\xd2\xc1\x0fc\xedS\xd7\xde?\xbf\xa0\xd38\x14\xa6\
+66\x1c\xd5G\xdc\x9f=\x00\xe0\xa0>dZL\xa9\
+\x8a\xbc\x15\x9c\xeb\xe6\xf3\x5c\xa8r\xf8\x03So\xe6\x94\
+\xd8i\x80Ek\xedf\x07\xf5\x01\xf7O\xeesT\x1f\
+w[\xd1\xac\xf6&>\x0fZN\xf8\x98\xf3\x17\xdaH\
+\x18D\x01\xe9\x064\x08\x87\xc0}\xe0\xbdt\xdc'\xa5\
+\x81\x19\x9a\x00\xcb&h\x16\x80{b\xac\xac\xd4f\xca\
+\xde\x02jM%\xaf1\x98z\x0b.\xe0\x83\xef!G\
+\xaf\xe4\xcd\x0d\xdd\xea,\xc1\x0e\x8eV+2\xe4\xd9\xec\
+\x19\xde8Eib\xc3as\x08\xc7\xb6\xf2'\xc5\x98\
+\xb2\xdb\x0c\xda\x9dJ\xde<\x7f\xf6/S$\x17\x9b\x06\
+\xeah\xcd'G\xf51\x87\xcd!Ml:\xa8\xfc\xb9\
+M\x13\xcd\xab\x7f\x88\xf8%\xe6\xc76\xa0mD\xfb\xf4\
+ov\x00\x0f0\xd5\xff\xae\x8a,\x0b@Z\x84\xb6i\
+T\x1b\xd5\x8b\x0b\x02'*\xd6\x02\xa0\xc2\x18\xdb\x8a\xfc\
+\x09p\x82\xb2\x00\xbc\xaaJ$\xaa\x04\x91\x1c\x12\x86\xd6\
+\x1cC\xd7\xcd\x13\xcaC\x18\x86\xd7\xaf6\xba\xfc\x83\xa8\
+\xe9\x01j\xd7\xa4\x0d \xeaP\xf3\xa4>\xb0n\x1d\x5c\
+\xea\x14\xe2\xea;VR\x98\x9d\xe7\x0a\x9b04]e\
+\xb1]\xd2\xf3\xbb\xa6\xcc\xfc\x0e\xebO\xf7=\x87\xe31\
+DM\xbb\x86*\x16\xf7\x9f`\xde\xff=\x15\xb9\xa3\xf0\
+\xbe\x8a<\x04f\xa0\xad\x0e5\x80\x8bP@\x18\xb5.\
+6\x9e\xd0xu\xc1\xe9C\x11\xf6S\xda\xf01\xb0\xa9\
+\xa8\xc36$t\x1aTB0\xdb\xe3\xd2\xf6q.\xed\
+/\xd0\xef#\x94#\x83\xe4\x1fp\xde\x9e\x98g\xd3p\
+\xe5\xe4\xf9\xffuj\xe7\xfa\xa8\xd2\xd0\xcbyn\xea?\
+gf\x87\xcc\xef\xc2\xbe.\xe9\x13\xd5\x96\x7f-\x229\
+\x94\xdfO\xc7C\x15y\x1c\x8a\xe2\xb8u\xae)\xda\x06\
+\x97PB\x0f\xf0\xfeo\xbe\xcf\x9b_x\x8d\x7f\xf6\x0f\
+\x7f'\xfe\xb9?\xf3F<\x9e\x04\x89\x8e\x91\x0a\x9b\x0c\
+v\x0fC\xbb\x0e\x22/\x22~8:>W\xe1x\x97\
+\xf6\x14\xceC\x8b\xa5\x17\x82\x9c\x98\xba\x8cz\xce\xceO\
+$v;\x82\xb4\x1a\x08\xdd(x\xfb\xb9M\xcf_\xc4\
+q\xe6\xf9\x89\xfd\xd0\x89\xfc\xcd\x9es\xbe\xa1\xab\xf7k\
+#m\xdd\x12\xea@\xbbhi\x87x\x8c!c3\xe0\
+@D\x1e`6\xff\xbb\xc0\x1f!\xf2n\xf4\xfe\xd1\xa3\
+\xeb{\xf3\xef\xff7\xffT\xb7\xfe\xda\x9b|\xfb+\xff\
+\x12\x18\x14w\xbd\xf3[\xb7\x01\xf8\xf6\xbf~\x87W\xff\
+\xe2\xabD\xcf\x88~\x17\xb1\xb1\xa2\x05\xd64R\x89H\
+\x89Pv\xcb9y\xff\x22\xb6\x93\xa5\xf3\xcb\xfb\x09v\
+_\xa4C'/g\xa1Woj7\xbd#\x9b\x9e\xfc\
+\x9f\xbc\xa0c\xe9\xfc\xb9d|\xe5\xf7/\x22\xe1\xa4\x06\
+\xfa\x84\xd6\x18\xdf,\x1a\xda\xc5\x12\xf3\xc1\xca\xbd\x8e\x04\
+y\x00\xdcFx\x07x\x1bx\x07\xe4\xae:9\xfc\xee\
+\x7f\xf7k\x01\xe0\xd1\xd7\xde\xe9N}f\xe5C\x10\x0d\
+\x8a.T:'b\x0b\xb51\xb2\x222\x02\xc6(#\
+\x0d\xea\xf2\x16,`m\xd2m\x19\xf0E$:\x87;\
+\x93\xd1\x1f\x82\xf9]\xd6U\xce>\xcd\x8bv\x03\x9ev\
+\xfe\x0e\x07{\xce\x8c\xcf\x8e_H\xa0O\xd3\x1a\xf3k\
+\x0b\xff\x12\xf3#P\x0b\x92\xf9\xf5\x1e\xca\xbb\xe9\xf9\x81\
+\x88.$W\xbf\xac\xd0\x99\x02\xd0\xb8\xa8\x22\x92\xbd\xc8\
+\xfb\xd8\xf6\xf1%\xfd\x8e\x13\xeb\x8a\x8e5j%\x9a\xfa\
+m\x9c\xd06-E]\xd0z\x03\x8a\xbc\xfa~\xc4\xbc\
+\x5c^\xfd\x0fi\x09q\xfc\x01\xa6\x9cd\xcbv?\xc3\
+\xbd!!~\xa1\x0d\xc9\xebG\x15m\x80c\x84G(\
+w1\xf5\x7f\x1b\xb8\x8fr\x00\xd4n\x09\xb3\xef\xe9L\
+\x01h=\xea\xa1\x11\xe5\x10\x93\x22/\x88G\x98b\xbb\
+\x8bmc\xfb\xd3;E\x8b\x84\x10J\xdb\xb4\xd4u\x0d\
+\xce\x9c\xb6\xa2*\xba\x0d\x0d\x7f\xd0\x19\xf6\x5ch\x18 \
+\xa5\x90;&\xa4\xcf\xe0\xdev\x88\xbd\xe4\xa4_\xb6\xfd\
+G\xc0>\xc2\x1d\x94w\xb2\x06P\xd5CQj\x89\x1f\
+D\x00\x1c\xea\xa24*\x1c\x89\xd5}(\xe6/l \
+\xeca\xc0\x90\x8d\x1cWF\x8a\x161D\x09M\xa0\x91\
+\xa6/O\xd6H\xa1\x05\x05\xc3\xee\x9a\x17\x01\xd2\xfc\xe0\
+P\xc6\xfaU\xb5s\xfa\xdaEKX\xf4\xab?\xa5\xe2\
+cb\xfeB\x84#U\x1ea\xda\xfa6\xe8\xbb\x0a\xb7\
+5\xea>\xe8\xb1BK\x1b/.\x00\xb4B\xeb\x8a\xd0\
+\xe2f\x1emK\x89\xad\xd3X\x08l\x83\xde\x04\xae!\
+LrT\xa7\xe8XU\xcb\xd0\x86\xb41j\xbfG\x0f\
+\xa2\xe0\xd4\xea\xec\x06\x99\xac?\xa13h\x00\xf5\x1a\xce\
+\x1fz\x8f?y\xff\xb1\x8dV\x9f\x81\x0e+|\x1e\x8a\
+p\x1f\xe5}Eo\x03w4\xc4{\xa1i\x0f\xdb6\
+\xb4\xbe\xf4\xf1\xbcL\xc9\x99\xd5\x8f\x0f\x7f\xe3}6\xfe\
+\xd2\x9b\xfa\xdd\xaf\xfe\xf3x\xf23_l\xd7t\x1e<\
+\xc1\x89m(5\xa1\xdf\x5cr8d\xba\xc0L\xc22\
+\xd4\xebrGq\xf7\x1d\x81\xe7\x0b\x92\xfc \xd0\xaa\xcd\
+\x1f\xae\xfe\xec\xf4u\xa5\xde\xb6\xba\xe6Xs\xc7\x03\x11\
+\xee\x00\xdfG\xf8\xae\xc0wU\xe3{\xf5b\xfe\xf0{\
+_\xff\x83\xc5\xbd\x7f\xfc \xae\xff\xf9-\xfd\xf6\xff\xfa\
+\xcd3?\xf7\xdc\xf2\xd7\xc7\xbf\xfe}\x00\xda_\xfbw\
+l\xfe\xe5\xcf\xc4\x92\xd6;Q\x8f\xedO\xad\x18\xdc\xd8\
+\xefKks\xe8}\xc7\xfc4O&\xf3\xd9f\x15,\
+\xff\xeeO\x84\xc0\xa8\xeb\xe3\x0f=\xc8\xd31~a\xf6\
+\x7f\xa5\xdd+`I\x9d\xfb\xc0;\x22)\xde\x87\xb7\x11\
+\xdeS\xd5\xfdf>?\xb9\xf7\x8f\x1f)\xc0\xe3\xdf~\
+x\xeeg_\xa8\x00\xbe\xa5P`\xae\xc8C\x11-T\
+\xa5\x15\xab4Q\xf2n\x94\xcaD\xd1B\x10\xa7A\x89\
+\xa2\xb4\xb5A\xa29s\xa5Ua\x12'\x1e\xe7\xff\x84\
+\xf9=i\xda\xfe=\x122\xd03x\x5c*\xf7\xb2\xa5\
+d^\xbf\x09\xc0\xdb\xc0\xb7\xd2\xe3{\x18r\xbb\xd0s\
+\x9c\xbeU\xba\x90\x00\x8c\xf5\x18\xd0F\x85'\xa8\xb4\x22\
+\xbaP\x95Fl\x1f:\x8b\x0a0\x9f@U+\x04\x17\
+\xdb\xe8\x00i\xb5\xedj\x09s\x02\x22\xaf|+,Y\
+\x8e\xf1\xff\xd8PN\xdai\xea\xe8m\x07\xc5\x1d\xf3e\
+\x94/#}\x09\xea\xcdI\xbb\x87X\x8a\xf7{\xc0w\
+D\xf8>\xe8>p\xe4\x1c\xcdh:\xb9\xd0e\x5c\xac\
+\x05&6\x1a\x0bi\xa3\xf3\xc1\xa96>\xc4\xd6\x11\x0b\
+\x84-\x94k\x98\x10\xf8tq\xeb\xaa:&R\xc56\
+\xfa\xe1\xee\x1e\xc6h\xe90\x02\xf5\xdaoL\x95Q\xbd\
+\x1ft\x1a\x80;\x9am~\x88\xc4&\x10\xea\x966\xa9\
+\xfc%\xac\xdf\x98_c\x19\xbe\x9c\xe3\xbf\x0d\xbc\x9b\x8e\
+\xdb\x88\xde\xf3N\x0fE\xb4\x09\x81\xe8*\x7f!\x0dp\
+\xa1\x16\x98\x87\xbfq\x9b\xbd\x9f\xbd\xa5\xdf\xfa\xcaok\
+\xf1\x1f\xfdh\x187su\xb6\x11a!\xd2\x8d\x9b\xcf\
+\x93\x94\xf2\xbc\xa1\xb2;\xbf\xc2\xb0\x8b\xa4sx\xb0V\
+\xf3\xe1\x9e\xbf\xc3\xe7\x1f{\xad \x9c\xfa\x1e\xabY=\
+\xf3\xf4[\x9a\xec\xf0\xd5a\x99\xf9\xda\xd9\xfc\x13,\xd4\
+\xbb\x83\xf0=\xcc\xe6\xbf\x05\xbc-\xc2\x1d\xefx<\x99\
+\xb6\xf3\x7f\xf9\xe5\x7f\x1b\xdf\xf8\x0fo\xe9\xd7\xbf\xf2{\
+\x17\xba\xc4\x0b\xf7@=\xf8\x7f-Wp\xf4\x7f\xbf\xc5\
+\xde_~]\x1c1g\xfc#B#\xb6\xfa!;\x85\
+\xc8\x88TSh\xdf\xbc+W\xee[\x96\xd2\x88\xca\xd5\
+\xbd\x08\x87\xd8\xfb\xc7Z\x08\x06\xf9\x09\x18\x14s\xc4>\
+\xc6\x0f\x19\xdb\x9f'\xe6\xd7\x86\xf0\x0d\x98\x9fs\xfbO\
+0\xe6\xff\x11\xf0m\xe0\x0f1\xf5\x7fG\x84G\xce\xe9\
+\xec\xb7\x7f\xee\xf7\x02\xc0\xbb\xff\xcf\xfb\x17\xbe\xc4Ku\
+A:\x8d\x01X\xa8\xf00E\x04\x0b\x85\x855\x0aI\
+\xde\x97\xaeL\x1eKIT\xaf\xa8\xa3A\x96z\xd7\x12\
+6\x91\xc1\x0f\xa7\x03\xd4\xf0\x07A\x03\x0c\xec\xfc\xd2\xb4\
+\x95\xb6G\xf8\x96\x12;}jW5Z\xddON\xf2\
+`(\xdf{\xd8\xca\xff\x16\x96\xe4\xb9\x07\xfaHa\x1e\
+\xcf\xdb\xdc\xec\x19t\xb96XmUEjD\x8f\x14\
+\x89\xa2\xb4iK\xd6\x11\x9a\xf7\x1f&\x80\xee\x00\xeb\xaa\
+\x8c\x89\x8c\x22\xb1\x10\x15\xd1\xa86\x866\xab\xfc\xec\x13\
+\x14v\x93d\xb0\xe5Y~\xfdc\xa5\x0d:@\x87^\
+\xf3\x0d\x1b8VC\xbd>\xb1cY}\xb4I\x8c\xef\
+\x80\x1e\xcc\xc3\xff\x1e\xf0=E\xbe\x0f\xdc\xc1z\xfcf\
+D\xea\x18\xe5R\x02p\xa96\xd8\xfb\xbf\xfe>{?\
+{\x93\xe8Q\x81\x00\x12\xa5/\xe1\x8c\xe4Qd}\xf9\
+q\x06\x8c\x1c\xa9\xaa\xa8\xbfW\xd9\x13\x8e}\xad\xdb9\
+\x1dG\x9d\x10\x9cw\x5c\x15\x0d>S\xce\xf8\xfcSv\
+\xbe\x09\x84&v\xc9\x9c.\xc4K\x9e\xfeRbG;\
+\x84/'\xe2\xde\xc5\xf2\xfa\xdfI\xc7\xdb w\x80G\
+\x8a\x1cG\x95:*\xf1\xdf\xfd\xd2\xd7/\x05\xb0^\xba\
+\x11>\xfaV\xa3\xf3\x01\xc0G9A\xbb\x1e\x82\x1a\xb3\
+W\xfb\x9a\xa6P\xd0\x0b\x81\xa8\xaa\x08RhT\x09m\
+\xe8`O\xe7\x9d\xd5\x12\x14\xb6\xfd\xb9=\xf7\xf8\x82\x94\
+P\xca\x9a\x00\xceJ\xba\xaa\x95\x1c\xe5\x1f^\x0c\xc9\xf0\
+\xa9,\xfd:\xe79WU}f~lC_\xc3\x97\
+\xcb\xb8\xfa\x10/3?\xb7p\x9b\xca\xa7\xcb\xe9\xbf\x0d\
+\xbc\xab\xc6\xf8\xfb\xd8\x80\x87\x99*M\x8cD.\xb9\xfa\
+\xe1C\x08@@4\x8a\xb5\x87\x16J-p(J#\
+\x16\xa6<V\xe1\x89\x98o \x08%&\x00\x11%*\
+:&R\xaa\xaa\xcb\xbd\x06\xe2\x85\xe0C'\x04\xb1\x8c\
+\xf8*c\x07\xde\x8aN|2\x0bN\xfby\x85\xb0\xcc\
+\xf0\x17\xa9\x09\x06y\xac\xa1\xc0\xad\xday]\x89\xeb\xb3\
+\x8a\xcf\x05\x9c\xc3\xe1\x0dI\xd3\xc5\x94\xd2\x9d\x89t*\
+\xff\x0e\xf0\xb6\xc2\xb7@\xdeR\xfb\xf9\x91\xc2\x91\xc0\x82\
+H\x8d\x1a\xfb9g\xc7\x94\x8b\xd0\xa5\x05\xe0\xad\x9f\xfb\
+\xb7\xf9i\xfc\xd3_\xf9q\xadZ\x17\x8b(\xb5\x0a\xb3\
+\xe0\x98E\xaf\xadB\x815\x96\xe4\xa1\xd43\xac\xb8d\
+C\xd1)J\xa5hA\xc4K4\xdf@\xa3\xe2\xa2\xef\
+M@T4\x82+\x14\xe7\x07\xbe\x81\x1b\x84\x8eC\xff\
+`(\x18\x1f\x12r\xeea\xed\xfc00K\xba\xfc\xf3\
+\xb0E\xbb[\xfdu\xa0M\xf1}h\x02!D\xb4M\
+\x05\x9c\x9a\xb3e\xdd\xec>\xeb\xdfS\x1e!\x9d\xea\x7f\
+\x1b\x83w\xbf\x1fq\xf7\xa2\x93\xe3\x88\xb4>\xc6\xe0\x88\
+\xfa\xfb\x97T\xfbCz\xee\xeb\xe5?\xfe\xcf\xff\xbc\xbc\
+{\x9dQ]\xb0\xadN_S\xf8$v\xbc\x86r\x13\
+\xb8\x0e\x5c\x03\xb6Uu\x13+;\x9b\x88\x93B\x9cm\
+Q\xef|:\xca\xde\x14\xd8\xef\xa4\xdf\x18y\xb87\xee\
+\xc0a\xcc\xa5\xe9\x82\xf4\xc5(|p!\xc8\xcc\xef0\
+\x8b\xc4\xdc\xeey\x9a\x91\xd0\xaf\xfa\xbe%{\xc9\xd3o\
+\x93\x09\xe8\x067tx~Kj\xd7\x16\xe4\x00\xe9\x8a\
+8\xef\x0b\xbc\x8fp\x1b\xf8\xbe\xc2\xf7T\xe4N\xeb\x8b\
+\xc7w\xaf\xbf\xb2x\xf8_\xfe\xef\xcf\xd5\xc0=\xf7Y\
+(\x7f\xf0o\xee\xf0\x89\x9f\xbcE\xebEU\xa4\x05Y\
+(r\x84\xcd\x1e8\x01\x16\x98\xba\xcb\x1bUX\x9d\xa1\
+\xed_$\x96_\xee3c\xbd\xe7lj4\xab\xd0\xae\
+\x11r\xd8\x0b\xaf\xfd\xdf\x0e\xcd\xc2P#<\xb3dk\
+\x90\x92]R\xeb\xa1\xbf\x96\x90\xedyF\xef\xea@H\
+ \x8e\xc5\xf6}\xbf^\xae\xd9\x1f\xb6n\xa7\xab[\x00\
+\x07\xa9\x86\xef\x0e\xf0\x0e\x96\xd4y\x0b\xf4\x0f\x81\xefZ\
+\xd8'\x0fT\xe4\xa8-\xfc\xe2\xdd\xff\xf6k\x97\xb6\xf5\
+\xe7\xd1s\x17\x80\xbf\xfe\xb7~\x8c\xc3\xb1#8\xa7Q\
+|\x1dq'ji\xcbcI\xd3)\xc9\x1b\x16\x08\x92\
+\xaa\x8b-B\x10\x9c\xcd\x9d\xa3\x07\x8cR\xfbS\x0c\xb1\
+\xebC8c5-G\x0e\xab\x07++\x99\xd3\xef\x1b\
+\x9e#w:\xad\xf6\xdew+\xba\x0d\x84:\xd7\xe8\x85\
+\x14\xca\xf5\x82\x90<{\x8d\xa9Y#j\xcc\xf5py\
+^\xff\x5cDr\xf5\xeem\xcc\xd9K\xe8\x9e~\x87\x94\
+\xd2U\xd5}U=Rh\x10\x89{\x7f\xed\xd3\xfa\xe0\
+k\xdf\x7f\xae\xfcz!.\xd3\x8f~\xf9'\xa8\x8b\x89\
+\xcc\xfc\x04G\x94B\x9b\xaa\xd2\xc5\xa6\xd3p\x03\xf45\
+\x81\xd7\x81W\x05y\x0dx\x15\xb8\x81u!M1\x0c\
+\xa1\xc44C\x86\x93\x9d\xf5\x9a\x88\x88K\xa6\xc0's\
+\x91J\xce$\x9b\x0dg\x87\x0c\xccE6\x05K\x85\xa5\
++_\xbd\xabV\x1c\x827\x03\x95\xbe:\x81\xa3\x9b\x95\
+0\x9c\xc8\x95g(\x99\x8d\xc8\xdb\xb2\xe4\xe9\x1cyN\
+\xff\x02\x06M\xb8p\x1bMx\xbe\xf2\xae\xa2\xb75\xc4\
+{M=?\x08m\xdb\x84\x10\xb4Z\x9b\x22U\xa5\xdf\
+\xfc\xc5\xdf}\xee\xbc\xba\x92\xe8\xb9\xfa\xea\xdf\xe0S\xe1\
+\x9dI\xa9\xcd\xb6C\xf7\xc4\x18~\x1d\xe4Fz\xbe\x07\
+\xecbY\xc5M\x94\x0d`M\xd1)\xa9\x00E\x90\x82\
+4\xa8\xba\xf7\x01\x5c'\x08\xe2\xc4\x04a\xc0\xf4\xceY\
+\x1c\x00N\xcf2\x01C\x8f~\xd5\xb3_\x12\x880x\
+\x0c\xc9\x07\x18\xfa\x09}\xc5\xceL\x90\x13$O\xe6\xe8\
+\x864\xee\x03\x0f\xd0\xaes\xf7>\xca=\x8d\xf1A[\
+7\x8f\xbf\xfb\xaf\x7f\x7f>\xff\xb5\x17\xc2\x8e%\xba\x92\
+\x81x\xf5/\xfc\x13\xe2\xcf\x7f1\xa71\xc1V\x81\xb5\
+-\xc1\x96\xd8\xea\xbf\x869\x88I8\xb8\x86\x09E\xc6\
+\x10\x1c\x8a\xb3\xdc\xb9m`\x22\x1a\x90(\xa8\xd3\xa5\x9c\
+B\xc7\xec\xe4\x10\xc2i'\xf0\x5c\x0d\x90\x7f>\xc3\x09\
+\xccC2\xf3\xf3\xd81<\xe79\xba?\xcfcYN\
+\x04\x1e\x0f\x1c\xbc\x9e\xd9\xc8\xbe%w\xf4\x09&\x14\x07\
+\x8a\x1e*z\xdc\xb6\xa1\xbd\x0a\xe6\xc3\x15i\x80\xd7\xbf\
+\xf2E\xa6\x04Wj\xebE\xb4\x10\xa8R\xb2\xa8\x02\x99\
+`\xa5\xe6\xbb\xa2z\x0b3\x0f\xaf\x01\xaf\xd0k\x87m\
+H\x10\xb3\xe0\xb3\x9f\x9f\xb9hh\x5czz\xce.\x10\
+\xf9\xad\x17\xbcd]\x12\x88\xe1S\xd5\xfe\xa1\x0f\x13\xf3\
+o\xb3\xca\xcfa]\xc7x\x81;\x0a\xef\x81\xbc\x0b\xdc\
+Q\xe5!\xb6 fb\x8eq\xad\xaa\xb5jl\xdb\xba\
+\x09\xed\xbc\x8eo\xfd\xea[\x17\xbc\xdc\xcb\xd3\x95\x01\xa8\
+\x9f\xff\xf2O\x80\x04\x0aE(\xbc\xa8s\x12\x9d\xf7\x02\
+\xa5\xc48q\xaa\xdb\xc0+\xa2\xfa\x1a\xa7\x05`\x87\xd4\
+\xa1D\xef\x1f\x14\x80G:\x88\xd9\xa1\xf8\xf4\x9dr\x0b\
+\xdby\x80\xf1y\xdf{\x10\xe5\x9f:\xa2 )\x8bO\
+@\xd2\xd6k6j%`6>\xdb\xf9\x8c\xe1?B\
+x p\x17;\xdeU\x95\xf7T\xe5\xaeF\xf7H\xd5\
+\xcdT\xa5u.\x04\x91F!j\x08\x8d:\x1c\xdf\xf8\
+\x07\xdf\xf8P\xf7\xfb\xa2\xf4\xd2\xd3+o\xfc\xf2\x97d\
+\xb4\xa8\xab\xa2m\xd7\x9c\xea\xae\xa8^\xc7L\xc0.\xc6\
+\xf8-`\x13\x13\x80)&\x04c4=\xda\x1c\x83\x11\
+h\xa5\xcb\x0ed\x81&!a $\xcb\x9bc\xae\x82\
+\xc7\xca\xf2\xbez\xc6\x5c\xe9\x98\xdbb#\xd7k\xa0\x06\
+Y`\xe6l\x8e\x0d\xd8\xcc\xc7\x09&\x00\x07\x08\x8f\xc5\
+\xcc\xdd>p\x1f\x95\xfbQ\xdd\xa3\xb6\x19\x1d-\x8e\xb7\
+\xeb?\xfa\xd5\xff\xf3y\xde\xce\x0fL/]\x00\x00>\
+\xfbK?\xe9Fu=r\xaaSQ\xdd\xc0\x98\xbd\x86\
+1|\x92\x1e\xa7X\xed\xe1zz\xdd&\x97\xc0\x06\xe8\
+Z~\xbf.\x09E'\x10Y(\x86\xc20\xd4\x08\xdd\
+*\x87\xa5\x15\xdd\xd0o\xb2\xb4\x00\x16\xd23\xf8\x18\xe4\
+\x98~\xf4\xbaM\xe1\x92~\x1a\x17p\x82p\x22\xf99\
+\x1c\xaa\xca\x91F\x7fR\xcf\xd7\x17\xdf\xfa\x95\x7f\xfa\xdc\
+\xe3\xfa\x0fJ/]\x00\xde\xfc\xfb?%\xa3\xba\x91\x22\
+F'\xaa\x85\xa8\x0e\x18\xa6Y\xd5W Y\x00\xb6\x80\
+-\x84\xed\xe4<\xee\x00\xdbjZb\x83e\xc1\xc9\xc2\
+P\xa5\xe3,!\x80\xb3\x99\x9fVyZ\xe1\x86a\xe4\
+Qz\x87b\x8e\xdbc\xe0Qj\xcax\x0c<Ax\
+\x02\x1c\x81\x9e`\x1b3\xb5\x82dajU\xa5\xd1\xe8\
+\xda\x10|lk\xe2\xb7\xff\xe1o\xbd\x88\xdbzaz\
+\xe9S\x91\x1f\x7f\xed\x1d\xf6\xbetS\x89\x1a\x05R\x01\
+\x84.\x10\x9d\xa9\xe8\xb1\xbax\xa4\x12\x0fQ9\x11\x95\
+\xb9 \x8d \xad\x88\xd8$|+\xb81\x9c@\x96\xec\
+\xff0\x05\xbdz\xac&\x90W5\xc0\xd0\x9ewC\x16\
+\x81c\x11\x8eD8Dx\x82\xf0\x10x \x22\xf7\x05\
+\xb9/\xc8=\xe0.\x12\xefG\x09\xfb*z\x904\xc2\
+\x0ce\x0eR\xabJ\x08)f\xfc\xe6\xff\xfc\xdb/\xfa\
+\xf6>\x93>\x12s\xd1\xbf\xf9w\xbf\x9e\x9f\xea\xcac\
+\xa6\xf6G\xbe\xf2gZ\xc7\x08\x14\x9f\xb2\x8b#l\xa5\
+g\xbb\x9b\xf7\xc2\xcb\xcc\xcb\xab9\xdb\xf3\xb3\x1c\xbbU\
+\x13\xb0\xe4\xf4qZ+\xac\x0aE'\x18$\x9b/p\
+\x18h\x0e\xbf\xf1w\x7f\xff\xa33\xc9\xf2)\xf4\xff\x03\
+\xd3e^$\xceY\xd0\xd7\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x0a\
+\x02hY\x87\
+\x00a\
+\x00p\x00p\x00_\x003\x002\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x02ZY\x87\
+\x00a\
+\x00p\x00p\x00_\x002\x004\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x02vY\x87\
+\x00a\
+\x00p\x00p\x00_\x004\x008\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x02DY\x87\
+\x00a\
+\x00p\x00p\x00_\x001\x006\x00.\x00p\x00n\x00g\
+\x00\x0b\
+\x05Y\xbb\x07\
+\x00a\
+\x00p\x00p\x00_\x002\x005\x006\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x02\x9aY\x87\
+\x00a\
+\x00p\x00p\x00_\x006\x004\x00.\x00p\x00n\x00g\
+\x00\x0b\
+\x04\x8b\xbb\x07\
+\x00a\
+\x00p\x00p\x00_\x001\x002\x008\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x07\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00^\x00\x00\x00\x00\x00\x01\x00\x00\x1b\xdc\
+\x00\x00\x01\xa1T\xf1(\xea\
+\x00\x00\x00*\x00\x00\x00\x00\x00\x01\x00\x00\x08\x1b\
+\x00\x00\x01\xa1T\xf1(\xf7\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1T\xf1(\xfa\
+\x00\x00\x00D\x00\x00\x00\x00\x00\x01\x00\x00\x0d\xb6\
+\x00\x00\x01\xa1T\xf1(\xfe\
+\x00\x00\x00\x94\x00\x00\x00\x00\x00\x01\x00\x00\xc2\xe5\
+\x00\x00\x01\xa1T\xf1)\x02\
+\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00\xd6\xc1\
+\x00\x00\x01\xa1T\xf1)\x06\
+\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x0c\
+\x00\x00\x01\xa1T\xf1)\x1e\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
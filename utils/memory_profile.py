@@ -0,0 +1,102 @@
+import os
+import sys
+import tracemalloc
+
+
+# 项目根目录，用于把内存分配归到项目模块
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 模块 -> 子系统名称，未列出的项目模块按相对路径显示
+SUBSYSTEMS = {
+    'utils/data_manager.py': '存储与解密（含解密后的记录）',
+    'utils/search_index.py': '搜索索引',
+    'utils/column_store.py': '列式筛选索引',
+    'utils/category_facets.py': '分类统计',
+    'utils/vault_audit.py': '密码体检',
+    'utils/breach_check.py': '泄露检查',
+    'ui/main_window.py': '主窗口（条目表与筛选结果）',
+    'ui/components/password_table_model.py': '表格模型',
+    'ui/handlers/password_loader.py': '后台加载',
+}
+OTHER = '其他（库与解释器）'
+
+
+class MemoryProfiler:
+    """内存分析
+
+    通过 --memory-profile 启用，用 tracemalloc 在登录、加载完成、搜索、导入等时刻拍摄快照，
+    把每块内存归到分配它的最内层项目模块（子系统），输出各子系统相对登录时的增量与
+    每条记录的平均字节数。tracemalloc 只统计经 Python 分配器的内存，Qt 在 C++ 侧分配的
+    内存不在其中。启用后分配会明显变慢，只用于分析。
+    """
+
+    def __init__(self, enabled: bool = False, frames: int = 10):
+        self.enabled = enabled
+        self.frames = frames
+        self.checkpoints = []  # (名称, 记录数, {子系统: 字节数})
+
+    def start(self):
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def checkpoint(self, name: str, entries: int = 0) -> dict:
+        """拍摄快照并记录各子系统占用，返回 {子系统: 字节数}"""
+        if not self.enabled or not tracemalloc.is_tracing():
+            return {}
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        ])
+        usage = {}
+        for stat in snapshot.statistics('traceback'):
+            subsystem = self.subsystem_of(stat.traceback)
+            usage[subsystem] = usage.get(subsystem, 0) + stat.size
+        self.checkpoints.append((name, entries, usage))
+        return usage
+
+    @staticmethod
+    def subsystem_of(traceback) -> str:
+        """分配调用栈中最内层的项目模块"""
+        for frame in reversed(traceback):  # tracemalloc 的调用栈最外层在前
+            if frame.filename.startswith(PROJECT_ROOT):
+                module = os.path.relpath(frame.filename, PROJECT_ROOT).replace(os.sep, '/')
+                if module.startswith('utils/memory_profile'):
+                    continue
+                return SUBSYSTEMS.get(module, module)
+        return OTHER
+
+    def per_entry(self, name: str = None) -> dict:
+        """指定检查点（默认最后一个）相对第一个检查点的每条记录字节数 {子系统: 字节}"""
+        if len(self.checkpoints) < 2:
+            return {}
+        baseline = self.checkpoints[0][2]
+        _, entries, usage = next((cp for cp in self.checkpoints if cp[0] == name), self.checkpoints[-1])
+        if not entries:
+            return {}
+        return {subsystem: (size - baseline.get(subsystem, 0)) / entries
+                for subsystem, size in usage.items()}
+
+    def report(self, stream=None):
+        """输出各检查点的子系统占用（相对第一个检查点的增量）"""
+        if not self.enabled or not self.checkpoints:
+            return
+
+        stream = stream or sys.stderr
+        baseline_name, _, baseline = self.checkpoints[0]
+        print(f'\n内存分析（tracemalloc，相对“{baseline_name}”的增量）', file=stream)
+        for name, entries, usage in self.checkpoints[1:]:
+            total = sum(usage.values()) - sum(baseline.values())
+            print(f'  {name}：{entries} 条记录，共 {total / 1024:.0f} KB'
+                  + (f'，每条 {total / entries:.0f} 字节' if entries else ''), file=stream)
+            deltas = sorted(((size - baseline.get(subsystem, 0), subsystem) for subsystem, size in usage.items()),
+                            reverse=True)
+            for delta, subsystem in deltas:
+                if abs(delta) < 1024:
+                    continue
+                per_entry = f'{delta / entries:10.0f}' if entries else f'{"-":>10}'
+                print(f'    {subsystem:<28}{delta / 1024:10.0f} KB{per_entry} B/条', file=stream)
+        stream.flush()
@@ -0,0 +1,68 @@
+import sys
+from collections.abc import Mapping
+
+
+class PasswordEntry(Mapping):
+    """界面侧的密码记录（不含敏感字段）
+
+    用 __slots__ 保存固定字段，比每条记录一个 dict 省去重复的键与哈希表；
+    分类名经 sys.intern 驻留，同一分类的所有记录共享一个字符串对象。
+    热点循环（搜索、筛选、表格绘制）直接读属性；同时实现只读的 Mapping 接口
+    （entry['website']、entry.get('notes')、dict(entry)），需要普通 dict 的边界
+    （JSON 输出、编辑对话框）可以直接转换。固定字段之外的字段保存在 extra 中。
+    """
+
+    FIELDS = ('id', 'website', 'username', 'category', 'url', 'notes')
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, id, website='', username='', category='', url='', notes='', extra=None):
+        self.id = id
+        self.website = website or ''
+        self.username = username or ''
+        self.category = sys.intern(category) if category else ''
+        self.url = url or ''
+        self.notes = notes or ''
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, data, exclude=()) -> 'PasswordEntry':
+        """由 dict 构造，exclude 中的字段不保留"""
+        extra = {key: value for key, value in data.items()
+                 if key not in cls.FIELDS and key not in exclude}
+        return cls(data.get('id'), data.get('website'), data.get('username'), data.get('category'),
+                   data.get('url'), data.get('notes'), extra)
+
+    def replace(self, **changes) -> 'PasswordEntry':
+        """返回修改了部分字段的新记录"""
+        return PasswordEntry.from_dict(dict(self, **changes))
+
+    # Mapping 接口
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        return self.extra.get(key, default) if self.extra else default
+
+    def __contains__(self, key):
+        return key in self.FIELDS or bool(self.extra) and key in self.extra
+
+    def __iter__(self):
+        yield from self.FIELDS
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return len(self.FIELDS) + (len(self.extra) if self.extra else 0)
+
+    def __repr__(self):
+        return f'PasswordEntry({dict(self)!r})'
+
+    def __reduce__(self):
+        return PasswordEntry.from_dict, (dict(self),)
@@ -0,0 +1,153 @@
+import re
+from functools import lru_cache
+from operator import attrgetter
+
+try:
+    from pypinyin import lazy_pinyin
+except ImportError:  # 未安装 pypinyin 时仅支持原文搜索
+    lazy_pinyin = None
+
+
+# 参与搜索的字段（与原有的文本搜索保持一致）
+SEARCH_FIELDS = ('website', 'username', 'notes', 'category')
+
+# 生成拼音/首字母索引的字段
+PINYIN_FIELDS = ('website', 'category')
+
+_search_fields = attrgetter(*SEARCH_FIELDS)
+
+_CJK_RUN = re.compile(r'[㐀-䶿一-鿿豈-﫿]+')
+_PINYIN_QUERY = re.compile(r'^[a-z0-9]+$')
+
+
+def pinyin_available() -> bool:
+    """是否支持拼音搜索"""
+    return lazy_pinyin is not None
+
+
+@lru_cache(maxsize=8192)
+def to_pinyin_keys(text: str) -> tuple[str, str]:
+    """将文本转换为（全拼, 首字母）
+
+    中文片段按词组整体转换以获得正确的多音字读音，非中文片段原样保留。
+    例如 "支付宝" -> ("zhifubao", "zfb")，"QQ音乐" -> ("qqyinyue", "qqyy")。
+    不含中文或未安装 pypinyin 时返回空字符串。
+    """
+    if lazy_pinyin is None or not _CJK_RUN.search(text):
+        return '', ''
+
+    full_parts = []
+    initial_parts = []
+    position = 0
+    for match in _CJK_RUN.finditer(text):
+        plain = re.sub(r'\s+', '', text[position:match.start()]).lower()
+        full_parts.append(plain)
+        initial_parts.append(plain)
+
+        syllables = lazy_pinyin(match.group())
+        full_parts.append(''.join(syllables))
+        initial_parts.append(''.join(s[0] for s in syllables if s))
+        position = match.end()
+
+    plain = re.sub(r'\s+', '', text[position:]).lower()
+    full_parts.append(plain)
+    initial_parts.append(plain)
+    return ''.join(full_parts), ''.join(initial_parts)
+
+
+def search_fields(entry) -> tuple:
+    """条目中参与索引的字段值"""
+    return _search_fields(entry)
+
+
+def build_search_text(fingerprint: tuple) -> tuple[str, str]:
+    """构建原文与拼音搜索文本
+
+    各字段之间用换行分隔，避免跨字段误匹配。
+    """
+    fields = dict(zip(SEARCH_FIELDS, fingerprint))
+    text = '\n'.join(value.lower() for value in fingerprint)
+
+    pinyin_parts = []
+    for field in PINYIN_FIELDS:
+        full, initials = to_pinyin_keys(fields[field])
+        if full:
+            pinyin_parts.append(full)
+            pinyin_parts.append(initials)
+    return text, '\n'.join(pinyin_parts)
+
+
+def normalize_query(query: str) -> tuple[str, str]:
+    """返回（原文查询, 拼音查询），查询不适用拼音匹配时拼音查询为空"""
+    text = query.lower()
+    compact = re.sub(r'\s+', '', text)
+    return text, compact if _PINYIN_QUERY.match(compact) else ''
+
+
+class SearchIndex:
+    """密码搜索索引
+
+    为每条密码预先计算小写的搜索文本以及拼音/首字母键，
+    在数据变更时按条目增量维护，避免每次按键都重新转换。
+    条目为 PasswordEntry，搜索循环中直接读取属性。
+    """
+
+    def __init__(self):
+        # id -> (指纹, 原文搜索文本, 拼音搜索文本)
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, entry_id):
+        return entry_id in self._entries
+
+    def add(self, entry):
+        """添加或更新条目索引，字段未变化时直接复用"""
+        fingerprint = search_fields(entry)
+        cached = self._entries.get(entry.id)
+        if cached is not None and cached[0] == fingerprint:
+            return
+        text, pinyin = build_search_text(fingerprint)
+        self._entries[entry.id] = (fingerprint, text, pinyin)
+
+    update = add
+
+    def remove(self, entry_id):
+        """移除条目索引"""
+        self._entries.pop(entry_id, None)
+
+    def clear(self):
+        """清空索引"""
+        self._entries.clear()
+
+    def sync(self, entries):
+        """与完整的条目列表同步
+
+        只为新增或字段发生变化的条目重新构建索引，并移除已不存在的条目。
+        """
+        seen = set()
+        for entry in entries:
+            self.add(entry)
+            seen.add(entry.id)
+
+        for entry_id in [entry_id for entry_id in self._entries if entry_id not in seen]:
+            del self._entries[entry_id]
+
+    def _match(self, entry_id, text, pinyin_query) -> bool:
+        cached = self._entries.get(entry_id)
+        if cached is None:
+            return False
+        if text in cached[1]:
+            return True
+        return bool(pinyin_query) and pinyin_query in cached[2]
+
+    def matches(self, entry_id, query: str) -> bool:
+        """判断条目是否匹配查询"""
+        text, pinyin_query = normalize_query(query)
+        return self._match(entry_id, text, pinyin_query)
+
+    def search(self, query: str, entries) -> list:
+        """按查询过滤条目，保持原有顺序"""
+        text, pinyin_query = normalize_query(query)
+        return [entry for entry in entries if self._match(entry.id, text, pinyin_query)]
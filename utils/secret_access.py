@@ -0,0 +1,58 @@
+import time
+
+
+class SecretAccessor:
+    """密码明文的短时访问器
+
+    界面侧只持有条目 ID，复制或查看时先查本类的缓存，未命中时通过 StorageService
+    在后台解密后再 put。本类不解密，明文只缓存 ttl 秒，过期后由 purge() 丢弃。
+    """
+
+    DEFAULT_TTL = 30.0
+
+    def __init__(self, ttl: float = DEFAULT_TTL, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._cache = {}  # id -> (明文, 过期时间)
+
+    def __contains__(self, entry_id):
+        cached = self._cache.get(entry_id)
+        return cached is not None and cached[1] > self._clock()
+
+    def cached(self, entry_id):
+        """未过期的缓存明文，未缓存时返回None（不解密）"""
+        cached = self._cache.get(entry_id)
+        if cached is not None and cached[1] > self._clock():
+            return cached[0]
+        return None
+
+    def put(self, entry_id, secret):
+        """缓存在别处解密得到的明文，secret 为None时丢弃缓存"""
+        if secret is None:
+            self._cache.pop(entry_id, None)
+        else:
+            self._cache[entry_id] = (secret, self._clock() + self.ttl)
+
+    def drop(self, entry_id):
+        """立即丢弃某条记录的明文"""
+        self._cache.pop(entry_id, None)
+
+    def purge(self) -> list:
+        """丢弃所有已过期的明文，返回被丢弃的条目 ID"""
+        now = self._clock()
+        expired = [entry_id for entry_id, (_, expires) in self._cache.items() if expires <= now]
+        for entry_id in expired:
+            del self._cache[entry_id]
+        return expired
+
+    def clear(self):
+        """丢弃全部明文"""
+        self._cache.clear()
+
+    def resident_count(self) -> int:
+        """当前缓存中的明文条数"""
+        return len(self._cache)
+
+    def resident_bytes(self) -> int:
+        """当前缓存中明文的总字节数（UTF-8）"""
+        return sum(len(secret.encode()) for secret, _ in self._cache.values())
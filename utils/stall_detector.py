@@ -0,0 +1,179 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+from .tracing import tracer
+
+
+logger = logging.getLogger(__name__)
+
+# 项目根目录，用于从调用栈中找出项目自身的函数
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class StallDetector:
+    """界面线程卡顿检测
+
+    界面线程中的心跳定时器每隔 HEARTBEAT_INTERVAL 毫秒记录一次心跳，定时器实际触发的
+    延迟即事件循环延迟。后台采样线程发现心跳超过 threshold 毫秒未更新时，抓取界面线程
+    当前的 Python 调用栈（卡顿期间持续采样），卡顿结束后记录并输出日志：最外层的项目函数
+    即正在执行的处理函数（如 PasswordHandler.add_password），采样中出现最多的最内层
+    项目函数即耗时所在。卡顿同时作为区间记入 tracer，导出的 trace 中可以看到。
+
+    依赖 Qt 事件循环，须在 QApplication 创建后于界面线程中调用 start()。
+    """
+
+    DEFAULT_THRESHOLD = 100  # 毫秒
+    HEARTBEAT_INTERVAL = 50  # 毫秒
+    SAMPLE_INTERVAL = 20  # 毫秒
+    MAX_SAMPLES = 50  # 单次卡顿最多保留的采样数
+    HISTORY = 100  # 保留的最近卡顿记录数
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.stall_count = 0
+        self.stalls = deque(maxlen=self.HISTORY)  # 最近的卡顿记录（dict）
+        self.latencies = deque(maxlen=1000)  # 最近的事件循环延迟（毫秒）
+        self._timer = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._gui_thread_id = None
+        self._last_beat = 0.0
+        self._samples = []  # 当前卡顿的调用栈采样
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        """开始检测（在界面线程中调用）"""
+        if self.running:
+            return
+
+        from PySide6.QtCore import QTimer, Qt
+
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._timer = QTimer()
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(self.HEARTBEAT_INTERVAL)
+        self._timer.timeout.connect(self._beat)
+        self._timer.start()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name='secretbook-stall-detector', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """停止检测"""
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._timer.stop()
+        self._timer = None
+
+    def latency_stats(self) -> dict:
+        """事件循环延迟的 p50、p99 与最大值（毫秒）"""
+        values = sorted(self.latencies)
+        if not values:
+            return {'p50_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+        return {
+            'p50_ms': values[len(values) // 2],
+            'p99_ms': values[min(len(values) - 1, int(len(values) * 0.99))],
+            'max_ms': values[-1],
+        }
+
+    def _beat(self):
+        """心跳（界面线程）：统计延迟，结束进行中的卡顿"""
+        now = time.monotonic()
+        gap_ms = (now - self._last_beat) * 1000
+        self.latencies.append(max(0.0, gap_ms - self.HEARTBEAT_INTERVAL))
+        with self._lock:
+            self._last_beat = now
+            samples, self._samples = self._samples, []
+
+        if gap_ms >= self.threshold:
+            self._record_stall(gap_ms, samples)
+
+    def _watch(self):
+        """采样线程：心跳超时期间反复抓取界面线程的调用栈"""
+        while not self._stop.wait(self.SAMPLE_INTERVAL / 1000):
+            with self._lock:
+                stalled_ms = (time.monotonic() - self._last_beat) * 1000
+                if stalled_ms < self.threshold or len(self._samples) >= self.MAX_SAMPLES:
+                    continue
+            frame = sys._current_frames().get(self._gui_thread_id)
+            if frame is None:
+                continue
+            stack = self._extract_stack(frame)
+            del frame
+            with self._lock:
+                self._samples.append(stack)
+
+    def _record_stall(self, duration_ms: float, samples: list):
+        handler = hotspot = '（未采样到调用栈）'
+        stack = []
+        if samples:
+            stack = [f'  {name} ({filename}:{lineno})\n' for filename, lineno, name in samples[0]]
+            handler = self._outermost_project_frame(samples[0]) or '（Qt 内部）'
+            hotspots = Counter(self._innermost_project_frame(sample) for sample in samples)
+            hotspot = hotspots.most_common(1)[0][0] or '（Qt 内部）'
+
+        stall = {
+            'at': time.time() - duration_ms / 1000,
+            'duration_ms': duration_ms,
+            'handler': handler,
+            'hotspot': hotspot,
+            'samples': len(samples),
+            'stack': stack,
+        }
+        self.stall_count += 1
+        self.stalls.append(stall)
+        start_ns = time.perf_counter_ns() - int(duration_ms * 1e6)
+        tracer.record(f'界面卡顿: {handler}', 'stall', start_ns, int(duration_ms * 1e6))
+        logger.warning('界面卡顿 %.0f ms，正在执行 %s，耗时集中在 %s\n%s',
+                       duration_ms, handler, hotspot, ''.join(stack))
+
+    @staticmethod
+    def _extract_stack(frame) -> list:
+        """调用栈（最外层在前），每帧为 (文件, 行号, 限定名)"""
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            # Python 3.11+ 的限定名包含类名，如 PasswordHandler.add_password
+            stack.append((code.co_filename, frame.f_lineno, getattr(code, 'co_qualname', code.co_name)))
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+    @staticmethod
+    def _project_frames(stack) -> list:
+        """调用栈中属于项目代码的帧（不含入口脚本、本模块与 tracing 的包装函数）"""
+        return [frame for frame in stack
+                if frame[0].startswith(PROJECT_ROOT)
+                and os.path.basename(frame[0]) not in ('main.py', 'stall_detector.py', 'tracing.py')]
+
+    @classmethod
+    def _outermost_project_frame(cls, stack):
+        frames = cls._project_frames(stack)
+        return cls._describe(frames[0]) if frames else None
+
+    @classmethod
+    def _innermost_project_frame(cls, stack):
+        frames = cls._project_frames(stack)
+        return cls._describe(frames[-1]) if frames else None
+
+    @staticmethod
+    def _describe(frame) -> str:
+        filename, lineno, name = frame
+        return f'{name} ({os.path.relpath(filename, PROJECT_ROOT)}:{lineno})'
+
+
+# 进程内共享的检测器，以 --watchdog 启动或在“帮助 → 诊断”中开启
+stall_detector = StallDetector()
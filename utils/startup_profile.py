@@ -0,0 +1,89 @@
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """启动耗时分析
+
+    通过 --startup-profile 启用，记录导入、Qt 初始化、图标加载、首次绘制等阶段的耗时。
+    本模块不在顶层导入 Qt，以便统计 Qt 本身的导入时间；未启用时各方法均为空操作。
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.started_at = time.perf_counter()
+        self.records = []  # (阶段, 开始时刻ms, 耗时ms)，耗时为None表示时间点
+        self.notes = []  # (名称, 说明)，在各阶段之后输出
+        self._paint_watchers = []
+
+    def elapsed_ms(self) -> float:
+        """自创建分析器（导入本模块）以来的毫秒数"""
+        return (time.perf_counter() - self.started_at) * 1000
+
+    @contextmanager
+    def phase(self, name: str):
+        """统计一个阶段的耗时"""
+        if not self.enabled:
+            yield
+            return
+
+        start = self.elapsed_ms()
+        try:
+            yield
+        finally:
+            self.records.append((name, start, self.elapsed_ms() - start))
+
+    def add_span(self, name: str, start_ms: float, duration_ms: float):
+        """补记一个已在别处测得的阶段"""
+        if self.enabled:
+            self.records.append((name, start_ms, duration_ms))
+
+    def add_note(self, name: str, text: str):
+        """补记一行附加信息（如缓存统计）"""
+        if self.enabled:
+            self.notes.append((name, text))
+
+    def mark(self, name: str):
+        """记录一个时间点"""
+        if self.enabled:
+            self.records.append((name, self.elapsed_ms(), None))
+
+    def watch_first_paint(self, widget, name: str, callback=None):
+        """在控件首次绘制时记录时间点，可选地随后调用 callback"""
+        if not self.enabled:
+            return
+
+        from PySide6.QtCore import QObject, QEvent
+
+        profiler = self
+
+        class _FirstPaintWatcher(QObject):
+            def eventFilter(self, watched, event):
+                if event.type() == QEvent.Paint:
+                    watched.removeEventFilter(self)
+                    profiler.mark(name)
+                    if callback:
+                        callback()
+                return False
+
+        watcher = _FirstPaintWatcher(widget)
+        widget.installEventFilter(watcher)
+        self._paint_watchers.append(watcher)
+
+    def report(self, stream=None):
+        """输出各阶段耗时"""
+        if not self.enabled or not self.records:
+            return
+
+        stream = stream or sys.stderr
+        print('\n启动耗时分析（毫秒，自导入 startup_profile 起计）', file=stream)
+        print(f'  {"阶段":<24}{"开始":>10}{"耗时":>10}', file=stream)
+        for name, start, duration in self.records:
+            duration_text = '-' if duration is None else f'{duration:.1f}'
+            print(f'  {name:<24}{start:>10.1f}{duration_text:>10}', file=stream)
+        for name, text in self.notes:
+            print(f'  {name:<24}{text}', file=stream)
+        stream.flush()
+        self.records = []
+        self.notes = []
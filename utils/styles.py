@@ -1,260 +1,354 @@
+from functools import lru_cache
+from string import Template
+
+from PySide6.QtCore import QSettings
+from PySide6.QtWidgets import QApplication
+
+
+# 勾选框选中时的对勾图标
+_CHECK_MARK = (
+    'data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iOSIgdmlld0JveD0iMCAwIDEyIDkiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CjxwYXRoIGQ9Ik0xIDQuNUw0LjUgOEwxMSAxIiBzdHJva2U9IndoaXRlIiBzdHJva2Utd2lkdGg9IjIiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIgc3Ryb2tlLWxpbmVqb2luPSJyb3VuZCIvPgo8L3N2Zz4K'
+)
+
+# 应用级样式表模板，变体通过对象名或动态属性区分：
+#   QLabel#dialogTitle                 对话框标题
+#   QLabel[role="form-label"]          表单标签
+#   QPushButton[variant="secondary"]   次要按钮
+#   QPushButton[variant="danger"]      危险按钮
+_STYLESHEET = Template("""
+    QWidget {
+        font-family: $font;
+    }
+    QMainWindow {
+        background-color: $window;
+    }
+    QDialog {
+        background-color: $surface;
+    }
+    QDialog QLabel {
+        color: $text;
+        margin: 5px 0px;
+    }
+    QLabel#dialogTitle {
+        color: $title;
+        margin-bottom: 10px;
+    }
+    QLabel[role="form-label"] {
+        color: $label;
+        font-weight: 500;
+    }
+
+    QLineEdit, QTextEdit, QComboBox {
+        border: 2px solid $border;
+        border-radius: 8px;
+        padding: 5px 10px;
+        font-size: 13px;
+        background-color: $input;
+        color: $text;
+    }
+    QLineEdit, QComboBox {
+        margin: 10px 0px;
+    }
+    QTextEdit {
+        margin: 5px 0px;
+        min-height: 50px;
+    }
+    QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
+        border-color: $primary;
+        background-color: $input_focus;
+    }
+    QLineEdit:hover, QTextEdit:hover, QComboBox:hover {
+        border-color: $border_hover;
+    }
+    QComboBox {
+        min-width: 120px;
+        padding-right: 25px;
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 20px;
+        border-left: 1px solid $border;
+        border-top-right-radius: 8px;
+        border-bottom-right-radius: 8px;
+        background-color: $subtle;
+    }
+    QComboBox::drop-down:hover {
+        background-color: $subtle_hover;
+    }
+    QComboBox QAbstractItemView {
+        border: 2px solid $border;
+        border-radius: 8px;
+        background-color: $input;
+        color: $text;
+        selection-background-color: $primary;
+        selection-color: white;
+        outline: none;
+    }
+
+    QPushButton {
+        background-color: $primary;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 12px;
+        font-size: 13px;
+        font-weight: 500;
+        margin: 5px 2px;
+    }
+    QPushButton:hover {
+        background-color: $primary_hover;
+    }
+    QPushButton:pressed {
+        background-color: $primary_pressed;
+    }
+    QPushButton:disabled {
+        background-color: $disabled;
+        color: $muted;
+    }
+    QPushButton[variant="secondary"] {
+        background-color: $subtle;
+        color: $text;
+    }
+    QPushButton[variant="secondary"]:hover {
+        background-color: $subtle_hover;
+    }
+    QPushButton[variant="secondary"]:pressed {
+        background-color: $subtle_pressed;
+    }
+    QPushButton[variant="danger"] {
+        background-color: #f44336;
+    }
+    QPushButton[variant="danger"]:hover {
+        background-color: #da190b;
+    }
+    QPushButton[variant="danger"]:pressed {
+        background-color: #c62828;
+    }
+
+    QCheckBox {
+        color: $label;
+        spacing: 8px;
+    }
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border: 2px solid $border_strong;
+        border-radius: 3px;
+        background-color: $input;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #3498db;
+        border-color: #3498db;
+        image: url($check_mark);
+    }
+
+    QMessageBox {
+        background-color: $surface;
+    }
+    QMessageBox QLabel {
+        color: $text;
+        font-size: 13px;
+        margin: 0px;
+    }
+    QMessageBox QPushButton {
+        min-width: 80px;
+        min-height: 30px;
+        border-radius: 5px;
+        padding: 0px 8px;
+        margin: 5px;
+    }
+
+    QMenuBar {
+        background-color: $surface;
+        color: $title;
+        border-bottom: 1px solid $border;
+        font-size: 13px;
+        padding: 5px;
+    }
+    QMenuBar::item {
+        padding: 8px 12px;
+        margin: 2px;
+        border-radius: 4px;
+    }
+    QMenuBar::item:selected {
+        background-color: $subtle;
+    }
+    QMenu {
+        background-color: $surface;
+        color: $text;
+        border: 1px solid $border;
+        border-radius: 6px;
+        padding: 5px;
+    }
+    QMenu::item {
+        padding: 6px 15px;
+        border-radius: 4px;
+    }
+    QMenu::item:selected {
+        background-color: $subtle;
+    }
+
+    QStatusBar {
+        background-color: $header;
+        color: $muted;
+        border-top: 1px solid $border;
+        padding: 8px;
+    }
+
+    QTableView {
+        border: 1px solid $border;
+        border-radius: 8px;
+        background-color: $input;
+        color: $text;
+        gridline-color: $grid;
+        font-size: 13px;
+        selection-background-color: transparent;
+    }
+    QTableView::item {
+        padding: 4px 12px;
+        border-bottom: 1px solid $grid;
+        min-height: 40px;
+    }
+    QTableView::item:selected, QTableView::item:focus {
+        background-color: transparent;
+        color: $text;
+        outline: none;
+    }
+    QHeaderView::section {
+        background-color: $header;
+        padding: 12px 10px;
+        border: none;
+        border-bottom: 2px solid $border;
+        font-weight: 600;
+        color: $title;
+        min-height: 35px;
+    }
+""")
+
+
 class StyleManager:
-    """样式管理器"""
-    
-    @staticmethod
-    def get_input_style():
-        """获取输入框样式"""
-        return """
-            QLineEdit {
-                border: 2px solid #e0e0e0;
-                border-radius: 8px;
-                padding: 5px 10px;
-                font-size: 13px;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                background-color: #ffffff;
-                margin: 10px 0px;
-            }
-            QLineEdit:focus {
-                border-color: #4CAF50;
-                background-color: #f9f9f9;
-            }
-            QLineEdit:hover {
-                border-color: #c0c0c0;
-            }
-        """
-    
-    @staticmethod
-    def get_combobox_style():
-        """获取下拉框样式"""
-        return """
-            QComboBox {
-                border: 2px solid #e0e0e0;
-                border-radius: 8px;
-                padding: 5px 10px;
-                font-size: 13px;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                background-color: #ffffff;
-                margin: 10px 0px;
-                min-width: 120px;
-                padding-right: 25px;
-            }
-            QComboBox:focus {
-                border-color: #4CAF50;
-                background-color: #f9f9f9;
-            }
-            QComboBox:hover {
-                border-color: #c0c0c0;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left-width: 1px;
-                border-left-color: #e0e0e0;
-                border-left-style: solid;
-                border-top-right-radius: 8px;
-                border-bottom-right-radius: 8px;
-                background-color: #f8f8f8;
-            }
-            QComboBox::drop-down:hover {
-                background-color: #e8e8e8;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                font-family: 'Arial';
-                font-size: 12px;
-                color: #666666;
-                width: 12px;
-                height: 12px;
-            }
-            QComboBox::down-arrow:after {
-                content: '▼';
-            }
-            QComboBox::down-arrow:hover {
-                border-top-color: #333333;
-            }
-            QComboBox QAbstractItemView {
-                border: 2px solid #e0e0e0;
-                border-radius: 8px;
-                background-color: #ffffff;
-                selection-background-color: #4CAF50;
-                selection-color: white;
-                font-size: 13px;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                padding: 5px;
-                outline: none;
-            }
-            QComboBox QAbstractItemView::item {
-                padding: 8px 10px;
-                border-radius: 4px;
-                margin: 1px;
-                min-height: 20px;
-            }
-            QComboBox QAbstractItemView::item:hover {
-                background-color: #f0f8f0;
-                color: #2c3e50;
-            }
-            QComboBox QAbstractItemView::item:selected {
-                background-color: #4CAF50;
-                color: white;
-            }
-        """
-    
-    @staticmethod
-    def get_textarea_style():
-        """获取文本域样式"""
-        return """
-            QTextEdit {
-                border: 2px solid #e0e0e0;
-                border-radius: 8px;
-                padding: 5px 10px;
-                font-size: 13px;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                background-color: #ffffff;
-                margin: 5px 0px;
-                min-height: 50px;
-            }
-            QTextEdit:focus {
-                border-color: #4CAF50;
-                background-color: #f9f9f9;
-            }
-            QTextEdit:hover {
-                border-color: #c0c0c0;
-            }
-        """
-    
-    @staticmethod
-    def get_button_style():
-        """获取按钮样式"""
-        return """
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 13px;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                font-weight: 500;
-                margin: 5px 2px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-                transform: translateY(-1px);
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """
-    
-    @staticmethod
-    def get_secondary_button_style():
-        """获取次要按钮样式"""
-        return """
-            QPushButton {
-                background-color: #f0f0f0;
-                color: #333333;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 13px;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                font-weight: 500;
-                margin: 5px 2px;
-            }
-            QPushButton:hover {
-                background-color: #e8e8e8;
-                border-color: #c0c0c0;
-            }
-            QPushButton:pressed {
-                background-color: #d8d8d8;
-            }
-        """
-    
-    @staticmethod
-    def get_danger_button_style():
-        """获取危险按钮样式"""
-        return """
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 13px;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                font-weight: 500;
-                margin: 5px 2px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-            QPushButton:pressed {
-                background-color: #c62828;
-            }
-        """
-    
-    @staticmethod
-    def get_dialog_style():
-        """获取对话框样式"""
-        return """
-            QDialog {
-                background-color: #ffffff;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-            }
-            QLabel {
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                color: #333333;
-                margin: 5px 0px;
-            }
-        """
-    
+    """样式管理器 - 主题引擎
+
+    每个主题只生成一份应用级样式表并缓存，通过 QApplication.setStyleSheet
+    一次性应用；切换主题时 Qt 会自动重新润色现有控件，无需重建界面。
+    """
+
+    DEFAULT_THEME = 'light'
+
+    THEMES = {
+        'light': {
+            'name': '浅色',
+            'font': "'Microsoft YaHei', 'Segoe UI', Arial, sans-serif",
+            'window': '#f5f5f5',
+            'surface': '#ffffff',
+            'input': '#ffffff',
+            'input_focus': '#f9f9f9',
+            'header': '#f8f9fa',
+            'grid': '#f0f0f0',
+            'subtle': '#f0f0f0',
+            'subtle_hover': '#e8e8e8',
+            'subtle_pressed': '#d8d8d8',
+            'border': '#e0e0e0',
+            'border_hover': '#c0c0c0',
+            'border_strong': '#bdc3c7',
+            'text': '#333333',
+            'title': '#2c3e50',
+            'label': '#34495e',
+            'muted': '#6c757d',
+            'disabled': '#cccccc',
+            'primary': '#4CAF50',
+            'primary_hover': '#45a049',
+            'primary_pressed': '#3d8b40',
+            # 自绘控件使用的颜色（见 StyleManager.color）
+            'action_copy': '#17a2b8',
+            'action_copy_hover': '#138496',
+            'action_view': '#6c757d',
+            'action_view_hover': '#5a6268',
+            'action_edit': '#28a745',
+            'action_edit_hover': '#218838',
+            'action_history': '#6f42c1',
+            'action_history_hover': '#59339d',
+            'action_delete': '#dc3545',
+            'action_delete_hover': '#c82333',
+            'warning': '#dc3545',
+            'chart': '#17a2b8',
+        },
+        'dark': {
+            'name': '深色',
+            'font': "'Microsoft YaHei', 'Segoe UI', Arial, sans-serif",
+            'window': '#1e1f22',
+            'surface': '#2b2d30',
+            'input': '#26282b',
+            'input_focus': '#2f3135',
+            'header': '#2b2d30',
+            'grid': '#33363a',
+            'subtle': '#3a3d41',
+            'subtle_hover': '#45484d',
+            'subtle_pressed': '#505459',
+            'border': '#3c3f43',
+            'border_hover': '#5a5e63',
+            'border_strong': '#6b7075',
+            'text': '#dfe1e5',
+            'title': '#e8eaed',
+            'label': '#c4c7cc',
+            'muted': '#9aa0a6',
+            'disabled': '#4a4d52',
+            'primary': '#4CAF50',
+            'primary_hover': '#45a049',
+            'primary_pressed': '#3d8b40',
+            'action_copy': '#138496',
+            'action_copy_hover': '#17a2b8',
+            'action_view': '#5a6268',
+            'action_view_hover': '#6c757d',
+            'action_edit': '#218838',
+            'action_edit_hover': '#28a745',
+            'action_history': '#59339d',
+            'action_history_hover': '#6f42c1',
+            'action_delete': '#c82333',
+            'action_delete_hover': '#dc3545',
+            'warning': '#ff6b6b',
+            'chart': '#3bb8cc',
+        },
+    }
+
+    _current_theme = None
+
     @staticmethod
-    def get_main_window_style():
-        """获取主窗口样式"""
-        return """
-            QMainWindow {
-                background-color: #f5f5f5;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-            }
-            QWidget {
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-            }
-        """
+    def _settings():
+        return QSettings('SecretBook', 'Appearance')
+
+    @classmethod
+    def saved_theme(cls) -> str:
+        """读取上次使用的主题"""
+        theme = cls._settings().value('theme', cls.DEFAULT_THEME)
+        return theme if theme in cls.THEMES else cls.DEFAULT_THEME
+
+    @classmethod
+    def current_theme(cls) -> str:
+        """当前主题"""
+        return cls._current_theme or cls.DEFAULT_THEME
+
+    @classmethod
+    def color(cls, key: str) -> str:
+        """当前主题的颜色，供自绘控件与表格前景色使用（绘制时读取，切换主题后即生效）"""
+        return cls.THEMES[cls.current_theme()][key]
 
     @staticmethod
-    def get_msg_box_style():
-        """获取消息提示样式"""
-        return """
-            QMessageBox {
-                background-color: #ffffff;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                border-radius: 8px;
-            }
-            QMessageBox QLabel { 
-                color: #333333;
-                font-size: 13px;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-            }
-            QMessageBox QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                min-width: 80px;
-                min-height: 30px;
-                border: none;
-                border-radius: 5px;
-                font-size: 13px;
-                font-family: 'Microsoft YaHei', 'Segoe UI', Arial, sans-serif;
-                margin: 5px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #45a049;
-            }
-            QMessageBox QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """
\ No newline at end of file
+    @lru_cache(maxsize=None)
+    def get_app_stylesheet(theme: str) -> str:
+        """生成并缓存主题的应用级样式表"""
+        return _STYLESHEET.substitute(StyleManager.THEMES[theme], check_mark=_CHECK_MARK)
+
+    @classmethod
+    def apply_theme(cls, theme: str = None, app=None, save: bool = True):
+        """应用主题（同一主题重复调用时不会重新设置样式表）"""
+        theme = theme if theme in cls.THEMES else cls.saved_theme()
+        app = app or QApplication.instance()
+        if app is None or theme == cls._current_theme:
+            return
+
+        cls._current_theme = theme
+        app.setStyleSheet(cls.get_app_stylesheet(theme))
+        if save:
+            cls._settings().setValue('theme', theme)
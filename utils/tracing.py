@@ -0,0 +1,135 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+# 直方图分桶上界（毫秒），最后一桶收纳更慢的记录
+HISTOGRAM_BOUNDS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class Tracer:
+    """操作耗时追踪
+
+    在存储、加密与界面刷新等关键路径上记录耗时区间，保存在固定容量的环形缓冲区中，
+    供诊断窗口统计和导出为 Chrome trace-event JSON（可在 chrome://tracing 或
+    Perfetto 中打开）。未启用时 span 与 traced 只做一次布尔判断。
+    本模块不依赖 Qt，命令行工具与代理进程同样可以使用。
+    """
+
+    DEFAULT_CAPACITY = 20000
+
+    def __init__(self, enabled: bool = False, capacity: int = DEFAULT_CAPACITY):
+        self.enabled = enabled
+        self.started_at = time.perf_counter_ns()
+        self._records = deque(maxlen=capacity)  # (名称, 类别, 开始ns, 耗时ns, 线程ID)
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def clear(self):
+        self._records.clear()
+
+    @property
+    def capacity(self) -> int:
+        return self._records.maxlen
+
+    def record(self, name: str, category: str, start_ns: int, duration_ns: int):
+        """补记一个已在别处测得的区间（deque.append 是原子操作，可在任意线程调用）"""
+        self._records.append((name, category, start_ns, duration_ns, threading.get_ident()))
+
+    @contextmanager
+    def span(self, name: str, category: str = 'app'):
+        """记录一段代码的耗时"""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.perf_counter_ns() - start)
+
+    def records(self) -> list:
+        """缓冲区中记录的快照"""
+        return list(self._records)
+
+    def stats(self) -> dict:
+        """按名称汇总：次数、总耗时、平均、p50、p95、最大值（毫秒）与直方图"""
+        durations = {}
+        categories = {}
+        for name, category, _, duration_ns, _ in self.records():
+            durations.setdefault(name, []).append(duration_ns / 1e6)
+            categories[name] = category
+
+        stats = {}
+        for name, values in durations.items():
+            values.sort()
+            histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+            for value in values:
+                histogram[_bucket(value)] += 1
+            stats[name] = {
+                'category': categories[name],
+                'count': len(values),
+                'total_ms': sum(values),
+                'mean_ms': sum(values) / len(values),
+                'p50_ms': values[len(values) // 2],
+                'p95_ms': values[min(len(values) - 1, int(len(values) * 0.95))],
+                'max_ms': values[-1],
+                'histogram': histogram,
+            }
+        return stats
+
+    def chrome_trace(self) -> dict:
+        """转换为 Chrome trace-event 格式（完整事件 ph=X，时间单位微秒）"""
+        pid = os.getpid()
+        events = [{
+            'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': thread_id,
+            'ts': (start_ns - self.started_at) / 1000, 'dur': duration_ns / 1000,
+        } for name, category, start_ns, duration_ns, thread_id in self.records()]
+
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id in {event['tid'] for event in events}:
+            if thread_id in thread_names:
+                events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id,
+                               'args': {'name': thread_names[thread_id]}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, file_path: str):
+        """导出为 Chrome trace-event JSON 文件"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f, ensure_ascii=False)
+
+
+def _bucket(duration_ms: float) -> int:
+    for index, bound in enumerate(HISTOGRAM_BOUNDS):
+        if duration_ms <= bound:
+            return index
+    return len(HISTOGRAM_BOUNDS)
+
+
+# 进程内共享的追踪器，设置环境变量 SECRETBOOK_TRACE=1 或以 --trace 启动时从一开始记录
+tracer = Tracer(enabled=os.environ.get('SECRETBOOK_TRACE') == '1')
+
+
+def traced(name: str, category: str = 'app'):
+    """装饰器：记录函数每次调用的耗时"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.record(name, category, start, time.perf_counter_ns() - start)
+        return wrapper
+    return decorator
@@ -0,0 +1,246 @@
+import hashlib
+import hmac
+import json
+import math
+import os
+import tempfile
+from collections import defaultdict
+
+from .crypto import CryptoManager
+from .tracing import traced
+
+
+# 强度等级（password_strength 的返回值为下标）
+STRENGTH_LABELS = ('极弱', '弱', '一般', '强', '很强')
+WEAK_SCORE = 1  # 不高于该等级的视为弱密码
+
+# 熵（比特）达到各等级所需的下限
+_STRENGTH_BITS = (28, 36, 60, 80)
+
+# 最常见的弱密码，命中时直接判为极弱
+COMMON_PASSWORDS = frozenset({
+    '123456', '123456789', '12345678', '12345', '1234567', '1234567890', '111111', '000000',
+    '123123', '666666', '888888', '654321', '112233', '121212', '520520', '5201314',
+    'password', 'password1', 'passw0rd', 'qwerty', 'qwerty123', 'qwertyuiop', 'abc123',
+    'abcd1234', 'a123456', 'aa123456', 'asdfgh', 'zxcvbnm', '1q2w3e4r', 'iloveyou',
+    'admin', 'admin123', 'root', 'letmein', 'welcome', 'monkey', 'dragon', 'football',
+    'woaini', 'woaini1314', 'qq123456', 'secretbook',
+})
+
+# 缓存文件格式版本，计算规则变化时递增以丢弃旧缓存
+CACHE_VERSION = 1
+
+
+def password_strength(password: str) -> int:
+    """估算密码强度，返回 0（极弱）到 4（很强）
+
+    按字符集大小与“有效长度”估算熵：与前一个字符相同或相邻（如 aaa、123、cba）的
+    字符不计入有效长度，常见弱密码直接判为极弱。
+    """
+    if not password or password.lower() in COMMON_PASSWORDS:
+        return 0
+
+    pool = 0
+    if any(char.islower() for char in password):
+        pool += 26
+    if any(char.isupper() for char in password):
+        pool += 26
+    if any(char.isdigit() for char in password):
+        pool += 10
+    if any(not char.isalnum() and char.isascii() for char in password):
+        pool += 33
+    if any(not char.isascii() for char in password):
+        pool += 100
+
+    effective_length = 1 + sum(
+        1 for previous, char in zip(password, password[1:])
+        if abs(ord(char) - ord(previous)) > 1
+    )
+    bits = effective_length * math.log2(pool)
+    return sum(1 for threshold in _STRENGTH_BITS if bits >= threshold)
+
+
+def hash_key(encryption_key: bytes) -> bytes:
+    """由用户加密密钥派生密码哈希的密钥"""
+    return hmac.new(encryption_key, b'secretbook-audit', hashlib.sha256).digest()
+
+
+def password_digest(key: bytes, password: str) -> str:
+    """密码的带密钥哈希"""
+    return hmac.new(key, password.encode(), hashlib.sha256).hexdigest()
+
+
+def fingerprint(ciphertext: str) -> str:
+    """密文指纹，用于在缓存文件中判断条目是否变化"""
+    return hashlib.blake2b(ciphertext.encode(), digest_size=16).hexdigest()
+
+
+def user_cache_file(data_manager, prefix: str):
+    """当前用户的缓存文件路径（文件名不含用户名）"""
+    user_hash = hashlib.sha256(data_manager.current_user.encode()).hexdigest()[:16]
+    return data_manager.data_dir / f'{prefix}-{user_hash}.json'
+
+
+def read_encrypted_cache(path, encryption_key: bytes, version: int):
+    """读取用用户密钥加密的缓存文件，文件不存在、损坏、属于其他密钥或版本不符时返回None"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.loads(CryptoManager.decrypt_data(f.read(), encryption_key))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get('version') != version:
+        return None
+    return payload
+
+
+def write_encrypted_cache(path, payload: dict, encryption_key: bytes):
+    """加密写入缓存文件（写入临时文件后原子替换），写入失败时保留旧文件"""
+    encrypted = CryptoManager.encrypt_data(json.dumps(payload), encryption_key)
+    fd, temp_path = tempfile.mkstemp(prefix=f'{path.stem}.', suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(encrypted)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+class VaultAudit:
+    """密码体检：重复使用与弱密码检测
+
+    - 重复检测：用带密钥的哈希（HMAC-SHA256，密钥由用户加密密钥派生）作为键，
+      维护 哈希 -> 条目 ID 集合 的多重映射，一遍扫描即可找出共用同一密码的条目，
+      不需要两两比较；哈希不带密钥就无法离线穷举。
+    - 增量计算：按条目缓存（密文指纹, 密码哈希, 强度），密文未变的条目直接沿用，
+      只解密新增或修改过的条目。缓存用用户密钥加密保存在数据目录中，
+      重新打开密码库时同样只计算上次体检之后变化的条目。
+
+    run() 在存储服务的工作线程中调用，返回的结果是独立的 dict，可以交给界面线程。
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self._user = None
+        self._key = None
+        self._records = {}  # id -> (密文指纹, 密码哈希, 强度)
+        self._ciphertexts = {}  # id -> 上次体检时的密文（与用户数据共享同一字符串）
+        self._by_digest = defaultdict(set)  # 密码哈希 -> 条目 ID 集合
+        self._loaded = False
+
+    @property
+    def cache_file(self):
+        return user_cache_file(self.data_manager, 'audit')
+
+    def _reset(self):
+        """切换用户或首次运行时重建状态"""
+        self._user = self.data_manager.current_user
+        self._key = hash_key(self.data_manager.encryption_key)
+        self._records = {}
+        self._ciphertexts = {}
+        self._by_digest = defaultdict(set)
+        self._loaded = False
+
+    # ---- 体检 ----
+
+    @traced('密码体检', 'storage')
+    def run(self) -> dict:
+        """增量体检当前用户的全部条目
+
+        Returns:
+            {'findings': {id: (强度, 共用该密码的条目数, 共用组编号)}, 'recomputed': 本次重新计算的条目数}
+        """
+        if not self.data_manager.current_user:
+            return {'findings': {}, 'recomputed': 0}
+        if self._user != self.data_manager.current_user:
+            self._reset()
+        if not self._loaded:
+            self._load_cache()
+            self._loaded = True
+
+        items = self.data_manager.read_encrypted_passwords()
+        current = set()
+        recomputed = 0
+        for item in items:
+            entry_id, ciphertext = item['id'], item['data']
+            current.add(entry_id)
+            seen = self._ciphertexts.get(entry_id)
+            if seen is ciphertext or seen == ciphertext:
+                continue
+
+            current_fingerprint = fingerprint(ciphertext)
+            record = self._records.get(entry_id)
+            if seen is None and record is not None and record[0] == current_fingerprint:
+                # 缓存文件中的记录仍然有效
+                self._ciphertexts[entry_id] = ciphertext
+                continue
+
+            password_data = self.data_manager.decrypt_password_item(item)
+            if password_data is None:
+                self._forget(entry_id)
+                continue
+            password = password_data.get('password', '') or ''
+            self._set(entry_id, (current_fingerprint, password_digest(self._key, password), password_strength(password)))
+            self._ciphertexts[entry_id] = ciphertext
+            recomputed += 1
+
+        removed = [entry_id for entry_id in self._records if entry_id not in current]
+        for entry_id in removed:
+            self._forget(entry_id)
+
+        if recomputed or removed:
+            self._save_cache()
+        return {'findings': self.findings(), 'recomputed': recomputed}
+
+    def _set(self, entry_id, record):
+        previous = self._records.get(entry_id)
+        if previous is not None:
+            self._discard_digest(entry_id, previous[1])
+        self._records[entry_id] = record
+        self._by_digest[record[1]].add(entry_id)
+
+    def _forget(self, entry_id):
+        record = self._records.pop(entry_id, None)
+        self._ciphertexts.pop(entry_id, None)
+        if record is not None:
+            self._discard_digest(entry_id, record[1])
+
+    def _discard_digest(self, entry_id, digest):
+        ids = self._by_digest.get(digest)
+        if ids is not None:
+            ids.discard(entry_id)
+            if not ids:
+                del self._by_digest[digest]
+
+    def findings(self) -> dict:
+        """{id: (强度, 共用该密码的条目数, 共用组编号)}
+
+        条目数为 1 表示未重复，此时组编号为 0；共用同一密码的条目组编号相同，
+        按组内最小 ID 从 1 开始编号。
+        """
+        groups = {}
+        for number, ids in enumerate(self.reused_groups(), 1):
+            for entry_id in ids:
+                groups[entry_id] = number
+        by_digest = self._by_digest
+        return {entry_id: (score, len(by_digest[digest]), groups.get(entry_id, 0))
+                for entry_id, (_, digest, score) in self._records.items()}
+
+    def reused_groups(self) -> list:
+        """共用同一密码的条目 ID 分组（每组至少两条，按组内最小 ID 排序）"""
+        return sorted(sorted(ids) for ids in self._by_digest.values() if len(ids) > 1)
+
+    # ---- 缓存文件 ----
+
+    def _load_cache(self):
+        """读取上次体检的结果"""
+        payload = read_encrypted_cache(self.cache_file, self.data_manager.encryption_key, CACHE_VERSION)
+        for entry_id, record_fingerprint, digest, score in (payload or {}).get('records', []):
+            self._set(entry_id, (record_fingerprint, digest, score))
+
+    def _save_cache(self):
+        """保存体检结果"""
+        write_encrypted_cache(self.cache_file, {
+            'version': CACHE_VERSION,
+            'records': [[entry_id, *record] for entry_id, record in self._records.items()],
+        }, self.data_manager.encryption_key)
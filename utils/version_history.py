@@ -0,0 +1,95 @@
+import difflib
+import json
+
+from .crypto import CryptoManager
+
+
+# 每条记录默认保留的历史版本数，0 表示不保留历史
+DEFAULT_HISTORY_LIMIT = 20
+MAX_HISTORY_LIMIT = 1000
+
+# 不短于此长度的文本字段按字符差异保存，较短的字段直接保存旧值
+TEXT_DIFF_MIN_LENGTH = 64
+
+
+def _diff_text(newer: str, older: str) -> list:
+    """由 newer 还原 older 的操作列表：[起, 止] 表示复制 newer 的片段，字符串表示插入的文本"""
+    ops = []
+    matcher = difflib.SequenceMatcher(None, newer, older, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append(older[j1:j2])
+    return ops
+
+
+def _patch_text(newer: str, ops: list) -> str:
+    return ''.join(newer[op[0]:op[1]] if isinstance(op, list) else op for op in ops)
+
+
+def make_delta(newer: dict, older: dict) -> dict:
+    """计算由 newer 还原 older 所需的差异，两者相同时返回空 dict
+
+    Returns:
+        {'set': {字段: 旧值}, 'patch': {字段: 文本操作}, 'unset': [旧版本中没有的字段]}，
+        只包含非空的部分
+    """
+    delta = {}
+    for field, value in older.items():
+        current = newer.get(field)
+        if field in newer and current == value:
+            continue
+        if isinstance(value, str) and isinstance(current, str) and len(value) >= TEXT_DIFF_MIN_LENGTH:
+            ops = _diff_text(current, value)
+            if len(json.dumps(ops, ensure_ascii=False)) < len(json.dumps(value, ensure_ascii=False)):
+                delta.setdefault('patch', {})[field] = ops
+                continue
+        delta.setdefault('set', {})[field] = value
+    unset = [field for field in newer if field not in older]
+    if unset:
+        delta['unset'] = unset
+    return delta
+
+
+def apply_delta(newer: dict, delta: dict) -> dict:
+    """由较新的版本与差异还原较旧的版本"""
+    unset = set(delta.get('unset', ()))
+    older = {field: value for field, value in newer.items() if field not in unset}
+    older.update(delta.get('set', {}))
+    for field, ops in delta.get('patch', {}).items():
+        older[field] = _patch_text(newer[field], ops)
+    return older
+
+
+def changed_fields(delta: dict) -> list:
+    """差异涉及的字段"""
+    return [*delta.get('set', {}), *delta.get('patch', {}), *delta.get('unset', ())]
+
+
+def push_version(history: list, delta: dict, saved_at: str, key: bytes, limit: int) -> list:
+    """把被替换的版本加入历史，返回新的历史列表（新到旧）
+
+    历史是反向差异链：第 1 项是相对当前版本的差异，第 k 项是相对第 k-1 项还原出的版本的差异，
+    因此更新时只需加密一项差异，超出保留数时直接丢弃最旧的几项，不影响其余版本。
+    """
+    if limit <= 0:
+        return []
+    data = CryptoManager.encrypt_data(json.dumps(delta, ensure_ascii=False), key)
+    return [{'data': data, 'saved_at': saved_at}, *history[:limit - 1]]
+
+
+def decrypt_delta(record: dict, key: bytes) -> dict:
+    return json.loads(CryptoManager.decrypt_data(record['data'], key))
+
+
+def iter_versions(current: dict, history: list, key: bytes, depth: int = None):
+    """由当前版本依次还原历史版本（新到旧），产出 (版本号, 保存时间, 完整数据, 与后一版本相比修改的字段)
+
+    还原第 k 个版本需要解密并应用 k 项差异，只访问这一条记录的历史。
+    """
+    password_data = current
+    for version, record in enumerate(history[:depth], 1):
+        delta = decrypt_delta(record, key)
+        password_data = apply_delta(password_data, delta)
+        yield version, record.get('saved_at'), password_data, changed_fields(delta)